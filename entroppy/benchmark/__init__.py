@@ -0,0 +1,28 @@
+"""Benchmarks: synthetic corpora, per-stage measurements and baseline comparison.
+
+Run with ``python -m entroppy.benchmark`` or ``pytest -m benchmark``.
+"""
+
+from entroppy.benchmark.baseline import (
+    BenchmarkResult,
+    Regression,
+    StageMeasurement,
+    compare_scaling,
+    compare_to_baseline,
+    load_baseline,
+)
+from entroppy.benchmark.corpus import SyntheticCorpus, build_corpus
+from entroppy.benchmark.runner import build_dictionary_data, run_benchmark
+
+__all__ = [
+    "BenchmarkResult",
+    "Regression",
+    "StageMeasurement",
+    "SyntheticCorpus",
+    "build_corpus",
+    "build_dictionary_data",
+    "compare_scaling",
+    "compare_to_baseline",
+    "load_baseline",
+    "run_benchmark",
+]
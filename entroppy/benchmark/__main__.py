@@ -0,0 +1,146 @@
+"""Command-line entry point: ``python -m entroppy.benchmark``."""
+
+import argparse
+from pathlib import Path
+import sys
+from typing import Any
+
+from loguru import logger
+
+from entroppy.benchmark.baseline import (
+    BenchmarkResult,
+    Regression,
+    compare_scaling,
+    compare_to_baseline,
+    load_baseline,
+)
+from entroppy.benchmark.runner import run_benchmark
+from entroppy.utils.logging import setup_logger
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the benchmark argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m entroppy.benchmark",
+        description="Measure each pipeline stage on a synthetic corpus and compare the "
+        "results with a stored baseline or with a run on twice the corpus",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Record a baseline
+  %(prog)s --words 2000 --save tests/benchmarks/baseline.json
+
+  # Check for regressions (exit status 1 if any stage got slower or bigger)
+  %(prog)s --baseline tests/benchmarks/baseline.json
+
+  # Check that no stage grows faster than linearly when the corpus doubles
+  %(prog)s --words 2000 --check-scaling
+        """,
+    )
+    parser.add_argument(
+        "--words",
+        type=int,
+        help="Source words in the synthetic corpus (default: baseline's, else 2000)",
+    )
+    parser.add_argument("--seed", type=int, help="Corpus seed (default: baseline's, else 0)")
+    parser.add_argument(
+        "-j", "--jobs", type=int, help="Number of parallel workers (default: baseline's, else 1)"
+    )
+    parser.add_argument("--baseline", type=Path, help="Baseline JSON to compare against")
+    parser.add_argument("--save", type=Path, help="Write the measurements to this JSON file")
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        help="Allowed relative slowdown, overriding the baseline's (e.g. 0.25 = 25%%)",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        help="Allowed relative peak RSS growth, overriding the baseline's",
+    )
+    parser.add_argument(
+        "--check-scaling",
+        action="store_true",
+        help="Also run on twice the corpus and flag stages that grow faster than linearly",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Exit status: 0 if no stage regressed, 1 otherwise
+    """
+    args = create_parser().parse_args(argv)
+    setup_logger(verbose=True, debug=False)
+
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    corpus = baseline.get("corpus", {}) if baseline else {}
+    words = args.words or corpus.get("words", 2000)
+    seed = args.seed if args.seed is not None else corpus.get("seed", 0)
+    jobs = args.jobs or corpus.get("jobs", 1)
+
+    logger.info(f"Benchmarking {words} synthetic words (seed {seed}, {jobs} worker(s))...")
+    result = run_benchmark(words, seed, jobs)
+    for name, stage in result.stages.items():
+        logger.info(
+            f"  {name:<32} {stage.seconds:9.3f}s {stage.peak_rss_mb:9.1f} MB "
+            f"{stage.items:>10} items"
+        )
+
+    if args.save:
+        result.save(args.save, baseline.get("tolerances") if baseline else None)
+        logger.info(f"Measurements written to {args.save}")
+
+    regressions: list[Regression] = []
+    if args.check_scaling:
+        logger.info(f"Benchmarking {words * 2} synthetic words for the scaling check...")
+        regressions.extend(compare_scaling(result, run_benchmark(words * 2, seed, jobs)))
+
+    if baseline is not None:
+        regressions.extend(_baseline_regressions(result, baseline, args))
+
+    if not regressions:
+        logger.info("✓ No regressions")
+        return 0
+    logger.error(f"✗ {len(regressions)} regression(s):")
+    for regression in regressions:
+        logger.error(f"  {regression}")
+    return 1
+
+
+def _baseline_regressions(
+    result: BenchmarkResult, baseline: dict[str, Any], args: argparse.Namespace
+) -> list[Regression]:
+    """Compare a run with the stored baseline, honouring the tolerance overrides.
+
+    Args:
+        result: Measurements from this run
+        baseline: Parsed baseline JSON
+        args: Parsed command-line arguments
+
+    Returns:
+        Regressions; empty when the baseline has no stages or another corpus
+    """
+    corpus = baseline.get("corpus", {})
+    if not baseline["stages"]:
+        logger.warning(f"Baseline {args.baseline} has no recorded stages; nothing to compare")
+        return []
+    if corpus and result.corpus != {key: corpus.get(key) for key in result.corpus}:
+        logger.warning(f"Baseline corpus {corpus} differs from this run; comparison skipped")
+        return []
+
+    overrides = {}
+    if args.time_tolerance is not None:
+        overrides["seconds"] = args.time_tolerance
+    if args.memory_tolerance is not None:
+        overrides["peak_rss_mb"] = args.memory_tolerance
+    return compare_to_baseline(result, baseline, overrides)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""Benchmark results, stored baselines and regression checks.
+
+A baseline is the JSON written by ``BenchmarkResult.save``, optionally extended with
+a ``tolerances`` section::
+
+    {
+      "corpus": {"words": 2000, "seed": 0, "jobs": 1},
+      "tolerances": {"seconds": 0.25, "peak_rss_mb": 0.15,
+                     "stages": {"generate_output": {"seconds": 1.0}}},
+      "stages": {"generate_typos": {"seconds": 1.8, "peak_rss_mb": 210.0, "items": 51234},
+                 ...}
+    }
+
+Tolerances are relative (0.25 allows 25% slower). Per-stage entries override the
+global ones, and tolerances passed on the command line override both.
+
+Stored numbers only mean something on the machine that recorded them.
+``compare_scaling`` needs none: it compares two runs made in the same process on
+corpora of different sizes, and flags stages whose time grows much faster than the
+corpus, such as a linear pass that turned quadratic.
+"""
+
+from dataclasses import asdict, dataclass, field
+import json
+from pathlib import Path
+import platform
+from typing import Any
+
+# Default relative tolerances
+DEFAULT_TIME_TOLERANCE = 0.25
+DEFAULT_MEMORY_TOLERANCE = 0.15
+
+# Allowed time growth over linear when the corpus grows (0.5: doubling the corpus may
+# make a stage up to 3x slower, while a quadratic stage gets 4x slower)
+DEFAULT_SCALING_TOLERANCE = 0.5
+
+# Differences below these are noise, whatever the relative change
+MIN_SECONDS_DELTA = 0.05
+MIN_MEMORY_DELTA_MB = 16.0
+
+METRICS = ("seconds", "peak_rss_mb")
+
+
+@dataclass
+class StageMeasurement:
+    """Cost of one stage.
+
+    Attributes:
+        seconds: Wall-clock time
+        peak_rss_mb: Peak resident set size of the main process while the stage ran
+        items: Stage output size (typos, corrections, ...), for sanity checks
+    """
+
+    seconds: float
+    peak_rss_mb: float
+    items: int = 0
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one benchmark run.
+
+    Attributes:
+        corpus: Corpus settings (words, seed, jobs)
+        stages: Stage name -> measurement, in run order
+        machine: Description of the machine the run was made on
+    """
+
+    corpus: dict[str, int]
+    stages: dict[str, StageMeasurement] = field(default_factory=dict)
+    machine: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to JSON-compatible data."""
+        return {
+            "corpus": self.corpus,
+            "machine": self.machine,
+            "stages": {name: asdict(stage) for name, stage in self.stages.items()},
+        }
+
+    def save(self, path: Path, tolerances: dict[str, Any] | None = None) -> None:
+        """Write the result as JSON, e.g. to record a new baseline.
+
+        Args:
+            path: Output file
+            tolerances: Tolerances section to store with the result
+        """
+        data = self.to_dict()
+        if tolerances:
+            data["tolerances"] = tolerances
+        path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def describe_machine() -> dict[str, Any]:
+    """Describe the current machine, so baselines from other machines stand out."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A metric that got worse than its baseline allows.
+
+    Attributes:
+        stage: Stage name
+        metric: "seconds" or "peak_rss_mb"
+        baseline: Baseline value (for scaling checks, the smaller run's value scaled
+            linearly to the larger corpus)
+        measured: Measured value
+        tolerance: Relative tolerance that was exceeded
+    """
+
+    stage: str
+    metric: str
+    baseline: float
+    measured: float
+    tolerance: float
+
+    def __str__(self) -> str:
+        """Describe the regression on one line, with the relative change."""
+        change = (self.measured / self.baseline - 1) if self.baseline else float("inf")
+        return (
+            f"{self.stage}: {self.metric} {self.measured:.3f} vs baseline {self.baseline:.3f} "
+            f"({change:+.0%}, allowed +{self.tolerance:.0%})"
+        )
+
+
+def load_baseline(path: Path) -> dict[str, Any]:
+    """Load a baseline file.
+
+    Args:
+        path: Baseline JSON file
+
+    Returns:
+        Baseline data
+
+    Raises:
+        ValueError: If the file is not a valid baseline
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid baseline JSON in {path}: {e}") from e
+    if not isinstance(data, dict) or not isinstance(data.get("stages"), dict):
+        raise ValueError(f"Baseline {path} has no 'stages' section")
+    return data
+
+
+def _tolerance(
+    baseline: dict[str, Any], stage: str, metric: str, overrides: dict[str, float]
+) -> float:
+    """Tolerance for one stage metric: command line, then per stage, then global."""
+    if metric in overrides:
+        return overrides[metric]
+    tolerances = baseline.get("tolerances", {})
+    stage_tolerances = tolerances.get("stages", {}).get(stage, {})
+    if metric in stage_tolerances:
+        return float(stage_tolerances[metric])
+    default = DEFAULT_TIME_TOLERANCE if metric == "seconds" else DEFAULT_MEMORY_TOLERANCE
+    return float(tolerances.get(metric, default))
+
+
+def compare_to_baseline(
+    result: BenchmarkResult,
+    baseline: dict[str, Any],
+    overrides: dict[str, float] | None = None,
+) -> list[Regression]:
+    """Find stage metrics that regressed beyond their tolerance.
+
+    Stages missing from either side are ignored, as are changes smaller than
+    MIN_SECONDS_DELTA / MIN_MEMORY_DELTA_MB.
+
+    Args:
+        result: Measurements to check
+        baseline: Data from load_baseline
+        overrides: Tolerances that replace the baseline's, by metric
+
+    Returns:
+        Regressions, in stage order
+    """
+    overrides = overrides or {}
+    regressions = []
+    for stage, measurement in result.stages.items():
+        expected = baseline["stages"].get(stage)
+        if expected is None:
+            continue
+        for metric in METRICS:
+            if metric not in expected:
+                continue
+            reference = float(expected[metric])
+            measured = float(getattr(measurement, metric))
+            tolerance = _tolerance(baseline, stage, metric, overrides)
+            noise = MIN_SECONDS_DELTA if metric == "seconds" else MIN_MEMORY_DELTA_MB
+            if measured > reference * (1 + tolerance) and measured - reference > noise:
+                regressions.append(Regression(stage, metric, reference, measured, tolerance))
+    return regressions
+
+
+def compare_scaling(
+    small: BenchmarkResult,
+    large: BenchmarkResult,
+    tolerance: float = DEFAULT_SCALING_TOLERANCE,
+) -> list[Regression]:
+    """Find stages whose time grows faster than the corpus between two runs.
+
+    Both runs should come from the same process, so no stored baseline is needed.
+    A stage regresses when its time in the large run exceeds its time in the small
+    run, scaled linearly by the corpus size ratio, by more than the tolerance and by
+    more than MIN_SECONDS_DELTA.
+
+    Args:
+        small: Run on the smaller corpus
+        large: Run on the larger corpus
+        tolerance: Allowed relative growth over linear scaling
+
+    Returns:
+        Regressions, in stage order
+    """
+    size_ratio = large.corpus["words"] / small.corpus["words"]
+    regressions = []
+    for stage, measurement in large.stages.items():
+        reference = small.stages.get(stage)
+        if reference is None:
+            continue
+        expected = reference.seconds * size_ratio
+        allowed = expected * (1 + tolerance)
+        if measurement.seconds > allowed and measurement.seconds - allowed > MIN_SECONDS_DELTA:
+            regressions.append(
+                Regression(stage, "seconds", expected, measurement.seconds, tolerance)
+            )
+    return regressions
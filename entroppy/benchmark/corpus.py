@@ -0,0 +1,101 @@
+"""Deterministic synthetic word lists for benchmarks.
+
+Real runs load english-words and wordfreq, whose contents change between releases and
+machines. Benchmarks instead build words from a fixed syllable inventory with a
+seeded RNG, so the same size and seed always give the same corpus. Words share
+onsets, vowels and suffixes the way English words do, so the solver finds collisions,
+patterns and substring conflicts at roughly realistic rates.
+"""
+
+from dataclasses import dataclass, field
+import random
+
+_ONSETS = [
+    "b", "c", "d", "f", "g", "h", "j", "k", "l", "m", "n", "p", "r", "s", "t", "v", "w",
+    "bl", "br", "ch", "cl", "cr", "dr", "fl", "fr", "gr", "pl", "pr", "sh", "sl", "sp",
+    "st", "th", "tr",
+]  # fmt: skip
+_VOWELS = ["a", "e", "i", "o", "u", "a", "e", "i", "o", "ea", "ou", "ai", "ee", "oo"]
+_CODAS = ["", "", "", "n", "r", "s", "t", "l", "m", "nd", "ng", "ck", "nt", "st", "rt"]
+_SUFFIXES = ["", "", "", "", "s", "ed", "er", "ing", "ly", "tion", "ness", "ment", "able"]
+
+# QWERTY neighbours, in the format of --adjacent-letters
+ADJACENT_LETTERS = {
+    "q": "wa", "w": "qase", "e": "wsdr", "r": "edft", "t": "rfgy", "y": "tghu",
+    "u": "yhji", "i": "ujko", "o": "iklp", "p": "ol", "a": "qwsz", "s": "awedxz",
+    "d": "serfcx", "f": "drtgvc", "g": "ftyhbv", "h": "gyujnb", "j": "huikmn",
+    "k": "jiolm", "l": "kop", "z": "asx", "x": "zsdc", "c": "xdfv", "v": "cfgb",
+    "b": "vghn", "n": "bhjm", "m": "njk",
+}  # fmt: skip
+
+
+@dataclass(frozen=True)
+class SyntheticCorpus:
+    """Word lists standing in for the Stage 1 dictionaries.
+
+    Attributes:
+        source_words: Words to generate typos for, most "frequent" first
+        validation_words: Valid words (includes every source word)
+        exclusions: Exclusion patterns
+        adjacent_letters: Key -> neighbouring keys
+    """
+
+    source_words: list[str]
+    validation_words: frozenset[str]
+    exclusions: frozenset[str] = field(default_factory=frozenset)
+    adjacent_letters: dict[str, str] = field(default_factory=lambda: dict(ADJACENT_LETTERS))
+
+
+def _make_word(rng: random.Random) -> str:
+    """Build one word from 1-3 syllables and an optional suffix."""
+    syllables = rng.choice((1, 2, 2, 2, 3, 3))
+    parts = [rng.choice(_ONSETS) + rng.choice(_VOWELS) + rng.choice(_CODAS)]
+    for _ in range(syllables - 1):
+        parts.append(rng.choice(_ONSETS) + rng.choice(_VOWELS) + rng.choice(_CODAS))
+    return "".join(parts) + rng.choice(_SUFFIXES)
+
+
+def build_corpus(
+    words: int,
+    seed: int = 0,
+    validation_ratio: int = 5,
+    min_length: int = 3,
+    max_length: int = 10,
+) -> SyntheticCorpus:
+    """Build a synthetic corpus.
+
+    Args:
+        words: Number of source words
+        seed: RNG seed; the same arguments always give the same corpus
+        validation_ratio: Validation words per source word
+        min_length: Minimum source word length
+        max_length: Maximum source word length
+
+    Returns:
+        The corpus
+    """
+    rng = random.Random(seed)
+    validation: set[str] = set()
+    source: list[str] = []
+    target = words * validation_ratio
+    # Bounded so tiny syllable inventories cannot loop forever
+    for _ in range(target * 20):
+        if len(validation) >= target and len(source) >= words:
+            break
+        word = _make_word(rng)
+        if word in validation:
+            continue
+        validation.add(word)
+        if len(source) < words and min_length <= len(word) <= max_length:
+            source.append(word)
+
+    exclusions = frozenset(
+        {
+            f"{rng.choice(_ONSETS)}{rng.choice(_VOWELS)}*",
+            f"*{rng.choice(_SUFFIXES[4:])}",
+            f"{rng.choice(_ONSETS)}{rng.choice(_VOWELS)}{rng.choice(_CODAS[3:])}* -> *",
+        }
+    )
+    return SyntheticCorpus(
+        source_words=source, validation_words=frozenset(validation), exclusions=exclusions
+    )
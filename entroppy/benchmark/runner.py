@@ -0,0 +1,207 @@
+"""Run the pipeline stages on a synthetic corpus and measure each one.
+
+Stages run in pipeline order on the same data, each timed on its own: corpus
+loading (exclusion filtering), typo generation, the iterative solver, ranking and
+output. ``end_to_end`` covers everything from loading to output, including the worker
+pool.
+
+Each solver pass is then timed in isolation as ``pass:<name>``: a fresh state gets one
+full run of every pass in solver order, outside the solver loop, so each pass sees the
+input it gets in the first iteration. The item count is the number of active
+corrections and patterns after the pass.
+
+Peak memory is the main process's resident set size, sampled in a background thread
+while a stage runs. Pool workers are not included.
+"""
+
+from collections.abc import Callable
+import tempfile
+import threading
+import time
+from typing import TypeVar
+
+from entroppy.benchmark.baseline import BenchmarkResult, StageMeasurement, describe_machine
+from entroppy.benchmark.corpus import SyntheticCorpus, build_corpus
+from entroppy.core import Config
+from entroppy.matching import ExclusionMatcher
+from entroppy.platforms import PlatformBackend, get_platform_backend
+from entroppy.processing.pipeline_helpers import resident_run_data
+from entroppy.processing.pipeline_stages import (
+    apply_platform_ranking,
+    create_solver_passes,
+    create_solver_state,
+    run_iterative_solver,
+)
+from entroppy.processing.stages import DictionaryData, TypoGenerationResult, generate_typos
+from entroppy.resolution.solver import Pass
+from entroppy.utils.tracing import current_rss_bytes
+from entroppy.utils.worker_pool import shared_worker_pool
+
+T = TypeVar("T")
+
+# Seconds between RSS samples while a stage runs
+RSS_SAMPLE_INTERVAL = 0.005
+
+_MB = 1024 * 1024
+
+
+class _PeakRss:
+    """Background thread tracking the peak RSS of this process."""
+
+    def __init__(self) -> None:
+        self.peak = current_rss_bytes()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(RSS_SAMPLE_INTERVAL):
+            self.peak = max(self.peak, current_rss_bytes())
+
+    def __enter__(self) -> "_PeakRss":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss_bytes())
+
+
+def _measure(
+    result: BenchmarkResult, name: str, func: Callable[[], T], items: Callable[[T], int]
+) -> T:
+    """Run one stage and record its time, peak RSS and output size.
+
+    Args:
+        result: Result to record into
+        name: Stage name
+        func: Stage to run
+        items: Function giving the size of the stage's output
+
+    Returns:
+        The stage's return value
+    """
+    with _PeakRss() as rss:
+        start = time.perf_counter()
+        value = func()
+        seconds = time.perf_counter() - start
+    result.stages[name] = StageMeasurement(seconds, rss.peak / _MB, items(value))
+    return value
+
+
+def build_dictionary_data(corpus: SyntheticCorpus) -> DictionaryData:
+    """Build the Stage 1 output for a synthetic corpus.
+
+    Args:
+        corpus: Synthetic corpus
+
+    Returns:
+        Dictionary data, as load_dictionaries would return it
+    """
+    start = time.time()
+    validation_set = set(corpus.validation_words)
+    exclusion_matcher = ExclusionMatcher(set(corpus.exclusions))
+    filtered_validation_set = exclusion_matcher.filter_validation_set(validation_set)
+    return DictionaryData(
+        validation_set=validation_set,
+        filtered_validation_set=filtered_validation_set,
+        exclusions=set(corpus.exclusions),
+        exclusion_matcher=exclusion_matcher,
+        adjacent_letters_map=corpus.adjacent_letters,
+        source_words=corpus.source_words,
+        source_words_set=set(corpus.source_words),
+        user_words_set=set(),
+        elapsed_time=time.time() - start,
+    )
+
+
+def _measure_passes(
+    result: BenchmarkResult,
+    typo_result: TypoGenerationResult,
+    dict_data: DictionaryData,
+    platform: PlatformBackend,
+    config: Config,
+) -> None:
+    """Time one full run of each solver pass on a fresh state, outside the solver.
+
+    Args:
+        result: Result to record into
+        typo_result: Stage 2 output
+        dict_data: Dictionary data
+        platform: Platform backend
+        config: Configuration object
+    """
+    state = create_solver_state(typo_result, config)
+    state.start_iteration()
+    for solver_pass in create_solver_passes(dict_data, platform, config, False):
+
+        def run_pass(solver_pass: Pass = solver_pass) -> None:
+            solver_pass.prepare(state)
+            solver_pass.run(state)
+
+        _measure(
+            result,
+            f"pass:{solver_pass.name}",
+            run_pass,
+            lambda _: len(state.active_corrections) + len(state.active_patterns),
+        )
+
+
+def run_benchmark(words: int, seed: int = 0, jobs: int = 1) -> BenchmarkResult:
+    """Run every stage on a synthetic corpus and measure it.
+
+    Args:
+        words: Number of source words
+        seed: Corpus seed
+        jobs: Number of worker processes
+
+    Returns:
+        Measurements per stage
+    """
+    corpus = build_corpus(words, seed)
+    config = Config.model_validate({"jobs": jobs, "platform": "espanso", "min_typo_length": 4})
+    platform = get_platform_backend(config.platform)
+    result = BenchmarkResult(
+        corpus={"words": words, "seed": seed, "jobs": jobs}, machine=describe_machine()
+    )
+
+    with _PeakRss() as total_rss, tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        dict_data = _measure(
+            result,
+            "load_corpus",
+            lambda: build_dictionary_data(corpus),
+            lambda d: len(d.filtered_validation_set),
+        )
+        resident = resident_run_data(dict_data) if jobs > 1 else None
+        with shared_worker_pool(jobs, resident):
+            typo_result = _measure(
+                result,
+                "generate_typos",
+                lambda: generate_typos(dict_data, config),
+                lambda r: len(r.typo_map),
+            )
+            solver_result, state = _measure(
+                result,
+                "solver",
+                lambda: run_iterative_solver(typo_result, dict_data, platform, config, False),
+                lambda r: len(r[0].corrections) + len(r[0].patterns),
+            )
+            ranked = _measure(
+                result,
+                "rank_corrections",
+                lambda: apply_platform_ranking(solver_result, state, dict_data, platform, config),
+                len,
+            )
+            _measure(
+                result,
+                "generate_output",
+                lambda: platform.generate_output(ranked, output_dir, config),
+                lambda _: len(ranked),
+            )
+        seconds = time.perf_counter() - start
+    result.stages["end_to_end"] = StageMeasurement(seconds, total_rss.peak / _MB, len(ranked))
+
+    with shared_worker_pool(jobs, resident):
+        _measure_passes(result, typo_result, dict_data, platform, config)
+    return result
@@ -157,6 +157,31 @@ Example config.json:
         action="store_true",
         help="Enable GPU acceleration for substring detection (requires PyTorch)",
     )
+    parser.add_argument(
+        "--index-backend",
+        choices=["dict", "sorted"],
+        default="dict",
+        help="Boundary index storage: 'dict' is fastest, 'sorted' uses far less memory "
+        "(default: dict)",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Record timings of every stage, solver pass, index build and worker task, "
+        "and write them as trace.json (Chrome trace) and trace.csv to the report "
+        "directory (or the current directory without --reports)",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=str,
+        help="Save the generated typos and a solver snapshot after every iteration "
+        "to this directory",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from the snapshots in --checkpoint-dir",
+    )
 
     # Debug tracing
     parser.add_argument(
@@ -11,8 +11,10 @@ from entroppy.core.boundaries import (
 )
 
 from .config import Config, load_config
+from .correction_table import CorrectionMap, CorrectionSet, CorrectionTable
 from .pattern_generalization import generalize_patterns
 from .types import Correction, MatchDirection
+from .typo_store import TypoStore, TypoStoreBuilder
 from .typos import generate_all_typos
 
 __all__ = [
@@ -20,7 +22,12 @@ __all__ = [
     "BoundaryType",
     "Config",
     "Correction",
+    "CorrectionMap",
+    "CorrectionSet",
+    "CorrectionTable",
     "MatchDirection",
+    "TypoStore",
+    "TypoStoreBuilder",
     "load_config",
     "determine_boundaries",
     "format_boundary_display",
@@ -1,5 +1,12 @@
 """Boundary detection and formatting for typo corrections."""
 
+from entroppy.core.boundaries.backends import (
+    INDEX_BACKENDS,
+    DictIndexBackend,
+    IndexBackend,
+    IndexBackendName,
+    SortedIndexBackend,
+)
 from entroppy.core.boundaries.detection import (
     batch_determine_boundaries,
     determine_boundaries,
@@ -9,17 +16,34 @@ from entroppy.core.boundaries.detection import (
 )
 from entroppy.core.boundaries.formatting import format_boundary_display, format_boundary_name
 from entroppy.core.boundaries.parsing import parse_boundary_markers
+from entroppy.core.boundaries.registry import (
+    BoundaryIndexRegistry,
+    get_boundary_index,
+    get_boundary_index_registry,
+    log_boundary_index_stats,
+    set_boundary_index_backend,
+)
 from entroppy.core.boundaries.types import BoundaryIndex, BoundaryType
 
 __all__ = [
+    "INDEX_BACKENDS",
     "BoundaryIndex",
+    "BoundaryIndexRegistry",
     "BoundaryType",
+    "DictIndexBackend",
+    "IndexBackend",
+    "IndexBackendName",
+    "SortedIndexBackend",
     "batch_determine_boundaries",
     "determine_boundaries",
     "format_boundary_display",
     "format_boundary_name",
+    "get_boundary_index",
+    "get_boundary_index_registry",
     "is_substring_of_any",
+    "log_boundary_index_stats",
     "parse_boundary_markers",
+    "set_boundary_index_backend",
     "would_trigger_at_end",
     "would_trigger_at_start",
 ]
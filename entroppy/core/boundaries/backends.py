@@ -0,0 +1,186 @@
+"""Storage backends for BoundaryIndex prefix/suffix queries."""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterator
+import sys
+from typing import Literal
+
+IndexBackendName = Literal["dict", "sorted"]
+
+INDEX_BACKENDS: tuple[str, ...] = ("dict", "sorted")
+
+
+class IndexBackend(ABC):
+    """Storage strategy behind a BoundaryIndex.
+
+    Backends answer prefix and suffix queries over a fixed word set. Substring
+    existence is answered by BoundaryIndex's suffix array for every backend.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def words_with_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield words that start with prefix (including an exact match).
+
+        Args:
+            prefix: Prefix to look up
+
+        Yields:
+            Words starting with prefix
+        """
+
+    @abstractmethod
+    def words_with_suffix(self, suffix: str) -> Iterator[str]:
+        """Yield words that end with suffix (including an exact match).
+
+        Args:
+            suffix: Suffix to look up
+
+        Yields:
+            Words ending with suffix
+        """
+
+    @abstractmethod
+    def memory_footprint(self) -> int:
+        """Estimate the memory used by the backend's own structures.
+
+        Strings shared with the original word set are not counted.
+
+        Returns:
+            Approximate size in bytes
+        """
+
+    def has_prefix_match(self, typo: str) -> bool:
+        """Check if typo is a prefix of any word other than itself."""
+        return any(word != typo for word in self.words_with_prefix(typo))
+
+    def has_suffix_match(self, typo: str) -> bool:
+        """Check if typo is a suffix of any word other than itself."""
+        return any(word != typo for word in self.words_with_suffix(typo))
+
+
+class DictIndexBackend(IndexBackend):
+    """Dict-of-sets backend: O(1) prefix/suffix lookups, one set per prefix/suffix.
+
+    Attributes:
+        prefix_index: Dict mapping prefixes to sets of words starting with that prefix
+        suffix_index: Dict mapping suffixes to sets of words ending with that suffix
+    """
+
+    name = "dict"
+
+    def __init__(self, word_set: set[str] | frozenset[str]) -> None:
+        """Build dict indexes from a word set.
+
+        Args:
+            word_set: Set of words to index
+        """
+        self.prefix_index: dict[str, set[str]] = {}
+        self.suffix_index: dict[str, set[str]] = {}
+
+        for word in word_set:
+            for i in range(1, len(word) + 1):
+                self.prefix_index.setdefault(word[:i], set()).add(word)
+            for i in range(len(word)):
+                self.suffix_index.setdefault(word[i:], set()).add(word)
+
+    def words_with_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield words that start with prefix (including an exact match)."""
+        yield from self.prefix_index.get(prefix, ())
+
+    def words_with_suffix(self, suffix: str) -> Iterator[str]:
+        """Yield words that end with suffix (including an exact match)."""
+        yield from self.suffix_index.get(suffix, ())
+
+    def memory_footprint(self) -> int:
+        """Estimate the memory used by the dicts, their key strings and word sets."""
+        total = sys.getsizeof(self.prefix_index) + sys.getsizeof(self.suffix_index)
+        for index in (self.prefix_index, self.suffix_index):
+            for key, words in index.items():
+                total += sys.getsizeof(key) + sys.getsizeof(words)
+        return total
+
+
+class SortedIndexBackend(IndexBackend):
+    """Compact backend: one sorted array of words and one of reversed words.
+
+    Prefix queries bisect the sorted words; suffix queries bisect the sorted reversed
+    words. Memory is O(total characters), with one extra string per word.
+    """
+
+    name = "sorted"
+
+    def __init__(self, word_set: set[str] | frozenset[str]) -> None:
+        """Build sorted arrays from a word set.
+
+        Args:
+            word_set: Set of words to index
+        """
+        self._words = sorted(word_set)
+        self._reversed_words = sorted(word[::-1] for word in word_set)
+
+    @staticmethod
+    def _iter_with_prefix(array: list[str], prefix: str) -> Iterator[str]:
+        """Yield entries of a sorted array that start with prefix."""
+        if not prefix:
+            return
+        i = bisect_left(array, prefix)
+        while i < len(array) and array[i].startswith(prefix):
+            yield array[i]
+            i += 1
+
+    @staticmethod
+    def _has_longer_with_prefix(array: list[str], prefix: str) -> bool:
+        """Check if a sorted array has an entry that strictly extends prefix."""
+        if not prefix:
+            return False
+        i = bisect_left(array, prefix)
+        # The exact match, if present, sorts first among entries with this prefix
+        if i < len(array) and array[i] == prefix:
+            i += 1
+        return i < len(array) and array[i].startswith(prefix)
+
+    def words_with_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield words that start with prefix (including an exact match)."""
+        yield from self._iter_with_prefix(self._words, prefix)
+
+    def words_with_suffix(self, suffix: str) -> Iterator[str]:
+        """Yield words that end with suffix (including an exact match)."""
+        for reversed_word in self._iter_with_prefix(self._reversed_words, suffix[::-1]):
+            yield reversed_word[::-1]
+
+    def has_prefix_match(self, typo: str) -> bool:
+        """Check if typo is a prefix of any word other than itself."""
+        return self._has_longer_with_prefix(self._words, typo)
+
+    def has_suffix_match(self, typo: str) -> bool:
+        """Check if typo is a suffix of any word other than itself."""
+        return self._has_longer_with_prefix(self._reversed_words, typo[::-1])
+
+    def memory_footprint(self) -> int:
+        """Estimate the memory used by both arrays and the reversed strings."""
+        total = sys.getsizeof(self._words) + sys.getsizeof(self._reversed_words)
+        total += sum(sys.getsizeof(word) for word in self._reversed_words)
+        return total
+
+
+def create_index_backend(name: str, word_set: set[str] | frozenset[str]) -> IndexBackend:
+    """Create an index backend by name.
+
+    Args:
+        name: Backend name ('dict' or 'sorted')
+        word_set: Set of words to index
+
+    Returns:
+        Built IndexBackend
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if name == "dict":
+        return DictIndexBackend(word_set)
+    if name == "sorted":
+        return SortedIndexBackend(word_set)
+    raise ValueError(f"Unknown boundary index backend: {name!r} (expected one of {INDEX_BACKENDS})")
@@ -27,10 +27,8 @@ def _batch_check_substrings(
     substring_val_results = {}
     substring_src_results = {}
     for typo in typos:
-        val_matches = val_suffix_index.find_substring_conflicts(typo)
-        src_matches = src_suffix_index.find_substring_conflicts(typo)
-        substring_val_results[typo] = len(val_matches) > 0
-        substring_src_results[typo] = len(src_matches) > 0
+        substring_val_results[typo] = val_suffix_index.contains_substring(typo)
+        substring_src_results[typo] = src_suffix_index.contains_substring(typo)
 
     return substring_val_results, substring_src_results
 
@@ -51,21 +49,13 @@ def _check_typo_in_wordset(
         True if typo matches any word according to check_type
     """
     if check_type == "substring":
-        return typo in index.substring_set
+        return index.contains_substring(typo)
     if check_type == "prefix":
         # Check if typo is a prefix of any word (excluding exact match)
-        if typo in index.prefix_index:
-            matching_words = index.prefix_index[typo]
-            # Exclude exact match
-            return any(word != typo for word in matching_words)
-        return False
+        return index.backend.has_prefix_match(typo)
     if check_type == "suffix":
         # Check if typo is a suffix of any word (excluding exact match)
-        if typo in index.suffix_index:
-            matching_words = index.suffix_index[typo]
-            # Exclude exact match
-            return any(word != typo for word in matching_words)
-        return False
+        return index.backend.has_suffix_match(typo)
 
     return False
 
@@ -80,15 +70,7 @@ def is_substring_of_any(typo: str, index: BoundaryIndex) -> bool:
     Returns:
         True if typo is a substring of any word (excluding exact matches)
     """
-    # First check the pre-built substring_set for fast lookup
-    if typo in index.substring_set:
-        return True
-    # Also do a direct check against all words in case substring_set is incomplete
-    # This is a fallback for when validation set doesn't include all possible words
-    for word in index.word_set:
-        if typo in word and typo != word:
-            return True
-    return False
+    return index.contains_substring(typo)
 
 
 def would_trigger_at_start(typo: str, index: BoundaryIndex) -> bool:
@@ -0,0 +1,191 @@
+"""Process-wide registry that builds each BoundaryIndex at most once per run."""
+
+from dataclasses import dataclass
+import threading
+
+from loguru import logger
+
+from entroppy.core.boundaries.backends import INDEX_BACKENDS, IndexBackendName
+from entroppy.core.boundaries.types import BoundaryIndex
+from entroppy.utils.tracing import span
+
+
+@dataclass
+class RegistryStats:
+    """Hit/miss counters for the boundary index registry.
+
+    Attributes:
+        hits: Number of lookups served by an already-built index
+        misses: Number of lookups that had to build a new index
+        builds: Number of distinct indexes currently held by the registry
+    """
+
+    hits: int = 0
+    misses: int = 0
+    builds: int = 0
+
+
+class BoundaryIndexRegistry:
+    """Registry of BoundaryIndex instances keyed by word-set content and backend.
+
+    Building a BoundaryIndex over the full validation dictionary is expensive, and the
+    pipeline needs the same index in several places (solver passes, pattern validation,
+    collision resolution, reporting). The registry hands out the same instance for
+    every request over an equal word set.
+
+    Lookups first try the identity of the word set (cheap), then fall back to a
+    content fingerprint so that copies (e.g. frozensets unpickled in workers, or
+    inherited via fork) also share the already-built index.
+
+    Word sets passed to the registry must be treated as read-only afterwards.
+
+    Attributes:
+        default_backend: Backend used when a caller does not request one explicitly
+        stats: Hit/miss counters
+    """
+
+    def __init__(self, default_backend: IndexBackendName = "dict") -> None:
+        """Initialize an empty registry.
+
+        Args:
+            default_backend: Backend used when a caller does not request one explicitly
+        """
+        self._lock = threading.Lock()
+        self.default_backend: IndexBackendName = default_backend
+        # (backend, size, content hash) -> index
+        self._indexes: dict[tuple[str, int, int], BoundaryIndex] = {}
+        # (backend, id(word_set)) -> key, only valid while the index holds the word set
+        self._identity: dict[tuple[str, int], tuple[str, int, int]] = {}
+        self.stats = RegistryStats()
+
+    @staticmethod
+    def _fingerprint(word_set: set[str] | frozenset[str]) -> tuple[int, int]:
+        """Compute a content fingerprint for a word set.
+
+        Args:
+            word_set: Word set to fingerprint
+
+        Returns:
+            Tuple of (size, content hash)
+        """
+        frozen = word_set if isinstance(word_set, frozenset) else frozenset(word_set)
+        return len(frozen), hash(frozen)
+
+    def _lookup_by_identity(
+        self, word_set: set[str] | frozenset[str], backend: str
+    ) -> BoundaryIndex | None:
+        """Return the index built from this exact word set object, if any."""
+        key = self._identity.get((backend, id(word_set)))
+        if key is None:
+            return None
+        index = self._indexes.get(key)
+        if index is None or index.word_set is not word_set or len(word_set) != key[1]:
+            return None
+        return index
+
+    def get(
+        self,
+        word_set: set[str] | frozenset[str],
+        backend: IndexBackendName | None = None,
+    ) -> BoundaryIndex:
+        """Get the shared BoundaryIndex for a word set, building it on first use.
+
+        Args:
+            word_set: Set of words to index
+            backend: Storage backend name (defaults to ``default_backend``)
+
+        Returns:
+            Shared BoundaryIndex for the word set
+        """
+        backend = backend or self.default_backend
+        with self._lock:
+            index = self._lookup_by_identity(word_set, backend)
+            if index is not None:
+                self.stats.hits += 1
+                return index
+
+            key = (backend, *self._fingerprint(word_set))
+            index = self._indexes.get(key)
+            if index is not None and index.word_set == word_set:
+                self.stats.hits += 1
+                return index
+
+            self.stats.misses += 1
+            with span("boundary index build", "index", items=len(word_set), backend=backend):
+                index = BoundaryIndex(word_set, backend=backend)
+            self._indexes[key] = index
+            self._identity[(backend, id(word_set))] = key
+            self.stats.builds = len(self._indexes)
+            return index
+
+    def memory_footprint(self) -> int:
+        """Estimate the memory used by all indexes held by the registry.
+
+        Returns:
+            Approximate size in bytes
+        """
+        with self._lock:
+            indexes = list(self._indexes.values())
+        return sum(index.memory_footprint() for index in indexes)
+
+    def clear(self) -> None:
+        """Drop all cached indexes and reset counters."""
+        with self._lock:
+            self._indexes.clear()
+            self._identity.clear()
+            self.stats = RegistryStats()
+
+
+_registry = BoundaryIndexRegistry()
+
+
+def get_boundary_index(
+    word_set: set[str] | frozenset[str], backend: IndexBackendName | None = None
+) -> BoundaryIndex:
+    """Get the shared BoundaryIndex for a word set from the process-wide registry.
+
+    Args:
+        word_set: Set of words to index
+        backend: Storage backend name (defaults to the configured backend)
+
+    Returns:
+        Shared BoundaryIndex for the word set
+    """
+    return _registry.get(word_set, backend)
+
+
+def set_boundary_index_backend(backend: IndexBackendName) -> None:
+    """Set the backend used for indexes requested without an explicit backend.
+
+    Worker processes started with fork inherit this setting.
+
+    Args:
+        backend: Storage backend name ('dict' or 'sorted')
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if backend not in INDEX_BACKENDS:
+        raise ValueError(
+            f"Unknown boundary index backend: {backend!r} (expected one of {INDEX_BACKENDS})"
+        )
+    _registry.default_backend = backend
+
+
+def get_boundary_index_registry() -> BoundaryIndexRegistry:
+    """Get the process-wide boundary index registry.
+
+    Returns:
+        The BoundaryIndexRegistry singleton
+    """
+    return _registry
+
+
+def log_boundary_index_stats() -> None:
+    """Log hit/miss counters for the process-wide boundary index registry."""
+    stats = _registry.stats
+    footprint_mb = _registry.memory_footprint() / (1024 * 1024)
+    logger.info(
+        f"  Boundary index registry ({_registry.default_backend}): {stats.builds} built, "
+        f"{stats.hits} hits, {stats.misses} misses, ~{footprint_mb:,.1f} MB"
+    )
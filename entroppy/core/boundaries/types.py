@@ -1,7 +1,9 @@
 """Boundary types and index classes."""
 
+from collections.abc import Iterator
 from enum import Enum
 
+from entroppy.core.boundaries.backends import IndexBackend, IndexBackendName, create_index_backend
 from entroppy.utils.suffix_array import SubstringIndex
 
 
@@ -21,55 +23,64 @@ class BoundaryIndex:
     linear searches through word sets. Provides O(1) or O(log n) lookups
     instead of O(n) linear scans.
 
+    Prefix/suffix storage is delegated to a backend (see ``backends.py``): ``dict``
+    keeps dict-of-sets indexes; ``sorted`` keeps two sorted arrays answered with bisect.
+    Substring existence is always answered by the suffix array.
+
     Attributes:
-        prefix_index: Dict mapping prefixes to sets of words starting with that prefix
-        suffix_index: Dict mapping suffixes to sets of words ending with that suffix
-        substring_set: Set of all substrings (excluding exact matches) from all words
         word_set: Original word set for reference
+        backend: Storage backend answering prefix/suffix queries
         _suffix_array_index: Cached suffix array index for O(log N) substring queries
     """
 
-    def _build_prefix_index(self, word: str) -> None:
-        """Build prefix index entries for a word."""
-        for i in range(1, len(word) + 1):
-            prefix = word[:i]
-            if prefix not in self.prefix_index:
-                self.prefix_index[prefix] = set()
-            self.prefix_index[prefix].add(word)
-
-    def _build_suffix_index(self, word: str) -> None:
-        """Build suffix index entries for a word."""
-        for i in range(len(word)):
-            suffix = word[i:]
-            if suffix not in self.suffix_index:
-                self.suffix_index[suffix] = set()
-            self.suffix_index[suffix].add(word)
-
-    def _build_substring_set(self, word: str) -> None:
-        """Build substring set entries for a word."""
-        for i in range(len(word)):
-            for j in range(i + 1, len(word) + 1):
-                substring = word[i:j]
-                if substring != word:  # Exclude exact matches
-                    self.substring_set.add(substring)
-
-    def __init__(self, word_set: set[str] | frozenset[str]) -> None:
+    def __init__(
+        self, word_set: set[str] | frozenset[str], backend: IndexBackendName = "dict"
+    ) -> None:
         """Build indexes from a word set.
 
         Args:
             word_set: Set of words to build indexes from
+            backend: Storage backend name ('dict' or 'sorted')
         """
         self.word_set = word_set
-        self.prefix_index: dict[str, set[str]] = {}
-        self.suffix_index: dict[str, set[str]] = {}
-        self.substring_set: set[str] = set()
+        self.backend: IndexBackend = create_index_backend(backend, word_set)
         self._suffix_array_index: SubstringIndex | None = None  # Lazy init for suffix array
 
-        # Build indexes for each word
-        for word in word_set:
-            self._build_prefix_index(word)
-            self._build_suffix_index(word)
-            self._build_substring_set(word)
+    def words_with_prefix(self, prefix: str) -> Iterator[str]:
+        """Yield words that start with prefix (including an exact match).
+
+        Args:
+            prefix: Prefix to look up
+
+        Yields:
+            Words starting with prefix
+        """
+        return self.backend.words_with_prefix(prefix)
+
+    def words_with_suffix(self, suffix: str) -> Iterator[str]:
+        """Yield words that end with suffix (including an exact match).
+
+        Args:
+            suffix: Suffix to look up
+
+        Yields:
+            Words ending with suffix
+        """
+        return self.backend.words_with_suffix(suffix)
+
+    def contains_substring(self, typo: str) -> bool:
+        """Check if typo is a substring of any word other than itself.
+
+        Uses the suffix array's early-exit existence query, so a miss is
+        O(|typo| log N) rather than a scan over the word set.
+
+        Args:
+            typo: The typo string to check
+
+        Returns:
+            True if typo appears inside some word that is not typo itself
+        """
+        return self.get_suffix_array_index().contains_substring(typo)
 
     def batch_check_start(self, typos: list[str]) -> dict[str, bool]:
         """Batch check if typos appear as prefixes of any word.
@@ -80,15 +91,8 @@ class BoundaryIndex:
         Returns:
             Dict mapping typo -> True if it appears as a prefix (excluding exact matches)
         """
-        results: dict[str, bool] = {}
-        for typo in typos:
-            if typo in self.prefix_index:
-                matching_words = self.prefix_index[typo]
-                # Exclude exact match
-                results[typo] = any(word != typo for word in matching_words)
-            else:
-                results[typo] = False
-        return results
+        has_prefix_match = self.backend.has_prefix_match
+        return {typo: has_prefix_match(typo) for typo in typos}
 
     def batch_check_end(self, typos: list[str]) -> dict[str, bool]:
         """Batch check if typos appear as suffixes of any word.
@@ -99,15 +103,19 @@ class BoundaryIndex:
         Returns:
             Dict mapping typo -> True if it appears as a suffix (excluding exact matches)
         """
-        results: dict[str, bool] = {}
-        for typo in typos:
-            if typo in self.suffix_index:
-                matching_words = self.suffix_index[typo]
-                # Exclude exact match
-                results[typo] = any(word != typo for word in matching_words)
-            else:
-                results[typo] = False
-        return results
+        has_suffix_match = self.backend.has_suffix_match
+        return {typo: has_suffix_match(typo) for typo in typos}
+
+    def memory_footprint(self) -> int:
+        """Estimate the memory used by this index's structures.
+
+        Covers the backend structures only; the word set itself and the lazily built
+        suffix array (which lives in Rust memory) are not counted.
+
+        Returns:
+            Approximate size in bytes
+        """
+        return self.backend.memory_footprint()
 
     def get_suffix_array_index(self) -> SubstringIndex:
         """Get or build cached suffix array index.
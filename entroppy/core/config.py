@@ -41,6 +41,16 @@ class Config(BaseModel):
         False, description="Generate typos for ALL english-words (not just top-n)"
     )
     use_gpu: bool = Field(False, description="Enable GPU acceleration for substring detection")
+    index_backend: Literal["dict", "sorted"] = Field(
+        "dict", description="Boundary index storage: 'dict' (fastest) or 'sorted' (compact)"
+    )
+    trace: bool = Field(
+        False, description="Write a Chrome trace and CSV of stage, pass and worker timings"
+    )
+    checkpoint_dir: str | None = Field(
+        None, description="Directory for Stage 2 and per-iteration solver checkpoints"
+    )
+    resume: bool = Field(False, description="Resume from the checkpoints in checkpoint_dir")
 
     # Debug tracing
     debug_words: set[str] = Field(default_factory=set, description="Exact word matches only")
@@ -82,6 +92,8 @@ class Config(BaseModel):
             )
         if self.platform == "qmk" and not self.max_corrections:
             raise ValueError("max_corrections is required for QMK platform")
+        if self.resume and not self.checkpoint_dir:
+            raise ValueError("resume requires checkpoint_dir")
         return self
 
     model_config = {
@@ -157,6 +169,10 @@ def _build_config_dict(cli_args, parser: ArgumentParser, json_config: dict) -> d
         "debug_corrections": cli_args.debug_corrections
         or json_config.get("debug_corrections", False),
         "use_gpu": cli_args.gpu or json_config.get("use_gpu", False),
+        "index_backend": get_value("index_backend", "dict"),
+        "trace": cli_args.trace or json_config.get("trace", False),
+        "checkpoint_dir": get_value("checkpoint_dir", None),
+        "resume": cli_args.resume or json_config.get("resume", False),
     }
 
 
@@ -0,0 +1,270 @@
+"""Interned integer keys for corrections.
+
+A Correction is a ``(typo, word, BoundaryType)`` tuple. Hashing it means hashing two
+strings and an Enum, and each stored tuple costs three object references plus the
+tuple itself. The solver keeps hundreds of thousands of them in sets and dicts, so
+DictionaryState stores corrections as single packed ints instead. Solver passes test
+membership and iterate on the int keys (``CorrectionSet.keys``,
+``CorrectionMap.entries``) and decode a key only when they need its strings; the
+tuple-facing set and mapping interfaces are for the edges (reports, platform output,
+tests), where decoding every key is acceptable.
+"""
+
+from collections.abc import Iterable, Iterator, MutableMapping, MutableSet, ValuesView
+from typing import TypeVar
+
+from entroppy.core.boundaries import BoundaryType
+from entroppy.core.types import Correction
+
+# Boundary types in code order; the code of a boundary is its position here
+BOUNDARIES: tuple[BoundaryType, ...] = tuple(BoundaryType)
+BOUNDARY_CODES: dict[BoundaryType, int] = {b: code for code, b in enumerate(BOUNDARIES)}
+
+# Key layout (63 bits): typo id (30 bits) | word id (30 bits) | boundary code (3 bits)
+_BOUNDARY_BITS = 3
+_ID_BITS = 30
+_ID_MASK = (1 << _ID_BITS) - 1
+_BOUNDARY_MASK = (1 << _BOUNDARY_BITS) - 1
+_WORD_SHIFT = _BOUNDARY_BITS
+_TYPO_SHIFT = _BOUNDARY_BITS + _ID_BITS
+
+T = TypeVar("T")
+V = TypeVar("V")
+
+
+class CorrectionTable:
+    """Interns typo and word strings and packs corrections into int64 keys.
+
+    Typos and words share one string table, since pattern typos and words often
+    reappear as parts of other corrections.
+    """
+
+    __slots__ = ("_strings", "_ids")
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._strings: list[str] = []
+        self._ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of interned strings."""
+        return len(self._strings)
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> "CorrectionTable":
+        """Rebuild a table from the strings of another, so its keys decode the same.
+
+        Args:
+            strings: Interned strings in ID order, as returned by strings()
+
+        Returns:
+            The table
+        """
+        table = cls()
+        for value in strings:
+            table._intern(value)
+        return table
+
+    def strings(self) -> list[str]:
+        """Copy the interned strings, in ID order."""
+        return list(self._strings)
+
+    def _intern(self, value: str) -> int:
+        """Get the ID for a string, assigning the next free one on first sight."""
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            if string_id > _ID_MASK:
+                raise OverflowError("Correction table is full")
+            self._ids[value] = string_id
+            self._strings.append(value)
+        return string_id
+
+    def encode(self, correction: Correction) -> int:
+        """Get the key for a correction, interning its strings if needed.
+
+        Args:
+            correction: (typo, word, boundary) tuple
+
+        Returns:
+            Packed integer key
+        """
+        typo, word, boundary = correction
+        return (
+            (self._intern(typo) << _TYPO_SHIFT)
+            | (self._intern(word) << _WORD_SHIFT)
+            | BOUNDARY_CODES[boundary]
+        )
+
+    def lookup(self, correction: object) -> int | None:
+        """Get the key for a correction without interning anything.
+
+        Args:
+            correction: Object to look up (normally a (typo, word, boundary) tuple)
+
+        Returns:
+            Packed integer key, or None if the correction cannot have been encoded
+        """
+        if not isinstance(correction, tuple) or len(correction) != 3:
+            return None
+        typo, word, boundary = correction
+        typo_id = self._ids.get(typo)
+        word_id = self._ids.get(word)
+        code = BOUNDARY_CODES.get(boundary)
+        if typo_id is None or word_id is None or code is None:
+            return None
+        return (typo_id << _TYPO_SHIFT) | (word_id << _WORD_SHIFT) | code
+
+    def decode(self, key: int) -> Correction:
+        """Convert a key back into a (typo, word, boundary) tuple.
+
+        Args:
+            key: Packed integer key from encode()
+
+        Returns:
+            The correction tuple
+        """
+        return (
+            self._strings[key >> _TYPO_SHIFT],
+            self._strings[(key >> _WORD_SHIFT) & _ID_MASK],
+            BOUNDARIES[key & _BOUNDARY_MASK],
+        )
+
+    def typo_of(self, key: int) -> str:
+        """Get the typo string of a key without building the full tuple.
+
+        Args:
+            key: Packed integer key from encode()
+
+        Returns:
+            The typo string
+        """
+        return self._strings[key >> _TYPO_SHIFT]
+
+
+class CorrectionSet(MutableSet[Correction]):
+    """Set of corrections stored as packed int keys.
+
+    Behaves like ``set[Correction]``: membership tests, add/remove and iteration all
+    take and yield (typo, word, boundary) tuples. Each of these encodes or decodes a
+    key, so solver code works on ``keys`` directly and leaves the tuple interface to
+    reports and output.
+
+    Attributes:
+        table: Table used to encode and decode keys
+        keys: The underlying set of packed keys
+    """
+
+    __slots__ = ("table", "keys")
+
+    def __init__(self, table: CorrectionTable, corrections: Iterable[Correction] = ()) -> None:
+        """Initialize the set.
+
+        Args:
+            table: Table used to encode and decode keys
+            corrections: Initial contents
+        """
+        self.table = table
+        self.keys: set[int] = {table.encode(c) for c in corrections}
+
+    def __contains__(self, correction: object) -> bool:
+        """Check if a correction is in the set."""
+        key = self.table.lookup(correction)
+        return key is not None and key in self.keys
+
+    def __iter__(self) -> Iterator[Correction]:
+        """Iterate over corrections as tuples."""
+        return map(self.table.decode, self.keys)
+
+    def __len__(self) -> int:
+        """Number of corrections in the set."""
+        return len(self.keys)
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[T]) -> set[T]:
+        """Build the result of set operators (``|``, ``-``, ...) as a plain set."""
+        return set(it)
+
+    def add(self, value: Correction) -> None:
+        """Add a correction."""
+        self.keys.add(self.table.encode(value))
+
+    def discard(self, value: Correction) -> None:
+        """Remove a correction if present."""
+        key = self.table.lookup(value)
+        if key is not None:
+            self.keys.discard(key)
+
+    def typos(self) -> Iterator[str]:
+        """Iterate over the typo of each correction without building tuples."""
+        typo_of = self.table.typo_of
+        return (typo_of(key) for key in self.keys)
+
+
+class CorrectionMap(MutableMapping[Correction, V]):
+    """Dict keyed by corrections, stored with packed int keys.
+
+    Behaves like ``dict[Correction, V]`` for callers. As with CorrectionSet, solver
+    code uses ``entries`` directly.
+
+    Attributes:
+        table: Table used to encode and decode keys
+        entries: The underlying dict from packed keys to values
+    """
+
+    __slots__ = ("table", "entries")
+
+    def __init__(self, table: CorrectionTable) -> None:
+        """Initialize an empty map.
+
+        Args:
+            table: Table used to encode and decode keys
+        """
+        self.table = table
+        self.entries: dict[int, V] = {}
+
+    def __getitem__(self, correction: Correction) -> V:
+        """Get the value for a correction.
+
+        Raises:
+            KeyError: If the correction is not in the map
+        """
+        key = self.table.lookup(correction)
+        if key is None:
+            raise KeyError(correction)
+        try:
+            return self.entries[key]
+        except KeyError:
+            raise KeyError(correction) from None
+
+    def __setitem__(self, correction: Correction, value: V) -> None:
+        """Set the value for a correction."""
+        self.entries[self.table.encode(correction)] = value
+
+    def __delitem__(self, correction: Correction) -> None:
+        """Delete a correction from the map.
+
+        Raises:
+            KeyError: If the correction is not in the map
+        """
+        key = self.table.lookup(correction)
+        if key is None or key not in self.entries:
+            raise KeyError(correction)
+        del self.entries[key]
+
+    def __contains__(self, correction: object) -> bool:
+        """Check if a correction is in the map."""
+        key = self.table.lookup(correction)
+        return key is not None and key in self.entries
+
+    def __iter__(self) -> Iterator[Correction]:
+        """Iterate over corrections as tuples, in insertion order."""
+        return map(self.table.decode, self.entries)
+
+    def __len__(self) -> int:
+        """Number of entries in the map."""
+        return len(self.entries)
+
+    def values(self) -> ValuesView[V]:
+        """View of the values, without decoding any keys."""
+        return self.entries.values()
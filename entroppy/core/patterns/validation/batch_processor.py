@@ -1,12 +1,11 @@
 """Batch processing for pattern validation."""
 
-from multiprocessing import Pool
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 from tqdm import tqdm
 
-from entroppy.core.boundaries import BoundaryIndex, BoundaryType
+from entroppy.core.boundaries import BoundaryType, get_boundary_index
 from entroppy.core.patterns.indexes import CorrectionIndex, ValidationIndexes
 from entroppy.core.patterns.logging import (
     is_debug_pattern,
@@ -35,6 +34,7 @@ from entroppy.core.patterns.validation.worker import (
 )
 from entroppy.core.types import Correction, MatchDirection
 from entroppy.utils.debug import is_debug_correction
+from entroppy.utils.worker_pool import borrow_pool
 
 if TYPE_CHECKING:
     from entroppy.utils.debug import DebugTypoMatcher
@@ -377,7 +377,7 @@ def run_parallel_validation(
     # Pre-build indexes once in main process (not in workers)
     if verbose:
         logger.info("  Pre-building validation indexes...")
-    validation_index = BoundaryIndex(validation_set)
+    validation_index = get_boundary_index(validation_set)
     correction_index = CorrectionIndex(corrections)  # Lightweight - just stores list
 
     # Extract all unique typo patterns
@@ -408,11 +408,8 @@ def run_parallel_validation(
     if verbose:
         logger.info("  Initializing workers (thin worker architecture - no index building)...")
 
-    with Pool(
-        processes=jobs,
-        initializer=init_pattern_validation_worker,
-        initargs=(context,),
-    ) as pool:
+    with borrow_pool(jobs) as pool:
+        pool.broadcast(init_pattern_validation_worker, context)
         pattern_items = list(patterns_to_validate.items())
         results_iter = pool.imap_unordered(_validate_single_pattern_worker, pattern_items)
 
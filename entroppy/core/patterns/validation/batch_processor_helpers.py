@@ -1,5 +1,6 @@
 """Helper functions for batch pattern validation."""
 
+import functools
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
@@ -8,7 +9,7 @@ from entroppy.core.boundaries import BoundaryIndex, BoundaryType
 from entroppy.core.patterns.logging import is_debug_pattern, process_rejected_pattern
 from entroppy.core.patterns.validation.conflicts import check_pattern_redundant_with_other_patterns
 from entroppy.core.types import Correction, MatchDirection
-from entroppy.rust_ext import batch_check_patterns  # pylint: disable=no-name-in-module
+from entroppy.rust_ext import RustBoundaryAnchorIndex  # pylint: disable=no-name-in-module
 from entroppy.utils.debug import is_debug_correction
 
 if TYPE_CHECKING:
@@ -208,6 +209,23 @@ def _remove_redundant_patterns_post_process(
     )
 
 
+# Source words are fixed for a run, so the anchor index is built once per direction
+@functools.lru_cache(maxsize=4)
+def _get_boundary_anchor_index(
+    source_words: frozenset[str], match_direction: MatchDirection
+) -> RustBoundaryAnchorIndex:
+    """Get the boundary-anchored Rust index for source words, building it on first use.
+
+    Args:
+        source_words: Frozen set of source words
+        match_direction: Platform match direction
+
+    Returns:
+        RustBoundaryAnchorIndex over the source words
+    """
+    return RustBoundaryAnchorIndex(list(source_words), match_direction.value)
+
+
 def _precalculate_would_corrupt_patterns(
     all_patterns: list[str],
     source_words: set[str],
@@ -228,12 +246,9 @@ def _precalculate_would_corrupt_patterns(
     if verbose:
         logger.info("  Pre-calculating pattern corruption checks...")
 
-    # Use Rust batch_check_patterns
-    would_corrupt_results = batch_check_patterns(
-        all_patterns,
-        list(source_words),
-        match_direction.value,
-    )
+    # One binary search per pattern over boundary-anchored suffixes (GIL released)
+    anchor_index = _get_boundary_anchor_index(frozenset(source_words), match_direction)
+    would_corrupt_results = anchor_index.would_corrupt_batch(all_patterns)
     # Build set of patterns that would corrupt
     return frozenset(
         pattern
@@ -266,10 +281,9 @@ def _precalculate_validation_checks(
 
     # Get substring checks using suffix array (O(log N) per query)
     suffix_index = validation_index.get_suffix_array_index()
-    substring_results = {}
-    for pattern in all_patterns:
-        matches = suffix_index.find_substring_conflicts(pattern)
-        substring_results[pattern] = len(matches) > 0
+    substring_results = {
+        pattern: suffix_index.contains_substring(pattern) for pattern in all_patterns
+    }
 
     # Build validation_checks dict from batch results
     validation_checks: dict[str, dict[str, bool]] = {}
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Callable
 
 from loguru import logger
 
-from entroppy.core.boundaries import BoundaryIndex, BoundaryType
+from entroppy.core.boundaries import BoundaryType, get_boundary_index
 from entroppy.core.patterns.extraction import find_prefix_patterns, find_suffix_patterns
 from entroppy.core.patterns.indexes import CorrectionIndex, SourceWordIndex, ValidationIndexes
 from entroppy.core.types import Correction, MatchDirection
@@ -32,7 +32,7 @@ def build_validation_indexes(
         ValidationIndexes containing all built indexes
     """
     return ValidationIndexes(
-        validation_index=BoundaryIndex(validation_set),
+        validation_index=get_boundary_index(validation_set),
         source_word_index=SourceWordIndex(source_words, match_direction),
         correction_index=CorrectionIndex(corrections),
     )
@@ -161,12 +161,10 @@ def _find_example_prefix_match(
     Returns:
         An example word that starts with the pattern, or None if not found
     """
-    if typo_pattern in validation_index.prefix_index:
-        matching_words = validation_index.prefix_index[typo_pattern]
-        # Exclude exact match and return first example
-        for word in matching_words:
-            if word != typo_pattern and word in validation_set:
-                return word
+    # Exclude exact match and return first example
+    for word in validation_index.words_with_prefix(typo_pattern):
+        if word != typo_pattern and word in validation_set:
+            return word
     return None
 
 
@@ -183,17 +181,15 @@ def _find_example_suffix_match(
     Returns:
         An example word that ends with the pattern, or None if not found
     """
-    if typo_pattern in validation_index.suffix_index:
-        matching_words = validation_index.suffix_index[typo_pattern]
-        # Exclude exact match and return first example
-        for word in matching_words:
-            if word != typo_pattern and word in validation_set:
-                return word
+    # Exclude exact match and return first example
+    for word in validation_index.words_with_suffix(typo_pattern):
+        if word != typo_pattern and word in validation_set:
+            return word
     return None
 
 
 def _check_validation_word_conflicts(
-    typo_pattern: str, validation_set: set[str]
+    typo_pattern: str, validation_set: set[str] | frozenset[str]
 ) -> tuple[bool, str | None]:
     """Check if pattern conflicts with validation words."""
     if typo_pattern in validation_set:
@@ -201,7 +197,9 @@ def _check_validation_word_conflicts(
     return True, None
 
 
-def _find_example_word_with_substring(typo_pattern: str, validation_set: set[str]) -> str | None:
+def _find_example_word_with_substring(
+    typo_pattern: str, validation_set: set[str] | frozenset[str]
+) -> str | None:
     """Find an example validation word containing the pattern as a substring.
 
     Args:
@@ -133,7 +133,7 @@ def _check_pattern_validation_and_conflicts(
 
     is_safe, conflict_error = _check_pattern_conflicts_with_precalc(
         typo_pattern,
-        set(context.validation_set),
+        context.validation_set,
         match_direction,
         boundary,
         target_words=target_words,
@@ -246,7 +246,7 @@ def _validate_single_pattern_worker(
 
 def _check_end_boundary_conflict(
     typo_pattern: str,
-    validation_set: set[str],
+    validation_set: set[str] | frozenset[str],
     boundary: BoundaryType,
     validation_checks: dict[str, bool],
 ) -> tuple[bool, str | None]:
@@ -283,7 +283,7 @@ def _check_end_boundary_conflict(
 
 def _check_start_boundary_conflict(
     typo_pattern: str,
-    validation_set: set[str],
+    validation_set: set[str] | frozenset[str],
     boundary: BoundaryType,
     validation_checks: dict[str, bool],
 ) -> tuple[bool, str | None]:
@@ -320,7 +320,7 @@ def _check_start_boundary_conflict(
 
 def _check_substring_conflict(
     typo_pattern: str,
-    validation_set: set[str],
+    validation_set: set[str] | frozenset[str],
     boundary: BoundaryType,
     validation_checks: dict[str, bool],
 ) -> tuple[bool, str | None]:
@@ -358,7 +358,7 @@ def _check_substring_conflict(
 
 def _check_pattern_conflicts_with_precalc(
     typo_pattern: str,
-    validation_set: set[str],
+    validation_set: set[str] | frozenset[str],
     match_direction: MatchDirection,
     boundary: BoundaryType,
     target_words: set[str] | None,
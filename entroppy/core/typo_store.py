@@ -0,0 +1,194 @@
+"""Columnar, integer-interned store of (typo, word) pairs from typo generation."""
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+
+
+class TypoStoreBuilder:
+    """Accumulates (typo, word) pairs and packs them into a TypoStore.
+
+    Typos and words are interned to integer IDs as they arrive; pairs are kept as two
+    parallel uint32 columns until build() groups them by typo. The builder hands its
+    string tables to the store, so it must not be used after build().
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty builder."""
+        self._typos: list[str] = []
+        self._typo_ids: dict[str, int] = {}
+        self._words: list[str] = []
+        self._word_ids: dict[str, int] = {}
+        self._pair_typos = array("I")
+        self._pair_words = array("I")
+
+    @staticmethod
+    def _intern(value: str, values: list[str], ids: dict[str, int]) -> int:
+        """Get the ID for a string, assigning the next free one on first sight."""
+        value_id = ids.get(value)
+        if value_id is None:
+            value_id = len(values)
+            ids[value] = value_id
+            values.append(value)
+        return value_id
+
+    def add(self, typo: str, word: str) -> None:
+        """Add one (typo, word) pair.
+
+        Args:
+            typo: The typo string
+            word: The correct word it was generated from
+        """
+        self._pair_typos.append(self._intern(typo, self._typos, self._typo_ids))
+        self._pair_words.append(self._intern(word, self._words, self._word_ids))
+
+    def add_pairs(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Add many (typo, word) pairs.
+
+        Args:
+            pairs: Iterable of (typo, word) tuples
+        """
+        for typo, word in pairs:
+            self.add(typo, word)
+
+    def build(self) -> "TypoStore":
+        """Group the pairs by typo into a CSR layout.
+
+        Uses a stable counting sort, so each typo's words keep their insertion order and
+        typos keep first-seen order, matching a dict built with setdefault/append.
+
+        Returns:
+            Packed TypoStore
+        """
+        typo_count = len(self._typos)
+        offsets = array("I", bytes(4 * (typo_count + 1)))
+        for typo_id in self._pair_typos:
+            offsets[typo_id + 1] += 1
+        for i in range(typo_count):
+            offsets[i + 1] += offsets[i]
+
+        cursor = array("I", offsets[:-1])
+        word_column = array("I", bytes(4 * len(self._pair_words)))
+        for typo_id, word_id in zip(self._pair_typos, self._pair_words):
+            word_column[cursor[typo_id]] = word_id
+            cursor[typo_id] += 1
+
+        return TypoStore(self._typos, self._typo_ids, self._words, offsets, word_column)
+
+
+class TypoStore(Mapping[str, list[str]]):
+    """Read-only typo -> words map backed by interned IDs and packed columns.
+
+    Equivalent to the ``dict[str, list[str]]`` typo map Stage 2 used to build, but
+    each pair costs 4 bytes in a uint32 column instead of a list slot, and each
+    distinct word string is stored once. Words for typo ``t`` are
+    ``word_column[offsets[id(t)]:offsets[id(t) + 1]]``.
+
+    Implements the Mapping protocol, so existing ``items()``, ``get()``, ``in`` and
+    ``[typo]`` callers work unchanged; ``[typo]`` materialises a fresh list.
+    """
+
+    __slots__ = ("_typos", "_typo_ids", "_words", "_offsets", "_word_column")
+
+    def __init__(
+        self,
+        typos: list[str],
+        typo_ids: dict[str, int],
+        words: list[str],
+        offsets: array,
+        word_column: array,
+    ) -> None:
+        """Initialize from packed columns (use TypoStoreBuilder or from_mapping).
+
+        Args:
+            typos: Typo strings by typo ID
+            typo_ids: Typo string -> typo ID
+            words: Word strings by word ID
+            offsets: uint32 CSR offsets, one more entry than typos
+            word_column: uint32 word IDs grouped by typo
+        """
+        self._typos = typos
+        self._typo_ids = typo_ids
+        self._words = words
+        self._offsets = offsets
+        self._word_column = word_column
+
+    @classmethod
+    def from_mapping(cls, typo_map: Mapping[str, Iterable[str]]) -> "TypoStore":
+        """Build a store from a plain typo -> words mapping.
+
+        Args:
+            typo_map: Mapping of typos to word lists
+
+        Returns:
+            Packed TypoStore with the same contents (typos with no words are dropped)
+        """
+        if isinstance(typo_map, TypoStore):
+            return typo_map
+        builder = TypoStoreBuilder()
+        for typo, words in typo_map.items():
+            for word in words:
+                builder.add(typo, word)
+        return builder.build()
+
+    def __getstate__(self) -> tuple[list[str], list[str], bytes, bytes]:
+        """Pickle the string tables and raw column bytes (the typo ID map is rebuilt)."""
+        return self._typos, self._words, self._offsets.tobytes(), self._word_column.tobytes()
+
+    def __setstate__(self, state: tuple[list[str], list[str], bytes, bytes]) -> None:
+        """Restore from pickled state."""
+        self._typos, self._words, offsets, word_column = state
+        self._typo_ids = {typo: i for i, typo in enumerate(self._typos)}
+        self._offsets = array("I")
+        self._offsets.frombytes(offsets)
+        self._word_column = array("I")
+        self._word_column.frombytes(word_column)
+
+    def __len__(self) -> int:
+        """Number of distinct typos."""
+        return len(self._typos)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over typos in first-seen order."""
+        return iter(self._typos)
+
+    def __contains__(self, typo: object) -> bool:
+        """Check if a typo is stored."""
+        return typo in self._typo_ids
+
+    def __getitem__(self, typo: str) -> list[str]:
+        """Get the words a typo was generated from, in insertion order.
+
+        Raises:
+            KeyError: If the typo is not stored
+        """
+        return self._words_for_id(self._typo_ids[typo])
+
+    def _words_for_id(self, typo_id: int) -> list[str]:
+        """Materialise the word list for a typo ID."""
+        words = self._words
+        start, end = self._offsets[typo_id], self._offsets[typo_id + 1]
+        return [words[word_id] for word_id in self._word_column[start:end]]
+
+    def unique_words(self, typo: str) -> list[str]:
+        """Get the distinct words for a typo, in first-seen order.
+
+        Args:
+            typo: The typo to look up
+
+        Returns:
+            List of distinct words (empty if the typo is not stored)
+        """
+        typo_id = self._typo_ids.get(typo)
+        if typo_id is None:
+            return []
+        return list(dict.fromkeys(self._words_for_id(typo_id)))
+
+    @property
+    def pair_count(self) -> int:
+        """Total number of (typo, word) pairs."""
+        return len(self._word_column)
+
+    @property
+    def distinct_word_count(self) -> int:
+        """Number of distinct words referenced by any typo."""
+        return len(self._words)
@@ -2,22 +2,33 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from re import Pattern
 
 from entroppy.core import BoundaryType, Correction, parse_boundary_markers
 from entroppy.matching.pattern_matcher import PatternMatcher
+from entroppy.matching.wildcard_index import WildcardIndex
 from entroppy.utils import compile_wildcard_regex
 
+# Word patterns are shared by many rules and checked once per candidate correction
+_compile_word_pattern = lru_cache(maxsize=None)(compile_wildcard_regex)
+
 
 class ExclusionMatcher:
-    """Handle exclusion patterns with wildcards."""
+    """Handle exclusion patterns with wildcards.
+
+    Wildcard typo -> word rules are indexed by their typo pattern in one WildcardIndex,
+    so checking a correction only looks at the rules whose typo pattern matches.
+    """
 
     def __init__(self, exclusion_set: set[str]) -> None:
         """Initialize ExclusionMatcher with exclusion patterns."""
         self.exact = set()
         self.wildcards = []
         self.exact_typo_map: dict[str, tuple[str, BoundaryType | None]] = {}
-        self.wildcard_typo_map: list[tuple[Pattern, str, BoundaryType | None]] = []
+        # (original rule, word pattern, required boundary), indexed by typo_index
+        self.wildcard_typo_rules: list[tuple[str, str, BoundaryType | None]] = []
+        wildcard_typo_patterns: list[str] = []
 
         # Collect word-only exclusion patterns
         word_only_patterns = set()
@@ -29,7 +40,7 @@ class ExclusionMatcher:
                 self.exact.add(exclusion)
 
         # e.g., "accel* -> accelerate" or ":*ing -> *in"
-        for pattern in exclusion_set:
+        for pattern in sorted(exclusion_set):
             if "->" in pattern:
                 typo_pat, word_pat = (p.strip() for p in pattern.split("->", 1))
 
@@ -37,14 +48,16 @@ class ExclusionMatcher:
                 typo_pat, required_boundary = parse_boundary_markers(typo_pat)
 
                 if "*" in typo_pat:
-                    regex = compile_wildcard_regex(typo_pat)
-                    self.wildcard_typo_map.append((regex, word_pat, required_boundary))
+                    wildcard_typo_patterns.append(typo_pat)
+                    self.wildcard_typo_rules.append((pattern, word_pat, required_boundary))
                 else:
                     self.exact_typo_map[typo_pat] = (word_pat, required_boundary)
             else:
                 # These are word-only exclusions (e.g., "*ball") used for dictionary filtering
                 word_only_patterns.add(pattern)
 
+        self.typo_index = WildcardIndex(wildcard_typo_patterns)
+
         # Use PatternMatcher for word-only exclusions
         self.word_pattern_matcher = PatternMatcher(word_only_patterns)
 
@@ -52,9 +65,28 @@ class ExclusionMatcher:
         """Helper to match a string against a simple wildcard pattern."""
         if "*" not in pattern:
             return text == pattern
-        regex = compile_wildcard_regex(pattern)
+        regex: Pattern = _compile_word_pattern(pattern)
         return regex.match(text) is not None
 
+    def _matching_wildcard_rule(self, correction: Correction) -> str | None:
+        """Find the first wildcard typo -> word rule excluding a correction.
+
+        Args:
+            correction: (typo, word, boundary) to check
+
+        Returns:
+            The original rule text, or None if no wildcard rule matches
+        """
+        typo, word, boundary = correction
+        for rule_id in self.typo_index.matching(typo):
+            rule, word_pat, required_boundary = self.wildcard_typo_rules[rule_id]
+            # If boundary is specified, it must match
+            if required_boundary is not None and required_boundary != boundary:
+                continue
+            if self._match_wildcard(word, word_pat):
+                return rule
+        return None
+
     def should_exclude(self, correction: Correction) -> bool:
         """Check if a (typo, word) correction should be excluded."""
         typo, word, boundary = correction
@@ -68,13 +100,7 @@ class ExclusionMatcher:
                     return True
 
         # Check for wildcard typo -> word match, e.g., "accel* -> accelerate"
-        for typo_re, word_pat, required_boundary in self.wildcard_typo_map:
-            if typo_re.match(typo) and self._match_wildcard(word, word_pat):
-                # If boundary is specified, it must match
-                if required_boundary is None or required_boundary == boundary:
-                    return True
-
-        return False
+        return self._matching_wildcard_rule(correction) is not None
 
     def get_matching_rule(self, correction: Correction) -> str:
         """Get the exclusion rule that matches this correction (for reporting)."""
@@ -88,17 +114,8 @@ class ExclusionMatcher:
                 return f"{typo} -> {word_pat}"
 
         # Check for wildcard typo -> word match
-        for typo_re, word_pat, _ in self.wildcard_typo_map:
-            if typo_re.match(typo) and self._match_wildcard(word, word_pat):
-                # This is imperfect, as it doesn't store the original rule with the parsed
-                # components, but it's good enough for reporting.
-                # We just find the first wildcard rule that could have produced this match.
-                clean_re = typo_re.pattern.replace("^", "").replace("$", "")
-                for original_pattern in self.wildcards:
-                    if "->" in original_pattern and clean_re in original_pattern:
-                        return original_pattern
-
-        return "unknown rule"
+        rule = self._matching_wildcard_rule(correction)
+        return rule if rule is not None else "unknown rule"
 
     def filter_validation_set(self, validation_set: set[str]) -> set[str]:
         """Create a filtered validation set for boundary detection.
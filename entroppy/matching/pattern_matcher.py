@@ -5,16 +5,15 @@ providing efficient compilation, caching, and matching operations for both
 exact string matches and wildcard patterns (using * syntax).
 """
 
-from re import Pattern
-
-from entroppy.utils import compile_wildcard_regex
+from entroppy.matching.wildcard_index import WildcardIndex
 
 
 class PatternMatcher:
     """Efficient matcher for exact strings and wildcard patterns.
 
     Separates exact matches from wildcard patterns for performance optimization.
-    Wildcard patterns are compiled once and cached for repeated matching operations.
+    Wildcard patterns are compiled once into a single WildcardIndex, so matching a
+    string costs about the same no matter how many wildcard patterns there are.
 
     Patterns containing '*' are treated as wildcards (e.g., '*ball', 'in*', '*teh*').
     All other patterns are treated as exact matches.
@@ -28,16 +27,16 @@ class PatternMatcher:
                      others as exact matches.
         """
         self.exact_patterns: set[str] = set()
-        self.wildcard_regexes: list[Pattern] = []
-        self._original_wildcards: list[str] = []
+        wildcards: list[str] = []
 
         for pattern in patterns:
             if "*" in pattern:
-                self.wildcard_regexes.append(compile_wildcard_regex(pattern))
-                self._original_wildcards.append(pattern)
+                wildcards.append(pattern)
             else:
                 self.exact_patterns.add(pattern)
 
+        self.wildcard_index = WildcardIndex(sorted(wildcards))
+
     def matches(self, text: str) -> bool:
         """Check if text matches any pattern (exact or wildcard).
 
@@ -51,12 +50,8 @@ class PatternMatcher:
         if text in self.exact_patterns:
             return True
 
-        # Check wildcard patterns (O(n) where n is number of wildcards)
-        for regex in self.wildcard_regexes:
-            if regex.match(text):
-                return True
-
-        return False
+        # Check all wildcard patterns at once
+        return self.wildcard_index.matches(text)
 
     def filter_set(self, items: set[str]) -> set[str]:
         """Return items that do NOT match any pattern.
@@ -70,5 +65,6 @@ class PatternMatcher:
         Returns:
             A new set containing only items that don't match any pattern.
         """
-        # Use generator expression for memory efficiency
+        if not self.exact_patterns and not self.wildcard_index:
+            return set(items)
         return {item for item in items if not self.matches(item)}
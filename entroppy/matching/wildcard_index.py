@@ -0,0 +1,130 @@
+"""Combined index for matching a string against many wildcard patterns at once.
+
+Matching a string by trying one compiled regex per pattern costs O(patterns) per
+string, which dominates when large exclude files are applied to the whole validation
+dictionary. Nearly all wildcard patterns have one of three shapes, and each shape can
+be answered without looking at the patterns one by one:
+
+- ``x*`` (prefix): look up ``text[:n]`` for each distinct prefix length ``n``
+- ``*x`` (suffix): look up ``text[-n:]`` for each distinct suffix length ``n``
+- ``*x*`` (infix): one pass over the text with an Aho–Corasick automaton
+  (``entroppy.utils.aho_corasick``) built over all infix literals
+
+Patterns made only of ``*`` match everything. Any other shape (e.g. ``a*b``) falls
+back to its compiled regex.
+"""
+
+from collections.abc import Sequence
+from re import Pattern
+
+from entroppy.utils import compile_wildcard_regex
+from entroppy.utils.aho_corasick import AhoCorasick
+
+
+class WildcardIndex:
+    """Matches a string against a fixed list of ``*`` wildcard patterns.
+
+    Attributes:
+        patterns: The patterns, in the order given (IDs refer to this list)
+    """
+
+    __slots__ = (
+        "patterns",
+        "_prefixes",
+        "_prefix_lengths",
+        "_suffixes",
+        "_suffix_lengths",
+        "_infixes",
+        "_match_all",
+        "_regexes",
+    )
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        """Build the index.
+
+        Args:
+            patterns: Wildcard patterns (``*`` matches any run of characters)
+        """
+        self.patterns = list(patterns)
+        self._prefixes: dict[str, list[int]] = {}
+        self._suffixes: dict[str, list[int]] = {}
+        infixes: dict[str, list[int]] = {}
+        self._match_all: list[int] = []
+        self._regexes: list[tuple[int, Pattern]] = []
+
+        for index, pattern in enumerate(self.patterns):
+            parts = pattern.split("*")
+            if not any(parts):
+                self._match_all.append(index)
+            elif len(parts) == 2 and not parts[1]:
+                self._prefixes.setdefault(parts[0], []).append(index)
+            elif len(parts) == 2 and not parts[0]:
+                self._suffixes.setdefault(parts[1], []).append(index)
+            elif len(parts) == 3 and not parts[0] and not parts[2]:
+                infixes.setdefault(parts[1], []).append(index)
+            else:
+                self._regexes.append((index, compile_wildcard_regex(pattern)))
+
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._prefixes})
+        self._suffix_lengths = sorted({len(suffix) for suffix in self._suffixes})
+        self._infixes = AhoCorasick(infixes) if infixes else None
+
+    def __len__(self) -> int:
+        """Number of patterns."""
+        return len(self.patterns)
+
+    def _collect(self, text: str, found: list[int], first_only: bool) -> None:
+        """Append the IDs of patterns matching text (stopping early if first_only)."""
+        found.extend(self._match_all[:1] if first_only else self._match_all)
+        if found and first_only:
+            return
+
+        text_length = len(text)
+        for table, lengths, is_prefix in (
+            (self._prefixes, self._prefix_lengths, True),
+            (self._suffixes, self._suffix_lengths, False),
+        ):
+            for length in lengths:
+                if length > text_length:
+                    break
+                ids = table.get(text[:length] if is_prefix else text[text_length - length :])
+                if ids:
+                    found.extend(ids[:1] if first_only else ids)
+                    if first_only:
+                        return
+
+        if self._infixes is not None and self._infixes.find(text, found, first_only):
+            if first_only:
+                return
+
+        for index, regex in self._regexes:
+            if regex.match(text):
+                found.append(index)
+                if first_only:
+                    return
+
+    def matches(self, text: str) -> bool:
+        """Check if text matches any pattern.
+
+        Args:
+            text: String to check
+
+        Returns:
+            True if at least one pattern matches
+        """
+        found: list[int] = []
+        self._collect(text, found, first_only=True)
+        return bool(found)
+
+    def matching(self, text: str) -> list[int]:
+        """Find all patterns matching text.
+
+        Args:
+            text: String to check
+
+        Returns:
+            Sorted IDs of the matching patterns
+        """
+        found: list[int] = []
+        self._collect(text, found, first_only=False)
+        return sorted(set(found))
@@ -1,6 +1,5 @@
 """Espanso YAML file writing utilities."""
 
-from multiprocessing import Pool
 import os
 
 from loguru import logger
@@ -8,6 +7,7 @@ from loguru import logger
 from entroppy.platforms.espanso.yaml_helpers import write_yaml_to_stream
 from entroppy.utils import expand_file_path
 from entroppy.utils.helpers import ensure_directory_exists, write_file_safely
+from entroppy.utils.worker_pool import borrow_pool
 
 
 def write_single_yaml_file(args: tuple) -> tuple[str, int]:
@@ -97,7 +97,7 @@ def write_yaml_files(
         if verbose:
             logger.info(f"  Writing {len(write_tasks)} YAML files using {jobs} workers...")
 
-        with Pool(processes=jobs) as pool:
+        with borrow_pool(jobs) as pool:
             results = pool.map(write_single_yaml_file, write_tasks)
 
             for _, entry_count in results:
@@ -7,8 +7,14 @@ from typing import TYPE_CHECKING
 from loguru import logger
 
 from entroppy.core import Config
+from entroppy.core.boundaries import set_boundary_index_backend
 from entroppy.platforms import PlatformBackend
-from entroppy.processing.pipeline_helpers import initialize_platform, setup_reporting
+from entroppy.processing.pipeline_helpers import (
+    initialize_platform,
+    resident_run_data,
+    setup_reporting,
+    write_trace,
+)
 from entroppy.processing.pipeline_stages import (
     run_stage_1_load_dictionaries,
     run_stage_2_generate_typos,
@@ -18,6 +24,10 @@ from entroppy.processing.pipeline_stages import (
     run_stage_9_reports,
 )
 from entroppy.reports import format_time
+from entroppy.resolution.checkpoint import CheckpointStore
+from entroppy.resolution.state import DictionaryState
+from entroppy.utils.tracing import disable_tracing, enable_tracing, span
+from entroppy.utils.worker_pool import shared_worker_pool
 
 if TYPE_CHECKING:
     pass
@@ -93,8 +103,34 @@ def run_pipeline(config: Config, platform: PlatformBackend | None = None) -> Non
         platform: Platform backend (if None, will be created from config.platform)
     """
     start_time = time.time()
+    tracer = enable_tracing() if config.trace else None
+    report_dir = None
+    try:
+        report_dir = _run_pipeline_stages(config, platform, start_time)
+    finally:
+        if tracer is not None:
+            disable_tracing()
+            write_trace(tracer, report_dir)
+
+
+def _run_pipeline_stages(
+    config: Config, platform: PlatformBackend | None, start_time: float
+) -> Path | None:
+    """Run all pipeline stages.
+
+    Args:
+        config: Configuration object containing all settings
+        platform: Platform backend (if None, will be created from config.platform)
+        start_time: Pipeline start time
+
+    Returns:
+        Report directory, or None if reports are disabled
+    """
     verbose = config.verbose
 
+    # Select boundary index storage before any index is built
+    set_boundary_index_backend(config.index_backend)
+
     # Get platform backend
     if platform is None:
         platform = initialize_platform(config)
@@ -105,52 +141,83 @@ def run_pipeline(config: Config, platform: PlatformBackend | None = None) -> Non
     # Initialize report data and create report directory if reports are enabled
     report_data, report_dir = setup_reporting(config, platform, start_time)
 
+    # Checkpoints for --resume (None unless --checkpoint-dir is set)
+    checkpoints = CheckpointStore.for_config(config)
+
     # Stage 1: Load dictionaries and mappings
-    dict_data = run_stage_1_load_dictionaries(config, verbose, report_data)
-
-    # Stage 2: Generate typos
-    typo_result = run_stage_2_generate_typos(dict_data, config, verbose, report_data)
-
-    # Stage 3-6: Iterative Solver
-    solver_result, state = run_stage_3_6_solver(
-        typo_result, dict_data, platform, config, verbose, report_data
-    )
-
-    # Stage 7: Platform-specific ranking and filtering
-    constraints = platform.get_constraints()
-    final_corrections, ranked_corrections, pattern_replacements = run_stage_7_ranking(
-        solver_result,
-        state,
-        dict_data,
-        platform,
-        config,
-        constraints,
-        verbose,
-        report_data,
-    )
-
-    # Stage 8: Generate output
-    run_stage_8_output(platform, final_corrections, config, verbose, report_data)
-
-    # Combine corrections and patterns for reporting
-    all_corrections = list(dict.fromkeys(solver_result.corrections + solver_result.patterns))
-
-    # Generate reports if enabled
-    _generate_reports(
-        config,
-        platform,
-        final_corrections,
-        ranked_corrections,
-        all_corrections,
-        solver_result,
-        pattern_replacements,
-        dict_data,
-        report_dir,
-        report_data,
-        verbose,
-        state=state,
-        typo_result=typo_result,
-    )
+    with span("Stage 1: load dictionaries", "stage"):
+        dict_data = run_stage_1_load_dictionaries(config, verbose, report_data)
+
+    # The solver state owns the event logs' temporary files; close them even if a
+    # later stage fails
+    state: DictionaryState | None = None
+    try:
+        # Start the worker pool once; stages and solver passes borrow it instead of
+        # starting their own, and the run data stays resident in every worker
+        resident = resident_run_data(dict_data) if config.jobs > 1 else None
+        with shared_worker_pool(config.jobs, resident):
+            # Stage 2: Generate typos
+            with span("Stage 2: generate typos", "stage") as stage_span:
+                typo_result = run_stage_2_generate_typos(
+                    dict_data, config, verbose, report_data, checkpoints
+                )
+                stage_span.set(items=len(typo_result.typo_map))
+
+            # Stage 3-6: Iterative Solver
+            with span("Stages 3-6: iterative solver", "stage") as stage_span:
+                solver_result, state = run_stage_3_6_solver(
+                    typo_result,
+                    dict_data,
+                    platform,
+                    config,
+                    verbose,
+                    report_data,
+                    checkpoints,
+                )
+                stage_span.set(items=len(solver_result.corrections) + len(solver_result.patterns))
+
+            # Stage 7: Platform-specific ranking and filtering
+            constraints = platform.get_constraints()
+            with span("Stage 7: ranking", "stage") as stage_span:
+                final_corrections, ranked_corrections, pattern_replacements = run_stage_7_ranking(
+                    solver_result,
+                    state,
+                    dict_data,
+                    platform,
+                    config,
+                    constraints,
+                    verbose,
+                    report_data,
+                )
+                stage_span.set(items=len(final_corrections))
+
+            # Stage 8: Generate output
+            with span("Stage 8: output", "stage", items=len(final_corrections)):
+                run_stage_8_output(platform, final_corrections, config, verbose, report_data)
+
+        # Combine corrections and patterns for reporting
+        all_corrections = list(dict.fromkeys(solver_result.corrections + solver_result.patterns))
+
+        # Generate reports if enabled
+        with span("Stage 9: reports", "stage"):
+            _generate_reports(
+                config,
+                platform,
+                final_corrections,
+                ranked_corrections,
+                all_corrections,
+                solver_result,
+                pattern_replacements,
+                dict_data,
+                report_dir,
+                report_data,
+                verbose,
+                state=state,
+                typo_result=typo_result,
+            )
+    finally:
+        if state is not None:
+            state.close_event_logs()
 
     # Print total time
     elapsed_time = time.time() - start_time
@@ -159,3 +226,4 @@ def run_pipeline(config: Config, platform: PlatformBackend | None = None) -> Non
 
     # Print debug summary if debugging is enabled
     _print_debug_summary(config, solver_result, verbose)
+    return report_dir
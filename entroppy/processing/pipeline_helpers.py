@@ -1,6 +1,7 @@
 """Helper functions for pipeline initialization and setup."""
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
@@ -8,6 +9,10 @@ from entroppy.core import Config
 from entroppy.platforms import PlatformBackend, get_platform_backend
 from entroppy.reports import ReportData, create_report_directory
 from entroppy.utils.logging import add_log_file_handler
+from entroppy.utils.tracing import Tracer
+
+if TYPE_CHECKING:
+    from entroppy.processing.stages import DictionaryData
 
 
 def initialize_platform(config: Config) -> PlatformBackend:
@@ -67,3 +72,43 @@ def setup_reporting(
         logger.info("")
 
     return report_data, report_dir
+
+
+def resident_run_data(dict_data: "DictionaryData") -> dict[str, frozenset[str]]:
+    """Collect the immutable run data kept resident in every pool worker.
+
+    Args:
+        dict_data: Dictionary data from Stage 1
+
+    Returns:
+        Named frozensets for the shared worker pool
+    """
+    return {
+        "validation_set": frozenset(dict_data.validation_set),
+        "filtered_validation_set": frozenset(dict_data.filtered_validation_set),
+        "source_words": frozenset(dict_data.source_words_set),
+        "user_words": frozenset(dict_data.user_words_set),
+        "exclusions": frozenset(dict_data.exclusions),
+    }
+
+
+def write_trace(tracer: Tracer, report_dir: Path | None) -> None:
+    """Write the run's trace as Chrome trace JSON and CSV.
+
+    Files go to the report directory (next to statistics.csv) when reports are
+    enabled, otherwise to the current directory.
+
+    Args:
+        tracer: Tracer that recorded the run
+        report_dir: Report directory, or None if reports are disabled
+    """
+    trace_dir = report_dir if report_dir is not None else Path.cwd()
+    json_path = trace_dir / "trace.json"
+    csv_path = trace_dir / "trace.csv"
+    try:
+        tracer.write_chrome_trace(json_path)
+        tracer.write_csv(csv_path)
+    except OSError as e:
+        logger.error(f"✗ Error writing trace to {trace_dir}: {e}")
+        return
+    logger.info(f"Trace ({len(tracer.events)} spans) written to {json_path} and {csv_path}")
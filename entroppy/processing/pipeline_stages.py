@@ -8,9 +8,12 @@ from typing import TYPE_CHECKING
 from loguru import logger
 
 from entroppy.core import Config, Correction
+from entroppy.core.boundaries import log_boundary_index_stats
 from entroppy.platforms import PlatformBackend, PlatformConstraints
 from entroppy.processing.stages import generate_typos, load_dictionaries
 from entroppy.reports import ReportData, generate_reports
+from entroppy.resolution.checkpoint import CheckpointStore
+from entroppy.resolution.event_log import ALL_EVENTS
 from entroppy.resolution.passes import (
     CandidateSelectionPass,
     ConflictRemovalPass,
@@ -18,7 +21,7 @@ from entroppy.resolution.passes import (
     PlatformConstraintsPass,
     PlatformSubstringConflictPass,
 )
-from entroppy.resolution.solver import IterativeSolver, PassContext
+from entroppy.resolution.solver import IterativeSolver, Pass, PassContext
 from entroppy.resolution.state import DictionaryState
 
 from .pipeline_reporting import extract_graveyard_data_for_reporting
@@ -28,27 +31,17 @@ if TYPE_CHECKING:
     from entroppy.resolution.solver import SolverResult
 
 
-def run_iterative_solver(
-    typo_result: "TypoGenerationResult",
-    dict_data: "DictionaryData",
-    platform: PlatformBackend,
-    config: Config,
-    verbose: bool,
-) -> tuple["SolverResult", DictionaryState]:
-    """Run the iterative solver for stages 3-6.
+def create_solver_state(typo_result: "TypoGenerationResult", config: Config) -> DictionaryState:
+    """Create the dictionary state the iterative solver starts from.
 
     Args:
         typo_result: Result from typo generation
-        dict_data: Dictionary data
-        platform: Platform backend
         config: Configuration object
-        verbose: Whether to show verbose output
 
     Returns:
-        Tuple of (solver_result, state)
+        Fresh dictionary state holding the Stage 2 typos
     """
-    # Create dictionary state
-    state = DictionaryState(
+    return DictionaryState(
         raw_typo_map=typo_result.typo_map,
         debug_words=config.debug_words,
         debug_typo_matcher=config.debug_typo_matcher,
@@ -57,7 +50,24 @@ def run_iterative_solver(
         debug_corrections=config.debug_corrections,
     )
 
-    # Create pass context
+
+def create_solver_passes(
+    dict_data: "DictionaryData",
+    platform: PlatformBackend,
+    config: Config,
+    verbose: bool,
+) -> list[Pass]:
+    """Create the solver passes, in the order the solver runs them.
+
+    Args:
+        dict_data: Dictionary data
+        platform: Platform backend
+        config: Configuration object
+        verbose: Whether to show verbose output
+
+    Returns:
+        Passes sharing one pass context
+    """
     pass_context = PassContext.from_dictionary_data(
         dictionary_data=dict_data,
         platform=platform,
@@ -67,9 +77,7 @@ def run_iterative_solver(
         verbose=verbose,
         use_gpu=config.use_gpu,
     )
-
-    # Create passes
-    passes = [
+    return [
         CandidateSelectionPass(pass_context),
         PatternGeneralizationPass(pass_context),
         ConflictRemovalPass(pass_context),
@@ -77,8 +85,38 @@ def run_iterative_solver(
         PlatformConstraintsPass(pass_context),
     ]
 
+
+def run_iterative_solver(
+    typo_result: "TypoGenerationResult",
+    dict_data: "DictionaryData",
+    platform: PlatformBackend,
+    config: Config,
+    verbose: bool,
+    checkpoints: CheckpointStore | None = None,
+) -> tuple["SolverResult", DictionaryState]:
+    """Run the iterative solver for stages 3-6.
+
+    Args:
+        typo_result: Result from typo generation
+        dict_data: Dictionary data
+        platform: Platform backend
+        config: Configuration object
+        verbose: Whether to show verbose output
+        checkpoints: Optional store for per-iteration solver snapshots
+
+    Returns:
+        Tuple of (solver_result, state)
+    """
+    state = create_solver_state(typo_result, config)
+    passes = create_solver_passes(dict_data, platform, config, verbose)
+
     # Run solver
-    solver = IterativeSolver(passes, max_iterations=config.max_iterations)
+    solver = IterativeSolver(
+        passes,
+        max_iterations=config.max_iterations,
+        checkpoints=checkpoints,
+        resume=config.resume,
+    )
     solver_result = solver.solve(state)
 
     return solver_result, state
@@ -198,6 +236,7 @@ def run_stage_2_generate_typos(
     config: Config,
     verbose: bool,
     report_data: ReportData | None,
+    checkpoints: CheckpointStore | None = None,
 ) -> "TypoGenerationResult":
     """Run Stage 2: Generate typos.
 
@@ -206,22 +245,31 @@ def run_stage_2_generate_typos(
         config: Configuration object
         verbose: Whether to show verbose output
         report_data: Optional report data to populate
+        checkpoints: Optional store to save the result to, or load it from on resume
 
     Returns:
         Typo generation result
     """
-    if verbose:
-        logger.info("Stage 2: Generating typos...")
-    typo_result = generate_typos(dict_data, config, verbose)
+    typo_result = None
+    if checkpoints is not None and config.resume:
+        typo_result = checkpoints.load_typo_result()
+        if typo_result is not None and verbose:
+            logger.info(f"Stage 2: Loaded typos from {checkpoints.directory}")
+    if typo_result is None:
+        if verbose:
+            logger.info("Stage 2: Generating typos...")
+        typo_result = generate_typos(dict_data, config, verbose)
+        if checkpoints is not None:
+            checkpoints.save_typo_result(typo_result)
 
     if report_data:
         report_data.stage_times["Generating typos"] = typo_result.elapsed_time
 
     if verbose:
-        typo_map_dict = dict(typo_result.typo_map)  # Convert to dict for pylint
-        total_typos = sum(len(words) for words in typo_map_dict.values())
+        typo_map = typo_result.typo_map
         logger.info(
-            f"✓ Generated {total_typos} typo mappings from {len(typo_result.typo_map)} unique typos"
+            f"✓ Generated {typo_map.pair_count} typo mappings from {len(typo_map)} unique typos "
+            f"({typo_map.distinct_word_count} distinct words)"
         )
         logger.info("")
 
@@ -235,6 +283,7 @@ def run_stage_3_6_solver(
     config: Config,
     verbose: bool,
     report_data: ReportData | None,
+    checkpoints: CheckpointStore | None = None,
 ) -> tuple["SolverResult", DictionaryState]:
     """Run Stages 3-6: Iterative solver.
 
@@ -245,6 +294,7 @@ def run_stage_3_6_solver(
         config: Configuration object
         verbose: Whether to show verbose output
         report_data: Optional report data to populate
+        checkpoints: Optional store for per-iteration solver snapshots
 
     Returns:
         Tuple of (solver_result, state)
@@ -253,7 +303,9 @@ def run_stage_3_6_solver(
         logger.info("Stage 3-6: Running iterative solver...")
 
     solver_start = time.time()
-    solver_result, state = run_iterative_solver(typo_result, dict_data, platform, config, verbose)
+    solver_result, state = run_iterative_solver(
+        typo_result, dict_data, platform, config, verbose, checkpoints
+    )
     solver_elapsed = time.time() - solver_start
 
     if verbose:
@@ -269,7 +321,7 @@ def run_stage_3_6_solver(
         report_data.stage_times["Iterative solver"] = solver_elapsed
         report_data.total_corrections = len(solver_result.corrections)
 
-        # Create pass context for accessing configuration
+        # Create pass context for accessing configuration (indexes come from the registry)
         pass_context = PassContext.from_dictionary_data(
             dictionary_data=dict_data,
             platform=platform,
@@ -283,6 +335,10 @@ def run_stage_3_6_solver(
         # Extract data from graveyard for reporting
         extract_graveyard_data_for_reporting(state, report_data, pass_context)
 
+    if verbose:
+        log_boundary_index_stats()
+        logger.info("")
+
     return solver_result, state
 
 
@@ -417,7 +473,11 @@ def run_stage_9_reports(
 
     # Extract debug data
     debug_messages = typo_result.debug_messages if typo_result else None
-    debug_trace = state.debug_trace if state else None
+    debug_trace = (
+        list(state.trace_log.read(ALL_EVENTS))
+        if state is not None and state.trace_log is not None
+        else None
+    )
 
     generate_reports(
         report_data,
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel, Field
 
+from entroppy.core.typo_store import TypoStore, TypoStoreBuilder
 from entroppy.matching import ExclusionMatcher
 
 
@@ -31,5 +32,9 @@ class DictionaryData(StageResult):
 class TypoGenerationResult(StageResult):
     """Output from typo generation stage."""
 
-    typo_map: dict[str, list[str]] = Field(default_factory=dict)
+    typo_map: TypoStore = Field(default_factory=lambda: TypoStoreBuilder().build())
     debug_messages: list[str] = Field(default_factory=list)
+
+    model_config = {
+        "arbitrary_types_allowed": True,  # For TypoStore
+    }
@@ -1,62 +1,85 @@
 """Stage 2: Typo generation with multiprocessing support."""
 
-from collections import defaultdict
-from multiprocessing import Pool
 import time
 from typing import Any
 
 from loguru import logger
 from tqdm import tqdm
 
-from entroppy.core import Config
+from entroppy.core import Config, TypoStore, TypoStoreBuilder
 from entroppy.processing.stages.data_models import DictionaryData, TypoGenerationResult
-from entroppy.processing.stages.worker_context import WorkerContext, get_worker_context, init_worker
-from entroppy.resolution import process_word
-from entroppy.utils.debug import DebugTypoMatcher
+from entroppy.processing.stages.worker_context import (
+    WorkerContext,
+    get_worker_context,
+    get_worker_state,
+    init_worker,
+)
+from entroppy.resolution import build_word_exclusion_matcher, process_word
+from entroppy.utils.worker_pool import borrow_pool
 
+# Upper bound on words per worker task; large enough to amortise IPC, small enough
+# to keep the progress bar moving and balance load across workers
+MAX_WORDS_PER_CHUNK = 256
 
-def process_word_worker(word: str) -> tuple[str, list[tuple[str, str]], list[str]]:
-    """Worker function for multiprocessing.
+
+def process_words_worker(words: list[str]) -> tuple[int, list[tuple[str, str]], list[str]]:
+    """Worker function for multiprocessing: process a batch of words.
+
+    Uses the sets from the worker context directly and the matchers built once in
+    init_worker, so per-word cost is just typo generation and lookups.
 
     Args:
-        word: The word to process
+        words: The words to process
 
     Returns:
-        Tuple of (word, list of (typo, word) pairs, list of debug messages)
+        Tuple of (number of words processed, list of (typo, word) pairs for the whole
+        batch, list of debug messages)
         Note: Boundaries are determined later in Stage 3 (collision resolution)
     """
     context = get_worker_context()
-    # Convert dict[str, list[str]] to dict[str, str] for process_word
-    # Join all adjacent letters back into a string
-    adj_map: dict[str, str] | None = None
-    if context.adjacent_letters_map:
-        adj_map = {k: "".join(v) if v else k for k, v in context.adjacent_letters_map.items() if v}
-
-    # Recreate DebugTypoMatcher in worker from patterns (not serializable due to compiled regex)
-    debug_typo_matcher: DebugTypoMatcher | None = (
-        DebugTypoMatcher.from_patterns(set(context.debug_typo_patterns))
-        if context.debug_typo_patterns
-        else None
-    )
+    state = get_worker_state()
 
-    corrections, debug_messages = process_word(
-        word,
-        set(context.validation_set),
-        set(context.source_words_set),
-        context.typo_freq_threshold,
-        adj_map,
-        set(context.exclusions_set),
-        frozenset(context.debug_words),
-        debug_typo_matcher,
-    )
-    return (word, corrections, debug_messages)
+    batch_corrections: list[tuple[str, str]] = []
+    batch_debug_messages: list[str] = []
+    for word in words:
+        corrections, debug_messages = process_word(
+            word,
+            context.validation_set,
+            context.source_words_set,
+            context.typo_freq_threshold,
+            state.adj_map,
+            context.exclusions_set,
+            context.debug_words,
+            state.debug_typo_matcher,
+            exclusion_matcher=state.exclusion_matcher,
+        )
+        batch_corrections.extend(corrections)
+        batch_debug_messages.extend(debug_messages)
+    return len(words), batch_corrections, batch_debug_messages
+
+
+def _chunk_words(words: list[str], jobs: int) -> list[list[str]]:
+    """Split words into batches for worker tasks.
+
+    Aims for several chunks per worker (for load balancing), capped at
+    MAX_WORDS_PER_CHUNK words each.
+
+    Args:
+        words: Words to split
+        jobs: Number of parallel workers
+
+    Returns:
+        List of word batches, in input order
+    """
+    chunk_size = max(1, min(MAX_WORDS_PER_CHUNK, len(words) // (jobs * 8)))
+    return [words[i : i + chunk_size] for i in range(0, len(words), chunk_size)]
 
 
 def _process_multiprocessing(
     dict_data: DictionaryData,
     config: Config,
     verbose: bool,
-) -> tuple[defaultdict[str, list[str]], list[str]]:
+) -> tuple[TypoStore, list[str]]:
     """Process words using multiprocessing."""
     if verbose:
         logger.info(f"  Using {config.jobs} parallel workers")
@@ -65,47 +88,45 @@ def _process_multiprocessing(
     # Create worker context (immutable, serializable)
     context = WorkerContext.from_dict_data(dict_data, config)
 
-    typo_map = defaultdict(list)
+    typo_store = TypoStoreBuilder()
     all_debug_messages = []
 
-    with Pool(
-        processes=config.jobs,
-        initializer=init_worker,
-        initargs=(context,),
-    ) as pool:
-        results = pool.imap_unordered(process_word_worker, dict_data.source_words)
-
-        # Wrap with progress bar
-        if verbose:
-            results_wrapped_iter: Any = tqdm(
-                results,
-                total=len(dict_data.source_words),
-                desc="Processing words",
-                unit="word",
-            )
-        else:
-            results_wrapped_iter = results
-
-        for _word, corrections, debug_messages in results_wrapped_iter:
-            for typo, correction_word in corrections:
-                typo_map[typo].append(correction_word)
+    with borrow_pool(config.jobs) as pool:
+        pool.broadcast(init_worker, context)
+        chunks = _chunk_words(dict_data.source_words, config.jobs)
+        results = pool.imap_unordered(process_words_worker, chunks)
+
+        # Progress bar advances by words, one batch at a time
+        progress_bar: Any = (
+            tqdm(total=len(dict_data.source_words), desc="Processing words", unit="word")
+            if verbose
+            else None
+        )
+
+        for word_count, corrections, debug_messages in results:
+            typo_store.add_pairs(corrections)
             # Collect debug messages from workers
             all_debug_messages.extend(debug_messages)
+            if progress_bar is not None:
+                progress_bar.update(word_count)
+
+        if progress_bar is not None:
+            progress_bar.close()
 
     # Print all collected debug messages after workers complete
     for message in all_debug_messages:
         logger.debug(message)
 
-    return typo_map, all_debug_messages
+    return typo_store.build(), all_debug_messages
 
 
 def _process_single_threaded(
     dict_data: DictionaryData,
     config: Config,
     verbose: bool,
-) -> tuple[defaultdict[str, list[str]], list[str]]:
+) -> tuple[TypoStore, list[str]]:
     """Process words using single-threaded mode."""
-    typo_map = defaultdict(list)
+    typo_store = TypoStoreBuilder()
     all_debug_messages: list[str] = []
 
     if verbose:
@@ -115,9 +136,12 @@ def _process_single_threaded(
     else:
         words_iter = dict_data.source_words
 
+    # Convert dict[str, str] to dict[str, str] | None (already correct type)
+    adj_map = dict_data.adjacent_letters_map if dict_data.adjacent_letters_map else None
+    exclusion_matcher = build_word_exclusion_matcher(dict_data.exclusions)
+    debug_words = frozenset(config.debug_words)
+
     for word in words_iter:
-        # Convert dict[str, str] to dict[str, str] | None (already correct type)
-        adj_map = dict_data.adjacent_letters_map if dict_data.adjacent_letters_map else None
         corrections, debug_messages = process_word(
             word,
             dict_data.validation_set,
@@ -125,18 +149,18 @@ def _process_single_threaded(
             config.typo_freq_threshold,
             adj_map,
             dict_data.exclusions,
-            frozenset(config.debug_words),
+            debug_words,
             config.debug_typo_matcher,
+            exclusion_matcher=exclusion_matcher,
         )
-        for typo, correction_word in corrections:
-            typo_map[typo].append(correction_word)
+        typo_store.add_pairs(corrections)
         # Collect debug messages (still log them, but also store for reports)
         all_debug_messages.extend(debug_messages)
         # In single-threaded mode, log immediately
         for message in debug_messages:
             logger.debug(message)
 
-    return typo_map, all_debug_messages
+    return typo_store.build(), all_debug_messages
 
 
 def generate_typos(
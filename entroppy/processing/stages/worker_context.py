@@ -2,10 +2,10 @@
 
 from dataclasses import dataclass
 import threading
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    pass
+from entroppy.matching import PatternMatcher
+from entroppy.resolution.word_processing import build_word_exclusion_matcher
+from entroppy.utils.debug import DebugTypoMatcher
 
 
 @dataclass(frozen=True)
@@ -65,6 +65,49 @@ class WorkerContext:
         )
 
 
+@dataclass(frozen=True)
+class WorkerState:
+    """Per-worker objects derived from a WorkerContext, built once in init_worker.
+
+    Attributes:
+        adj_map: Adjacent letters map in the dict[str, str] form process_word expects
+        exclusion_matcher: Matcher for single-word exclusion patterns
+        debug_typo_matcher: Matcher for debug typos (recreated from patterns because
+            compiled regexes are not serializable)
+    """
+
+    adj_map: dict[str, str] | None
+    exclusion_matcher: PatternMatcher
+    debug_typo_matcher: DebugTypoMatcher | None
+
+    @classmethod
+    def from_context(cls, context: WorkerContext) -> "WorkerState":
+        """Build worker state from a WorkerContext.
+
+        Args:
+            context: WorkerContext received by the worker
+
+        Returns:
+            New WorkerState instance
+        """
+        adj_map: dict[str, str] | None = None
+        if context.adjacent_letters_map:
+            # Join all adjacent letters back into a string
+            adj_map = {
+                k: "".join(v) if v else k for k, v in context.adjacent_letters_map.items() if v
+            }
+        debug_typo_matcher = (
+            DebugTypoMatcher.from_patterns(set(context.debug_typo_patterns))
+            if context.debug_typo_patterns
+            else None
+        )
+        return cls(
+            adj_map=adj_map,
+            exclusion_matcher=build_word_exclusion_matcher(context.exclusions_set),
+            debug_typo_matcher=debug_typo_matcher,
+        )
+
+
 # Thread-local storage for worker context
 _worker_context = threading.local()
 
@@ -72,10 +115,14 @@ _worker_context = threading.local()
 def init_worker(context: WorkerContext) -> None:
     """Initialize worker process with context in thread-local storage.
 
+    Also builds the derived WorkerState once, so per-word work is just typo generation
+    and set lookups.
+
     Args:
         context: WorkerContext to store in thread-local storage
     """
     _worker_context.value = context
+    _worker_context.state = WorkerState.from_context(context)
 
 
 def get_worker_context() -> WorkerContext:
@@ -94,3 +141,21 @@ def get_worker_context() -> WorkerContext:
         return context
     except AttributeError as e:
         raise RuntimeError("Worker context not initialized. Call init_worker first.") from e
+
+
+def get_worker_state() -> WorkerState:
+    """Get the current worker's derived state from thread-local storage.
+
+    Returns:
+        WorkerState for this worker
+
+    Raises:
+        RuntimeError: If called before init_worker
+    """
+    try:
+        state = _worker_context.state
+        if not isinstance(state, WorkerState):
+            raise RuntimeError("Invalid worker state type")
+        return state
+    except AttributeError as e:
+        raise RuntimeError("Worker context not initialized. Call init_worker first.") from e
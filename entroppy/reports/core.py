@@ -22,7 +22,8 @@ from entroppy.reports.summary import generate_summary_report
 
 if TYPE_CHECKING:
     from entroppy.core import Config
-    from entroppy.resolution.state import DebugTraceEntry, DictionaryState
+    from entroppy.resolution.event_log import LifecycleEvent
+    from entroppy.resolution.state import DictionaryState
 
 
 def _generate_state_debug_reports(
@@ -54,7 +55,7 @@ def _generate_state_debug_reports(
 def _generate_word_typo_debug_reports(
     config: "Config",
     debug_messages: list[str],
-    debug_trace: list["DebugTraceEntry"],
+    debug_trace: list["LifecycleEvent"],
     report_dir: Path,
 ) -> int:
     """Generate word/typo debug reports.
@@ -62,7 +63,7 @@ def _generate_word_typo_debug_reports(
     Args:
         config: Configuration object
         debug_messages: Stage 2 debug messages
-        debug_trace: Debug trace entries
+        debug_trace: Debug target events
         report_dir: Report directory
 
     Returns:
@@ -82,7 +83,7 @@ def _generate_all_debug_reports(
     config: "Config | None",
     state: "DictionaryState | None",
     debug_messages: list[str] | None,
-    debug_trace: list["DebugTraceEntry"] | None,
+    debug_trace: list["LifecycleEvent"] | None,
     report_dir: Path,
 ) -> int:
     """Generate all debug reports if enabled.
@@ -91,7 +92,7 @@ def _generate_all_debug_reports(
         config: Configuration object
         state: Dictionary state
         debug_messages: Stage 2 debug messages
-        debug_trace: Debug trace entries
+        debug_trace: Debug target events
         report_dir: Report directory
 
     Returns:
@@ -153,7 +154,7 @@ def generate_reports(
     report_dir: Path | None = None,
     state: "DictionaryState | None" = None,
     debug_messages: list[str] | None = None,
-    debug_trace: list["DebugTraceEntry"] | None = None,
+    debug_trace: list["LifecycleEvent"] | None = None,
     config: "Config | None" = None,
 ) -> Path:
     """Generate all reports in a timestamped directory.
@@ -166,7 +167,7 @@ def generate_reports(
         report_dir: Optional pre-created report directory. If None, creates a new one.
         state: Optional dictionary state for debug reports
         debug_messages: Optional Stage 2 debug messages
-        debug_trace: Optional debug trace entries
+        debug_trace: Optional debug target events
         config: Optional config for checking debug flags
 
     Returns:
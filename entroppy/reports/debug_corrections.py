@@ -8,6 +8,7 @@ from entroppy.reports.helpers import (
     iterate_by_iteration_and_pass,
     write_report_header,
 )
+from entroppy.resolution.event_log import CORRECTION_EVENTS
 from entroppy.resolution.state import DictionaryState
 from entroppy.utils.helpers import write_file_safely
 
@@ -24,10 +25,11 @@ def generate_corrections_debug_report(state: DictionaryState, report_dir: Path)
     def write_content(f: TextIO) -> None:
         write_report_header(f, "CORRECTIONS DEBUG REPORT")
 
-        total_events = len(state.correction_history)
+        event_log = state.event_log
+        total_events = event_log.count(CORRECTION_EVENTS) if event_log is not None else 0
         f.write(f"Total correction events: {total_events:,}\n\n")
 
-        if not state.correction_history:
+        if event_log is None or not total_events:
             f.write("No correction events tracked.\n")
             return
 
@@ -47,6 +49,6 @@ def generate_corrections_debug_report(state: DictionaryState, report_dir: Path)
                 f.write(f"      Reason: {entry.reason}\n")
             f.write("\n")
 
-        iterate_by_iteration_and_pass(state.correction_history, f, write_entry)
+        iterate_by_iteration_and_pass(event_log.read(CORRECTION_EVENTS), f, write_entry)
 
     write_file_safely(filepath, write_content, "writing corrections debug report")
@@ -6,6 +6,7 @@ from typing import TextIO
 
 from entroppy.core import format_boundary_display
 from entroppy.reports.helpers import iterate_by_iteration_and_pass, write_report_header
+from entroppy.resolution.event_log import GRAVEYARD_EVENTS
 from entroppy.resolution.state import DictionaryState
 from entroppy.utils.helpers import write_file_safely
 
@@ -22,10 +23,11 @@ def generate_graveyard_debug_report(state: DictionaryState, report_dir: Path) ->
     def write_content(f: TextIO) -> None:
         write_report_header(f, "GRAVEYARD DEBUG REPORT")
 
-        total_entries = len(state.graveyard_history)
+        event_log = state.event_log
+        total_entries = event_log.count(GRAVEYARD_EVENTS) if event_log is not None else 0
         f.write(f"Total graveyard entries: {total_entries:,}\n\n")
 
-        if not state.graveyard_history:
+        if event_log is None or not total_entries:
             f.write("No graveyard entries tracked.\n")
             return
 
@@ -37,12 +39,12 @@ def generate_graveyard_debug_report(state: DictionaryState, report_dir: Path) ->
             f.write(
                 f'    typo: "{entry.typo}" → word: "{entry.word}" ' f"(boundary: {boundary_str})\n"
             )
-            f.write(f"      Reason: {entry.reason.value}\n")
+            f.write(f"      Reason: {entry.reason}\n")
             if entry.blocker:
                 f.write(f"      Blocker: {entry.blocker}\n")
             f.write(f"      Added at: {timestamp_str}\n")
             f.write("\n")
 
-        iterate_by_iteration_and_pass(state.graveyard_history, f, write_entry)
+        iterate_by_iteration_and_pass(event_log.read(GRAVEYARD_EVENTS), f, write_entry)
 
     write_file_safely(filepath, write_content, "writing graveyard debug report")
@@ -8,6 +8,7 @@ from entroppy.reports.helpers import (
     iterate_by_iteration_and_pass,
     write_report_header,
 )
+from entroppy.resolution.event_log import PATTERN_EVENTS
 from entroppy.resolution.state import DictionaryState
 from entroppy.utils.helpers import write_file_safely
 
@@ -24,10 +25,11 @@ def generate_patterns_debug_report(state: DictionaryState, report_dir: Path) ->
     def write_content(f: TextIO) -> None:
         write_report_header(f, "PATTERNS DEBUG REPORT")
 
-        total_events = len(state.pattern_history)
+        event_log = state.event_log
+        total_events = event_log.count(PATTERN_EVENTS) if event_log is not None else 0
         f.write(f"Total pattern events: {total_events:,}\n\n")
 
-        if not state.pattern_history:
+        if event_log is None or not total_events:
             f.write("No pattern events tracked.\n")
             return
 
@@ -62,6 +64,6 @@ def generate_patterns_debug_report(state: DictionaryState, report_dir: Path) ->
 
             f.write("\n")
 
-        iterate_by_iteration_and_pass(state.pattern_history, f, write_entry)
+        iterate_by_iteration_and_pass(event_log.read(PATTERN_EVENTS), f, write_entry)
 
     write_file_safely(filepath, write_content, "writing patterns debug report")
@@ -9,7 +9,7 @@ from entroppy.reports.helpers import (
     write_solver_events,
     write_stage2_messages,
 )
-from entroppy.resolution.state import DebugTraceEntry
+from entroppy.resolution.event_log import LifecycleEvent
 from entroppy.utils.helpers import write_file_safely
 
 
@@ -58,18 +58,18 @@ def _extract_typo_events(debug_messages: list[str]) -> dict[str, list[str]]:
 
 
 def _extract_typo_solver_events(
-    debug_trace: list[DebugTraceEntry], typo_events: dict[str, list[str]]
-) -> dict[str, list[DebugTraceEntry]]:
+    debug_trace: list[LifecycleEvent], typo_events: dict[str, list[str]]
+) -> dict[str, list[LifecycleEvent]]:
     """Extract solver events for debug typos.
 
     Args:
-        debug_trace: Debug trace entries from solver
+        debug_trace: Debug target events from the solver
         typo_events: Dictionary of typo events from Stage 2
 
     Returns:
         Dictionary mapping typos to their solver events
     """
-    typo_solver_events: dict[str, list[DebugTraceEntry]] = {}
+    typo_solver_events: dict[str, list[LifecycleEvent]] = {}
     for entry in debug_trace:
         if entry.typo in typo_events:
             if entry.typo not in typo_solver_events:
@@ -82,7 +82,7 @@ def _write_typo_report(
     typo: str,
     matched_patterns: list[str],
     typo_events: list[str],
-    typo_solver_events: list[DebugTraceEntry],
+    typo_solver_events: list[LifecycleEvent],
     filepath: Path,
 ) -> None:
     """Write a single typo lifecycle report.
@@ -118,14 +118,14 @@ def _write_typo_report(
 
 def generate_debug_typos_report(
     debug_messages: list[str],
-    debug_trace: list[DebugTraceEntry],
+    debug_trace: list[LifecycleEvent],
     report_dir: Path,
 ) -> None:
     """Generate debug typo lifecycle reports (one file per typo).
 
     Args:
         debug_messages: Stage 2 debug messages
-        debug_trace: Debug trace entries from solver
+        debug_trace: Debug target events from the solver
         report_dir: Directory to write reports to
     """
     # Extract typo-specific events from debug messages
@@ -9,7 +9,7 @@ from entroppy.reports.helpers import (
     write_solver_events,
     write_stage2_messages,
 )
-from entroppy.resolution.state import DebugTraceEntry
+from entroppy.resolution.event_log import LifecycleEvent
 from entroppy.utils.helpers import write_file_safely
 
 
@@ -32,14 +32,14 @@ def _sanitize_filename(word: str) -> str:
 
 def generate_debug_words_report(
     debug_messages: list[str],
-    debug_trace: list[DebugTraceEntry],
+    debug_trace: list[LifecycleEvent],
     report_dir: Path,
 ) -> None:
     """Generate debug word lifecycle reports (one file per word).
 
     Args:
         debug_messages: Stage 2 debug messages
-        debug_trace: Debug trace entries from solver
+        debug_trace: Debug target events from the solver
         report_dir: Directory to write reports to
     """
     # Extract word-specific events from debug messages
@@ -58,7 +58,7 @@ def generate_debug_words_report(
                 continue
 
     # Extract solver events for debug words
-    word_solver_events: dict[str, list[DebugTraceEntry]] = {}
+    word_solver_events: dict[str, list[LifecycleEvent]] = {}
     for entry in debug_trace:
         if entry.word in word_events:
             if entry.word not in word_solver_events:
@@ -1,18 +1,15 @@
 """Helper functions for report generation."""
 
+from collections.abc import Iterable
 from datetime import datetime
-from typing import TYPE_CHECKING, Callable, Protocol, TextIO, Union
+from itertools import groupby
+from typing import TYPE_CHECKING, Callable, Protocol, TextIO
 
 from entroppy.core import format_boundary_display
 
 if TYPE_CHECKING:
     from entroppy.core.boundaries import BoundaryType
-    from entroppy.resolution.history import (
-        CorrectionHistoryEntry,
-        GraveyardHistoryEntry,
-        PatternHistoryEntry,
-    )
-    from entroppy.resolution.state_types import DebugTraceEntry
+    from entroppy.resolution.event_log import LifecycleEvent
 
 
 # Minimal protocol for entries that can be grouped by iteration and pass
@@ -38,31 +35,15 @@ class FormattableEntry(Protocol):
     timestamp: float
 
 
-# Protocol for solver events that have all fields for solver lifecycle reporting
-class SolverEventEntry(Protocol):
-    """Protocol for solver event entries with all lifecycle fields.
-
-    This protocol matches DebugTraceEntry and similar solver event types.
-    """
-
-    iteration: int
-    pass_name: str
-    action: str
-    typo: str
-    word: str
-    boundary: "BoundaryType"
-    reason: str | None
-
-
 def write_solver_events(
     f: TextIO,
-    solver_events: Union[list["DebugTraceEntry"], list[SolverEventEntry]],
+    solver_events: list["LifecycleEvent"],
 ) -> None:
     """Write solver lifecycle events to file.
 
     Args:
         f: File object to write to
-        solver_events: List of solver event entries (DebugTraceEntry or compatible)
+        solver_events: Solver events for one debug target
     """
     if solver_events:
         f.write("Solver Lifecycle:\n")
@@ -150,56 +131,32 @@ def write_stage2_messages(f: TextIO, messages: list[str]) -> None:
 
 
 def iterate_by_iteration_and_pass(
-    entries: Union[
-        list["CorrectionHistoryEntry"],
-        list["PatternHistoryEntry"],
-        list["GraveyardHistoryEntry"],
-    ],
+    entries: Iterable["LifecycleEvent"],
     f: TextIO,
-    write_entry: Callable[
-        [TextIO, Union["CorrectionHistoryEntry", "PatternHistoryEntry", "GraveyardHistoryEntry"]],
-        None,
-    ],
+    write_entry: Callable[[TextIO, "LifecycleEvent"], None],
 ) -> None:
     """Iterate over entries grouped by iteration and pass.
 
     This helper function handles the common pattern of grouping entries by iteration,
     then by pass within each iteration, and writing them in chronological order.
+    Entries come from the event log in recording order, so only one iteration's
+    entries are held in memory at a time.
 
     Args:
-        entries: List of entries with 'iteration' and 'pass_name' attributes
+        entries: Entries with 'iteration' and 'pass_name' attributes, in recording order
         f: File object to write to
         write_entry: Callback function to write each entry
     """
-    # Group by iteration
-    EntryType = Union["CorrectionHistoryEntry", "PatternHistoryEntry", "GraveyardHistoryEntry"]
-    by_iteration: dict[int, list[EntryType]] = {}
-    for entry in entries:
-        if entry.iteration not in by_iteration:
-            by_iteration[entry.iteration] = []
-        by_iteration[entry.iteration].append(entry)
-
-    # Sort iterations
-    for iteration in sorted(by_iteration.keys()):
+    for iteration, iteration_entries in groupby(entries, key=lambda e: e.iteration):
         f.write(f"--- Iteration {iteration} ---\n")
-        iteration_entries = by_iteration[iteration]
 
-        # Group by pass within iteration
-        by_pass: dict[str, list[EntryType]] = {}
+        # Group by pass within iteration, passes in order of their first entry
+        by_pass: dict[str, list["LifecycleEvent"]] = {}
         for entry in iteration_entries:
-            if entry.pass_name not in by_pass:
-                by_pass[entry.pass_name] = []
-            by_pass[entry.pass_name].append(entry)
-
-        # Sort passes by timestamp (chronological order)
-        # Sort items directly to avoid closure issues
-        sorted_pass_items = sorted(
-            by_pass.items(), key=lambda item: min(e.timestamp for e in item[1])
-        )
-        for pass_name, pass_entries_list in sorted_pass_items:
-            f.write(f"  [{pass_name}]\n")
-            pass_entries = sorted(pass_entries_list, key=lambda e: e.timestamp)
+            by_pass.setdefault(entry.pass_name, []).append(entry)
 
+        for pass_name, pass_entries in by_pass.items():
+            f.write(f"  [{pass_name}]\n")
             for entry in pass_entries:
                 write_entry(f, entry)
 
@@ -4,10 +4,11 @@ from .boundaries.utils import choose_strictest_boundary
 from .collision import resolve_collisions
 from .conflicts import ConflictDetector, get_detector_for_boundary, resolve_conflicts_for_group
 from .substring_conflicts import remove_substring_conflicts
-from .word_processing import process_word
+from .word_processing import build_word_exclusion_matcher, process_word
 
 __all__ = [
     "process_word",
+    "build_word_exclusion_matcher",
     "resolve_collisions",
     "choose_strictest_boundary",
     "remove_substring_conflicts",
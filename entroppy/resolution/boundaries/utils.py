@@ -1,5 +1,7 @@
 """Boundary type utilities for collision resolution."""
 
+from collections.abc import Iterable
+
 from entroppy.core import BoundaryType
 from entroppy.core.boundaries import BoundaryIndex
 from entroppy.utils.debug import DebugTypoMatcher, log_if_debug_correction
@@ -100,13 +102,14 @@ def _check_typo_in_target_word(
 
 
 def _collect_examples_from_index(
-    typo: str, index: dict[str, set[str]], examples: list[str], max_examples: int = 3
+    typo: str, words: Iterable[str], examples: list[str], max_examples: int = 3
 ) -> None:
-    """Collect example words from an index, avoiding duplicates."""
-    if typo in index:
-        for word in index[typo]:
-            if word != typo and word not in examples and len(examples) < max_examples:
-                examples.append(word)
+    """Collect example words from an index lookup, avoiding duplicates."""
+    for word in words:
+        if len(examples) >= max_examples:
+            break
+        if word != typo and word not in examples:
+            examples.append(word)
 
 
 def _get_example_words_with_prefix(
@@ -124,10 +127,10 @@ def _get_example_words_with_prefix(
     """
     examples: list[str] = []
     # Check validation index first
-    _collect_examples_from_index(typo, validation_index.prefix_index, examples)
+    _collect_examples_from_index(typo, validation_index.words_with_prefix(typo), examples)
     # Then check source index if we need more examples
     if len(examples) < 3:
-        _collect_examples_from_index(typo, source_index.prefix_index, examples)
+        _collect_examples_from_index(typo, source_index.words_with_prefix(typo), examples)
     return examples
 
 
@@ -146,10 +149,10 @@ def _get_example_words_with_suffix(
     """
     examples: list[str] = []
     # Check validation index first
-    _collect_examples_from_index(typo, validation_index.suffix_index, examples)
+    _collect_examples_from_index(typo, validation_index.words_with_suffix(typo), examples)
     # Then check source index if we need more examples
     if len(examples) < 3:
-        _collect_examples_from_index(typo, source_index.suffix_index, examples)
+        _collect_examples_from_index(typo, source_index.words_with_suffix(typo), examples)
     return examples
 
 
@@ -0,0 +1,318 @@
+"""Solver checkpoints, so a long run can resume after a crash.
+
+With ``--checkpoint-dir`` the pipeline saves the Stage 2 result once, and the solver
+saves a snapshot of the state at the end of every iteration. With ``--resume`` Stage 1
+is re-run (it only reads the word lists), Stage 2 is loaded instead of regenerated,
+and the solver continues after the last saved iteration.
+
+A snapshot holds only what the solver cannot rebuild cheaply: the active corrections
+and patterns, the graveyard, pattern replacements, uncovered typos, the debug trace,
+the iteration counter and pass-level caches (see ``Pass.checkpoint``). Corrections are
+stored as packed int64 keys next to the string table that decodes them. The coverage
+map, pattern coverage index and change journal are rebuilt on load, and every
+incremental pass does a full run on its first iteration after resuming.
+
+Snapshots are copied on the solver thread, then pickled, compressed and written by a
+background thread. Files are replaced atomically, so a crash while writing keeps the
+previous snapshot. Checkpoint files are pickles: only resume from directories you
+wrote yourself.
+"""
+
+from array import array
+import contextlib
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+from pathlib import Path
+import pickle
+import threading
+from typing import TYPE_CHECKING, Any
+import zlib
+
+from loguru import logger
+
+from entroppy.resolution.event_log import LifecycleEvent
+from entroppy.resolution.history import RejectionReason
+from entroppy.utils import expand_file_path
+
+if TYPE_CHECKING:
+    from entroppy.core import Config
+    from entroppy.processing.stages import TypoGenerationResult
+
+# Bumped whenever the snapshot layout changes; older checkpoints are then refused
+CHECKPOINT_VERSION = 1
+
+TYPOS_FILENAME = "typos.ckpt"
+SOLVER_FILENAME = "solver.ckpt"
+
+# Config fields that change Stage 2 or solver results. Others (jobs, output, reports,
+# debug flags, max_iterations, ...) may differ between the original run and the resume.
+FINGERPRINT_FIELDS = (
+    "top_n",
+    "max_word_length",
+    "min_word_length",
+    "min_typo_length",
+    "freq_ratio",
+    "typo_freq_threshold",
+    "include",
+    "exclude",
+    "adjacent_letters",
+    "platform",
+    "max_corrections",
+    "hurtmycpu",
+)
+
+# Fingerprinted fields that name input files; their contents are hashed, not the paths
+FINGERPRINT_FILE_FIELDS = ("include", "exclude", "adjacent_letters")
+
+# Fast compression: snapshots are written every iteration
+_COMPRESSION_LEVEL = 1
+
+REJECTION_REASONS: tuple[RejectionReason, ...] = tuple(RejectionReason)
+REJECTION_REASON_CODES: dict[RejectionReason, int] = {
+    reason: code for code, reason in enumerate(REJECTION_REASONS)
+}
+
+
+def config_fingerprint(config: "Config") -> str:
+    """Hash the config fields a checkpoint depends on.
+
+    Input files are hashed by content, so editing an include, exclude or adjacent
+    letters file invalidates checkpoints even though its path is unchanged.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Hex digest identifying compatible runs
+    """
+    values = config.model_dump(include=set(FINGERPRINT_FIELDS))
+    for name in FINGERPRINT_FILE_FIELDS:
+        values[f"{name}_sha256"] = _file_digest(values[name])
+    encoded = json.dumps(values, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _file_digest(filepath: str | None) -> str | None:
+    """Hash a file's contents, or return None if there is no readable file."""
+    filepath = expand_file_path(filepath)
+    if filepath is None:
+        return None
+    try:
+        with open(filepath, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def pack_keys(keys: Any) -> bytes:
+    """Pack correction keys as int64 bytes."""
+    return array("q", keys).tobytes()
+
+
+def unpack_keys(data: bytes) -> array:
+    """Unpack int64 correction keys written by pack_keys."""
+    keys = array("q")
+    keys.frombytes(data)
+    return keys
+
+
+@dataclass
+class StateSnapshot:
+    """The parts of a DictionaryState that a resume cannot rebuild.
+
+    Correction keys decode with a CorrectionTable rebuilt from ``strings``.
+
+    Attributes:
+        iteration: Last completed iteration
+        is_dirty: Whether that iteration changed the state
+        strings: Correction table strings, in ID order
+        corrections: Active correction keys (int64 bytes)
+        patterns: Active pattern keys (int64 bytes)
+        graveyard_keys: Graveyard keys (int64 bytes)
+        graveyard_reasons: RejectionReason code per graveyard entry
+        graveyard_iterations: Iteration per graveyard entry (uint32 bytes)
+        graveyard_blockers: Blocker per graveyard entry
+        pattern_replacements: Pattern key -> keys of the corrections it replaced
+        uncovered_typos: Typos not covered by any correction
+        debug_trace: Debug target events so far
+    """
+
+    iteration: int
+    is_dirty: bool
+    strings: list[str]
+    corrections: bytes
+    patterns: bytes
+    graveyard_keys: bytes
+    graveyard_reasons: bytes
+    graveyard_iterations: bytes
+    graveyard_blockers: list[str | None]
+    pattern_replacements: dict[int, bytes]
+    uncovered_typos: list[str]
+    debug_trace: list[LifecycleEvent] = field(default_factory=list)
+
+
+@dataclass
+class SolverCheckpoint:
+    """A solver snapshot taken at the end of an iteration.
+
+    Attributes:
+        state: State snapshot
+        previous_counts: (corrections, patterns, graveyard) for the convergence check
+        pass_states: Pass name -> value returned by the pass's checkpoint()
+    """
+
+    state: StateSnapshot
+    previous_counts: tuple[int, int, int]
+    pass_states: dict[str, Any] = field(default_factory=dict)
+
+
+class CheckpointStore:
+    """Checkpoint directory for one run.
+
+    Writes happen on a background thread, one at a time; a new write waits for the
+    previous one to finish.
+    """
+
+    def __init__(self, directory: Path, fingerprint: str) -> None:
+        """Open (and create if needed) a checkpoint directory.
+
+        Args:
+            directory: Checkpoint directory
+            fingerprint: config_fingerprint() of the run
+        """
+        self.directory = directory
+        self.fingerprint = fingerprint
+        self._writer: threading.Thread | None = None
+        self._error: BaseException | None = None
+        directory.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def for_config(cls, config: "Config") -> "CheckpointStore | None":
+        """Open the store configured by --checkpoint-dir.
+
+        Args:
+            config: Configuration object
+
+        Returns:
+            The store, or None if checkpoints are disabled
+        """
+        if not config.checkpoint_dir:
+            return None
+        return cls(Path(config.checkpoint_dir), config_fingerprint(config))
+
+    def _write(self, filename: str, payload: object) -> None:
+        """Serialize and write one file atomically (runs on the writer thread).
+
+        Any failure is stored for ``wait`` to report, and the partial temp file is
+        removed; the previous checkpoint file is left in place.
+        """
+        path = self.directory / filename
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        try:
+            data = pickle.dumps(
+                {
+                    "version": CHECKPOINT_VERSION,
+                    "fingerprint": self.fingerprint,
+                    "payload": payload,
+                },
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+            compressed = zlib.compress(data, _COMPRESSION_LEVEL)
+            with open(temp_path, "wb") as f:
+                f.write(compressed)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except Exception as e:
+            # Uncaught, the error would die with the writer thread and wait() would
+            # report success
+            self._error = e
+            with contextlib.suppress(OSError):
+                temp_path.unlink(missing_ok=True)
+
+    def _submit(self, filename: str, payload: object) -> None:
+        """Start writing a file in the background."""
+        self.wait()
+        self._writer = threading.Thread(
+            target=self._write, args=(filename, payload), name="checkpoint-writer", daemon=True
+        )
+        self._writer.start()
+
+    def wait(self) -> None:
+        """Wait for the pending write and report if it failed."""
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        if self._error is not None:
+            logger.warning(f"  ⚠ Could not write checkpoint to {self.directory}: {self._error}")
+            self._error = None
+
+    def _read(self, filename: str) -> Any:
+        """Read one file.
+
+        Returns:
+            The stored payload, or None if the file does not exist
+
+        Raises:
+            ValueError: If the file is unreadable or belongs to another version or config
+        """
+        path = self.directory / filename
+        if not path.exists():
+            return None
+        try:
+            data = pickle.loads(zlib.decompress(path.read_bytes()))
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError) as e:
+            raise ValueError(f"Unreadable checkpoint {path}: {e}") from e
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Checkpoint {path} has version {data.get('version')}, "
+                f"expected {CHECKPOINT_VERSION}"
+            )
+        if data.get("fingerprint") != self.fingerprint:
+            raise ValueError(
+                f"Checkpoint {path} was written with different settings; "
+                "resume with the original configuration"
+            )
+        return data["payload"]
+
+    def save_typo_result(self, typo_result: "TypoGenerationResult") -> None:
+        """Save the Stage 2 result in the background.
+
+        Args:
+            typo_result: Result from typo generation
+        """
+        self._submit(TYPOS_FILENAME, typo_result)
+
+    def load_typo_result(self) -> "TypoGenerationResult | None":
+        """Load the saved Stage 2 result.
+
+        Returns:
+            The result, or None if none was saved
+
+        Raises:
+            ValueError: If the checkpoint does not match this run
+        """
+        result: TypoGenerationResult | None = self._read(TYPOS_FILENAME)
+        return result
+
+    def save_solver(self, checkpoint: SolverCheckpoint) -> None:
+        """Save a solver snapshot in the background.
+
+        Args:
+            checkpoint: Snapshot captured at the end of an iteration
+        """
+        self._submit(SOLVER_FILENAME, checkpoint)
+
+    def load_solver(self) -> SolverCheckpoint | None:
+        """Load the latest solver snapshot.
+
+        Returns:
+            The snapshot, or None if none was saved
+
+        Raises:
+            ValueError: If the checkpoint does not match this run
+        """
+        checkpoint: SolverCheckpoint | None = self._read(SOLVER_FILENAME)
+        return checkpoint
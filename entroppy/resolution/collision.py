@@ -1,15 +1,15 @@
 """Collision resolution for typo corrections."""
 
-from multiprocessing import Pool
 from typing import Any
 
 from loguru import logger
 from tqdm import tqdm
 
 from entroppy.core import BoundaryType, Correction
-from entroppy.core.boundaries import BoundaryIndex
+from entroppy.core.boundaries import get_boundary_index
 from entroppy.matching import ExclusionMatcher
 from entroppy.utils.debug import DebugTypoMatcher
+from entroppy.utils.worker_pool import borrow_pool
 
 from .boundaries.selection import log_boundary_selection_details
 from .collision_helpers import _process_collision_item, _process_single_word_item
@@ -167,7 +167,8 @@ def _process_parallel_collisions(
     excluded_corrections = []
     all_boundary_details = []
 
-    with Pool(processes=jobs, initializer=init_collision_worker, initargs=(context,)) as pool:
+    with borrow_pool(jobs) as pool:
+        pool.broadcast(init_collision_worker, context)
         items = list(typo_map.items())
         results = pool.imap_unordered(_process_typo_worker, items)
 
@@ -245,8 +246,8 @@ def _process_single_threaded_collisions(
     """
     if verbose:
         logger.info("  Building boundary indexes...")
-    validation_index = BoundaryIndex(validation_set)
-    source_index = BoundaryIndex(source_words)
+    validation_index = get_boundary_index(validation_set)
+    source_index = get_boundary_index(source_words)
 
     # Wrap with progress bar if verbose
     if verbose:
@@ -0,0 +1,253 @@
+"""Prefix trie of typos for substring conflict detection.
+
+A ConflictDetector only compares typos that share their index character (the first
+character, or the last one for RIGHT boundaries) and blocks a longer typo if it
+contains a shorter one. Scanning every typo in the index character's bucket costs
+O(k) per typo, and buckets for common letters hold thousands of typos.
+
+The trie answers the same question by walking the typo itself. Call a position of a
+typo an anchor if it holds the typo's index character. A shorter typo with the same
+index character can only occur at an anchor, so walking the trie from each anchor
+finds every candidate in O(L²) for a typo of length L, independent of how many typos
+are stored. RIGHT boundaries index on the last character, so their trie stores
+reversed typos.
+
+For the reverse question (which stored typos contain a new, shorter typo), every
+anchored suffix of a stored typo is also inserted and tagged with its owner. The
+owners in the subtree below the new typo's path are exactly the stored typos that
+contain it at an anchor.
+"""
+
+from collections.abc import Iterator
+
+from entroppy.core import BoundaryType, Correction
+
+
+class _TrieNode:
+    """A trie node.
+
+    Attributes:
+        children: Child nodes by character
+        typo: Stored typo whose (possibly reversed) key ends here, if any
+        owners: Stored typos with an anchored suffix (past position 0) ending here
+    """
+
+    __slots__ = ("children", "typo", "owners")
+
+    def __init__(self) -> None:
+        """Initialize an empty node."""
+        self.children: dict[str, _TrieNode] = {}
+        self.typo: str | None = None
+        self.owners: set[str] | None = None
+
+    def is_empty(self) -> bool:
+        """Check if the node holds nothing and can be pruned."""
+        return not self.children and self.typo is None and not self.owners
+
+
+class ConflictTrie:
+    """Typo trie for one boundary type, supporting insert, delete and conflict queries.
+
+    Several corrections can share a typo (same typo, different words); all of them are
+    stored and returned together.
+    """
+
+    __slots__ = ("_reverse", "_root", "_entries")
+
+    def __init__(self, reverse: bool = False) -> None:
+        """Initialize an empty trie.
+
+        Args:
+            reverse: Index typos from their last character (RIGHT boundaries)
+        """
+        self._reverse = reverse
+        self._root = _TrieNode()
+        self._entries: dict[str, list[Correction]] = {}
+
+    @classmethod
+    def for_boundary(cls, boundary: BoundaryType) -> "ConflictTrie":
+        """Create an empty trie oriented like the boundary's conflict detector.
+
+        Args:
+            boundary: The boundary type
+
+        Returns:
+            Reversed trie for RIGHT boundaries, forward trie otherwise
+        """
+        return cls(reverse=boundary == BoundaryType.RIGHT)
+
+    def __len__(self) -> int:
+        """Number of stored corrections."""
+        return sum(len(corrections) for corrections in self._entries.values())
+
+    def __contains__(self, correction: object) -> bool:
+        """Check if a correction is stored."""
+        if not isinstance(correction, tuple) or not correction:
+            return False
+        return correction in self._entries.get(correction[0], ())
+
+    def _key(self, typo: str) -> str:
+        """Get the string the trie walks for a typo."""
+        return typo[::-1] if self._reverse else typo
+
+    @staticmethod
+    def _anchors(key: str) -> list[int]:
+        """Get the positions of a key that hold its index character."""
+        first = key[0]
+        return [position for position, char in enumerate(key) if char == first]
+
+    def _path(self, key: str) -> list[_TrieNode] | None:
+        """Get the nodes along a key's path, root first.
+
+        Args:
+            key: Key to walk
+
+        Returns:
+            Nodes for each prefix of key (root included), or None if the path is missing
+        """
+        node = self._root
+        path = [node]
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                return None
+            node = child
+            path.append(node)
+        return path
+
+    def _end_node(self, key: str) -> _TrieNode:
+        """Get the node a key ends at, creating missing nodes along the way."""
+        node = self._root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+        return node
+
+    def _prune(self, key: str, path: list[_TrieNode]) -> None:
+        """Delete nodes left empty at the end of a path."""
+        for depth in range(len(key), 0, -1):
+            if not path[depth].is_empty():
+                return
+            del path[depth - 1].children[key[depth - 1]]
+
+    def insert(self, correction: Correction) -> None:
+        """Store a correction.
+
+        Args:
+            correction: (typo, word, boundary) tuple with a non-empty typo
+        """
+        typo = correction[0]
+        corrections = self._entries.get(typo)
+        if corrections is not None:
+            if correction not in corrections:
+                corrections.append(correction)
+            return
+
+        self._entries[typo] = [correction]
+        key = self._key(typo)
+        self._end_node(key).typo = typo
+        for anchor in self._anchors(key)[1:]:
+            node = self._end_node(key[anchor:])
+            if node.owners is None:
+                node.owners = set()
+            node.owners.add(typo)
+
+    def remove(self, correction: Correction) -> None:
+        """Delete a correction if it is stored.
+
+        Args:
+            correction: (typo, word, boundary) tuple
+        """
+        typo = correction[0]
+        corrections = self._entries.get(typo)
+        if corrections is None or correction not in corrections:
+            return
+        corrections.remove(correction)
+        if corrections:
+            return
+
+        del self._entries[typo]
+        key = self._key(typo)
+        path = self._path(key)
+        if path is not None:
+            path[-1].typo = None
+            self._prune(key, path)
+        for anchor in self._anchors(key)[1:]:
+            suffix = key[anchor:]
+            suffix_path = self._path(suffix)
+            if suffix_path is None or suffix_path[-1].owners is None:
+                continue
+            suffix_path[-1].owners.discard(typo)
+            self._prune(suffix, suffix_path)
+
+    def _corrections_for(self, typos: set[str]) -> list[Correction]:
+        """Get the stored corrections for typos, shortest typo first."""
+        return [
+            correction
+            for typo in sorted(typos, key=lambda t: (len(t), t))
+            for correction in self._entries[typo]
+        ]
+
+    def contained_in(self, typo: str) -> list[Correction]:
+        """Find stored corrections whose typo occurs in a typo at an anchor.
+
+        These are the shorter typos that might block it. A stored typo equal to the
+        given one is included as well.
+
+        Args:
+            typo: Typo to look up (need not be stored)
+
+        Returns:
+            Matching corrections, shortest typo first
+        """
+        if not typo:
+            return []
+        key = self._key(typo)
+        found: set[str] = set()
+        for anchor in self._anchors(key):
+            node = self._root
+            for char in key[anchor:]:
+                child = node.children.get(char)
+                if child is None:
+                    break
+                node = child
+                if node.typo is not None:
+                    found.add(node.typo)
+        return self._corrections_for(found)
+
+    def containing(self, typo: str) -> list[Correction]:
+        """Find stored corrections whose typo contains a typo at one of its anchors.
+
+        These are the longer typos that the given typo might block. A stored typo equal
+        to the given one is not included.
+
+        Args:
+            typo: Typo to look up (need not be stored)
+
+        Returns:
+            Matching corrections, shortest typo first
+        """
+        if not typo:
+            return []
+        path = self._path(self._key(typo))
+        if path is None:
+            return []
+        found: set[str] = set()
+        for node in self._subtree(path[-1]):
+            if node.typo is not None:
+                found.add(node.typo)
+            if node.owners:
+                found.update(node.owners)
+        found.discard(typo)
+        return self._corrections_for(found)
+
+    @staticmethod
+    def _subtree(node: _TrieNode) -> Iterator[_TrieNode]:
+        """Iterate over a node and all its descendants."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(current.children.values())
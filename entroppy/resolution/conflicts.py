@@ -11,12 +11,12 @@ When typing "wherre":
 """
 
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from entroppy.core import BoundaryType, Correction
 
 from .conflict_logging import log_blocked_correction, log_kept_correction
+from .conflict_trie import ConflictTrie
 
 if TYPE_CHECKING:
     from entroppy.utils.debug import DebugTypoMatcher
@@ -173,39 +173,29 @@ def get_detector_for_boundary(boundary: BoundaryType) -> ConflictDetector:
 
 
 def _check_if_typo_is_blocked(
-    typo: str,
-    candidate: str,
-    typo_to_correction: dict[str, Correction],
+    long_correction: Correction,
+    short_correction: Correction,
     detector: ConflictDetector,
     debug_words: set[str],
     debug_typo_matcher: "DebugTypoMatcher | None",
-) -> Correction | None:
-    """Check if a typo is blocked by a candidate typo.
+) -> bool:
+    """Check if a correction is blocked by a correction with a shorter typo.
 
     Args:
-        typo: The typo to check
-        candidate: The candidate typo that might block it
-        typo_to_correction: Map from typo to full correction
+        long_correction: The correction to check
+        short_correction: The candidate correction that might block it
         detector: Conflict detector for this boundary type
         debug_words: Set of words to debug
         debug_typo_matcher: Matcher for debug typos
 
     Returns:
-        The blocking correction if the typo is blocked, None otherwise
+        True if long_correction is blocked by short_correction, False otherwise
     """
-    # Quick substring check first
-    if not detector.contains_substring(typo, candidate):
-        return None
-
-    # Validate with full conflict detection
-    long_correction = typo_to_correction[typo]
-    short_correction = typo_to_correction[candidate]
-
-    long_word = long_correction[1]
-    short_word = short_correction[1]
+    typo, long_word, _ = long_correction
+    candidate, short_word, _ = short_correction
 
     if not detector.check_conflict(typo, candidate, long_word, short_word):
-        return None
+        return False
 
     # Debug logging for blocked corrections
     log_blocked_correction(
@@ -219,59 +209,41 @@ def _check_if_typo_is_blocked(
         debug_typo_matcher,
     )
 
-    return short_correction
+    return True
 
 
 def _process_typo_for_conflicts(
-    typo: str,
-    index_key: str,
-    candidates_by_char: defaultdict[str, list[str]],
-    typo_to_correction: dict[str, Correction],
+    correction: Correction,
+    trie: ConflictTrie,
     detector: ConflictDetector,
-    typos_to_remove: set[str],
     blocking_map: dict[Correction, Correction],
-    boundary: BoundaryType,
     debug_words: set[str],
     debug_typo_matcher: "DebugTypoMatcher | None",
 ) -> bool:
-    """Process a single typo to check for conflicts and update the index.
+    """Process a single correction to check for conflicts and update the trie.
 
     Args:
-        typo: The typo to process
-        index_key: The character key for indexing this typo
-        candidates_by_char: Index mapping characters to candidate typos
-        typo_to_correction: Map from typo to full correction
+        correction: The correction to process
+        trie: Trie of the shorter corrections kept so far
         detector: Conflict detector for this boundary type
-        typos_to_remove: Set of typos that should be removed
         blocking_map: Map from blocked correction to blocking correction
-        boundary: The boundary type
         debug_words: Set of words to debug
         debug_typo_matcher: Matcher for debug typos
 
     Returns:
-        True if the typo was blocked, False otherwise
+        True if the correction was blocked, False otherwise
     """
-    # Check against candidates that share the same index character
-    if index_key in candidates_by_char:
-        for candidate in candidates_by_char[index_key]:
-            blocking_correction = _check_if_typo_is_blocked(
-                typo,
-                candidate,
-                typo_to_correction,
-                detector,
-                debug_words,
-                debug_typo_matcher,
-            )
-            if blocking_correction is not None:
-                blocked_correction = typo_to_correction[typo]
-                typos_to_remove.add(typo)
-                blocking_map[blocked_correction] = blocking_correction
-                return True
-
-    # If not blocked, add to index for future comparisons
-    candidates_by_char[index_key].append(typo)
-    correction = typo_to_correction[typo]
-    log_kept_correction(correction, boundary, debug_words, debug_typo_matcher)
+    # Only shorter typos occurring at the typo's index character can block it
+    for candidate in trie.contained_in(correction[0]):
+        if _check_if_typo_is_blocked(
+            correction, candidate, detector, debug_words, debug_typo_matcher
+        ):
+            blocking_map[correction] = candidate
+            return True
+
+    # If not blocked, add to the trie for future comparisons
+    trie.insert(correction)
+    log_kept_correction(correction, correction[2], debug_words, debug_typo_matcher)
     return False
 
 
@@ -283,7 +255,7 @@ def build_typo_index(
     debug_typo_matcher: "DebugTypoMatcher | None",
     collect_blocking_map: bool = False,
 ) -> tuple[set[str], dict[Correction, Correction]]:
-    """Build character-based index and identify blocked typos.
+    """Build a typo trie and identify blocked typos.
 
     Args:
         corrections: List of corrections with the same boundary type
@@ -309,27 +281,22 @@ def build_typo_index(
     # Map from blocked correction to blocking correction
     blocking_map: dict[Correction, Correction] = {}
 
-    # Build character-based index for efficient lookup
-    # Maps character → list of typos with that character at the relevant position
-    candidates_by_char: defaultdict[str, list[str]] = defaultdict(list)
+    # Trie of the corrections kept so far (none longer than the next typo)
+    trie = ConflictTrie.for_boundary(boundary)
 
     for typo in sorted_typos:
         if not typo:
             continue
 
-        index_key = detector.get_index_key(typo)
-        _process_typo_for_conflicts(
-            typo,
-            index_key,
-            candidates_by_char,
-            typo_to_correction,
+        if _process_typo_for_conflicts(
+            typo_to_correction[typo],
+            trie,
             detector,
-            typos_to_remove,
             blocking_map if collect_blocking_map else {},
-            boundary,
             debug_words,
             debug_typo_matcher,
-        )
+        ):
+            typos_to_remove.add(typo)
 
     return typos_to_remove, blocking_map
 
@@ -343,9 +310,8 @@ def resolve_conflicts_for_group(
 ) -> tuple[list[Correction], dict[Correction, Correction]]:
     """Remove substring conflicts from a group of corrections with the same boundary.
 
-    Uses character-based indexing for efficient O(n*k) performance where:
-    - n = number of corrections
-    - k = average number of candidates per character (typically small)
+    Uses a typo trie, so each correction is checked in O(L²) for typo length L
+    regardless of how many corrections share its index character.
 
     Args:
         corrections: List of corrections with the same boundary type
@@ -0,0 +1,227 @@
+"""Append-only binary log of solver lifecycle events for the debug reports.
+
+With --debug-graveyard, --debug-patterns or --debug-corrections the state records
+every graveyard addition, pattern change or correction change, and with --debug-words
+or --debug-typos every change to a debug target. Holding one object per event in
+memory until Stage 9 costs as much as the solver state itself on large runs. Each
+event is instead packed into a fixed-width record and streamed to an anonymous
+temporary file:
+
+    kind (uint8, a ChangeKind), 3 pad bytes, iteration (uint32),
+    pass name id, reason id, blocker id (uint32 each), correction key (int64),
+    monotonic time in ns since the log was opened (uint64)
+
+36 bytes per event, little-endian. The correction key comes from the state's
+CorrectionTable; pass names, reasons and blockers are interned in the log's own text
+table (id 0 means none). Both tables live in memory, so only the process that wrote
+the file can decode it, and it is deleted when the log is closed. Reports read it back
+with ``EventLog.read``, which decodes records lazily in chunks.
+"""
+
+from collections.abc import Collection, Iterator, Mapping
+from dataclasses import dataclass
+import os
+import struct
+import tempfile
+import time
+
+from entroppy.core import BoundaryType, CorrectionTable
+from entroppy.resolution.state_delta import ChangeKind
+
+_RECORD = struct.Struct("<B3xIIIIqQ")
+
+# Records held in memory before they are written out, and read back per chunk
+_CHUNK_RECORDS = 4096
+
+_ACTIONS = {
+    ChangeKind.CORRECTION_ADDED: "added",
+    ChangeKind.CORRECTION_REMOVED: "removed",
+    ChangeKind.PATTERN_ADDED: "added",
+    ChangeKind.PATTERN_REMOVED: "removed",
+    ChangeKind.GRAVEYARD_ADDED: "rejected",
+}
+
+# Actions shown in the debug target trace, which mixes corrections and patterns
+TRACE_ACTIONS = {
+    ChangeKind.CORRECTION_ADDED: "added",
+    ChangeKind.CORRECTION_REMOVED: "removed",
+    ChangeKind.PATTERN_ADDED: "added_pattern",
+    ChangeKind.PATTERN_REMOVED: "removed_pattern",
+    ChangeKind.GRAVEYARD_ADDED: "rejected",
+}
+
+# Kinds read by each debug report
+ALL_EVENTS = tuple(ChangeKind)
+CORRECTION_EVENTS = (ChangeKind.CORRECTION_ADDED, ChangeKind.CORRECTION_REMOVED)
+PATTERN_EVENTS = (ChangeKind.PATTERN_ADDED, ChangeKind.PATTERN_REMOVED)
+GRAVEYARD_EVENTS = (ChangeKind.GRAVEYARD_ADDED,)
+
+
+@dataclass(frozen=True)
+class LifecycleEvent:
+    """A decoded event.
+
+    Attributes:
+        kind: What happened
+        iteration: Solver iteration
+        pass_name: Name of the pass that made the change
+        action: "added", "removed" or "rejected" (see TRACE_ACTIONS for the trace)
+        typo: The typo string
+        word: The correct word
+        boundary: The boundary type
+        reason: Removal reason, or the RejectionReason value for graveyard entries
+        blocker: What blocked a graveyard entry, if known
+        timestamp: Wall-clock time of the event (seconds since the epoch)
+    """
+
+    kind: ChangeKind
+    iteration: int
+    pass_name: str
+    action: str
+    typo: str
+    word: str
+    boundary: BoundaryType
+    reason: str | None
+    blocker: str | None
+    timestamp: float
+
+
+class EventLog:
+    """Append-only lifecycle event log backed by an anonymous temporary file.
+
+    Events are buffered and written in chunks of _CHUNK_RECORDS records.
+    """
+
+    def __init__(
+        self, table: CorrectionTable, actions: Mapping[ChangeKind, str] = _ACTIONS
+    ) -> None:
+        """Open a new, empty log.
+
+        Args:
+            table: Table that encodes the correction keys passed to record()
+            actions: Action name reported for each kind of event
+        """
+        self._table = table
+        self._actions = actions
+        # pylint: disable=consider-using-with
+        # Acceptable pattern: the file stays open for the lifetime of the log and is
+        # closed by close().
+        self._file = tempfile.TemporaryFile()
+        self._buffer = bytearray()
+        self._texts: list[str] = [""]
+        self._text_ids: dict[str, int] = {}
+        self._counts = [0] * len(ChangeKind)
+        self._wall_start_ns = time.time_ns()
+        self._mono_start_ns = time.monotonic_ns()
+
+    def __len__(self) -> int:
+        """Number of recorded events."""
+        return sum(self._counts)
+
+    def _text_id(self, text: str | None) -> int:
+        """Get the id of a text, interning it on first sight."""
+        if text is None:
+            return 0
+        text_id = self._text_ids.get(text)
+        if text_id is None:
+            text_id = len(self._texts)
+            self._text_ids[text] = text_id
+            self._texts.append(text)
+        return text_id
+
+    def record(
+        self,
+        kind: ChangeKind,
+        key: int,
+        iteration: int,
+        pass_name: str,
+        reason: str | None = None,
+        blocker: str | None = None,
+    ) -> None:
+        """Append an event.
+
+        Args:
+            kind: What happened
+            key: Correction key from the table
+            iteration: Current solver iteration
+            pass_name: Name of the pass making the change
+            reason: Optional removal or rejection reason
+            blocker: Optional identifier of what blocked a graveyard entry
+        """
+        self._buffer += _RECORD.pack(
+            kind,
+            iteration,
+            self._text_id(pass_name),
+            self._text_id(reason),
+            self._text_id(blocker),
+            key,
+            time.monotonic_ns() - self._mono_start_ns,
+        )
+        self._counts[kind] += 1
+        if len(self._buffer) >= _CHUNK_RECORDS * _RECORD.size:
+            self.flush()
+
+    def count(self, kinds: Collection[ChangeKind]) -> int:
+        """Count recorded events of some kinds without reading the file.
+
+        Args:
+            kinds: Kinds to count
+
+        Returns:
+            Number of events of those kinds
+        """
+        return sum(self._counts[kind] for kind in kinds)
+
+    def flush(self) -> None:
+        """Write buffered events to the file."""
+        if self._buffer:
+            self._file.seek(0, os.SEEK_END)
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def read(self, kinds: Collection[ChangeKind]) -> Iterator[LifecycleEvent]:
+        """Read events of some kinds back, in the order they were recorded.
+
+        Args:
+            kinds: Kinds to return
+
+        Yields:
+            Decoded events
+        """
+        self.flush()
+        wanted = set(kinds)
+        texts = self._texts
+        actions = self._actions
+        decode = self._table.decode
+        chunk_size = _CHUNK_RECORDS * _RECORD.size
+        offset = 0
+        while True:
+            self._file.seek(offset)
+            chunk = self._file.read(chunk_size)
+            if not chunk:
+                return
+            offset += len(chunk)
+            for kind, iteration, pass_id, reason_id, blocker_id, key, ns in _RECORD.iter_unpack(
+                chunk
+            ):
+                if kind not in wanted:
+                    continue
+                typo, word, boundary = decode(key)
+                yield LifecycleEvent(
+                    kind=ChangeKind(kind),
+                    iteration=iteration,
+                    pass_name=texts[pass_id],
+                    action=actions[kind],
+                    typo=typo,
+                    word=word,
+                    boundary=boundary,
+                    reason=texts[reason_id] if reason_id else None,
+                    blocker=texts[blocker_id] if blocker_id else None,
+                    timestamp=(self._wall_start_ns + ns) / 1e9,
+                )
+
+    def close(self) -> None:
+        """Close and delete the file; the log cannot be read afterwards."""
+        self._buffer.clear()
+        self._file.close()
@@ -1,8 +1,6 @@
 """False trigger checking logic for boundary selection."""
 
-from typing import TYPE_CHECKING, Any
-
-from tqdm import tqdm
+from typing import TYPE_CHECKING
 
 from entroppy.core import BoundaryType
 from entroppy.core.boundaries import (
@@ -11,9 +9,17 @@ from entroppy.core.boundaries import (
     would_trigger_at_end,
     would_trigger_at_start,
 )
-from entroppy.core.boundaries.detection import _batch_check_substrings
 
 from .boundaries.utils import _check_typo_in_target_word
+from .false_trigger_flags import (
+    END_SRC,
+    END_VAL,
+    START_SRC,
+    START_VAL,
+    SUBSTRING_SRC,
+    SUBSTRING_VAL,
+    FalseTriggerFlags,
+)
 
 if TYPE_CHECKING:
     pass
@@ -119,7 +125,7 @@ def _check_false_trigger_with_details(
     validation_index: BoundaryIndex,
     source_index: BoundaryIndex,
     target_word: str | None = None,
-    batch_results: dict[str, dict[str, bool]] | None = None,
+    batch_results: FalseTriggerFlags | None = None,
 ) -> tuple[bool, dict[str, bool | str | None]]:
     """Check if boundary would cause false triggers and return details.
 
@@ -132,21 +138,21 @@ def _check_false_trigger_with_details(
         validation_index: Boundary index for validation set
         source_index: Boundary index for source words
         target_word: Optional target word to check against
-        batch_results: Optional pre-computed batch results dict with keys:
-            'start_val', 'end_val', 'substring_val', 'start_src', 'end_src', 'substring_src'
+        batch_results: Optional pre-computed batch results (packed start/end/substring
+            flags for validation and source words)
 
     Returns:
         Tuple of (would_cause_false_trigger, details_dict)
     """
     # Use batch results if available, otherwise compute individually
-    if batch_results and typo in batch_results:
-        batch = batch_results[typo]
-        would_trigger_start_val = batch.get("start_val", False)
-        would_trigger_end_val = batch.get("end_val", False)
-        is_substring_val = batch.get("substring_val", False)
-        would_trigger_start_src = batch.get("start_src", False)
-        would_trigger_end_src = batch.get("end_src", False)
-        is_substring_src = batch.get("substring_src", False)
+    mask = batch_results.mask(typo) if batch_results is not None else None
+    if mask is not None:
+        would_trigger_start_val = bool(mask & START_VAL)
+        would_trigger_end_val = bool(mask & END_VAL)
+        is_substring_val = bool(mask & SUBSTRING_VAL)
+        would_trigger_start_src = bool(mask & START_SRC)
+        would_trigger_end_src = bool(mask & END_SRC)
+        is_substring_src = bool(mask & SUBSTRING_SRC)
     else:
         # Fallback to individual checks
         would_trigger_start_val = would_trigger_at_start(typo, validation_index)
@@ -208,65 +214,24 @@ def batch_check_false_triggers(
     typos: list[str],
     validation_index: BoundaryIndex,
     source_index: BoundaryIndex,
-    verbose: bool = False,
-    pass_name: str = "BatchCheck",
-) -> dict[str, dict[str, bool]]:
+) -> FalseTriggerFlags:
     """Batch check false trigger conditions for multiple typos.
 
-    Pre-computes validation and source index checks for all typos at once,
-    which is much faster than checking individually.
-
-    Uses suffix array for substring detection (O(log N) queries - algorithmically optimal).
+    All six checks (start/end/substring against validation and source words) are
+    computed in a single Rust call that releases the GIL, runs across all cores and
+    uses early-exit suffix array queries instead of materialising match lists.
 
     Args:
         typos: List of typo strings to check
         validation_index: Boundary index for validation set
         source_index: Boundary index for source words
-        verbose: Whether to show progress bar
-        pass_name: Name of the pass (for progress bar)
 
     Returns:
-        Dict mapping typo -> dict with keys: 'start_val', 'end_val', 'substring_val',
-        'start_src', 'end_src', 'substring_src'
+        FalseTriggerFlags mapping typo -> packed start/end/substring flags for
+        validation and source words
     """
-    # Batch check all typos at once
-    start_val_results = validation_index.batch_check_start(typos)
-    end_val_results = validation_index.batch_check_end(typos)
-
-    progress_bar: Any = None
-    if verbose and len(typos) > 1000:
-        progress_bar = tqdm(
-            total=4,
-            desc=f"    {pass_name} (batch checks)",
-            unit="check",
-            leave=False,
-        )
-        progress_bar.update(2)  # start/end checks done
-
-    # Get substring checks using suffix array (efficient)
-    substring_val_results, substring_src_results = _batch_check_substrings(
-        typos, validation_index, source_index
-    )
-
-    if progress_bar:
-        progress_bar.update(1)
-
-    start_src_results = source_index.batch_check_start(typos)
-    end_src_results = source_index.batch_check_end(typos)
-    if progress_bar:
-        progress_bar.update(1)
-        progress_bar.close()
-
-    # Combine results
-    batch_results: dict[str, dict[str, bool]] = {}
-    for typo in typos:
-        batch_results[typo] = {
-            "start_val": start_val_results[typo],
-            "end_val": end_val_results[typo],
-            "substring_val": substring_val_results[typo],
-            "start_src": start_src_results[typo],
-            "end_src": end_src_results[typo],
-            "substring_src": substring_src_results[typo],
-        }
-
-    return batch_results
+    unique_typos = list(dict.fromkeys(typos))
+    val_suffix_index = validation_index.get_suffix_array_index()
+    src_suffix_index = source_index.get_suffix_array_index()
+    masks = val_suffix_index.batch_boundary_flags(unique_typos, src_suffix_index)
+    return FalseTriggerFlags.from_masks(unique_typos, masks)
@@ -0,0 +1,150 @@
+"""Compact container for batch false trigger check results."""
+
+from collections.abc import Iterable, Iterator
+
+# Flag names in bit order; bit i of a typo's mask is set when FLAG_NAMES[i] is True.
+# The Rust kernel (batch_false_trigger_flags) uses the same layout.
+FLAG_NAMES: tuple[str, ...] = (
+    "start_val",
+    "end_val",
+    "substring_val",
+    "start_src",
+    "end_src",
+    "substring_src",
+)
+
+START_VAL = 1 << 0
+END_VAL = 1 << 1
+SUBSTRING_VAL = 1 << 2
+START_SRC = 1 << 3
+END_SRC = 1 << 4
+SUBSTRING_SRC = 1 << 5
+
+
+class FalseTriggerFlags:
+    """Typo -> uint8 bitmask of start/end/substring checks against validation and source.
+
+    Typos are stored in a list and their masks in a parallel bytearray, so the container
+    pickles as one list of strings plus one bytes object instead of a dict of dicts.
+    The typo -> position map is rebuilt lazily after unpickling (e.g. in workers).
+    """
+
+    __slots__ = ("_typos", "_masks", "_ids")
+
+    def __init__(self) -> None:
+        """Initialize an empty container."""
+        self._typos: list[str] = []
+        self._masks = bytearray()
+        self._ids: dict[str, int] | None = {}
+
+    def _id_map(self) -> dict[str, int]:
+        """Get the typo -> position map, building it if needed."""
+        if self._ids is None:
+            self._ids = {typo: i for i, typo in enumerate(self._typos)}
+        return self._ids
+
+    def __len__(self) -> int:
+        """Number of typos with stored results."""
+        return len(self._typos)
+
+    def __contains__(self, typo: object) -> bool:
+        """Check if results are stored for a typo."""
+        return typo in self._id_map()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over typos with stored results, in insertion order."""
+        return iter(self._typos)
+
+    def __getstate__(self) -> tuple[list[str], bytes]:
+        """Pickle only the typo list and packed masks."""
+        return self._typos, bytes(self._masks)
+
+    def __setstate__(self, state: tuple[list[str], bytes]) -> None:
+        """Restore from pickled state; the id map is rebuilt on first lookup."""
+        self._typos, masks = state
+        self._masks = bytearray(masks)
+        self._ids = None
+
+    def set(self, typo: str, mask: int) -> None:
+        """Store the bitmask for a typo, replacing any existing one.
+
+        Args:
+            typo: The typo string
+            mask: Bitmask of START_VAL ... SUBSTRING_SRC bits
+        """
+        ids = self._id_map()
+        position = ids.get(typo)
+        if position is None:
+            ids[typo] = len(self._typos)
+            self._typos.append(typo)
+            self._masks.append(mask)
+        else:
+            self._masks[position] = mask
+
+    def mask(self, typo: str) -> int | None:
+        """Get the bitmask for a typo.
+
+        Args:
+            typo: The typo string
+
+        Returns:
+            Bitmask, or None if no results are stored for the typo
+        """
+        position = self._id_map().get(typo)
+        return None if position is None else self._masks[position]
+
+    def get(self, typo: str) -> dict[str, bool] | None:
+        """Get results for a typo in the legacy dict form.
+
+        Args:
+            typo: The typo string
+
+        Returns:
+            Dict with keys 'start_val', 'end_val', 'substring_val', 'start_src',
+            'end_src', 'substring_src', or None if no results are stored for the typo
+        """
+        mask = self.mask(typo)
+        if mask is None:
+            return None
+        return {name: bool(mask & (1 << bit)) for bit, name in enumerate(FLAG_NAMES)}
+
+    @classmethod
+    def from_masks(cls, typos: list[str], masks: bytes) -> "FalseTriggerFlags":
+        """Build a container from parallel typo and mask sequences.
+
+        Args:
+            typos: Typos, one per mask (must be unique)
+            masks: One bitmask byte per typo
+
+        Returns:
+            New FalseTriggerFlags holding the given results
+        """
+        result = cls.__new__(cls)
+        result.__setstate__((list(typos), bytes(masks)))
+        return result
+
+    def update(self, other: "FalseTriggerFlags") -> None:
+        """Copy all results from another container into this one.
+
+        Args:
+            other: Container to copy from
+        """
+        typos, masks = other.__getstate__()
+        for typo, mask in zip(typos, masks):
+            self.set(typo, mask)
+
+    def subset(self, typos: Iterable[str]) -> "FalseTriggerFlags":
+        """Build a container holding only the given typos' results.
+
+        Args:
+            typos: Typos to keep (typos without stored results are skipped)
+
+        Returns:
+            New FalseTriggerFlags with the requested typos
+        """
+        result = FalseTriggerFlags()
+        for typo in typos:
+            mask = self.mask(typo)
+            if mask is not None:
+                result.set(typo, mask)
+        return result
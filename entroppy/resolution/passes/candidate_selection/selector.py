@@ -1,6 +1,6 @@
 """Candidate Selection Pass - promotes raw typos to active corrections."""
 
-from multiprocessing import Pool
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
@@ -8,15 +8,21 @@ from tqdm import tqdm
 
 from entroppy.core import BoundaryType
 from entroppy.core.boundaries import batch_determine_boundaries
-from entroppy.resolution.false_trigger_check import batch_check_false_triggers
+from entroppy.resolution.false_trigger_flags import FalseTriggerFlags
 from entroppy.resolution.passes.candidate_selection_workers import _process_typo_batch_worker
-from entroppy.resolution.solver import Pass
+from entroppy.resolution.solver import Pass, PassContext
 from entroppy.resolution.state import RejectionReason
+from entroppy.resolution.state_delta import StateDelta
 from entroppy.resolution.worker_context import (
     CandidateSelectionContext,
+    CandidateSelectionUpdate,
+    apply_candidate_selection_update,
     init_candidate_selection_worker,
+    update_candidate_selection_worker,
 )
+from entroppy.utils.chunk_scheduler import ChunkScheduler
 from entroppy.utils.helpers import cached_word_frequency
+from entroppy.utils.worker_pool import borrow_pool
 
 from .filters import _check_length_constraints, _is_excluded
 from .helpers import _get_boundary_order, group_words_by_boundary
@@ -30,13 +36,48 @@ class CandidateSelectionPass(Pass):
 
     Iterates through raw typos, checks coverage, resolves collisions, and adds corrections.
     Implements self-healing via Graveyard: if (typo, word, NONE) fails, tries stricter boundaries.
+
+    Incremental: after the first run, only typos uncovered by a removal since the last
+    run are retried. A typo that stayed uncovered already failed every boundary, and
+    the graveyard only grows, so retrying it cannot add anything.
     """
 
+    incremental = True
+
+    def __init__(self, context: PassContext) -> None:
+        """Initialize the pass with context.
+
+        Args:
+            context: Shared context with resources
+        """
+        super().__init__(context)
+        # Context last sent to parallel workers, and the journal position it covers
+        self._worker_context: CandidateSelectionContext | None = None
+        self._worker_cursor = 0
+        # Learns per-typo costs across iterations; the prior weighs collisions 4x
+        self._scheduler: ChunkScheduler[tuple[str, list[str]]] = ChunkScheduler(
+            self._typo_cost_features, prior=(1.0, 3.0, 0.0, 0.0)
+        )
+
     @property
     def name(self) -> str:
         """Return the name of this pass."""
         return "CandidateSelection"
 
+    def is_affected_by(self, delta: StateDelta) -> bool:
+        """Only removed corrections can uncover typos."""
+        return bool(delta.removed_corrections)
+
+    def checkpoint(self) -> tuple[list[float], bool]:
+        """Keep the learned chunk cost weights."""
+        model = self._scheduler.model
+        return list(model.weights), model.fitted
+
+    def restore(self, data: tuple[list[float], bool]) -> None:
+        """Restore the learned chunk cost weights."""
+        model = self._scheduler.model
+        model.weights, model.fitted = list(data[0]), data[1]
+
     def run(self, state: "DictionaryState") -> None:
         """Run the candidate selection pass.
 
@@ -47,30 +88,25 @@ class CandidateSelectionPass(Pass):
         if not typos_to_process:
             return
 
-        # Batch check all typos for false triggers (optimization)
+        # Batch check false triggers, reusing results memoized in earlier iterations
         all_typos = [typo for typo, _ in typos_to_process]
         if all_typos:
-            batch_results = batch_check_false_triggers(
-                all_typos,
-                self.context.validation_index,
-                self.context.source_index,
-                verbose=self.context.verbose,
-                pass_name=self.name,
-            )
-            state.caching.set_batch_false_trigger_results(batch_results)
-
-            # Batch determine boundaries for all typos (optimization)
-            boundary_map = batch_determine_boundaries(
+            batch_results, computed = state.caching.ensure_batch_false_trigger_results(
                 all_typos,
                 self.context.validation_index,
                 self.context.source_index,
             )
+            if self.context.verbose:
+                logger.info(
+                    f"  False trigger checks: {computed} computed, "
+                    f"{len(all_typos) - computed} reused"
+                )
         else:
-            boundary_map = {}
+            batch_results = FalseTriggerFlags()
 
         # Use multiprocessing if jobs > 1 and we have enough work
         if self.context.jobs > 1 and len(typos_to_process) > 100:
-            self._run_parallel(state, typos_to_process, boundary_map)
+            self._run_parallel(state, typos_to_process, batch_results)
         else:
             self._run_sequential(state, typos_to_process)
 
@@ -81,25 +117,30 @@ class CandidateSelectionPass(Pass):
             state: The dictionary state
 
         Returns:
-            List of (typo, word_list) tuples to process
+            List of (typo, unique word list) tuples to process
         """
         uncovered_typos = state.caching.get_uncovered_typos()
         if state.current_iteration == 1:
             # First iteration: check all typos and build uncovered set
             typos_to_process = []
-            for typo, word_list in state.raw_typo_map.items():
+            for typo in state.raw_typo_map:
                 if not state.is_typo_covered(typo):
-                    typos_to_process.append((typo, word_list))
+                    typos_to_process.append((typo, state.raw_typo_map.unique_words(typo)))
                     uncovered_typos.add(typo)
             return typos_to_process
 
         # Subsequent iterations: early termination if no uncovered typos
         if not uncovered_typos:
             return []
+        candidates: Iterable[str] = uncovered_typos
+        if self.delta is not None:
+            # Only typos uncovered since the last run can still gain a correction
+            typo_of = self.delta.table.typo_of
+            candidates = set(map(typo_of, self.delta.removed_corrections)) & uncovered_typos
         # Only process uncovered typos
         return [
-            (typo, state.raw_typo_map[typo])
-            for typo in uncovered_typos
+            (typo, state.raw_typo_map.unique_words(typo))
+            for typo in candidates
             if typo in state.raw_typo_map
         ]
 
@@ -132,55 +173,99 @@ class CandidateSelectionPass(Pass):
             else:
                 self._process_collision(state, typo, unique_words)
 
+    def _worker_update(
+        self,
+        state: "DictionaryState",
+        worker_context: CandidateSelectionContext,
+        typos: list[str],
+        batch_results: FalseTriggerFlags,
+    ) -> CandidateSelectionUpdate:
+        """Collect the entries workers have not received yet.
+
+        Args:
+            state: The dictionary state
+            worker_context: Context to send to workers
+            typos: Typos processed in this run
+            batch_results: Batch false trigger results for those typos
+
+        Returns:
+            Graveyard additions since the last parallel run, plus boundaries and false
+            trigger results for typos no earlier run sent
+        """
+        # Workers have no correction table, so they get the corrections as tuples
+        if self._worker_context is None:
+            graveyard_added = frozenset(state.graveyard)
+        else:
+            added_keys = state.changes.graveyard_added_since(self._worker_cursor)
+            graveyard_added = frozenset(map(state.correction_table.decode, added_keys))
+        self._worker_cursor = state.changes.cursor
+
+        # Boundaries and false trigger results never change during a run
+        sent = worker_context.batch_false_trigger_results
+        new_typos = [typo for typo in typos if typo not in sent]
+        boundary_map = batch_determine_boundaries(
+            new_typos,
+            self.context.validation_index,
+            self.context.source_index,
+        )
+        return CandidateSelectionUpdate(
+            graveyard_added=graveyard_added,
+            batch_false_trigger_results=batch_results.subset(new_typos),
+            boundary_map=boundary_map,
+        )
+
     def _run_parallel(
         self,
         state: "DictionaryState",
         typos_to_process: list[tuple[str, list[str]]],
-        boundary_map: dict[str, BoundaryType],
+        batch_results: FalseTriggerFlags,
     ) -> None:
         """Run candidate selection in parallel.
 
+        Workers keep their CandidateSelectionContext between runs and only receive the
+        entries added since the previous run.
+
         Args:
             state: The dictionary state to modify
             typos_to_process: List of (typo, word_list) tuples to process
-            boundary_map: Pre-calculated boundary map (typo -> BoundaryType)
+            batch_results: Batch false trigger results for the typos being processed
         """
-        # Build coverage and graveyard sets for workers
-        covered_typos = frozenset(
-            typo for typo in state.raw_typo_map.keys() if state.is_typo_covered(typo)
-        )
-        graveyard_set = frozenset(state.graveyard.keys())
-
-        # Create worker context
-        exclusion_set = frozenset(self.context.exclusion_set)
-
-        # Retrieve batch false trigger results from state caching
-        batch_results = state.caching.get_batch_false_trigger_results()
+        # Covered typos are skipped here rather than shipping a covered set to workers
+        typos_to_process = [
+            (typo, word_list)
+            for typo, word_list in typos_to_process
+            if not state.is_typo_covered(typo)
+        ]
+        if not typos_to_process:
+            return
 
-        worker_context = CandidateSelectionContext(
+        worker_context = self._worker_context or CandidateSelectionContext(
             validation_set=frozenset(self.context.filtered_validation_set),
             source_words=frozenset(self.context.source_words_set),
             min_typo_length=self.context.min_typo_length,
             collision_threshold=self.context.collision_threshold,
-            exclusion_set=exclusion_set,
-            covered_typos=covered_typos,
-            graveyard=graveyard_set,
-            batch_false_trigger_results=batch_results,
-            boundary_map=boundary_map,
+            exclusion_set=frozenset(self.context.exclusion_set),
+            graveyard=set(),
+            batch_false_trigger_results=FalseTriggerFlags(),
+            boundary_map={},
         )
+        update = self._worker_update(
+            state, worker_context, [typo for typo, _ in typos_to_process], batch_results
+        )
+        apply_candidate_selection_update(worker_context, update)
+        self._worker_context = worker_context
 
-        # Calculate optimal chunk size based on workload
-        chunks = self._calculate_optimal_chunks(typos_to_process, self.context.jobs)
+        # Balance chunks by estimated cost, most expensive first
+        chunks = self._scheduler.plan(typos_to_process, self.context.jobs)
 
         logger.info(f"  Using {self.context.jobs} parallel workers for candidate selection")
         logger.info(f"  Processing {len(typos_to_process)} typos in {len(chunks)} chunks")
 
-        with Pool(
-            processes=self.context.jobs,
-            initializer=init_candidate_selection_worker,
-            initargs=(worker_context,),
-        ) as pool:
-            results = pool.imap_unordered(_process_typo_batch_worker, chunks)
+        with borrow_pool(self.context.jobs) as pool:
+            # Workers that already hold the context only need this run's update
+            if not pool.broadcast(init_candidate_selection_worker, worker_context):
+                pool.broadcast(update_candidate_selection_worker, update)
+            results = self._scheduler.imap(pool, _process_typo_batch_worker, chunks)
 
             # Wrap with progress bar
             if self.context.verbose:
@@ -213,35 +298,23 @@ class CandidateSelectionPass(Pass):
                         typo, word, boundary, reason, blocker, pass_name=self.name
                     )
 
-    @staticmethod
-    def _calculate_optimal_chunks(
-        typos_to_process: list[tuple[str, list[str]]], num_workers: int
-    ) -> list[list[tuple[str, list[str]]]]:
-        """Calculate optimal chunk size and split typos into chunks.
+        if self.context.verbose:
+            self._scheduler.log_stats(self.context.jobs)
+
+    def _typo_cost_features(self, item: tuple[str, list[str]]) -> tuple[float, ...]:
+        """Cost features of one typo for the chunk scheduler.
 
         Args:
-            typos_to_process: List of (typo, word_list) tuples to process
-            num_workers: Number of parallel workers
+            item: (typo, word_list) tuple
 
         Returns:
-            List of chunks, each containing a list of (typo, word_list) tuples
+            Tuple of (1, is collision, word count, words x boundaries to try)
         """
-        # Estimate work per typo (single word vs collision)
-        single_word_typos = sum(1 for _, words in typos_to_process if len(set(words)) == 1)
-        collision_typos = len(typos_to_process) - single_word_typos
-
-        # Collisions are 3-5x more expensive
-        total_work_units = single_word_typos + (collision_typos * 4)
-
-        # Target 50-100 work units per chunk (balances overhead vs granularity)
-        optimal_chunks = max(num_workers, total_work_units // 75)
-        optimal_chunks = min(optimal_chunks, num_workers * 10)  # Cap at 10 chunks per worker
-
-        chunk_size = max(1, len(typos_to_process) // optimal_chunks)
-        return [
-            typos_to_process[i : i + chunk_size]
-            for i in range(0, len(typos_to_process), chunk_size)
-        ]
+        typo, word_list = item
+        boundary_map = self._worker_context.boundary_map if self._worker_context else {}
+        fan_out = len(_get_boundary_order(boundary_map.get(typo, BoundaryType.NONE)))
+        words = len(word_list)
+        return 1.0, float(words > 1), float(words), float(words * fan_out)
 
     def _try_boundary_for_correction(
         self,
@@ -401,10 +401,6 @@ def _process_typo_batch_worker(
     graveyard_entries: list[tuple[str, str, BoundaryType, RejectionReason, str | None]] = []
 
     for typo, word_list in batch:
-        # Skip if already covered
-        if typo in context.covered_typos:
-            continue
-
         # Get unique words for this typo
         unique_words = list(set(word_list))
 
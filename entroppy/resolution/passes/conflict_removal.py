@@ -1,19 +1,24 @@
 """Conflict Removal Pass - removes substring conflicts."""
 
 from collections import defaultdict
-from multiprocessing import Pool
 from typing import TYPE_CHECKING, Any
 
 from tqdm import tqdm
 
-from entroppy.core import BoundaryType
+from entroppy.core import BoundaryType, Correction
+from entroppy.resolution.conflict_trie import ConflictTrie
 from entroppy.resolution.conflicts import build_typo_index, get_detector_for_boundary
-from entroppy.resolution.solver import Pass
+from entroppy.resolution.solver import Pass, PassContext
 from entroppy.resolution.state import RejectionReason
+from entroppy.resolution.state_delta import StateDelta
+from entroppy.utils.worker_pool import borrow_pool
 
 if TYPE_CHECKING:
     from entroppy.resolution.state import DictionaryState
 
+# One detector per boundary, shared by all runs of the pass
+_DETECTORS = {boundary: get_detector_for_boundary(boundary) for boundary in BoundaryType}
+
 
 def _process_conflict_batch_worker(
     boundary: BoundaryType,
@@ -92,21 +97,54 @@ class ConflictRemovalPass(Pass):
         - This pass detects conflict: "tehir" starts with "teh"
         - Removes "tehir" with NONE, adds to graveyard
         - Next iteration: CandidateSelectionPass retries "tehir" with LEFT/RIGHT/BOTH
+
+    Incremental: the pass keeps one ConflictTrie per boundary holding the active items,
+    which are conflict-free after each run. Later runs delete removed items from the
+    tries and check each added item against them, both for shorter typos that block it
+    and for longer typos it blocks, instead of rebuilding anything.
     """
 
+    incremental = True
+
+    def __init__(self, context: PassContext) -> None:
+        """Initialize the pass with context.
+
+        Args:
+            context: Shared context with resources
+        """
+        super().__init__(context)
+        self._tries: dict[BoundaryType, ConflictTrie] = {}
+
     @property
     def name(self) -> str:
         """Return the name of this pass."""
         return "ConflictRemoval"
 
+    def is_affected_by(self, delta: StateDelta) -> bool:
+        """Only added corrections or patterns can create new conflicts."""
+        return bool(delta.added_corrections or delta.added_patterns)
+
     def run(self, state: "DictionaryState") -> None:
         """Run the conflict removal pass.
 
         Args:
             state: The dictionary state to modify
         """
+        if self.delta is None:
+            self._run_full(state)
+        else:
+            self._run_incremental(state, self.delta)
+
+    def _run_full(self, state: "DictionaryState") -> None:
+        """Check every active item and rebuild the tries from scratch.
+
+        Args:
+            state: The dictionary state to modify
+        """
+        self._tries = {boundary: ConflictTrie.for_boundary(boundary) for boundary in BoundaryType}
+
         # Combine active corrections and patterns - both can conflict with each other
-        all_corrections = list(state.active_corrections) + list(state.active_patterns)
+        all_corrections = self._active_items(state)
 
         if not all_corrections:
             return
@@ -122,6 +160,9 @@ class ConflictRemovalPass(Pass):
 
         if use_parallel:
             self._process_parallel(state, by_boundary)
+            # Workers build their own tries; index the survivors for incremental runs
+            for correction in self._active_items(state):
+                self._tries[correction[2]].insert(correction)
         else:
             # Process each boundary group sequentially
             if self.context.verbose:
@@ -134,22 +175,139 @@ class ConflictRemovalPass(Pass):
             else:
                 boundary_items = by_boundary.items()
 
-            for boundary, corrections in boundary_items:
-                self._process_boundary_group(state, corrections, boundary)
+            for _, corrections in boundary_items:
+                self._process_boundary_group(state, corrections)
+
+    def _run_incremental(self, state: "DictionaryState", delta: StateDelta) -> None:
+        """Update the tries with a delta and check only the added items.
+
+        Added items are processed shortest first, as in a full run, so an added item
+        that is itself blocked never blocks anything.
+
+        Args:
+            state: The dictionary state to modify
+            delta: Changes since the previous run
+        """
+        decode = delta.table.decode
+        for key in delta.removed_corrections | delta.removed_patterns:
+            correction = decode(key)
+            self._tries[correction[2]].remove(correction)
+
+        added = [(decode(key), key) for key in delta.added_corrections | delta.added_patterns]
+        for correction, key in sorted(added, key=lambda item: (len(item[0][0]), item[0][0])):
+            # Skip empty typos and items a shorter added item has already blocked
+            if not correction[0] or not self._is_active(state, key):
+                continue
+            if self._add_if_unblocked(state, correction):
+                self._remove_longer_blocked(state, correction)
+
+    @staticmethod
+    def _active_items(state: "DictionaryState") -> list[Correction]:
+        """Decode the active corrections and patterns."""
+        decode = state.correction_table.decode
+        return [
+            *map(decode, state.active_corrections.keys),
+            *map(decode, state.active_patterns.keys),
+        ]
+
+    @staticmethod
+    def _is_active(state: "DictionaryState", key: int) -> bool:
+        """Check if a correction key is an active correction or pattern."""
+        return key in state.active_corrections.keys or key in state.active_patterns.keys
+
+    def _add_if_unblocked(self, state: "DictionaryState", correction: Correction) -> bool:
+        """Add a correction to its trie, unless a shorter stored typo blocks it.
+
+        Args:
+            state: The dictionary state
+            correction: The correction to check
+
+        Returns:
+            True if the correction was kept and added to the trie
+        """
+        typo, word, boundary = correction
+        trie = self._tries[boundary]
+        detector = _DETECTORS[boundary]
+        for stored in trie.contained_in(typo):
+            # A correction removed and re-added since the last run is still stored,
+            # since the delta only reports it as added; it must not block itself
+            if stored == correction:
+                continue
+            short_typo, short_word, _ = stored
+            if detector.check_conflict(typo, short_typo, word, short_word):
+                self._block(state, correction, short_typo)
+                return False
+        trie.insert(correction)
+        return True
+
+    def _remove_longer_blocked(self, state: "DictionaryState", correction: Correction) -> None:
+        """Remove stored corrections with longer typos that a new correction blocks.
+
+        Args:
+            state: The dictionary state
+            correction: The newly kept correction
+        """
+        typo, word, boundary = correction
+        trie = self._tries[boundary]
+        detector = _DETECTORS[boundary]
+        for longer in trie.containing(typo):
+            long_typo, long_word, _ = longer
+            if detector.check_conflict(long_typo, typo, long_word, word):
+                trie.remove(longer)
+                self._block(state, longer, typo)
+
+    def _block(self, state: "DictionaryState", correction: Correction, blocker_typo: str) -> None:
+        """Move a blocked correction or pattern to the graveyard.
+
+        Args:
+            state: The dictionary state
+            correction: The blocked correction
+            blocker_typo: The shorter typo that blocks it
+        """
+        typo, word, boundary = correction
+        state.add_to_graveyard(
+            typo,
+            word,
+            boundary,
+            RejectionReason.BLOCKED_BY_CONFLICT,
+            blocker_typo,
+            pass_name=self.name,
+        )
+        self._remove_blocked(state, correction)
+
+    def _remove_blocked(self, state: "DictionaryState", correction: Correction) -> None:
+        """Remove a blocked correction or pattern from the active sets."""
+        typo_str, word, boundary_type = correction
+
+        # Remove from active set (it is either a correction or a pattern)
+        if not state.remove_correction(
+            typo_str,
+            word,
+            boundary_type,
+            self.name,
+            "Blocked by substring conflict",
+        ):
+            state.remove_pattern(
+                typo_str,
+                word,
+                boundary_type,
+                self.name,
+                "Blocked by substring conflict",
+            )
 
     def _shard_large_group(
-        self, corrections: list[tuple[str, str, BoundaryType]]
+        self, corrections: list[tuple[str, str, BoundaryType]], boundary: BoundaryType
     ) -> list[list[tuple[str, str, BoundaryType]]]:
-        """Shard a large group of corrections by first character."""
+        """Shard a large group of corrections by index character.
+
+        Typos only conflict with typos sharing their index character (the last one for
+        RIGHT boundaries), so shards can be checked independently. Empty typos share
+        the "" shard.
+        """
+        detector = _DETECTORS[boundary]
         sharded = defaultdict(list)
         for correction in corrections:
-            typo = correction[0]
-            if typo:
-                first_char = typo[0].lower()
-                sharded[first_char].append(correction)
-            else:
-                # Empty typos go to a special shard
-                sharded[""].append(correction)
+            sharded[detector.get_index_key(correction[0])].append(correction)
 
         return [shard for shard in sharded.values() if shard]
 
@@ -162,9 +320,9 @@ class ConflictRemovalPass(Pass):
             if not corrections:
                 continue
 
-            # For large groups (especially NONE), shard by first character
+            # For large groups (especially NONE), shard by index character
             if len(corrections) > 1000:
-                shards = self._shard_large_group(corrections)
+                shards = self._shard_large_group(corrections, boundary)
                 for shard_corrections in shards:
                     tasks.append((boundary, shard_corrections))
             else:
@@ -191,7 +349,7 @@ class ConflictRemovalPass(Pass):
             return
 
         # Process tasks in parallel
-        with Pool(processes=self.context.jobs) as pool:
+        with borrow_pool(self.context.jobs) as pool:
             if self.context.verbose:
                 # Use starmap_async for progress tracking
                 async_result = pool.starmap_async(_process_conflict_batch_worker, tasks)
@@ -216,25 +374,7 @@ class ConflictRemovalPass(Pass):
 
         # Apply removals in main thread
         for correction in blocked_corrections:
-            typo_str, word, boundary_type = correction
-
-            # Remove from active set (check both corrections and patterns)
-            if correction in state.active_corrections:
-                state.remove_correction(
-                    typo_str,
-                    word,
-                    boundary_type,
-                    self.name,
-                    "Blocked by substring conflict",
-                )
-            elif correction in state.active_patterns:
-                state.remove_pattern(
-                    typo_str,
-                    word,
-                    boundary_type,
-                    self.name,
-                    "Blocked by substring conflict",
-                )
+            self._remove_blocked(state, correction)
 
         # Add to graveyard
         for typo_str, word, boundary_type, blocker_typo in graveyard_entries:
@@ -247,158 +387,23 @@ class ConflictRemovalPass(Pass):
                 pass_name=self.name,
             )
 
-    def _check_typo_against_candidates(
-        self,
-        state: "DictionaryState",
-        typo: str,
-        index_key: str,
-        candidates_by_char: dict[str, list[str]],
-        typo_to_correction: dict[str, tuple[str, str, BoundaryType]],
-        detector,
-    ) -> bool:
-        """Check if typo is blocked by any candidate, returning True if blocked."""
-        if index_key not in candidates_by_char:
-            return False
-
-        for candidate in candidates_by_char[index_key]:
-            blocking_correction = self._check_if_blocked(
-                state,
-                typo,
-                candidate,
-                typo_to_correction,
-                detector,
-            )
-            if blocking_correction:
-                return True
-
-        return False
-
-    def _remove_blocked_corrections(
-        self,
-        state: "DictionaryState",
-        typos_to_remove: set[str],
-        typo_to_correction: dict[str, tuple[str, str, BoundaryType]],
-    ) -> None:
-        """Remove all blocked corrections/patterns from state."""
-        for typo in typos_to_remove:
-            correction = typo_to_correction[typo]
-            typo_str, word, boundary_type = correction
-
-            # Remove from active set (check both corrections and patterns)
-            if correction in state.active_corrections:
-                state.remove_correction(
-                    typo_str,
-                    word,
-                    boundary_type,
-                    self.name,
-                    "Blocked by substring conflict",
-                )
-            elif correction in state.active_patterns:
-                state.remove_pattern(
-                    typo_str,
-                    word,
-                    boundary_type,
-                    self.name,
-                    "Blocked by substring conflict",
-                )
-
     def _process_boundary_group(
         self,
         state: "DictionaryState",
         corrections: list[tuple[str, str, BoundaryType]],
-        boundary: BoundaryType,
     ) -> None:
         """Process a single boundary group to find and remove conflicts.
 
+        Typos are checked shortest first, so each one only needs to be compared with
+        the kept typos already in the trie.
+
         Args:
             state: The dictionary state
             corrections: List of corrections with the same boundary
-            boundary: The boundary type for this group
         """
-        if not corrections:
-            return
-
-        # Get the appropriate conflict detector for this boundary
-        detector = get_detector_for_boundary(boundary)
-
         # Build lookup map from typo to full correction
         typo_to_correction = {c[0]: c for c in corrections}
 
-        # Sort typos by length (shorter first)
-        sorted_typos = sorted(typo_to_correction.keys(), key=len)
-
-        # Track which typos are blocked
-        typos_to_remove = set()
-
-        # Build character-based index for efficient lookup
-        # Maps character → list of shorter typos with that character at the relevant position
-        # pylint: disable=duplicate-code
-        # Similar initialization pattern to conflicts.py, but logic diverges significantly
-        # after this point (uses state and different conflict checking)
-        candidates_by_char: dict[str, list[str]] = defaultdict(list)
-
-        for typo in sorted_typos:
-            if not typo:
-                continue
-
-            index_key = detector.get_index_key(typo)
-
-            # Check against candidates that share the same index character
-            if self._check_typo_against_candidates(
-                state, typo, index_key, candidates_by_char, typo_to_correction, detector
-            ):
-                typos_to_remove.add(typo)
-            else:
-                # If not blocked, add to index for future comparisons
-                candidates_by_char[index_key].append(typo)
-
-        # Remove all blocked corrections/patterns
-        self._remove_blocked_corrections(state, typos_to_remove, typo_to_correction)
-
-    def _check_if_blocked(
-        self,
-        state: "DictionaryState",
-        long_typo: str,
-        short_typo: str,
-        typo_to_correction: dict[str, tuple[str, str, BoundaryType]],
-        detector,
-    ) -> tuple[str, str, BoundaryType] | None:
-        """Check if a typo is blocked by a shorter candidate.
-
-        Args:
-            state: The dictionary state
-            long_typo: The longer typo to check
-            short_typo: The shorter candidate that might block it
-            typo_to_correction: Map from typo to full correction
-            detector: Conflict detector for this boundary type
-
-        Returns:
-            The blocking correction if blocked, None otherwise
-        """
-        # Quick substring check first
-        if not detector.contains_substring(long_typo, short_typo):
-            return None
-
-        # Get the corrections
-        long_correction = typo_to_correction[long_typo]
-        short_correction = typo_to_correction[short_typo]
-
-        long_word = long_correction[1]
-        short_word = short_correction[1]
-        boundary = long_correction[2]
-
-        # Full conflict check
-        if not detector.check_conflict(long_typo, short_typo, long_word, short_word):
-            return None
-
-        # This is a conflict - add to graveyard
-        state.add_to_graveyard(
-            long_typo,
-            long_word,
-            boundary,
-            RejectionReason.BLOCKED_BY_CONFLICT,
-            short_typo,
-            pass_name=self.name,
-        )
-
-        return short_correction
+        for typo in sorted(typo_to_correction.keys(), key=len):
+            if typo:
+                self._add_if_unblocked(state, typo_to_correction[typo])
@@ -9,6 +9,7 @@ from entroppy.core.pattern_generalization import generalize_patterns
 from entroppy.core.types import MatchDirection
 from entroppy.resolution.solver import Pass
 from entroppy.resolution.state import RejectionReason
+from entroppy.resolution.state_delta import StateDelta
 
 if TYPE_CHECKING:
     from entroppy.resolution.solver import PassContext
@@ -28,8 +29,13 @@ class PatternGeneralizationPass(Pass):
         - "aer" -> "are", "ehr" -> "her", "oer" -> "ore" (all have *er -> *re pattern)
         - Creates pattern "*er" -> "*re"
         - Removes the specific corrections
+
+    Incremental: the result depends only on the active corrections and on graveyard
+    lookups of extracted pattern keys, so the pass is skipped when neither changed.
     """
 
+    incremental = True
+
     def __init__(self, context: "PassContext") -> None:
         """Initialize the pass with context and pattern extraction cache.
 
@@ -50,6 +56,33 @@ class PatternGeneralizationPass(Pass):
         """Return the name of this pass."""
         return "PatternGeneralization"
 
+    def is_affected_by(self, delta: StateDelta) -> bool:
+        """Check for correction changes, removed patterns, or newly buried pattern keys."""
+        if delta.added_corrections or delta.removed_corrections or delta.removed_patterns:
+            return True
+        if not delta.graveyard_added:
+            return False
+        # Every pattern ever looked up in the graveyard comes from the cache
+        pattern_keys = {
+            (typo_pattern, word_pattern, boundary)
+            for patterns in self._pattern_cache.values()
+            for typo_pattern, word_pattern, boundary, _ in patterns
+        }
+        return not pattern_keys.isdisjoint(map(delta.table.decode, delta.graveyard_added))
+
+    def checkpoint(
+        self,
+    ) -> dict[tuple[str, str, BoundaryType, bool], list[tuple[str, str, BoundaryType, int]]]:
+        """Keep the pattern extraction cache (entries are never changed once added)."""
+        return dict(self._pattern_cache)
+
+    def restore(
+        self,
+        data: dict[tuple[str, str, BoundaryType, bool], list[tuple[str, str, BoundaryType, int]]],
+    ) -> None:
+        """Restore the pattern extraction cache."""
+        self._pattern_cache.update(data)
+
     def _get_match_direction(self) -> MatchDirection:
         """Get platform match direction."""
         match_direction = MatchDirection.LEFT_TO_RIGHT
@@ -81,14 +114,14 @@ class PatternGeneralizationPass(Pass):
         Args:
             state: The dictionary state to modify
         """
-        if not state.active_corrections:
+        if not state.active_corrections.keys:
             return
 
         # Get platform match direction
         match_direction = self._get_match_direction()
 
         # Run pattern extraction and validation
-        corrections_list = list(state.active_corrections)
+        corrections_list = list(map(state.correction_table.decode, state.active_corrections.keys))
 
         try:
             patterns, corrections_to_remove, pattern_replacements, rejected_patterns = (
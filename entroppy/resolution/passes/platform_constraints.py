@@ -8,6 +8,7 @@ from entroppy.core import BoundaryType
 from entroppy.platforms import PlatformConstraints
 from entroppy.resolution.solver import Pass
 from entroppy.resolution.state import RejectionReason
+from entroppy.resolution.state_delta import StateDelta
 
 if TYPE_CHECKING:
     from entroppy.resolution.state import DictionaryState
@@ -22,13 +23,22 @@ class PlatformConstraintsPass(Pass):
     - Platform-specific format constraints
 
     Corrections that violate constraints are removed and added to the graveyard.
+
+    Incremental: constraints are checked per item, so after the first run only items
+    added since the last run are checked.
     """
 
+    incremental = True
+
     @property
     def name(self) -> str:
         """Return the name of this pass."""
         return "PlatformConstraints"
 
+    def is_affected_by(self, delta: StateDelta) -> bool:
+        """Only added corrections or patterns can violate constraints."""
+        return bool(delta.added_corrections or delta.added_patterns)
+
     def _check_correction_constraints(
         self,
         correction: tuple[str, str, BoundaryType],
@@ -143,14 +153,22 @@ class PlatformConstraintsPass(Pass):
         # Get platform constraints
         constraints = self.context.platform.get_constraints()
 
+        correction_keys = state.active_corrections.keys
+        pattern_keys = state.active_patterns.keys
+        if self.delta is not None:
+            # Items that were active at the last run already passed
+            correction_keys = self.delta.added_corrections & correction_keys
+            pattern_keys = self.delta.added_patterns & pattern_keys
+        decode = state.correction_table.decode
+        corrections = list(map(decode, correction_keys))
+        patterns = list(map(decode, pattern_keys))
+
         # Check corrections
-        corrections_to_remove = self._check_items(
-            list(state.active_corrections), constraints, "corrections"
-        )
+        corrections_to_remove = self._check_items(corrections, constraints, "corrections")
         self._remove_invalid_items(state, corrections_to_remove, is_pattern=False)
 
         # Check patterns
-        patterns_to_remove = self._check_items(list(state.active_patterns), constraints, "patterns")
+        patterns_to_remove = self._check_items(patterns, constraints, "patterns")
         self._remove_invalid_items(state, patterns_to_remove, is_pattern=True)
 
     @staticmethod
@@ -0,0 +1,173 @@
+"""Index of active patterns for typo coverage checks.
+
+A pattern covers a raw typo if the typo is the pattern's typo, or if the pattern
+matches at the typo's edge and rewriting it there yields one of the words the typo
+was generated from. Which edge a pattern may match follows the pattern validator:
+RIGHT patterns rewrite a suffix, LEFT patterns a prefix, and NONE/BOTH patterns a
+suffix if the typo ends with them, else a prefix.
+
+Scanning every active pattern costs O(P) per typo. The index instead keeps pattern
+typos in a hash for exact matches, in a prefix trie for prefix rewrites and in a trie
+of reversed typos for suffix rewrites. A coverage check walks the typo once through
+each trie, so it costs O(L) trie steps for a typo of length L however many patterns
+are active.
+"""
+
+from collections.abc import Collection
+
+from entroppy.core import BoundaryType
+
+_SUFFIX_BOUNDARIES = (BoundaryType.RIGHT, BoundaryType.NONE, BoundaryType.BOTH)
+_PREFIX_BOUNDARIES = (BoundaryType.LEFT, BoundaryType.NONE, BoundaryType.BOTH)
+
+
+class _TrieNode:
+    """A trie node.
+
+    Attributes:
+        children: Child nodes by character
+        patterns: (word, boundary) of the patterns whose typo ends here
+    """
+
+    __slots__ = ("children", "patterns")
+
+    def __init__(self) -> None:
+        """Initialize an empty node."""
+        self.children: dict[str, _TrieNode] = {}
+        self.patterns: set[tuple[str, BoundaryType]] = set()
+
+
+class _PatternTrie:
+    """Trie of pattern typos, read forwards or backwards."""
+
+    __slots__ = ("_reverse", "_root")
+
+    def __init__(self, reverse: bool) -> None:
+        """Initialize an empty trie.
+
+        Args:
+            reverse: Store typos reversed, for suffix matches
+        """
+        self._reverse = reverse
+        self._root = _TrieNode()
+
+    def add(self, typo: str, word: str, boundary: BoundaryType) -> None:
+        """Store a pattern."""
+        node = self._root
+        for char in reversed(typo) if self._reverse else typo:
+            node = node.children.setdefault(char, _TrieNode())
+        node.patterns.add((word, boundary))
+
+    def remove(self, typo: str, word: str, boundary: BoundaryType) -> None:
+        """Remove a pattern, pruning nodes left empty."""
+        path = [self._root]
+        key = typo[::-1] if self._reverse else typo
+        for char in key:
+            child = path[-1].children.get(char)
+            if child is None:
+                return
+            path.append(child)
+        path[-1].patterns.discard((word, boundary))
+        for depth in range(len(key), 0, -1):
+            node = path[depth]
+            if node.children or node.patterns:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+
+    def matches(self, typo: str) -> list[tuple[int, str, BoundaryType]]:
+        """Find the patterns whose typo is a proper prefix (or suffix) of a typo.
+
+        Args:
+            typo: The typo to walk
+
+        Returns:
+            (pattern typo length, word, boundary) for each matching pattern
+        """
+        found: list[tuple[int, str, BoundaryType]] = []
+        node = self._root
+        for depth, char in enumerate(reversed(typo[1:]) if self._reverse else typo[:-1], 1):
+            child = node.children.get(char)
+            if child is None:
+                break
+            node = child
+            found.extend((depth, word, boundary) for word, boundary in node.patterns)
+        return found
+
+
+class PatternCoverageIndex:
+    """Active patterns, indexed to answer "does any pattern cover this typo?" in O(L).
+
+    Kept in step with the active pattern set by DictionaryState.add_pattern and
+    remove_pattern.
+    """
+
+    __slots__ = ("_exact", "_prefixes", "_suffixes")
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        # Pattern typo -> number of active patterns with that typo
+        self._exact: dict[str, int] = {}
+        self._prefixes = _PatternTrie(reverse=False)
+        self._suffixes = _PatternTrie(reverse=True)
+
+    def __len__(self) -> int:
+        """Number of indexed patterns."""
+        return sum(self._exact.values())
+
+    def add(self, typo: str, word: str, boundary: BoundaryType) -> None:
+        """Index a pattern.
+
+        Args:
+            typo: The pattern typo
+            word: The pattern word
+            boundary: The pattern boundary
+        """
+        self._exact[typo] = self._exact.get(typo, 0) + 1
+        if boundary in _PREFIX_BOUNDARIES:
+            self._prefixes.add(typo, word, boundary)
+        if boundary in _SUFFIX_BOUNDARIES:
+            self._suffixes.add(typo, word, boundary)
+
+    def remove(self, typo: str, word: str, boundary: BoundaryType) -> None:
+        """Drop a pattern from the index.
+
+        Args:
+            typo: The pattern typo
+            word: The pattern word
+            boundary: The pattern boundary
+        """
+        count = self._exact.get(typo, 0)
+        if count <= 1:
+            self._exact.pop(typo, None)
+        else:
+            self._exact[typo] = count - 1
+        if boundary in _PREFIX_BOUNDARIES:
+            self._prefixes.remove(typo, word, boundary)
+        if boundary in _SUFFIX_BOUNDARIES:
+            self._suffixes.remove(typo, word, boundary)
+
+    def covers(self, typo: str, words: Collection[str]) -> bool:
+        """Check if any indexed pattern covers a typo.
+
+        Args:
+            typo: The raw typo
+            words: The words the typo was generated from
+
+        Returns:
+            True if a pattern's typo equals the typo, or a pattern rewrites the typo's
+            prefix or suffix into one of the words
+        """
+        if typo in self._exact:
+            return True
+        if not words:
+            return False
+        for length, word, _ in self._suffixes.matches(typo):
+            if typo[:-length] + word in words:
+                return True
+        for length, word, boundary in self._prefixes.matches(typo):
+            # NONE/BOTH patterns are only read as prefixes if they are not a suffix
+            if boundary != BoundaryType.LEFT and typo.endswith(typo[:length]):
+                continue
+            if word + typo[length:] in words:
+                return True
+        return False
@@ -6,7 +6,6 @@ including caching and parallel processing optimizations.
 
 from collections import defaultdict
 from dataclasses import dataclass
-from multiprocessing import Pool
 import threading
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -14,6 +13,7 @@ from tqdm import tqdm
 
 from entroppy.core.boundaries import BoundaryType
 from entroppy.platforms.qmk.formatting import format_boundary_markers
+from entroppy.utils.worker_pool import borrow_pool
 
 if TYPE_CHECKING:
     from entroppy.resolution.state import DictionaryState
@@ -125,16 +125,18 @@ def format_corrections_with_cache(
     cached_results = []
 
     formatted_cache = state.get_formatted_cache()
+    encode = state.correction_table.encode
     for correction in all_corrections:
+        key = encode(correction)
         if correction in dirty_corrections:
             # This correction changed, need to reformat (check cache first though)
-            if correction in formatted_cache:
+            if key in formatted_cache:
                 # Remove from cache (will be reformatted)
-                del formatted_cache[correction]
+                del formatted_cache[key]
             corrections_to_format.append(correction)
-        elif correction in formatted_cache:
+        elif key in formatted_cache:
             # Use cached formatted string (correction hasn't changed)
-            formatted_typo = formatted_cache[correction]
+            formatted_typo = formatted_cache[key]
             cached_results.append((correction, formatted_typo))
         else:
             # Not in cache and not dirty - format it (first time or cache was cleared)
@@ -146,9 +148,8 @@ def format_corrections_with_cache(
             corrections_to_format, is_qmk, pass_name, jobs, verbose, format_typo_fn
         )
         # Update cache with newly formatted corrections
-        formatted_cache = state.get_formatted_cache()
         for correction, formatted_typo in formatted_results_new:
-            formatted_cache[correction] = formatted_typo
+            formatted_cache[encode(correction)] = formatted_typo
     else:
         formatted_results_new = []
 
@@ -227,20 +228,17 @@ def _format_corrections_parallel_impl(
         List of (correction, formatted_typo) tuples
     """
     # pylint: disable=duplicate-code
-    # Acceptable pattern: Parallel processing setup using Pool with initializer pattern.
+    # Acceptable pattern: Parallel setup broadcasting an initializer to the worker pool.
     # This pattern is shared with formatting_helpers.py because both need to set up
-    # parallel formatting workers in the same way. The Pool initialization pattern
+    # parallel formatting workers in the same way. The broadcast initializer pattern
     # is standard and should not be refactored.
 
     # Create worker context (immutable, serializable)
     formatting_context = FormattingContext(is_qmk=is_qmk)
 
-    # Process in parallel using initializer pattern (avoids pickle)
-    with Pool(
-        processes=jobs,
-        initializer=init_formatting_worker,
-        initargs=(formatting_context,),
-    ) as pool:
+    # Install the context once per worker, then stream corrections through the pool
+    with borrow_pool(jobs) as pool:
+        pool.broadcast(init_formatting_worker, formatting_context)
         if verbose:
             results_iter = pool.imap(_format_correction_worker, corrections_to_format)
             results: Any = tqdm(
@@ -1,7 +1,6 @@
 """Helper functions for formatting corrections in platform substring conflict pass."""
 
 from collections import defaultdict
-from multiprocessing import Pool
 from typing import TYPE_CHECKING, Any, Callable
 
 from tqdm import tqdm
@@ -12,6 +11,7 @@ from entroppy.resolution.platform_conflicts.formatting import (
     _format_correction_worker,
     init_formatting_worker,
 )
+from entroppy.utils.worker_pool import borrow_pool
 
 if TYPE_CHECKING:
     pass
@@ -48,17 +48,14 @@ def format_corrections_parallel(
 
     if use_parallel:
         # pylint: disable=duplicate-code
-        # Acceptable pattern: Parallel processing setup using Pool with initializer pattern.
+        # Acceptable pattern: Parallel setup broadcasting an initializer to the worker pool.
         # This pattern is shared with formatting.py because both need to set up
-        # parallel formatting workers in the same way. The Pool initialization pattern
+        # parallel formatting workers in the same way. The broadcast initializer pattern
         # is standard and should not be refactored.
         formatting_context = FormattingContext(is_qmk=is_qmk)
 
-        with Pool(
-            processes=jobs,
-            initializer=init_formatting_worker,
-            initargs=(formatting_context,),
-        ) as pool:
+        with borrow_pool(jobs) as pool:
+            pool.broadcast(init_formatting_worker, formatting_context)
             if verbose:
                 results_iter = pool.imap(_format_correction_worker, all_corrections)
                 results: Any = tqdm(
@@ -12,6 +12,7 @@ This pass runs after ConflictRemovalPass to catch cross-boundary conflicts
 that weren't detected within boundary groups.
 """
 
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, Any
 
 from tqdm import tqdm
@@ -22,20 +23,23 @@ from entroppy.platforms.qmk.formatting import format_boundary_markers
 from entroppy.resolution.platform_conflicts.conflict_processing import (
     process_conflict_combinations,
 )
-from entroppy.resolution.platform_conflicts.detection import is_substring
 from entroppy.resolution.platform_conflicts.formatting_helpers import (
     format_corrections_parallel,
 )
 from entroppy.resolution.platform_conflicts.logging import log_platform_substring_conflict
 from entroppy.resolution.platform_conflicts.suffix_array_helpers import (
     build_suffix_array,
-    find_substring_matches,
+    find_all_substring_matches,
+    find_dirty_substring_matches,
 )
+from entroppy.resolution.platform_conflicts.utils import is_substring
 from entroppy.resolution.solver import Pass
 from entroppy.resolution.state import RejectionReason
+from entroppy.resolution.state_delta import StateDelta
 from entroppy.utils.suffix_array import SubstringIndex
 
 if TYPE_CHECKING:
+    from entroppy.resolution.solver import PassContext
     from entroppy.resolution.state import DictionaryState
 
 
@@ -60,13 +64,33 @@ class PlatformSubstringConflictPass(Pass):
     - With LTR matching, boundaries are handled separately in YAML
     - Still checks for substring relationships in the core typo text
     - Removes duplicates preferring less restrictive boundaries
+
+    Incremental: pair decisions depend only on the two formatted typos and their
+    corrections, so after the first run only pairs involving a formatted typo that
+    gained a correction since the last run are checked.
     """
 
+    incremental = True
+
+    def __init__(self, context: "PassContext") -> None:
+        """Initialize the pass with context and a reusable suffix array slot.
+
+        Args:
+            context: Shared context with resources
+        """
+        super().__init__(context)
+        # Suffix array from the previous iteration, rebuilt in place on the next run
+        self._substring_index: SubstringIndex | None = None
+
     @property
     def name(self) -> str:
         """Return the name of this pass."""
         return "PlatformSubstringConflicts"
 
+    def is_affected_by(self, delta: StateDelta) -> bool:
+        """Only added corrections or patterns can create new conflicts."""
+        return bool(delta.added_corrections or delta.added_patterns)
+
     def run(self, state: "DictionaryState") -> None:
         """Run the platform substring conflict pass.
 
@@ -82,7 +106,9 @@ class PlatformSubstringConflictPass(Pass):
         match_direction = constraints.match_direction
 
         # Combine active corrections and patterns
-        all_corrections = list(state.active_corrections) + list(state.active_patterns)
+        decode = state.correction_table.decode
+        active_keys = state.active_corrections.keys | state.active_patterns.keys
+        all_corrections = list(map(decode, active_keys))
 
         if not all_corrections:
             return
@@ -92,9 +118,17 @@ class PlatformSubstringConflictPass(Pass):
             all_corrections
         )
 
+        # Formatted typos that gained a correction since the last run (None = check all)
+        dirty_typos = None
+        if self.delta is not None:
+            added = (self.delta.added_corrections | self.delta.added_patterns) & active_keys
+            dirty_typos = {correction_to_formatted[decode(key)] for key in added}
+            if not dirty_typos:
+                return
+
         # Phase 2: Detect conflicts (suffix array is already integrated in _detect_conflicts)
         corrections_to_remove, conflict_pairs = self._detect_conflicts(
-            formatted_to_corrections, match_direction, state
+            formatted_to_corrections, match_direction, state, dirty_typos
         )
 
         # Phase 3: Remove conflicts and log (using stored conflict pairs)
@@ -143,7 +177,7 @@ class PlatformSubstringConflictPass(Pass):
         corrections_to_remove_set: set[tuple[str, str, BoundaryType]],
         all_corrections_to_remove: list[tuple[tuple[str, str, BoundaryType], str]],
         all_conflict_pairs: dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]],
-        sa: SubstringIndex,
+        matched_typo_indices: Sequence[int],
         state: "DictionaryState",
     ) -> None:
         """Process conflicts for a single formatted typo.
@@ -159,12 +193,9 @@ class PlatformSubstringConflictPass(Pass):
             corrections_to_remove_set: Set of corrections to remove
             all_corrections_to_remove: List to append removals
             all_conflict_pairs: Dict to update with conflict pairs
-            sa: Suffix array
+            matched_typo_indices: Indices of typos containing this typo (from suffix array)
             state: Dictionary state
         """
-        # Find which typos contain this as a substring using suffix array
-        matched_typo_indices = find_substring_matches(sa, formatted_typo)
-
         # Check each match for conflicts
         for match_idx in matched_typo_indices:
             if match_idx == i:
@@ -221,6 +252,7 @@ class PlatformSubstringConflictPass(Pass):
         ],
         match_direction: MatchDirection,
         state: "DictionaryState",
+        dirty_typos: set[str] | None = None,
     ) -> tuple[
         list[tuple[tuple[str, str, BoundaryType], str]],
         dict[tuple[str, str, BoundaryType], tuple[str, str, BoundaryType]],
@@ -239,6 +271,7 @@ class PlatformSubstringConflictPass(Pass):
                 list of (correction, typo, boundary)
             match_direction: Platform match direction
             state: The dictionary state (for debug words/typos)
+            dirty_typos: If given, only check pairs involving one of these formatted typos
 
         Returns:
             Tuple of:
@@ -258,12 +291,25 @@ class PlatformSubstringConflictPass(Pass):
             return all_corrections_to_remove, all_conflict_pairs
 
         # Build suffix array
-        sa = build_suffix_array(formatted_typos, self.context.verbose, self.name)
+        sa = build_suffix_array(
+            formatted_typos, self.context.verbose, self.name, previous=self._substring_index
+        )
+        self._substring_index = sa
+        work: Iterable[tuple[int, Sequence[int]]]
+        if dirty_typos is None:
+            # Query all typos at once; matches for typo i are indices[offsets[i]:offsets[i + 1]]
+            offsets, indices = find_all_substring_matches(sa, formatted_typos)
+            work = ((i, indices[offsets[i] : offsets[i + 1]]) for i in range(len(formatted_typos)))
+            work_count = len(formatted_typos)
+        else:
+            dirty_matches = find_dirty_substring_matches(sa, formatted_typos, dirty_typos)
+            work = dirty_matches.items()
+            work_count = len(dirty_matches)
 
         # Setup progress bar
         if self.context.verbose:
             progress_bar: Any = tqdm(
-                total=len(formatted_typos),
+                total=work_count,
                 desc=f"    {self.name} (checking conflicts)",
                 unit="typo",
                 leave=False,
@@ -272,10 +318,11 @@ class PlatformSubstringConflictPass(Pass):
             progress_bar = None
 
         # Process each formatted typo
-        for i, formatted_typo in enumerate(formatted_typos):
+        for i, matched_typo_indices in work:
             if progress_bar is not None:
                 progress_bar.update(1)
 
+            formatted_typo = formatted_typos[i]
             corrections_for_typo = formatted_to_corrections[formatted_typo]
 
             # Process conflicts for this typo
@@ -290,7 +337,7 @@ class PlatformSubstringConflictPass(Pass):
                 corrections_to_remove_set,
                 all_corrections_to_remove,
                 all_conflict_pairs,
-                sa,
+                matched_typo_indices,
                 state,
             )
 
@@ -339,10 +386,8 @@ class PlatformSubstringConflictPass(Pass):
                 state.debug_typo_matcher,
             )
 
-        # Remove from active set
-        if correction in state.active_corrections:
-            state.remove_correction(typo, word, boundary, self.name, reason)
-        elif correction in state.active_patterns:
+        # Remove from active set (it is either a correction or a pattern)
+        if not state.remove_correction(typo, word, boundary, self.name, reason):
             state.remove_pattern(typo, word, boundary, self.name, reason)
 
         # Add to graveyard
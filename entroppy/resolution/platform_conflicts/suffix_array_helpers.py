@@ -3,20 +3,30 @@
 Uses Rust implementation for ~100x performance improvement.
 """
 
+from collections import defaultdict
+from collections.abc import Iterator
+
 from tqdm import tqdm
 
 from entroppy.utils.suffix_array import SubstringIndex
 
 
-def build_suffix_array(formatted_typos: list[str], verbose: bool, pass_name: str) -> SubstringIndex:
+def build_suffix_array(
+    formatted_typos: list[str],
+    verbose: bool,
+    pass_name: str,
+    previous: SubstringIndex | None = None,
+) -> SubstringIndex:
     """Build suffix array from formatted typos.
 
-    Uses Rust implementation for ~100x performance improvement.
+    Uses Rust implementation for ~100x performance improvement. If an index from a
+    previous run is given, it is rebuilt in place so its memory is reused.
 
     Args:
         formatted_typos: List of formatted typo strings
         verbose: Whether to show progress
         pass_name: Name of the pass (for progress bar)
+        previous: Index from a previous iteration to rebuild instead of allocating anew
 
     Returns:
         SubstringIndex instance
@@ -30,7 +40,11 @@ def build_suffix_array(formatted_typos: list[str], verbose: bool, pass_name: str
         )
         build_bar.update(0)
 
-    sa = SubstringIndex(formatted_typos)
+    if previous is None:
+        sa = SubstringIndex(formatted_typos)
+    else:
+        previous.rebuild(formatted_typos)
+        sa = previous
 
     if verbose:
         build_bar.update(1)
@@ -39,21 +53,63 @@ def build_suffix_array(formatted_typos: list[str], verbose: bool, pass_name: str
     return sa
 
 
-def find_substring_matches(
+def find_all_substring_matches(
     sa: SubstringIndex,
-    formatted_typo: str,
-) -> set[int]:
-    """Find which typos contain the given typo as a substring using suffix array.
+    formatted_typos: list[str],
+) -> tuple[memoryview, memoryview]:
+    """Find, for every typo, which typos contain it as a substring using suffix array.
 
-    Uses Rust implementation for ~100x performance improvement.
+    Uses one parallel Rust query for all typos and returns packed uint32 arrays, so no
+    Python int or set is created per match up front.
 
     Args:
         sa: SubstringIndex instance (wraps Rust implementation)
-        formatted_typo: The typo to search for
+        formatted_typos: Typos to search for
+
+    Returns:
+        Tuple of (offsets, indices) in CSR layout: indices of typos containing
+        formatted_typos[i] are indices[offsets[i]:offsets[i + 1]]
+    """
+    # Use Rust implementation - O(log N + M) query per typo, no linear scan
+    return sa.find_substring_conflicts_batch(formatted_typos)
+
+
+def find_dirty_substring_matches(
+    sa: SubstringIndex,
+    formatted_typos: list[str],
+    dirty_typos: set[str],
+) -> dict[int, list[int]]:
+    """Find containment pairs that involve at least one dirty typo.
+
+    Longer typos containing a dirty typo come from the suffix array; shorter typos
+    contained in a dirty typo are found by looking up each of its substrings.
+
+    Args:
+        sa: SubstringIndex built over formatted_typos
+        formatted_typos: All typos, in the order the index was built with
+        dirty_typos: Typos that changed since the last check
 
     Returns:
-        Set of indices of typos that contain formatted_typo as substring
+        Dict mapping the index of a typo to the sorted indices of typos containing it,
+        restricted to pairs with a dirty member (the same shape find_all_substring_matches
+        gives for every typo)
     """
-    # Use Rust implementation - O(log N + M) query, no linear scan
-    matched_indices = sa.find_substring_conflicts(formatted_typo)
-    return set(matched_indices)
+    position = {typo: i for i, typo in enumerate(formatted_typos)}
+    dirty = sorted(position[typo] for typo in dirty_typos if typo in position)
+    offsets, indices = find_all_substring_matches(sa, [formatted_typos[i] for i in dirty])
+
+    matches: dict[int, set[int]] = defaultdict(set)
+    for n, i in enumerate(dirty):
+        matches[i].update(indices[offsets[n] : offsets[n + 1]])
+        for j in _contained_typo_indices(formatted_typos[i], position):
+            matches[j].add(i)
+    return {i: sorted(matches[i]) for i in sorted(matches)}
+
+
+def _contained_typo_indices(typo: str, position: dict[str, int]) -> Iterator[int]:
+    """Yield indices of indexed typos that are proper substrings of typo."""
+    for start in range(len(typo)):
+        for end in range(start + 1, len(typo) + 1):
+            j = position.get(typo[start:end])
+            if j is not None and (start, end) != (0, len(typo)):
+                yield j
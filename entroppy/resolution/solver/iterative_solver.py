@@ -5,6 +5,9 @@ from typing import TYPE_CHECKING
 
 from loguru import logger
 
+from entroppy.resolution.checkpoint import CheckpointStore, SolverCheckpoint
+from entroppy.utils.tracing import span
+
 from .convergence import _check_convergence, _get_state_counts
 from .pass_context import Pass, SolverResult
 
@@ -23,15 +26,21 @@ class IterativeSolver:
         self,
         passes: list[Pass],
         max_iterations: int,
+        checkpoints: CheckpointStore | None = None,
+        resume: bool = False,
     ) -> None:
         """Initialize the solver.
 
         Args:
             passes: List of passes to run in order
             max_iterations: Maximum iterations (from config.max_iterations)
+            checkpoints: Store to snapshot the state to after every iteration
+            resume: Continue from the latest snapshot in checkpoints, if there is one
         """
         self.passes = passes
         self.max_iterations = max_iterations
+        self.checkpoints = checkpoints
+        self.resume = resume
 
     def _find_conflict_removal_index(self) -> int | None:
         """Find the index of ConflictRemovalPass in the passes list.
@@ -95,6 +104,27 @@ class IterativeSolver:
 
         logger.info(f"  [{pass_name}] {', '.join(changes)}{time_str}")
 
+    def _execute_pass(self, pass_instance: Pass, state: "DictionaryState") -> float:
+        """Run a pass, unless it is incremental and nothing relevant to it changed.
+
+        Args:
+            pass_instance: The pass to run
+            state: The dictionary state
+
+        Returns:
+            Elapsed time in seconds
+        """
+        start_time = time.time()
+        with span(pass_instance.name, "pass") as pass_span:
+            if pass_instance.prepare(state):
+                pass_instance.run(state)
+                corrections, patterns, graveyard = _get_state_counts(state)
+                pass_span.set(corrections=corrections, patterns=patterns, graveyard=graveyard)
+            else:
+                logger.debug(f"  [{pass_instance.name}] skipped (no relevant changes)")
+                pass_span.set(skipped=True)
+        return time.time() - start_time
+
     def _run_single_pass(
         self,
         pass_instance: Pass,
@@ -115,9 +145,7 @@ class IterativeSolver:
         Returns:
             Tuple of (corrections_after, patterns_after, graveyard_after)
         """
-        start_time = time.time()
-        pass_instance.run(state)
-        elapsed_time = time.time() - start_time
+        elapsed_time = self._execute_pass(pass_instance, state)
 
         corrections_after, patterns_after, graveyard_after = _get_state_counts(state)
 
@@ -158,9 +186,7 @@ class IterativeSolver:
         graveyard_before_pass = graveyard_before
 
         for post_pass in passes_after:
-            start_time = time.time()
-            post_pass.run(state)
-            elapsed_time = time.time() - start_time
+            elapsed_time = self._execute_pass(post_pass, state)
 
             corrections_after, patterns_after, graveyard_after = _get_state_counts(state)
 
@@ -272,6 +298,49 @@ class IterativeSolver:
             debug_trace=state.get_debug_summary(),
         )
 
+    def _save_checkpoint(
+        self, state: "DictionaryState", previous_counts: tuple[int, int, int]
+    ) -> None:
+        """Snapshot the state; pickling and writing happen on a background thread.
+
+        Args:
+            state: The dictionary state
+            previous_counts: Counts the next convergence check compares against
+        """
+        if self.checkpoints is None:
+            return
+        pass_states = {}
+        for pass_instance in self.passes:
+            data = pass_instance.checkpoint()
+            if data is not None:
+                pass_states[pass_instance.name] = data
+        self.checkpoints.save_solver(
+            SolverCheckpoint(state.snapshot(), previous_counts, pass_states)
+        )
+
+    def _restore_checkpoint(self, state: "DictionaryState") -> tuple[int, int, int] | None:
+        """Load the latest snapshot into the state and passes.
+
+        Args:
+            state: Newly created dictionary state
+
+        Returns:
+            Counts for the next convergence check, or None if there is no snapshot
+        """
+        if self.checkpoints is None or not self.resume:
+            return None
+        checkpoint = self.checkpoints.load_solver()
+        if checkpoint is None:
+            logger.info("No solver checkpoint found, starting from iteration 1")
+            return None
+        with span("checkpoint restore", "checkpoint"):
+            state.restore_snapshot(checkpoint.state)
+            for pass_instance in self.passes:
+                if pass_instance.name in checkpoint.pass_states:
+                    pass_instance.restore(checkpoint.pass_states[pass_instance.name])
+        logger.info(f"Resuming solver after iteration {state.current_iteration}")
+        return checkpoint.previous_counts
+
     def solve(self, state: "DictionaryState") -> SolverResult:
         """Run the iterative solver until convergence.
 
@@ -281,8 +350,11 @@ class IterativeSolver:
         Returns:
             SolverResult with final corrections and metadata
         """
-        iteration = 0
-        previous_corrections, previous_patterns, previous_graveyard = _get_state_counts(state)
+        restored_counts = self._restore_checkpoint(state)
+        iteration = state.current_iteration
+        previous_corrections, previous_patterns, previous_graveyard = (
+            restored_counts or _get_state_counts(state)
+        )
 
         logger.info(f"Starting iterative solver (max {self.max_iterations} iterations)")
 
@@ -293,7 +365,8 @@ class IterativeSolver:
             iteration += 1
 
             self._log_iteration_start(iteration, state)
-            self._run_all_passes(state, verbose)
+            with span(f"Iteration {iteration}", "iteration"):
+                self._run_all_passes(state, verbose)
 
             converged, previous_corrections, previous_patterns, previous_graveyard = (
                 _check_convergence(
@@ -304,7 +377,12 @@ class IterativeSolver:
                     previous_graveyard,
                 )
             )
+            self._save_checkpoint(
+                state, (previous_corrections, previous_patterns, previous_graveyard)
+            )
 
+        if self.checkpoints is not None:
+            self.checkpoints.wait()
         converged = not state.is_dirty
         self._log_solver_completion(iteration, converged, state)
 
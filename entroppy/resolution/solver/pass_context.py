@@ -2,13 +2,14 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from entroppy.core import BoundaryIndex
-from entroppy.core.boundaries import BoundaryType
+from entroppy.core.boundaries import BoundaryType, get_boundary_index
 from entroppy.matching import ExclusionMatcher
 from entroppy.platforms.base import PlatformBackend
 from entroppy.processing.stages.data_models import DictionaryData
+from entroppy.resolution.state_delta import StateDelta
 
 if TYPE_CHECKING:
     from entroppy.resolution.state import DictionaryState
@@ -69,11 +70,11 @@ class PassContext:
         Returns:
             PassContext instance
         """
-        # Build boundary indices
+        # Get shared boundary indices (built once per run by the registry)
         # Use filtered validation set for boundary detection - words matching exclusion
         # patterns (like *ball) should not block valid typos from using NONE boundary
-        validation_index = BoundaryIndex(dictionary_data.filtered_validation_set)
-        source_index = BoundaryIndex(dictionary_data.source_words_set)
+        validation_index = get_boundary_index(dictionary_data.filtered_validation_set)
+        source_index = get_boundary_index(dictionary_data.source_words_set)
 
         return cls(
             validation_set=dictionary_data.validation_set,
@@ -98,8 +99,19 @@ class Pass(ABC):
 
     Each pass implements a single responsibility in the optimization pipeline.
     Passes run iteratively until the state converges (no more changes).
+
+    Passes that set ``incremental`` receive the state changes made since their previous
+    run in ``delta`` (None on the first run, or when run outside the solver) and only
+    process the affected items. The solver skips them entirely when
+    ``is_affected_by`` reports that nothing relevant changed.
+
+    Attributes:
+        context: Shared context with resources
+        delta: Changes since this pass last ran, or None for a full run
     """
 
+    incremental: ClassVar[bool] = False
+
     def __init__(self, context: PassContext) -> None:
         """Initialize the pass with context.
 
@@ -107,6 +119,63 @@ class Pass(ABC):
             context: Shared context with resources
         """
         self.context = context
+        self.delta: StateDelta | None = None
+        self._change_cursor: int | None = None
+
+    def prepare(self, state: "DictionaryState") -> bool:
+        """Compute this run's delta and decide whether the pass needs to run.
+
+        Called by the solver before run(). Non-incremental passes always run on the
+        full state.
+
+        Args:
+            state: The dictionary state
+
+        Returns:
+            False if the pass can be skipped because nothing relevant changed
+        """
+        cursor = self._change_cursor
+        if not self.incremental or cursor is None:
+            self._change_cursor = state.changes.cursor
+            self.delta = None
+            return True
+        delta = state.changes.since(cursor)
+        if not self.is_affected_by(delta):
+            # Keep the cursor, so the skipped changes are part of the next delta
+            return False
+        self._change_cursor = state.changes.cursor
+        self.delta = delta
+        return True
+
+    def is_affected_by(self, delta: StateDelta) -> bool:
+        """Check if a delta can change the outcome of this pass.
+
+        Args:
+            delta: Changes since this pass last ran
+
+        Returns:
+            True if the pass must run
+        """
+        return not delta.is_empty()
+
+    def checkpoint(self) -> Any:
+        """Copy pass-level caches worth keeping when a run is resumed.
+
+        Called on the solver thread at the end of an iteration; the value is pickled
+        later on a background thread, so it must not share mutable objects with the
+        pass.
+
+        Returns:
+            Picklable value for restore(), or None if there is nothing to keep
+        """
+        return None
+
+    def restore(self, data: Any) -> None:
+        """Restore caches saved by checkpoint() when a run is resumed.
+
+        Args:
+            data: Value returned by checkpoint()
+        """
 
     @abstractmethod
     def run(self, state: "DictionaryState") -> None:
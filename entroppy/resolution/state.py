@@ -1,27 +1,35 @@
 """Dictionary state management for the iterative solver."""
 
+from array import array
 from collections import defaultdict
-import time
-from typing import TYPE_CHECKING
-
-from entroppy.core import BoundaryType, Correction
-from entroppy.resolution.history import (
-    CorrectionHistoryEntry,
-    GraveyardHistoryEntry,
-    PatternHistoryEntry,
-    RejectionReason,
+from collections.abc import Mapping
+
+from entroppy.core import (
+    BoundaryType,
+    Correction,
+    CorrectionMap,
+    CorrectionSet,
+    CorrectionTable,
+    TypoStore,
 )
+from entroppy.resolution.checkpoint import (
+    REJECTION_REASON_CODES,
+    REJECTION_REASONS,
+    StateSnapshot,
+    pack_keys,
+    unpack_keys,
+)
+from entroppy.resolution.event_log import ALL_EVENTS, TRACE_ACTIONS, EventLog
+from entroppy.resolution.history import RejectionReason
 from entroppy.resolution.state_caching import StateCaching
 from entroppy.resolution.state_debug import get_debug_summary
-from entroppy.resolution.state_types import DebugTraceEntry, GraveyardEntry
+from entroppy.resolution.state_delta import ChangeKind, ChangeLog
+from entroppy.resolution.state_types import GraveyardEntry
 
 # Re-export for backward compatibility
-__all__ = ["DictionaryState", "DebugTraceEntry", "GraveyardEntry", "RejectionReason"]
+__all__ = ["DictionaryState", "GraveyardEntry", "RejectionReason"]
 from entroppy.utils.debug import DebugTypoMatcher
 
-if TYPE_CHECKING:
-    pass
-
 
 class DictionaryState:
     """Central state manager for the iterative solver.
@@ -32,7 +40,7 @@ class DictionaryState:
 
     def __init__(
         self,
-        raw_typo_map: dict[str, list[str]],
+        raw_typo_map: Mapping[str, list[str]],
         debug_words: set[str] | None = None,
         debug_typo_matcher: DebugTypoMatcher | None = None,
         debug_graveyard: bool = False,
@@ -42,20 +50,24 @@ class DictionaryState:
         """Initialize the dictionary state.
 
         Args:
-            raw_typo_map: The typo map from Stage 2
+            raw_typo_map: The typo map from Stage 2 (a TypoStore, or a plain mapping
+                that is packed into one)
             debug_words: Optional set of words to track
             debug_typo_matcher: Optional matcher for debug typos
             debug_graveyard: Whether to track comprehensive graveyard history
             debug_patterns: Whether to track comprehensive pattern history
             debug_corrections: Whether to track comprehensive correction history
         """
-        self.raw_typo_map = raw_typo_map
-        self.active_corrections: set[Correction] = set()
-        self.active_patterns: set[Correction] = set()
-        self.graveyard: dict[tuple[str, str, BoundaryType], GraveyardEntry] = {}
+        self.raw_typo_map = TypoStore.from_mapping(raw_typo_map)
+        # Corrections are stored as interned int keys. Passes work on the keys
+        # (active_corrections.keys, graveyard.entries); the tuple interfaces are for
+        # reports and output
+        self.correction_table = CorrectionTable()
+        self.active_corrections = CorrectionSet(self.correction_table)
+        self.active_patterns = CorrectionSet(self.correction_table)
+        self.graveyard: CorrectionMap[GraveyardEntry] = CorrectionMap(self.correction_table)
         self.debug_words = debug_words or set()
         self.debug_typo_matcher = debug_typo_matcher
-        self.debug_trace: list[DebugTraceEntry] = []
         self.is_dirty = True  # Start dirty to trigger first iteration
         self.current_iteration = 0
 
@@ -64,19 +76,27 @@ class DictionaryState:
         self.debug_patterns = debug_patterns
         self.debug_corrections = debug_corrections
 
-        # History tracking (only populated if debug flags enabled)
-        self.graveyard_history: list[GraveyardHistoryEntry] = []
-        self.pattern_history: list[PatternHistoryEntry] = []
-        self.correction_history: list[CorrectionHistoryEntry] = []
+        # Lifecycle event log (only opened if a debug history flag is enabled)
+        self.event_log: EventLog | None = None
+        if debug_graveyard or debug_patterns or debug_corrections:
+            self.event_log = EventLog(self.correction_table)
+
+        # Changes to debug words and typos (only opened if there are debug targets)
+        self.trace_log: EventLog | None = None
+        if self.debug_words or debug_typo_matcher:
+            self.trace_log = EventLog(self.correction_table, TRACE_ACTIONS)
 
-        # Track what corrections cover which raw typos
-        self._coverage_map: dict[str, set[Correction]] = defaultdict(set)
+        # Track what corrections (as table keys) cover which raw typos
+        self._coverage_map: dict[str, set[int]] = defaultdict(set)
 
         # Track pattern replacements for reporting
         self.pattern_replacements: dict[Correction, list[Correction]] = {}
 
-        # Cache for formatted correction strings (typo with boundary markers)
-        self._formatted_cache: dict[Correction, str] = {}
+        # Cache for formatted correction strings (typo with boundary markers), by key
+        self._formatted_cache: dict[int, str] = {}
+
+        # Journal of changes, read by passes running in incremental mode
+        self.changes = ChangeLog(self.correction_table)
 
         # Optimization caches for CandidateSelection pass
         self.caching = StateCaching()
@@ -97,7 +117,8 @@ class DictionaryState:
         Returns:
             True if this correction has been rejected
         """
-        return (typo, word, boundary) in self.graveyard
+        key = self.correction_table.lookup((typo, word, boundary))
+        return key is not None and key in self.graveyard.entries
 
     def add_to_graveyard(
         self,
@@ -126,35 +147,29 @@ class DictionaryState:
             blocker=blocker,
             iteration=self.current_iteration,
         )
-        self.graveyard[(typo, word, boundary)] = entry
+        key = self.correction_table.encode((typo, word, boundary))
+        self.graveyard.entries[key] = entry
+        self.changes.record(ChangeKind.GRAVEYARD_ADDED, key)
 
         # Track comprehensive history if enabled
-        if self.debug_graveyard:
-            self.graveyard_history.append(
-                GraveyardHistoryEntry(
-                    iteration=self.current_iteration,
-                    pass_name=pass_name,
-                    typo=typo,
-                    word=word,
-                    boundary=boundary,
-                    reason=reason,
-                    blocker=blocker,
-                    timestamp=time.time(),
-                )
+        if self.debug_graveyard and self.event_log is not None:
+            self.event_log.record(
+                ChangeKind.GRAVEYARD_ADDED,
+                key,
+                self.current_iteration,
+                pass_name,
+                reason.value,
+                blocker,
             )
 
         # Log if this is a debug target
-        if self._is_debug_target(typo, word, boundary):
-            self.debug_trace.append(
-                DebugTraceEntry(
-                    iteration=self.current_iteration,
-                    pass_name=pass_name,
-                    action="rejected",
-                    typo=typo,
-                    word=word,
-                    boundary=boundary,
-                    reason=f"{reason.value}: {blocker}" if blocker else reason.value,
-                )
+        if self.trace_log is not None and self._is_debug_target(typo, word, boundary):
+            self.trace_log.record(
+                ChangeKind.GRAVEYARD_ADDED,
+                key,
+                self.current_iteration,
+                pass_name,
+                f"{reason.value}: {blocker}" if blocker else reason.value,
             )
 
     def add_correction(
@@ -175,13 +190,13 @@ class DictionaryState:
         Returns:
             True if the correction was added (wasn't already present)
         """
-        correction = (typo, word, boundary)
-
-        if correction in self.active_corrections:
+        key = self.correction_table.encode((typo, word, boundary))
+        if key in self.active_corrections.keys:
             return False
 
-        self.active_corrections.add(correction)
-        self._coverage_map[typo].add(correction)
+        self.active_corrections.keys.add(key)
+        self.changes.record(ChangeKind.CORRECTION_ADDED, key)
+        self._coverage_map[typo].add(key)
         self.is_dirty = True
         # Mark typo as covered (remove from uncovered set)
         self.caching.get_uncovered_typos().discard(typo)
@@ -189,36 +204,15 @@ class DictionaryState:
         self.caching.invalidate_pattern_coverage_for_typo(typo)
 
         # Track comprehensive history if enabled
-        if self.debug_corrections:
-            # pylint: disable=duplicate-code
-            # Acceptable pattern: This is simple field assignment to a dataclass constructor.
-            # The similar code for PatternHistoryEntry uses a different type with the same
-            # field structure. Extracting this would require generic factories that add
-            # complexity without benefit. The similarity is inherent to the data model design.
-            self.correction_history.append(
-                CorrectionHistoryEntry(
-                    iteration=self.current_iteration,
-                    pass_name=pass_name,
-                    action="added",
-                    typo=typo,
-                    word=word,
-                    boundary=boundary,
-                    reason=None,
-                    timestamp=time.time(),
-                )
+        if self.debug_corrections and self.event_log is not None:
+            self.event_log.record(
+                ChangeKind.CORRECTION_ADDED, key, self.current_iteration, pass_name
             )
 
         # Log if this is a debug target
-        if self._is_debug_target(typo, word, boundary):
-            self.debug_trace.append(
-                DebugTraceEntry(
-                    iteration=self.current_iteration,
-                    pass_name=pass_name,
-                    action="added",
-                    typo=typo,
-                    word=word,
-                    boundary=boundary,
-                )
+        if self.trace_log is not None and self._is_debug_target(typo, word, boundary):
+            self.trace_log.record(
+                ChangeKind.CORRECTION_ADDED, key, self.current_iteration, pass_name
             )
 
         return True
@@ -243,54 +237,32 @@ class DictionaryState:
         Returns:
             True if the correction was removed (was present)
         """
-        correction = (typo, word, boundary)
-
-        if correction not in self.active_corrections:
+        key = self.correction_table.lookup((typo, word, boundary))
+        if key is None or key not in self.active_corrections.keys:
             return False
 
-        self.active_corrections.remove(correction)
-        self._coverage_map[typo].discard(correction)
+        self.active_corrections.keys.remove(key)
+        self.changes.record(ChangeKind.CORRECTION_REMOVED, key)
+        self._coverage_map[typo].discard(key)
         self.is_dirty = True
         # If typo is no longer covered, mark it as uncovered
         if not self._coverage_map.get(typo) and not self.caching.is_typo_covered_by_pattern(
-            typo, self.active_patterns
+            typo, self.raw_typo_map.get(typo, [])
         ):
             self.caching.get_uncovered_typos().add(typo)
         # Invalidate pattern coverage cache for this typo (coverage may have changed)
         self.caching.invalidate_pattern_coverage_for_typo(typo)
 
         # Track comprehensive history if enabled
-        if self.debug_corrections:
-            # pylint: disable=duplicate-code
-            # Acceptable pattern: This is simple field assignment to a dataclass constructor.
-            # The similar code for PatternHistoryEntry uses a different type with the same
-            # field structure. Extracting this would require generic factories that add
-            # complexity without benefit. The similarity is inherent to the data model design.
-            self.correction_history.append(
-                CorrectionHistoryEntry(
-                    iteration=self.current_iteration,
-                    pass_name=pass_name,
-                    action="removed",
-                    typo=typo,
-                    word=word,
-                    boundary=boundary,
-                    reason=reason,
-                    timestamp=time.time(),
-                )
+        if self.debug_corrections and self.event_log is not None:
+            self.event_log.record(
+                ChangeKind.CORRECTION_REMOVED, key, self.current_iteration, pass_name, reason
             )
 
         # Log if this is a debug target
-        if self._is_debug_target(typo, word, boundary):
-            self.debug_trace.append(
-                DebugTraceEntry(
-                    iteration=self.current_iteration,
-                    pass_name=pass_name,
-                    action="removed",
-                    typo=typo,
-                    word=word,
-                    boundary=boundary,
-                    reason=reason,
-                )
+        if self.trace_log is not None and self._is_debug_target(typo, word, boundary):
+            self.trace_log.record(
+                ChangeKind.CORRECTION_REMOVED, key, self.current_iteration, pass_name, reason
             )
 
         return True
@@ -313,48 +285,23 @@ class DictionaryState:
         Returns:
             True if the pattern was added (wasn't already present)
         """
-        pattern = (typo, word, boundary)
-
-        if pattern in self.active_patterns:
+        key = self.correction_table.encode((typo, word, boundary))
+        if key in self.active_patterns.keys:
             return False
 
-        self.active_patterns.add(pattern)
+        self.active_patterns.keys.add(key)
+        self.changes.record(ChangeKind.PATTERN_ADDED, key)
         self.is_dirty = True
-        # Invalidate pattern coverage cache when patterns change
-        self.caching.invalidate_pattern_coverage_cache()
+        # Index the pattern for coverage checks (invalidates the coverage cache)
+        self.caching.add_pattern(typo, word, boundary)
 
         # Track comprehensive history if enabled
-        if self.debug_patterns:
-            # pylint: disable=duplicate-code
-            # Acceptable pattern: This is simple field assignment to a dataclass constructor.
-            # The similar code for CorrectionHistoryEntry uses a different type with the same
-            # field structure. Extracting this would require generic factories that add
-            # complexity without benefit. The similarity is inherent to the data model design.
-            self.pattern_history.append(
-                PatternHistoryEntry(
-                    iteration=self.current_iteration,
-                    pass_name=pass_name,
-                    action="added",
-                    typo=typo,
-                    word=word,
-                    boundary=boundary,
-                    reason=None,
-                    timestamp=time.time(),
-                )
-            )
+        if self.debug_patterns and self.event_log is not None:
+            self.event_log.record(ChangeKind.PATTERN_ADDED, key, self.current_iteration, pass_name)
 
         # Log if this is a debug target
-        if self._is_debug_target(typo, word, boundary):
-            self.debug_trace.append(
-                DebugTraceEntry(
-                    iteration=self.current_iteration,
-                    pass_name=pass_name,
-                    action="added_pattern",
-                    typo=typo,
-                    word=word,
-                    boundary=boundary,
-                )
-            )
+        if self.trace_log is not None and self._is_debug_target(typo, word, boundary):
+            self.trace_log.record(ChangeKind.PATTERN_ADDED, key, self.current_iteration, pass_name)
 
         return True
 
@@ -378,48 +325,26 @@ class DictionaryState:
         Returns:
             True if the pattern was removed (was present)
         """
-        pattern = (typo, word, boundary)
-
-        if pattern not in self.active_patterns:
+        key = self.correction_table.lookup((typo, word, boundary))
+        if key is None or key not in self.active_patterns.keys:
             return False
 
-        self.active_patterns.remove(pattern)
+        self.active_patterns.keys.remove(key)
+        self.changes.record(ChangeKind.PATTERN_REMOVED, key)
         self.is_dirty = True
-        # Invalidate pattern coverage cache when patterns change
-        self.caching.invalidate_pattern_coverage_cache()
+        # Drop the pattern from the coverage index (invalidates the coverage cache)
+        self.caching.remove_pattern(typo, word, boundary)
 
         # Track comprehensive history if enabled
-        if self.debug_patterns:
-            # pylint: disable=duplicate-code
-            # Acceptable pattern: This is simple field assignment to a dataclass constructor.
-            # The similar code for CorrectionHistoryEntry uses a different type with the same
-            # field structure. Extracting this would require generic factories that add
-            # complexity without benefit. The similarity is inherent to the data model design.
-            self.pattern_history.append(
-                PatternHistoryEntry(
-                    iteration=self.current_iteration,
-                    pass_name=pass_name,
-                    action="removed",
-                    typo=typo,
-                    word=word,
-                    boundary=boundary,
-                    reason=reason,
-                    timestamp=time.time(),
-                )
+        if self.debug_patterns and self.event_log is not None:
+            self.event_log.record(
+                ChangeKind.PATTERN_REMOVED, key, self.current_iteration, pass_name, reason
             )
 
         # Log if this is a debug target
-        if self._is_debug_target(typo, word, boundary):
-            self.debug_trace.append(
-                DebugTraceEntry(
-                    iteration=self.current_iteration,
-                    pass_name=pass_name,
-                    action="removed_pattern",
-                    typo=typo,
-                    word=word,
-                    boundary=boundary,
-                    reason=reason,
-                )
+        if self.trace_log is not None and self._is_debug_target(typo, word, boundary):
+            self.trace_log.record(
+                ChangeKind.PATTERN_REMOVED, key, self.current_iteration, pass_name, reason
             )
 
         return True
@@ -433,7 +358,7 @@ class DictionaryState:
         Returns:
             True if the typo is covered by any active correction or pattern
         """
-        return self.caching.is_typo_covered(typo, self._coverage_map, self.active_patterns)
+        return self.caching.is_typo_covered(typo, self._coverage_map, self.raw_typo_map)
 
     def clear_dirty_flag(self) -> None:
         """Mark the state as clean (no changes in this iteration)."""
@@ -443,9 +368,101 @@ class DictionaryState:
         """Mark the start of a new iteration."""
         self.current_iteration += 1
         self.clear_dirty_flag()
-        # Clear false trigger cache and batch results at start of each iteration
-        # (validation/source sets don't change, but corrections/patterns do)
-        self.caching.clear_false_trigger_cache()
+        # False trigger results are kept across iterations: they only depend on the
+        # typo and the validation/source indexes, which don't change during a run
+
+    def snapshot(self) -> StateSnapshot:
+        """Copy the state a resumed run cannot rebuild (see entroppy.resolution.checkpoint).
+
+        Returns:
+            Snapshot sharing no mutable objects with the state
+        """
+        table = self.correction_table
+        graveyard = list(self.graveyard.values())
+        graveyard_keys = pack_keys(
+            table.encode((entry.typo, entry.word, entry.boundary)) for entry in graveyard
+        )
+        pattern_replacements = {
+            table.encode(pattern): pack_keys(table.encode(c) for c in replaced)
+            for pattern, replaced in self.pattern_replacements.items()
+        }
+        return StateSnapshot(
+            iteration=self.current_iteration,
+            is_dirty=self.is_dirty,
+            # Copied after encoding, which may intern replaced corrections
+            strings=table.strings(),
+            corrections=pack_keys(self.active_corrections.keys),
+            patterns=pack_keys(self.active_patterns.keys),
+            graveyard_keys=graveyard_keys,
+            graveyard_reasons=bytes(REJECTION_REASON_CODES[entry.reason] for entry in graveyard),
+            graveyard_iterations=array("I", (entry.iteration for entry in graveyard)).tobytes(),
+            graveyard_blockers=[entry.blocker for entry in graveyard],
+            pattern_replacements=pattern_replacements,
+            uncovered_typos=list(self.caching.get_uncovered_typos()),
+            debug_trace=(
+                list(self.trace_log.read(ALL_EVENTS)) if self.trace_log is not None else []
+            ),
+        )
+
+    def restore_snapshot(self, snapshot: StateSnapshot) -> None:
+        """Load a snapshot into this newly created state, to resume a run.
+
+        Coverage tracking and the pattern coverage index are rebuilt, and the debug
+        trace is replayed into the trace log. Nothing is recorded in the change journal
+        or lifecycle event log, so every incremental pass does a full run next.
+
+        Args:
+            snapshot: Snapshot from snapshot(), made on a state with the same raw typos
+        """
+        decode = CorrectionTable.from_strings(snapshot.strings).decode
+        encode = self.correction_table.encode
+        for key in unpack_keys(snapshot.corrections):
+            correction = decode(key)
+            new_key = encode(correction)
+            self.active_corrections.keys.add(new_key)
+            self._coverage_map[correction[0]].add(new_key)
+        for key in unpack_keys(snapshot.patterns):
+            typo, word, boundary = decode(key)
+            self.active_patterns.keys.add(encode((typo, word, boundary)))
+            self.caching.add_pattern(typo, word, boundary)
+
+        iterations = array("I")
+        iterations.frombytes(snapshot.graveyard_iterations)
+        for key, reason_code, iteration, blocker in zip(
+            unpack_keys(snapshot.graveyard_keys),
+            snapshot.graveyard_reasons,
+            iterations,
+            snapshot.graveyard_blockers,
+        ):
+            typo, word, boundary = decode(key)
+            self.graveyard.entries[encode((typo, word, boundary))] = GraveyardEntry(
+                typo=typo,
+                word=word,
+                boundary=boundary,
+                reason=REJECTION_REASONS[reason_code],
+                blocker=blocker,
+                iteration=iteration,
+            )
+
+        self.pattern_replacements = {
+            decode(pattern): [decode(key) for key in unpack_keys(replaced)]
+            for pattern, replaced in snapshot.pattern_replacements.items()
+        }
+        uncovered_typos = self.caching.get_uncovered_typos()
+        uncovered_typos.clear()
+        uncovered_typos.update(snapshot.uncovered_typos)
+        if self.trace_log is not None:
+            for event in snapshot.debug_trace:
+                self.trace_log.record(
+                    event.kind,
+                    encode((event.typo, event.word, event.boundary)),
+                    event.iteration,
+                    event.pass_name,
+                    event.reason,
+                    event.blocker,
+                )
+        self.current_iteration = snapshot.iteration
+        self.is_dirty = snapshot.is_dirty
 
     def get_debug_summary(self) -> str:
         """Get a summary of debug trace for reporting.
@@ -453,13 +470,22 @@ class DictionaryState:
         Returns:
             Formatted string with debug trace
         """
-        return get_debug_summary(self.debug_trace)
-
-    def get_formatted_cache(self) -> dict[Correction, str]:
+        if self.trace_log is None:
+            return get_debug_summary([])
+        return get_debug_summary(list(self.trace_log.read(ALL_EVENTS)))
+
+    def close_event_logs(self) -> None:
+        """Close the lifecycle event log and debug trace, deleting their files."""
+        if self.event_log is not None:
+            self.event_log.close()
+        if self.trace_log is not None:
+            self.trace_log.close()
+
+    def get_formatted_cache(self) -> dict[int, str]:
         """Get the formatted cache for corrections.
 
         Returns:
-            Dictionary mapping corrections to their formatted typo strings
+            Dictionary mapping correction keys to their formatted typo strings
         """
         return self._formatted_cache
 
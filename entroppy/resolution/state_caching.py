@@ -1,10 +1,16 @@
 """Caching helpers for DictionaryState optimization."""
 
+from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
 from entroppy.core import BoundaryType
 from entroppy.core.boundaries import determine_boundaries
-from entroppy.resolution.false_trigger_check import _check_false_trigger_with_details
+from entroppy.resolution.false_trigger_check import (
+    _check_false_trigger_with_details,
+    batch_check_false_triggers,
+)
+from entroppy.resolution.false_trigger_flags import FalseTriggerFlags
+from entroppy.resolution.pattern_coverage import PatternCoverageIndex
 
 if TYPE_CHECKING:
     from entroppy.core.boundaries.types import BoundaryIndex
@@ -19,13 +25,16 @@ class StateCaching:
         self._boundary_cache: dict[str, BoundaryType] = {}
         # Pattern coverage cache: typo -> bool (invalidated when patterns added/removed)
         self._pattern_coverage_cache: dict[str, bool] = {}
-        # False trigger cache: (typo, boundary) -> (bool, dict) (cleared at start of each iteration)
+        # Active patterns, indexed for O(L) coverage checks
+        self.pattern_index = PatternCoverageIndex()
+        # False trigger cache: (typo, boundary, target_word) -> (bool, dict)
+        # (run lifetime: inputs and the validation/source indexes never change during a run)
         self._false_trigger_cache: dict[
-            tuple[str, BoundaryType], tuple[bool, dict[str, bool | str | None]]
+            tuple[str, BoundaryType, str | None], tuple[bool, dict[str, bool | str | None]]
         ] = {}
-        # Batch false trigger results: typo -> dict of batch check results
-        # (cleared at start of each iteration)
-        self._batch_false_trigger_results: dict[str, dict[str, bool]] = {}
+        # Batch false trigger memo: typo -> packed batch check flags
+        # (run lifetime: only typos never seen before are computed)
+        self._batch_false_trigger_results = FalseTriggerFlags()
         # Track uncovered typos for early termination
         self._uncovered_typos: set[str] = set()
 
@@ -72,13 +81,13 @@ class StateCaching:
         Returns:
             Tuple of (would_cause_false_trigger, details_dict)
         """
-        cache_key = (typo, boundary)
+        cache_key = (typo, boundary, target_word)
         if cache_key in self._false_trigger_cache:
             return self._false_trigger_cache[cache_key]
 
         # Use batch results if available
         batch_results = (
-            self._batch_false_trigger_results if self._batch_false_trigger_results else None
+            self._batch_false_trigger_results if len(self._batch_false_trigger_results) else None
         )
         would_cause, details = _check_false_trigger_with_details(
             typo,
@@ -91,26 +100,40 @@ class StateCaching:
         self._false_trigger_cache[cache_key] = (would_cause, details)
         return would_cause, details
 
-    def set_batch_false_trigger_results(self, batch_results: dict[str, dict[str, bool]]) -> None:
-        """Set batch false trigger results for use in individual checks.
+    def ensure_batch_false_trigger_results(
+        self,
+        typos: list[str],
+        validation_index: "BoundaryIndex",
+        source_index: "BoundaryIndex",
+    ) -> tuple[FalseTriggerFlags, int]:
+        """Get batch false trigger results for typos, computing only unseen typos.
 
-        Args:
-            batch_results: Dict mapping typo -> dict of batch check results
-        """
-        self._batch_false_trigger_results = batch_results
+        Results depend only on the typo and the validation/source indexes, which never
+        change during a run, so they are memoized for the lifetime of the state.
 
-    def get_batch_false_trigger_results(self) -> dict[str, dict[str, bool]]:
-        """Get batch false trigger results.
+        Args:
+            typos: List of typo strings needed by the caller
+            validation_index: Boundary index for validation set
+            source_index: Boundary index for source words
 
         Returns:
-            Dict mapping typo -> dict of batch check results
+            Tuple of (FalseTriggerFlags holding exactly the requested typos,
+            number of typos that had to be computed)
         """
-        return self._batch_false_trigger_results
+        memo = self._batch_false_trigger_results
+        misses = [typo for typo in typos if typo not in memo]
+        if misses:
+            memo.update(batch_check_false_triggers(misses, validation_index, source_index))
+        return memo.subset(typos), len(misses)
 
     def clear_false_trigger_cache(self) -> None:
-        """Clear false trigger cache and batch results (called at start of each iteration)."""
+        """Clear the false trigger cache and batch memo.
+
+        Only needed if the validation or source indexes change; the solver keeps both
+        for the whole run.
+        """
         self._false_trigger_cache.clear()
-        self._batch_false_trigger_results.clear()
+        self._batch_false_trigger_results = FalseTriggerFlags()
 
     def invalidate_pattern_coverage_cache(self) -> None:
         """Invalidate pattern coverage cache (called when patterns change)."""
@@ -124,35 +147,52 @@ class StateCaching:
         """
         self._pattern_coverage_cache.pop(typo, None)
 
-    def is_typo_covered_by_pattern(
-        self, typo: str, active_patterns: set[tuple[str, str, BoundaryType]]
-    ) -> bool:
+    def add_pattern(self, typo: str, word: str, boundary: BoundaryType) -> None:
+        """Index a newly active pattern and invalidate the coverage cache.
+
+        Args:
+            typo: The pattern typo
+            word: The pattern word
+            boundary: The pattern boundary
+        """
+        self.pattern_index.add(typo, word, boundary)
+        self.invalidate_pattern_coverage_cache()
+
+    def remove_pattern(self, typo: str, word: str, boundary: BoundaryType) -> None:
+        """Drop a deactivated pattern from the index and invalidate the coverage cache.
+
+        Args:
+            typo: The pattern typo
+            word: The pattern word
+            boundary: The pattern boundary
+        """
+        self.pattern_index.remove(typo, word, boundary)
+        self.invalidate_pattern_coverage_cache()
+
+    def is_typo_covered_by_pattern(self, typo: str, words: list[str]) -> bool:
         """Check if typo is covered by patterns only.
 
         Args:
             typo: The typo to check
-            active_patterns: Set of active patterns
+            words: The words the typo was generated from
 
         Returns:
             True if the typo is covered by any pattern
         """
-        for pattern_typo, _, _ in active_patterns:
-            if pattern_typo == typo:  # For now, exact match
-                return True
-        return False
+        return self.pattern_index.covers(typo, words)
 
     def is_typo_covered(
         self,
         typo: str,
-        coverage_map: dict[str, set[tuple[str, str, BoundaryType]]],
-        active_patterns: set[tuple[str, str, BoundaryType]],
+        coverage_map: dict[str, set[int]],
+        raw_typo_map: Mapping[str, list[str]],
     ) -> bool:
         """Check if a raw typo is covered by active corrections or patterns.
 
         Args:
             typo: The typo to check
-            coverage_map: Map of typo -> set of corrections
-            active_patterns: Set of active patterns
+            coverage_map: Map of typo -> set of covering correction keys
+            raw_typo_map: Map of typo -> words it was generated from
 
         Returns:
             True if the typo is covered by any active correction or pattern
@@ -167,16 +207,10 @@ class StateCaching:
             cache[typo] = True
             return True
 
-        # Check if any pattern covers this typo (slow: O(P) where P=2000-2300)
-        # For now, exact match (patterns will be enhanced in PatternGeneralizationPass)
-        for pattern_typo, _, _ in active_patterns:
-            if pattern_typo == typo:
-                cache[typo] = True
-                return True
-
-        # Not covered
-        cache[typo] = False
-        return False
+        # Check if any pattern covers this typo (O(L) through the pattern index)
+        covered = self.pattern_index.covers(typo, raw_typo_map.get(typo, []))
+        cache[typo] = covered
+        return covered
 
     def get_uncovered_typos(self) -> set[str]:
         """Get uncovered typos set (for CandidateSelection pass optimization).
@@ -11,7 +11,7 @@ def get_debug_summary(debug_trace: list) -> str:
     """Get a summary of debug trace for reporting.
 
     Args:
-        debug_trace: List of DebugTraceEntry objects
+        debug_trace: List of debug target events (LifecycleEvent objects)
 
     Returns:
         Formatted string with debug trace
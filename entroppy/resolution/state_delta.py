@@ -0,0 +1,135 @@
+"""Change journal for DictionaryState, used by incremental solver passes.
+
+Every add/remove of a correction or pattern and every graveyard addition is appended
+to a ChangeLog as a (kind, correction key) pair. A pass remembers the journal position
+it last ran at and asks for the changes since then, so later iterations only look at
+the few entries that actually changed instead of the whole state. Deltas hold the
+correction keys themselves; passes decode only the keys whose strings they need.
+"""
+
+from array import array
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from entroppy.core import CorrectionTable
+
+
+class ChangeKind(IntEnum):
+    """Kinds of state changes recorded in the journal."""
+
+    CORRECTION_ADDED = 0
+    CORRECTION_REMOVED = 1
+    PATTERN_ADDED = 2
+    PATTERN_REMOVED = 3
+    GRAVEYARD_ADDED = 4
+
+
+@dataclass
+class StateDelta:
+    """Net changes to the state between two journal positions.
+
+    An item added and later removed within the range is reported as removed only; an
+    item removed and later re-added is reported as added, so passes re-check it. Items
+    are correction keys from the state's CorrectionTable.
+
+    Attributes:
+        table: Table that decodes the keys
+        added_corrections: Keys of corrections added to the active set
+        removed_corrections: Keys of corrections removed from the active set
+        added_patterns: Keys of patterns added to the active set
+        removed_patterns: Keys of patterns removed from the active set
+        graveyard_added: Keys of corrections added to (or re-recorded in) the graveyard
+    """
+
+    table: CorrectionTable
+    added_corrections: set[int] = field(default_factory=set)
+    removed_corrections: set[int] = field(default_factory=set)
+    added_patterns: set[int] = field(default_factory=set)
+    removed_patterns: set[int] = field(default_factory=set)
+    graveyard_added: set[int] = field(default_factory=set)
+
+    def is_empty(self) -> bool:
+        """Check if nothing changed."""
+        return not (
+            self.added_corrections
+            or self.removed_corrections
+            or self.added_patterns
+            or self.removed_patterns
+            or self.graveyard_added
+        )
+
+
+class ChangeLog:
+    """Append-only journal of state changes, stored as packed correction keys.
+
+    Entries cost 9 bytes each (one kind byte plus one int64 key), so the journal stays
+    small even though it is never truncated during a run.
+    """
+
+    __slots__ = ("_table", "_kinds", "_keys")
+
+    def __init__(self, table: CorrectionTable) -> None:
+        """Initialize an empty journal.
+
+        Args:
+            table: Table used to encode and decode correction keys
+        """
+        self._table = table
+        self._kinds = bytearray()
+        self._keys = array("q")
+
+    @property
+    def cursor(self) -> int:
+        """Journal position after the latest change."""
+        return len(self._kinds)
+
+    def record(self, kind: ChangeKind, key: int) -> None:
+        """Append a change.
+
+        Args:
+            kind: What happened
+            key: Correction key from the state's CorrectionTable
+        """
+        self._kinds.append(kind)
+        self._keys.append(key)
+
+    def graveyard_added_since(self, cursor: int) -> set[int]:
+        """Collect only the graveyard additions recorded after a journal position.
+
+        Args:
+            cursor: Position returned by ``cursor`` at an earlier point
+
+        Returns:
+            Keys of corrections added to the graveyard since that position
+        """
+        return {
+            key
+            for kind, key in zip(self._kinds[cursor:], self._keys[cursor:])
+            if kind == ChangeKind.GRAVEYARD_ADDED
+        }
+
+    def since(self, cursor: int) -> StateDelta:
+        """Collect the net changes recorded after a journal position.
+
+        Args:
+            cursor: Position returned by ``cursor`` at an earlier point
+
+        Returns:
+            StateDelta with the changes since that position
+        """
+        delta = StateDelta(self._table)
+        pairs = (
+            (delta.added_corrections, delta.removed_corrections),
+            (delta.removed_corrections, delta.added_corrections),
+            (delta.added_patterns, delta.removed_patterns),
+            (delta.removed_patterns, delta.added_patterns),
+        )
+        for kind, key in zip(self._kinds[cursor:], self._keys[cursor:]):
+            if kind == ChangeKind.GRAVEYARD_ADDED:
+                delta.graveyard_added.add(key)
+                continue
+            # The latest change to an item wins
+            target, opposite = pairs[kind]
+            target.add(key)
+            opposite.discard(key)
+        return delta
@@ -100,8 +100,8 @@ def _would_drop_valid_suffix(typo: str, word: str) -> bool:
 def _should_filter_typo(
     typo: str,
     word: str,
-    source_words: set[str],
-    validation_set: set[str],
+    source_words: set[str] | frozenset[str],
+    validation_set: set[str] | frozenset[str],
     exclusion_matcher: PatternMatcher,
     typo_freq_threshold: float,
 ) -> tuple[bool, str | None]:
@@ -137,15 +137,31 @@ def _should_filter_typo(
     return False, None
 
 
+def build_word_exclusion_matcher(exclusions: set[str] | frozenset[str]) -> PatternMatcher:
+    """Build the matcher for single-word exclusion patterns.
+
+    Typo->word exclusion patterns (containing '->') are ignored here; they are applied
+    later, once corrections exist.
+
+    Args:
+        exclusions: Set of exclusion patterns
+
+    Returns:
+        PatternMatcher over the single-word exclusion patterns
+    """
+    return PatternMatcher({p for p in exclusions if "->" not in p})
+
+
 def process_word(
     word: str,
-    validation_set: set[str],
-    source_words: set[str],
+    validation_set: set[str] | frozenset[str],
+    source_words: set[str] | frozenset[str],
     typo_freq_threshold: float,
     adj_letters_map: dict[str, str] | None,
-    exclusions: set[str],
+    exclusions: set[str] | frozenset[str],
     debug_words: frozenset[str] = frozenset(),
     debug_typo_matcher: "DebugTypoMatcher | None" = None,
+    exclusion_matcher: PatternMatcher | None = None,
 ) -> tuple[list[tuple[str, str]], list[str]]:
     """Process a single word and generate all valid typos.
 
@@ -158,6 +174,8 @@ def process_word(
         exclusions: Set of exclusion patterns
         debug_words: Set of words to debug (exact matches)
         debug_typo_matcher: Matcher for debug typos (with wildcards/boundaries)
+        exclusion_matcher: Prebuilt matcher from build_word_exclusion_matcher(exclusions);
+            built from exclusions if not given. Pass one when processing many words.
 
     Returns:
         Tuple of (list of (typo, word) pairs, debug messages list)
@@ -171,9 +189,8 @@ def process_word(
 
     typos = generate_all_typos(word, adj_letters_map)
 
-    # Filter out typo->word patterns, keep only single word exclusion patterns
-    word_exclusion_patterns = {p for p in exclusions if "->" not in p}
-    exclusion_matcher = PatternMatcher(word_exclusion_patterns)
+    if exclusion_matcher is None:
+        exclusion_matcher = build_word_exclusion_matcher(exclusions)
 
     for typo in typos:
         if typo == word:
@@ -3,7 +3,8 @@
 from dataclasses import dataclass
 import threading
 
-from entroppy.core.boundaries import BoundaryIndex, BoundaryType
+from entroppy.core.boundaries import BoundaryIndex, BoundaryType, get_boundary_index
+from entroppy.resolution.false_trigger_flags import FalseTriggerFlags
 
 
 @dataclass(frozen=True)
@@ -51,8 +52,9 @@ def init_collision_worker(context: CollisionResolutionContext) -> None:
 
     # Build indexes eagerly during initialization
     # This prevents the progress bar from freezing when workers start
-    _worker_indexes.validation_index = BoundaryIndex(context.validation_set)
-    _worker_indexes.source_index = BoundaryIndex(context.source_words)
+    # Reuse indexes already built in this process (e.g. inherited from the parent via fork)
+    _worker_indexes.validation_index = get_boundary_index(context.validation_set)
+    _worker_indexes.source_index = get_boundary_index(context.source_words)
 
 
 def get_collision_worker_context() -> CollisionResolutionContext:
@@ -94,10 +96,12 @@ def get_worker_indexes() -> tuple[BoundaryIndex, BoundaryIndex]:
 
 @dataclass(frozen=True)
 class CandidateSelectionContext:
-    """Immutable context for candidate selection workers.
+    """Context for candidate selection workers, kept in the workers across iterations.
 
-    This encapsulates all state that workers need for parallel candidate selection.
-    The frozen dataclass ensures immutability and thread-safety.
+    The word sets and thresholds never change during a run. The graveyard, boundary
+    map and false trigger results only grow: after the context is installed, each
+    iteration sends a CandidateSelectionUpdate with just the new entries, applied in
+    place by apply_candidate_selection_update.
 
     Attributes:
         validation_set: Set of validation words
@@ -105,11 +109,9 @@ class CandidateSelectionContext:
         min_typo_length: Minimum typo length
         collision_threshold: Minimum frequency ratio for collision resolution
         exclusion_set: Set of exclusion patterns (raw strings, not matcher)
-        covered_typos: Set of typos already covered by active corrections/patterns
         graveyard: Set of (typo, word, boundary) tuples in graveyard
         batch_false_trigger_results: Pre-computed batch false trigger check results
-            (typo -> dict with keys: 'start_val', 'end_val', 'substring_val',
-            'start_src', 'end_src', 'substring_src')
+            (typo -> packed start/end/substring flags for validation and source words)
         boundary_map: Pre-computed boundary determination results (typo -> BoundaryType)
     """
 
@@ -118,12 +120,40 @@ class CandidateSelectionContext:
     min_typo_length: int
     collision_threshold: float
     exclusion_set: frozenset[str]
-    covered_typos: frozenset[str]
-    graveyard: frozenset[tuple[str, str, BoundaryType]]
-    batch_false_trigger_results: dict[str, dict[str, bool]]
+    graveyard: set[tuple[str, str, BoundaryType]]
+    batch_false_trigger_results: FalseTriggerFlags
     boundary_map: dict[str, BoundaryType]
 
 
+@dataclass(frozen=True)
+class CandidateSelectionUpdate:
+    """Entries added to a CandidateSelectionContext since it was last sent to workers.
+
+    Attributes:
+        graveyard_added: Graveyard entries added since the last update
+        batch_false_trigger_results: False trigger results for typos not sent before
+        boundary_map: Boundaries for typos not sent before
+    """
+
+    graveyard_added: frozenset[tuple[str, str, BoundaryType]]
+    batch_false_trigger_results: FalseTriggerFlags
+    boundary_map: dict[str, BoundaryType]
+
+
+def apply_candidate_selection_update(
+    context: CandidateSelectionContext, update: CandidateSelectionUpdate
+) -> None:
+    """Merge an update into a context in place.
+
+    Args:
+        context: Context to extend
+        update: New entries to add
+    """
+    context.graveyard.update(update.graveyard_added)
+    context.batch_false_trigger_results.update(update.batch_false_trigger_results)
+    context.boundary_map.update(update.boundary_map)
+
+
 # Thread-local storage for candidate selection worker context and indexes
 _candidate_worker_context = threading.local()
 _candidate_worker_indexes = threading.local()
@@ -146,6 +176,18 @@ def init_candidate_selection_worker(context: "CandidateSelectionContext") -> Non
     _candidate_worker_indexes.source_index = BoundaryIndex(frozenset())
 
 
+def update_candidate_selection_worker(update: CandidateSelectionUpdate) -> None:
+    """Apply an update to the context installed in this worker.
+
+    Args:
+        update: New entries since the context or the previous update was sent
+
+    Raises:
+        RuntimeError: If called before init_candidate_selection_worker
+    """
+    apply_candidate_selection_update(get_candidate_selection_worker_context(), update)
+
+
 def get_candidate_selection_worker_context() -> "CandidateSelectionContext":
     """Get the current worker's context from thread-local storage.
 
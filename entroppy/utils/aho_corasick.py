@@ -0,0 +1,91 @@
+"""Aho–Corasick automaton for finding many literals in a text in one pass.
+
+The automaton is built once over a set of literals. Scanning a text reports every
+literal occurring anywhere in it in O(len(text) + matches), instead of searching for
+the literals one by one.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Mapping
+
+
+class AhoCorasick:
+    """Aho–Corasick automaton mapping each literal to a list of caller-chosen IDs.
+
+    Nodes are integers. ``_goto[node]`` maps a character to a child node, ``_fail`` is
+    the failure link, ``_ids[node]`` lists the IDs of the literal ending at the node,
+    and ``_output`` links to the nearest node on the failure chain that has IDs (-1 if
+    none), so matches are collected without walking the whole failure chain.
+    """
+
+    __slots__ = ("_goto", "_fail", "_ids", "_output")
+
+    def __init__(self, literals: Mapping[str, Iterable[int]]) -> None:
+        """Build the automaton.
+
+        Args:
+            literals: Literal -> IDs reported when it occurs (empty literals are ignored)
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._ids: list[list[int]] = [[]]
+        for literal, ids in literals.items():
+            if literal:
+                self._ids[self._insert(literal)].extend(ids)
+
+        self._fail = [0] * len(self._goto)
+        self._output = [-1] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                state = self._fail[node]
+                while state and char not in self._goto[state]:
+                    state = self._fail[state]
+                target = self._goto[state].get(char, 0)
+                self._fail[child] = target
+                self._output[child] = target if self._ids[target] else self._output[target]
+                queue.append(child)
+
+    def _insert(self, literal: str) -> int:
+        """Add the trie path for a literal and return its end node."""
+        node = 0
+        for char in literal:
+            child = self._goto[node].get(char)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][char] = child
+                self._goto.append({})
+                self._ids.append([])
+            node = child
+        return node
+
+    def find(self, text: str, found: list[int], first_only: bool = False) -> bool:
+        """Collect the IDs of literals occurring in a text.
+
+        IDs are appended in the order their literals end in the text, longest literal
+        first at each position.
+
+        Args:
+            text: String to scan
+            found: List to append matching IDs to
+            first_only: Stop at the first match and append only its first ID
+
+        Returns:
+            True if any literal occurs in the text
+        """
+        goto, fail, ids, output = self._goto, self._fail, self._ids, self._output
+        matched = False
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            node = state if ids[state] else output[state]
+            while node > 0:
+                matched = True
+                if first_only:
+                    found.append(ids[node][0])
+                    return True
+                found.extend(ids[node])
+                node = output[node]
+        return matched
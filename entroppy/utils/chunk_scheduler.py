@@ -0,0 +1,298 @@
+"""Cost-model-driven chunk scheduling for parallel passes.
+
+Splitting work into equal-sized chunks assumes every item costs the same. In
+candidate selection a collision typo with many words and a NONE boundary (four
+boundaries to try) costs far more than a single-word BOTH typo, so one unlucky chunk
+can keep a single worker busy long after all the others have gone idle.
+
+A ChunkScheduler estimates each item's cost from a few numeric features with a linear
+model, packs items into chunks of roughly equal estimated cost, and hands the most
+expensive chunks out first so the tail of the run is made of cheap chunks. Workers
+time every chunk; after each run the model is refit on the measured chunk times, so
+later iterations of the solver schedule with real costs. The scheduler lives as long
+as the pass that owns it, i.e. for the whole solver run.
+"""
+
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+import os
+import time
+from typing import Any, Generic, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Chunks per worker to aim for: enough to balance load, few enough to keep IPC cheap
+CHUNKS_PER_WORKER = 8
+
+# Most recent chunk timings kept for refitting the model
+MAX_SAMPLES = 2048
+
+# Ridge penalty keeping the fit stable when features are nearly collinear
+_RIDGE = 1e-9
+
+
+def _run_timed(
+    task: tuple[Callable[[list[T]], R], int, list[T]],
+) -> tuple[int, R, float, int]:
+    """Worker wrapper: run a chunk function and time it.
+
+    Args:
+        task: Tuple of (chunk function, chunk number, chunk)
+
+    Returns:
+        Tuple of (chunk number, result, seconds spent, worker process ID)
+    """
+    func, index, chunk = task
+    start = time.perf_counter()
+    result = func(chunk)
+    return index, result, time.perf_counter() - start, os.getpid()
+
+
+def _solve(matrix: list[list[float]], vector: list[float]) -> list[float] | None:
+    """Solve a small linear system by Gaussian elimination with partial pivoting.
+
+    Args:
+        matrix: Square coefficient matrix (modified in place)
+        vector: Right-hand side (modified in place)
+
+    Returns:
+        Solution, or None if the system is singular
+    """
+    size = len(vector)
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda row: abs(matrix[row][col]))
+        if abs(matrix[pivot][col]) < 1e-18:
+            return None
+        matrix[col], matrix[pivot] = matrix[pivot], matrix[col]
+        vector[col], vector[pivot] = vector[pivot], vector[col]
+        for row in range(col + 1, size):
+            factor = matrix[row][col] / matrix[col][col]
+            for k in range(col, size):
+                matrix[row][k] -= factor * matrix[col][k]
+            vector[row] -= factor * vector[col]
+    solution = [0.0] * size
+    for row in range(size - 1, -1, -1):
+        total = vector[row] - sum(matrix[row][k] * solution[k] for k in range(row + 1, size))
+        solution[row] = total / matrix[row][row]
+    return solution
+
+
+class CostModel:
+    """Linear model of per-item cost: ``cost = sum(weight * feature)``.
+
+    Fit by least squares on chunk timings, where a chunk's features are the sums of
+    its items' features. Weights start from a prior in arbitrary units; only their
+    ratios matter for scheduling.
+
+    Attributes:
+        weights: Current weight per feature
+        fitted: Whether the weights come from measurements rather than the prior
+    """
+
+    def __init__(self, prior: Sequence[float]) -> None:
+        """Initialize the model.
+
+        Args:
+            prior: Weights to use until enough chunks have been measured
+        """
+        self.weights = list(prior)
+        self.fitted = False
+        self._samples: list[tuple[list[float], float]] = []
+
+    def estimate(self, features: Sequence[float]) -> float:
+        """Estimate the cost of an item (or chunk) from its features."""
+        return sum(w * f for w, f in zip(self.weights, features))
+
+    def add_sample(self, features: Sequence[float], seconds: float) -> None:
+        """Record a measured chunk.
+
+        Args:
+            features: Summed features of the chunk's items
+            seconds: Time the worker spent on the chunk
+        """
+        self._samples.append((list(features), seconds))
+        if len(self._samples) > MAX_SAMPLES:
+            del self._samples[: len(self._samples) - MAX_SAMPLES]
+
+    def refit(self) -> None:
+        """Refit the weights on the recorded samples.
+
+        Keeps the current weights if there are fewer samples than features or the fit
+        is degenerate. Negative weights are clamped to zero, since no feature can make
+        an item cheaper.
+        """
+        size = len(self.weights)
+        if len(self._samples) < size:
+            return
+        # Normal equations: (XᵀX + λI) w = Xᵀy
+        gram = [[0.0] * size for _ in range(size)]
+        moment = [0.0] * size
+        for features, seconds in self._samples:
+            for i in range(size):
+                moment[i] += features[i] * seconds
+                for j in range(size):
+                    gram[i][j] += features[i] * features[j]
+        for i in range(size):
+            gram[i][i] += _RIDGE * (gram[i][i] or 1.0)
+        solution = _solve(gram, moment)
+        if solution is None:
+            return
+        weights = [max(0.0, w) for w in solution]
+        if any(weights):
+            self.weights = weights
+            self.fitted = True
+
+
+@dataclass
+class ScheduleStats:
+    """Observed timing of one scheduled parallel run.
+
+    Attributes:
+        chunks: Number of chunks run
+        wall_seconds: Time from the first chunk handed out to the last result received
+        busy_seconds: Time spent inside chunks, per worker process
+        longest_chunk_seconds: Time taken by the slowest chunk
+    """
+
+    chunks: int
+    wall_seconds: float
+    busy_seconds: dict[int, float]
+    longest_chunk_seconds: float
+
+    def utilization(self, workers: int) -> float:
+        """Fraction of the available worker time spent on chunks.
+
+        Args:
+            workers: Number of workers in the pool
+
+        Returns:
+            Utilization between 0 and 1
+        """
+        if self.wall_seconds <= 0 or workers <= 0:
+            return 1.0
+        return min(1.0, sum(self.busy_seconds.values()) / (self.wall_seconds * workers))
+
+
+class ChunkScheduler(Generic[T]):
+    """Plans cost-balanced chunks and learns item costs from their run times.
+
+    Attributes:
+        model: Cost model used to estimate item costs
+        last_stats: Timing of the most recent run, or None before the first run
+    """
+
+    def __init__(self, features: Callable[[T], Sequence[float]], prior: Sequence[float]) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            features: Function returning an item's numeric cost features
+            prior: Initial weight per feature
+        """
+        self._features = features
+        self.model = CostModel(prior)
+        self.last_stats: ScheduleStats | None = None
+
+    def plan(self, items: Sequence[T], workers: int) -> list[list[T]]:
+        """Split items into chunks of similar estimated cost, most expensive first.
+
+        Items are sorted by estimated cost (descending) and packed greedily, so each
+        chunk holds items of similar cost and an item costlier than the target gets a
+        chunk to itself.
+
+        Args:
+            items: Items to schedule
+            workers: Number of parallel workers
+
+        Returns:
+            Chunks in the order they should be handed out
+        """
+        if not items:
+            return []
+        costs = [max(self.model.estimate(self._features(item)), 0.0) for item in items]
+        order = sorted(range(len(items)), key=costs.__getitem__, reverse=True)
+        total = sum(costs)
+        num_chunks = min(len(items), max(1, workers) * CHUNKS_PER_WORKER)
+        if total <= 0:
+            size = -(-len(items) // num_chunks)
+            return [
+                [items[i] for i in order[start : start + size]]
+                for start in range(0, len(order), size)
+            ]
+        target = total / num_chunks
+
+        chunks: list[list[T]] = []
+        current: list[T] = []
+        current_cost = 0.0
+        for i in order:
+            if current and current_cost + costs[i] > target:
+                chunks.append(current)
+                current, current_cost = [], 0.0
+            current.append(items[i])
+            current_cost += costs[i]
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def imap(self, pool: Any, func: Callable[[list[T]], R], chunks: list[list[T]]) -> Iterator[R]:
+        """Hand chunks to a pool in order, yielding results as they complete.
+
+        Measured chunk times are fed back into the model once all results have been
+        consumed, and the run's timing is kept in ``last_stats``.
+
+        Args:
+            pool: WorkerPool (or multiprocessing.Pool) to run on
+            func: Picklable module-level function taking one chunk
+            chunks: Chunks from ``plan``
+
+        Yields:
+            Results of func, in completion order
+        """
+        chunk_features = [self._sum_features(chunk) for chunk in chunks]
+        busy: dict[int, float] = {}
+        longest = 0.0
+        start = time.perf_counter()
+        tasks = [(func, index, chunk) for index, chunk in enumerate(chunks)]
+        # chunksize=1 keeps the hand-out order, so expensive chunks start first
+        for index, result, seconds, pid in pool.imap_unordered(_run_timed, tasks, chunksize=1):
+            self.model.add_sample(chunk_features[index], seconds)
+            busy[pid] = busy.get(pid, 0.0) + seconds
+            longest = max(longest, seconds)
+            yield result
+        self.last_stats = ScheduleStats(
+            chunks=len(chunks),
+            wall_seconds=time.perf_counter() - start,
+            busy_seconds=busy,
+            longest_chunk_seconds=longest,
+        )
+        self.model.refit()
+
+    def _sum_features(self, chunk: list[T]) -> list[float]:
+        """Sum the features of a chunk's items."""
+        totals = [0.0] * len(self.model.weights)
+        for item in chunk:
+            for i, value in enumerate(self._features(item)):
+                totals[i] += value
+        return totals
+
+    def log_stats(self, workers: int) -> None:
+        """Log worker utilization for the most recent run.
+
+        Args:
+            workers: Number of workers in the pool
+        """
+        stats = self.last_stats
+        if stats is None:
+            return
+        busy = list(stats.busy_seconds.values())
+        # Workers that never got a chunk were idle the whole time
+        busy.extend([0.0] * max(0, workers - len(busy)))
+        logger.info(
+            f"  Worker utilization: {stats.utilization(workers):.0%} over "
+            f"{stats.wall_seconds:.2f}s ({stats.chunks} chunks; busiest worker "
+            f"{max(busy, default=0.0):.2f}s, idlest {min(busy, default=0.0):.2f}s, "
+            f"longest chunk {stats.longest_chunk_seconds:.2f}s; "
+            f"{'measured' if self.model.fitted else 'prior'} cost model)"
+        )
@@ -7,7 +7,11 @@ for ~100x faster query performance compared to Python implementations.
 # pylint: disable=no-name-in-module
 # RustSubstringIndex is provided by the Rust extension module (entroppy.rust_ext)
 # which is built dynamically. Pylint cannot detect it statically.
-from entroppy.rust_ext import RustSubstringIndex  # noqa: E0611  # pylint: disable=import-error
+from entroppy.rust_ext import (  # noqa: E0611  # pylint: disable=import-error
+    RustSubstringIndex,
+    batch_false_trigger_flags,
+)
+from entroppy.utils.tracing import span
 
 
 class SubstringIndex:
@@ -23,19 +27,69 @@ class SubstringIndex:
         Args:
             formatted_typos: List of formatted typo strings
         """
-        self._rust_index = RustSubstringIndex(formatted_typos)
+        with span("suffix array build", "index", items=len(formatted_typos)):
+            self._rust_index = RustSubstringIndex(formatted_typos)
         self.typos = formatted_typos
 
-    def find_substring_conflicts(self, typo: str) -> list[int]:
-        """Find all typos that contain this typo as substring.
+    def rebuild(self, formatted_typos: list[str]) -> bool:
+        """Rebuild the index in place from a new typo list.
 
-        Delegates to the Rust implementation for maximum performance.
+        The Rust index reuses its previous buffers instead of allocating a new index,
+        and skips the rebuild entirely if the typo list is unchanged.
+
+        Args:
+            formatted_typos: New list of formatted typo strings
+
+        Returns:
+            True if the index was rebuilt, False if the typo list was unchanged
+        """
+        self.typos = formatted_typos
+        with span("suffix array rebuild", "index", items=len(formatted_typos)):
+            return bool(self._rust_index.rebuild(formatted_typos))
+
+    def find_substring_conflicts_batch(self, typos: list[str]) -> tuple[memoryview, memoryview]:
+        """Find substring conflicts for many typos in one parallel Rust call.
+
+        Results use a CSR layout: matches for typos[i] are
+        ``indices[offsets[i]:offsets[i + 1]]``. Slicing a memoryview is zero-copy.
+
+        Args:
+            typos: Substrings to search for
+
+        Returns:
+            Tuple of (offsets, indices), both memoryviews of format 'I'
+        """
+        offsets, indices = self._rust_index.find_substring_conflicts_batch(typos)
+        return memoryview(offsets).cast("I"), memoryview(indices).cast("I")
+
+    def contains_substring(self, typo: str) -> bool:
+        """Check if any other indexed string contains this typo as a substring.
+
+        Early-exit existence query: a miss costs a single O(|typo| log N) search and
+        no match list is built.
 
         Args:
             typo: The substring to search for
 
         Returns:
-            List of indices where typo appears as substring
+            True if typo appears inside some indexed string other than itself
+        """
+        return bool(self._rust_index.contains_substring(typo))
+
+    def batch_boundary_flags(self, typos: list[str], source_index: "SubstringIndex") -> bytes:
+        """Compute packed start/end/substring flags for many typos in one Rust call.
+
+        This index is treated as the validation index. The Rust kernel releases the
+        GIL, spreads typos across all cores and uses early-exit existence queries
+        instead of materialising match lists.
+
+        Args:
+            typos: Typos to check
+            source_index: Suffix array index over the source words
+
+        Returns:
+            One byte per typo: bits 0-2 are start/end/substring matches in this index,
+            bits 3-5 the same checks in source_index
         """
-        result = self._rust_index.find_substring_conflicts(typo)
-        return list(result)
+        source_rust_index = source_index._rust_index  # pylint: disable=protected-access
+        return bytes(batch_false_trigger_flags(typos, self._rust_index, source_rust_index))
@@ -0,0 +1,349 @@
+"""Pipeline tracing: timed spans exported as a Chrome trace and a flat CSV.
+
+Tracing is off unless ``enable_tracing`` is called (``--trace``). While it is off,
+``span`` returns a shared no-op span, so instrumented code pays one global lookup per
+span. While it is on, every span records its name, category, start time, duration,
+process, thread and arguments (e.g. item counts); the resident set size of the process
+is added when the span ends.
+
+Spans are recorded in the main process only. Work done in pool workers is traced by
+the WorkerPool, which times each task in the worker and records it in the parent
+under the worker's process ID (see ``record_worker_tasks``). Consecutive short tasks
+on the same worker are merged into one span so that per-item maps stay readable.
+
+``Tracer.write_chrome_trace`` writes JSON for chrome://tracing or
+https://ui.perfetto.dev; ``Tracer.write_csv`` writes one row per span.
+"""
+
+import csv
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+# Worker tasks shorter than this are merged with the next task on the same worker,
+# unless the worker sat idle for more than a tenth of this in between
+WORKER_SPAN_MIN_SECONDS = 0.1
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process in bytes (peak RSS where unavailable).
+
+    Returns:
+        RSS in bytes, or 0 if it cannot be determined
+    """
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+@dataclass
+class TraceEvent:
+    """One completed span.
+
+    Attributes:
+        name: Span name (e.g. "Stage 2: generate typos", "CandidateSelection")
+        category: Span category ("stage", "iteration", "pass", "index", "pool", "worker")
+        start_ns: Start time in nanoseconds since the tracer started
+        duration_ns: Duration in nanoseconds
+        pid: Process that did the work
+        tid: Thread that did the work
+        args: Extra values (item counts, RSS, ...)
+    """
+
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    pid: int
+    tid: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class Span:
+    """A running span; use as a context manager.
+
+    Values passed to ``set`` while the span is open are stored with the event.
+    """
+
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: dict[str, Any]):
+        """Prepare a span; timing starts on ``__enter__``.
+
+        Args:
+            tracer: Tracer that records the finished span
+            name: Span name
+            category: Span category
+            args: Initial values stored with the event
+        """
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = 0
+
+    def set(self, **args: Any) -> None:
+        """Attach values to the span (e.g. ``items=len(batch)``)."""
+        self._args.update(args)
+
+    def __enter__(self) -> "Span":
+        """Start timing."""
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        """Stop timing and record the event with the current RSS."""
+        end = time.perf_counter_ns()
+        self._args["rss_bytes"] = current_rss_bytes()
+        self._tracer.add_event(
+            self._name,
+            self._category,
+            self._start,
+            end,
+            os.getpid(),
+            threading.get_ident(),
+            self._args,
+        )
+
+
+class _NullSpan:
+    """Span used while tracing is off: does nothing."""
+
+    __slots__ = ()
+
+    def set(self, **args: Any) -> None:
+        """Ignore span values."""
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Collects spans for one pipeline run.
+
+    Attributes:
+        origin_ns: perf_counter_ns() value that trace timestamps are relative to
+        pid: Process the tracer records spans for
+        events: Completed spans, in completion order
+    """
+
+    def __init__(self) -> None:
+        """Start an empty trace."""
+        self.origin_ns = time.perf_counter_ns()
+        self.pid = os.getpid()
+        self.events: list[TraceEvent] = []
+        self._lock = threading.Lock()
+
+    def add_event(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int,
+        pid: int,
+        tid: int,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a completed span.
+
+        Args:
+            name: Span name
+            category: Span category
+            start_ns: Start time as a perf_counter_ns() value
+            end_ns: End time as a perf_counter_ns() value
+            pid: Process that did the work
+            tid: Thread that did the work
+            args: Extra values to store with the span
+        """
+        event = TraceEvent(
+            name, category, start_ns - self.origin_ns, end_ns - start_ns, pid, tid, args or {}
+        )
+        with self._lock:
+            self.events.append(event)
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the trace in Chrome trace event format.
+
+        Args:
+            path: Output JSON file
+        """
+        trace_events: list[dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": "main" if pid == self.pid else f"worker {pid}"},
+            }
+            for pid in sorted({event.pid for event in self.events})
+        ]
+        for event in sorted(self.events, key=lambda e: e.start_ns):
+            trace_events.append(
+                {
+                    "name": event.name,
+                    "cat": event.category,
+                    "ph": "X",
+                    "ts": event.start_ns / 1000,
+                    "dur": event.duration_ns / 1000,
+                    "pid": event.pid,
+                    "tid": event.tid,
+                    "args": event.args,
+                }
+            )
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f, default=str)
+
+    def write_csv(self, path: Path) -> None:
+        """Write one row per span.
+
+        Args:
+            path: Output CSV file
+        """
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "name",
+                    "category",
+                    "pid",
+                    "start_seconds",
+                    "duration_seconds",
+                    "items",
+                    "rss_mb",
+                    "args",
+                ]
+            )
+            for event in sorted(self.events, key=lambda e: e.start_ns):
+                extra = {k: v for k, v in event.args.items() if k not in ("items", "rss_bytes")}
+                writer.writerow(
+                    [
+                        event.name,
+                        event.category,
+                        event.pid,
+                        f"{event.start_ns / 1e9:.6f}",
+                        f"{event.duration_ns / 1e9:.6f}",
+                        event.args.get("items", ""),
+                        f"{event.args.get('rss_bytes', 0) / (1024 * 1024):.1f}",
+                        json.dumps(extra, default=str) if extra else "",
+                    ]
+                )
+
+
+_tracer: Tracer | None = None
+
+
+def enable_tracing() -> Tracer:
+    """Start recording spans in this process.
+
+    Returns:
+        The new tracer
+    """
+    global _tracer  # pylint: disable=global-statement
+    _tracer = Tracer()
+    return _tracer
+
+
+def disable_tracing() -> Tracer | None:
+    """Stop recording spans.
+
+    Returns:
+        The tracer that was recording, if any
+    """
+    global _tracer  # pylint: disable=global-statement
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def get_tracer() -> Tracer | None:
+    """Get the active tracer.
+
+    Returns:
+        The tracer, or None while tracing is off
+    """
+    return _tracer
+
+
+def span(name: str, category: str, **args: Any) -> Span | _NullSpan:
+    """Time a block of code.
+
+    Example:
+        with span("Stage 2: generate typos", "stage") as s:
+            ...
+            s.set(items=len(typo_map))
+
+    Args:
+        name: Span name
+        category: Span category
+        **args: Values to store with the span
+
+    Returns:
+        Context manager recording the span, or a no-op span while tracing is off
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return Span(tracer, name, category, args)
+
+
+def record_worker_tasks(
+    tracer: Tracer, name: str, timings: list[tuple[int, int, int, int, int]]
+) -> None:
+    """Record tasks timed in pool workers, merging short consecutive tasks.
+
+    Args:
+        tracer: Tracer to record into
+        name: Span name (usually the worker function's name)
+        timings: (start_ns, end_ns, pid, items, rss_bytes) per task
+    """
+    min_ns = int(WORKER_SPAN_MIN_SECONDS * 1e9)
+    by_pid: dict[int, list[tuple[int, int, int, int, int]]] = {}
+    for timing in timings:
+        by_pid.setdefault(timing[2], []).append(timing)
+
+    for pid, worker_timings in by_pid.items():
+        worker_timings.sort()
+        current: list[int] | None = None  # [start, end, tasks, items, rss]
+        for start, end, _, items, rss in worker_timings:
+            if current is not None and (
+                current[1] - current[0] >= min_ns or start - current[1] > min_ns // 10
+            ):
+                _add_worker_span(tracer, name, pid, current)
+                current = None
+            if current is None:
+                current = [start, end, 1, items, rss]
+            else:
+                current[1:] = [end, current[2] + 1, current[3] + items, rss]
+        if current is not None:
+            _add_worker_span(tracer, name, pid, current)
+
+
+def _add_worker_span(tracer: Tracer, name: str, pid: int, merged: list[int]) -> None:
+    """Record one merged worker span ([start, end, tasks, items, rss])."""
+    start, end, tasks, items, rss = merged
+    tracer.add_event(
+        name, "worker", start, end, pid, pid, {"tasks": tasks, "items": items, "rss_bytes": rss}
+    )
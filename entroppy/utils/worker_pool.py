@@ -0,0 +1,320 @@
+"""Persistent process pool shared by all parallel stages and solver passes.
+
+Creating a multiprocessing.Pool costs a fork (or spawn) per worker plus pickling the
+initializer arguments once per worker. The solver runs up to four parallel passes per
+iteration for many iterations, so a fresh pool per call spends most of its time
+starting processes and re-sending the same dictionaries.
+
+A WorkerPool is started once per pipeline run. It keeps named, immutable run data
+(validation set, source words, exclusions, ...) resident in every worker. Per-call
+worker contexts are installed with ``broadcast``, which runs an initializer exactly
+once in each worker; any frozenset in the payload equal to a resident set is sent as
+its name instead of its contents, so only the data that actually changed crosses the
+process boundary.
+
+Code that needs workers calls ``borrow_pool``: it yields the shared pool while one is
+running (see ``shared_worker_pool``) and a temporary pool otherwise.
+
+While tracing is on (see ``entroppy.utils.tracing``), every task is timed in its worker
+and recorded as a worker span in the parent when the map call finishes.
+"""
+
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+import io
+import multiprocessing
+from multiprocessing.pool import AsyncResult
+import os
+import pickle
+import threading
+import time
+from typing import Any
+
+from entroppy.utils.tracing import (
+    Tracer,
+    current_rss_bytes,
+    disable_tracing,
+    get_tracer,
+    record_worker_tasks,
+    span,
+)
+
+# Seconds a worker waits for the other workers to reach a broadcast before giving up
+BROADCAST_TIMEOUT = 600.0
+
+# Per-process worker state: resident data and the barrier used by broadcasts
+_worker = threading.local()
+
+# Pools started by shared_worker_pool, innermost last
+_shared_pools: list["WorkerPool"] = []
+
+
+class _ResidentPickler(pickle.Pickler):
+    """Pickler that replaces resident frozensets with their names."""
+
+    def __init__(self, file: io.BytesIO, resident: Mapping[str, frozenset]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._names_by_length: dict[int, list[tuple[str, frozenset]]] = {}
+        for name, values in resident.items():
+            self._names_by_length.setdefault(len(values), []).append((name, values))
+
+    def persistent_id(self, obj: Any) -> str | None:  # pylint: disable=arguments-renamed
+        """Return the resident name for a frozenset equal to resident data."""
+        if type(obj) is not frozenset:  # pylint: disable=unidiomatic-typecheck
+            return None
+        for name, values in self._names_by_length.get(len(obj), ()):
+            if obj is values or obj == values:
+                return name
+        return None
+
+
+class _ResidentUnpickler(pickle.Unpickler):
+    """Unpickler that resolves resident names to this worker's resident data."""
+
+    def persistent_load(self, pid: Any) -> Any:
+        """Look up resident data by name."""
+        try:
+            return _worker.resident[pid]
+        except (AttributeError, KeyError) as e:
+            raise pickle.UnpicklingError(f"Unknown resident data: {pid!r}") from e
+
+
+def _init_pool_worker(resident: Mapping[str, frozenset], barrier: Any) -> None:
+    """Pool initializer: keep the resident data and broadcast barrier in this worker."""
+    _worker.resident = resident
+    _worker.barrier = barrier
+    # A tracer inherited through fork would collect spans nobody reads
+    disable_tracing()
+
+
+def _run_traced(task: tuple[Callable, Any, bool]) -> tuple[Any, tuple[int, int, int, int, int]]:
+    """Worker wrapper: run one task and time it.
+
+    Args:
+        task: Tuple of (function, item, whether to unpack the item as arguments)
+
+    Returns:
+        Tuple of (result, (start_ns, end_ns, pid, items, rss_bytes))
+    """
+    func, item, star = task
+    start = time.perf_counter_ns()
+    result = func(*item) if star else func(item)
+    end = time.perf_counter_ns()
+    items = len(item) if isinstance(item, list) else 1
+    return result, (start, end, os.getpid(), items, current_rss_bytes())
+
+
+def _record_results(tracer: Tracer, func: Callable, results: Iterable) -> Iterator:
+    """Unwrap results of _run_traced, recording the task timings once all are read."""
+    timings = []
+    try:
+        for result, timing in results:
+            timings.append(timing)
+            yield result
+    finally:
+        record_worker_tasks(tracer, getattr(func, "__name__", "worker task"), timings)
+
+
+class _TracedAsyncResult:
+    """AsyncResult of a traced starmap_async that records the task timings on get()."""
+
+    def __init__(self, tracer: Tracer, func: Callable, result: AsyncResult) -> None:
+        self._tracer = tracer
+        self._func = func
+        self._result = result
+
+    def ready(self) -> bool:
+        """Whether the call has completed."""
+        return self._result.ready()
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait until the result is available or the timeout passes."""
+        self._result.wait(timeout)
+
+    def get(self, timeout: float | None = None) -> list:
+        """Return the results, recording the task timings."""
+        return list(_record_results(self._tracer, self._func, self._result.get(timeout)))
+
+
+def _run_broadcast(payload: bytes) -> None:
+    """Run a broadcast initializer, then wait until every worker has run it.
+
+    Waiting on the barrier keeps this worker from taking a second copy of the task,
+    so each worker runs the initializer exactly once.
+    """
+    initializer, args = _ResidentUnpickler(io.BytesIO(payload)).load()
+    initializer(*args)
+    try:
+        _worker.barrier.wait(timeout=BROADCAST_TIMEOUT)
+    except threading.BrokenBarrierError as e:
+        raise RuntimeError("Worker broadcast timed out waiting for other workers") from e
+
+
+class WorkerPool:
+    """Process pool that outlives individual stages and passes.
+
+    Attributes:
+        processes: Number of worker processes
+    """
+
+    def __init__(self, processes: int, resident: Mapping[str, frozenset] | None = None) -> None:
+        """Start the worker processes.
+
+        Args:
+            processes: Number of worker processes
+            resident: Named immutable data kept in every worker for the pool's lifetime
+        """
+        self.processes = processes
+        self._resident = dict(resident or {})
+        with span("worker pool start", "pool", processes=processes):
+            self._barrier = multiprocessing.Barrier(processes)
+            self._pool = multiprocessing.Pool(  # pylint: disable=consider-using-with
+                processes=processes,
+                initializer=_init_pool_worker,
+                initargs=(self._resident, self._barrier),
+            )
+        # Latest arguments broadcast for each initializer (kept alive for identity checks)
+        self._installed: dict[Callable[..., None], tuple] = {}
+
+    def broadcast(self, initializer: Callable[..., None], *args: Any) -> bool:
+        """Run an initializer once in every worker, e.g. to install a worker context.
+
+        Skipped if the same initializer was last broadcast with the very same argument
+        objects, since the workers already hold them.
+
+        Args:
+            initializer: Picklable module-level function
+            *args: Arguments for the initializer
+
+        Returns:
+            True if the initializer ran, False if the workers already had the arguments
+
+        Raises:
+            RuntimeError: If a worker does not reach the broadcast in time
+        """
+        installed = self._installed.get(initializer)
+        if installed is not None and len(installed) == len(args):
+            if all(old is new for old, new in zip(installed, args)):
+                return False
+
+        with span(f"broadcast {initializer.__name__}", "pool") as broadcast_span:
+            buffer = io.BytesIO()
+            _ResidentPickler(buffer, self._resident).dump((initializer, args))
+            payload = buffer.getvalue()
+            broadcast_span.set(payload_bytes=len(payload))
+            try:
+                self._pool.map(_run_broadcast, [payload] * self.processes, chunksize=1)
+            except RuntimeError:
+                self._barrier.reset()
+                self._installed.pop(initializer, None)
+                raise
+        self._installed[initializer] = args
+        return True
+
+    def imap(self, func: Callable, iterable: Iterable, chunksize: int = 1) -> Iterator:
+        """Lazy ordered map over the workers (see multiprocessing.Pool.imap)."""
+        tracer = get_tracer()
+        if tracer is None:
+            return self._pool.imap(func, iterable, chunksize)
+        tasks = ((func, item, False) for item in iterable)
+        return _record_results(tracer, func, self._pool.imap(_run_traced, tasks, chunksize))
+
+    def imap_unordered(self, func: Callable, iterable: Iterable, chunksize: int = 1) -> Iterator:
+        """Lazy unordered map over the workers (see multiprocessing.Pool.imap_unordered)."""
+        tracer = get_tracer()
+        if tracer is None:
+            return self._pool.imap_unordered(func, iterable, chunksize)
+        tasks = ((func, item, False) for item in iterable)
+        results = self._pool.imap_unordered(_run_traced, tasks, chunksize)
+        return _record_results(tracer, func, results)
+
+    def map(self, func: Callable, iterable: Iterable) -> list:
+        """Ordered map over the workers (see multiprocessing.Pool.map)."""
+        tracer = get_tracer()
+        if tracer is None:
+            return self._pool.map(func, iterable)
+        results = self._pool.map(_run_traced, [(func, item, False) for item in iterable])
+        return list(_record_results(tracer, func, results))
+
+    def starmap(self, func: Callable, iterable: Iterable) -> list:
+        """Ordered map with argument unpacking (see multiprocessing.Pool.starmap)."""
+        tracer = get_tracer()
+        if tracer is None:
+            return self._pool.starmap(func, iterable)
+        results = self._pool.map(_run_traced, [(func, args, True) for args in iterable])
+        return list(_record_results(tracer, func, results))
+
+    def starmap_async(
+        self, func: Callable, iterable: Iterable
+    ) -> "AsyncResult | _TracedAsyncResult":
+        """Asynchronous starmap (see multiprocessing.Pool.starmap_async)."""
+        tracer = get_tracer()
+        if tracer is None:
+            return self._pool.starmap_async(func, iterable)
+        tasks = [(func, args, True) for args in iterable]
+        return _TracedAsyncResult(tracer, func, self._pool.map_async(_run_traced, tasks))
+
+    def close(self) -> None:
+        """Let outstanding work finish and stop the workers."""
+        self._pool.close()
+        self._pool.join()
+
+    def terminate(self) -> None:
+        """Stop the workers immediately."""
+        self._pool.terminate()
+        self._pool.join()
+
+    def __enter__(self) -> "WorkerPool":
+        """Use the pool as a context manager."""
+        return self
+
+    def __exit__(self, exc_type, *_exc_info) -> None:
+        """Close the pool, or terminate it if the block raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.terminate()
+
+
+@contextmanager
+def shared_worker_pool(
+    processes: int, resident: Mapping[str, frozenset] | None = None
+) -> Iterator[WorkerPool | None]:
+    """Start the pool that ``borrow_pool`` hands out until the block exits.
+
+    Args:
+        processes: Number of worker processes (no pool is started for 1 or fewer)
+        resident: Named immutable data kept in every worker
+
+    Yields:
+        The shared pool, or None when running single-process
+    """
+    if processes <= 1:
+        yield None
+        return
+
+    with WorkerPool(processes, resident) as pool:
+        _shared_pools.append(pool)
+        try:
+            yield pool
+        finally:
+            _shared_pools.remove(pool)
+
+
+@contextmanager
+def borrow_pool(processes: int) -> Iterator[WorkerPool]:
+    """Get a pool with at least the given number of workers.
+
+    Args:
+        processes: Number of workers needed
+
+    Yields:
+        The shared pool if one is running and large enough, else a temporary pool that
+        is closed when the block exits
+    """
+    if _shared_pools and _shared_pools[-1].processes >= processes:
+        yield _shared_pools[-1]
+        return
+
+    with WorkerPool(processes) as temporary:
+        yield temporary
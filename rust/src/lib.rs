@@ -1,6 +1,14 @@
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use rayon::prelude::*;
 use std::collections::HashMap;
 
+// Bit layout shared with entroppy/resolution/false_trigger_flags.py
+const FLAG_START: u8 = 1 << 0;
+const FLAG_END: u8 = 1 << 1;
+const FLAG_SUBSTRING: u8 = 1 << 2;
+const SOURCE_SHIFT: u8 = 3;
+
 /// High-performance suffix array-based substring index implemented in Rust.
 ///
 /// This provides O(log N + M) substring queries using suffix arrays,
@@ -12,17 +20,43 @@ use std::collections::HashMap;
 #[pyclass]
 pub struct RustSubstringIndex {
     typos: Vec<String>,
-    #[allow(dead_code)] // Kept for potential future use
-    concatenated: String,
-    #[allow(dead_code)] // Kept for potential future use
-    delimiter: String,
     cumulative_starts: Vec<usize>,
     typo_to_idx: HashMap<String, usize>,
-    // SuffixTable has two lifetime parameters - we use 'static by leaking the string
-    // This is safe because the struct owns the string and it lives as long as the struct
+    // The table owns its text (Cow::Owned), so the 'static lifetimes borrow nothing
+    // and both the text and the suffix array are freed when the index is dropped
     suffix_array: suffix::SuffixTable<'static, 'static>,
 }
 
+/// Separator between indexed strings in the suffix table's text.
+const DELIMITER: char = '\x00';
+
+impl RustSubstringIndex {
+    /// Fill `text` with the typos joined by DELIMITER and record each typo's start.
+    ///
+    /// `text`, `cumulative_starts` and `typo_to_idx` are cleared first, so callers can
+    /// pass buffers from a previous build to reuse their allocations.
+    fn layout(
+        typos: &[String],
+        text: &mut String,
+        cumulative_starts: &mut Vec<usize>,
+        typo_to_idx: &mut HashMap<String, usize>,
+    ) {
+        text.clear();
+        cumulative_starts.clear();
+        typo_to_idx.clear();
+        text.reserve(typos.iter().map(|typo| typo.len() + 1).sum());
+        cumulative_starts.reserve(typos.len());
+        for (i, typo) in typos.iter().enumerate() {
+            if i > 0 {
+                text.push(DELIMITER);
+            }
+            cumulative_starts.push(text.len());
+            text.push_str(typo);
+            typo_to_idx.insert(typo.clone(), i);
+        }
+    }
+}
+
 #[pymethods]
 impl RustSubstringIndex {
     /// Build a new suffix array index from formatted typos.
@@ -31,93 +65,110 @@ impl RustSubstringIndex {
     ///     formatted_typos: List of formatted typo strings
     #[new]
     pub fn new(formatted_typos: Vec<String>) -> PyResult<Self> {
-        let delimiter = "\x00".to_string();
-
-        // Build cumulative starts for O(log N) position lookup
-        let mut cumulative_starts = Vec::with_capacity(formatted_typos.len());
-        let mut cumulative_pos = 0;
-        for typo in &formatted_typos {
-            cumulative_starts.push(cumulative_pos);
-            cumulative_pos += typo.len() + delimiter.len();
-        }
-
-        // Concatenate all typos with delimiter
-        let concatenated = formatted_typos.join(&delimiter);
+        let mut text = String::new();
+        let mut cumulative_starts = Vec::new();
+        let mut typo_to_idx = HashMap::new();
+        Self::layout(
+            &formatted_typos,
+            &mut text,
+            &mut cumulative_starts,
+            &mut typo_to_idx,
+        );
 
         // Build suffix array (this is the expensive operation, but done once)
-        // SuffixTable::new expects a string, not bytes
-        // We need to leak the string to get 'static lifetime, or use a different approach
-        // Actually, let's box and leak it to get 'static
-        let concatenated_static: &'static str = Box::leak(concatenated.clone().into_boxed_str());
-        let suffix_array = suffix::SuffixTable::new(concatenated_static);
-
-        // Build reverse lookup: string -> index
-        let typo_to_idx: HashMap<String, usize> = formatted_typos
-            .iter()
-            .enumerate()
-            .map(|(i, typo)| (typo.clone(), i))
-            .collect();
+        let suffix_array = suffix::SuffixTable::new(text);
 
         Ok(Self {
             typos: formatted_typos,
-            concatenated,
-            delimiter,
             cumulative_starts,
             typo_to_idx,
             suffix_array,
         })
     }
 
-    /// Find all typos that contain the given typo as a substring.
+    /// Rebuild the index in place from a new list of formatted typos.
     ///
-    /// Uses binary search for O(log N) position lookup instead of O(N) linear scan.
+    /// Reuses the previous text buffer, position table and lookup map allocations
+    /// instead of allocating a fresh index. Does nothing if the typo list is unchanged.
     ///
     /// Args:
-    ///     typo: The substring to search for
+    ///     formatted_typos: New list of formatted typo strings
     ///
     /// Returns:
-    ///     List of indices where typo appears as substring (excluding self)
-    pub fn find_substring_conflicts(&self, typo: &str) -> PyResult<Vec<usize>> {
-        // Find all occurrences using suffix array
-        // The suffix crate's positions() method returns &[u32] (slice of positions)
-        let matches = self.suffix_array.positions(typo);
-
-        // Map match positions back to typo indices using binary search
-        let mut matched_typo_indices = Vec::new();
-        for &pos_u32 in matches {
-            let pos = pos_u32 as usize; // Convert u32 to usize
-
-            // Binary search to find which typo contains this position
-            let idx = match self.cumulative_starts.binary_search(&pos) {
-                Ok(i) => i,
-                Err(i) => {
-                    // Position is between cumulative_starts[i-1] and cumulative_starts[i]
-                    if i > 0 {
-                        i - 1
-                    } else {
-                        continue; // Position is before first typo
-                    }
-                }
-            };
-
-            if idx < self.typos.len() {
-                // Verify position is actually within this typo's range
-                let typo_start = self.cumulative_starts[idx];
-                let typo_end = typo_start + self.typos[idx].len();
-                if typo_start <= pos && pos < typo_end {
-                    matched_typo_indices.push(idx);
-                }
-            }
+    ///     True if the index was rebuilt, False if the typo list was unchanged
+    pub fn rebuild(&mut self, formatted_typos: Vec<String>) -> bool {
+        if formatted_typos == self.typos {
+            return false;
         }
+        let old_table = std::mem::replace(&mut self.suffix_array, suffix::SuffixTable::new(""));
+        let mut text = old_table.into_parts().0.into_owned();
+        Self::layout(
+            &formatted_typos,
+            &mut text,
+            &mut self.cumulative_starts,
+            &mut self.typo_to_idx,
+        );
+        self.suffix_array = suffix::SuffixTable::new(text);
+        self.typos = formatted_typos;
+        true
+    }
 
-        // Filter out self-matches
-        let self_idx = self.typo_to_idx.get(typo);
-        let result: Vec<usize> = matched_typo_indices
-            .into_iter()
-            .filter(|idx| Some(idx) != self_idx)
-            .collect();
+    /// Find substring conflicts for many typos at once, in CSR layout.
+    ///
+    /// Queries run in parallel with the GIL released. Matches for typos[i] are
+    /// indices[offsets[i]:offsets[i + 1]].
+    ///
+    /// Args:
+    ///     typos: Substrings to search for
+    ///
+    /// Returns:
+    ///     Tuple of (offsets, indices) as bytes of native-endian uint32 values;
+    ///     offsets has len(typos) + 1 entries
+    pub fn find_substring_conflicts_batch(
+        &self,
+        py: Python<'_>,
+        typos: Vec<String>,
+    ) -> PyResult<(PyObject, PyObject)> {
+        let per_typo: Vec<Vec<u32>> = py.allow_threads(|| {
+            typos
+                .par_iter()
+                .map(|typo| self.conflict_indices(typo))
+                .collect()
+        });
+        let mut offsets = Vec::with_capacity(per_typo.len() + 1);
+        offsets.push(0u32);
+        let mut total = 0u32;
+        for matches in &per_typo {
+            total += matches.len() as u32;
+            offsets.push(total);
+        }
+        let indices = per_typo.concat();
+        Ok((u32_bytes(py, &offsets)?, u32_bytes(py, &indices)?))
+    }
 
-        Ok(result)
+    /// Check whether any indexed string other than `typo` itself contains `typo`.
+    ///
+    /// Stops at the first qualifying match, so a miss costs a single suffix array
+    /// search (O(|typo| log N)) and a hit never materialises the full match list.
+    ///
+    /// Args:
+    ///     typo: The substring to search for
+    ///
+    /// Returns:
+    ///     True if typo appears inside some other indexed string
+    pub fn contains_substring(&self, typo: &str) -> bool {
+        if typo.is_empty() {
+            return false;
+        }
+        // The only occurrence that does not count is the start of typo's own entry
+        let self_start = self
+            .typo_to_idx
+            .get(typo)
+            .map(|&idx| self.cumulative_starts[idx]);
+        self.suffix_array
+            .positions(typo)
+            .iter()
+            .any(|&pos| Some(pos as usize) != self_start)
     }
 
     /// Get the list of typos (for compatibility/testing).
@@ -126,85 +177,295 @@ impl RustSubstringIndex {
     }
 }
 
-/// Check if a pattern would corrupt a source word for RTL matching.
-///
-/// For RTL: checks if pattern appears at word boundaries at the start
-/// (position 0 or after a non-alpha character).
-fn would_corrupt_rtl(pattern: &str, source_word: &str) -> bool {
-    let mut idx = 0;
-    while let Some(pos) = source_word[idx..].find(pattern) {
-        let absolute_pos = idx + pos;
-        // Check if there's a word boundary before the pattern
-        if absolute_pos == 0 || !source_word.chars().nth(absolute_pos - 1).map_or(false, |c| c.is_alphabetic()) {
-            return true;
+impl RustSubstringIndex {
+    /// Start offset of `typo`'s own entry, if `typo` is itself indexed.
+    fn self_start(&self, typo: &str) -> Option<usize> {
+        self.typo_to_idx
+            .get(typo)
+            .map(|&idx| self.cumulative_starts[idx])
+    }
+
+    /// Whether `pos` is the first byte of an indexed string.
+    fn is_entry_start(&self, pos: usize) -> bool {
+        self.cumulative_starts.binary_search(&pos).is_ok()
+    }
+
+    /// Whether `end` is one past the last byte of an indexed string.
+    fn is_entry_end(&self, end: usize) -> bool {
+        end == self.suffix_array.text().len() || self.suffix_array.text().as_bytes()[end] == 0
+    }
+
+    /// Index of the indexed string containing byte `pos`, if `pos` is inside one.
+    fn entry_index(&self, pos: usize) -> Option<usize> {
+        let idx = match self.cumulative_starts.binary_search(&pos) {
+            Ok(i) => i,
+            Err(0) => return None,
+            // Position is between cumulative_starts[i-1] and cumulative_starts[i]
+            Err(i) => i - 1,
+        };
+        let typo_end = self.cumulative_starts[idx] + self.typos[idx].len();
+        (pos < typo_end).then_some(idx)
+    }
+
+    /// Sorted, unique indices of other indexed strings containing `typo`.
+    fn conflict_indices(&self, typo: &str) -> Vec<u32> {
+        let self_idx = self.typo_to_idx.get(typo).copied();
+        let mut indices: Vec<u32> = self
+            .suffix_array
+            .positions(typo)
+            .iter()
+            .filter_map(|&pos| self.entry_index(pos as usize))
+            .filter(|&idx| Some(idx) != self_idx)
+            .map(|idx| idx as u32)
+            .collect();
+        indices.sort_unstable();
+        indices.dedup();
+        indices
+    }
+
+    /// Start/end/substring flags for `typo`, ignoring `typo`'s own entry.
+    ///
+    /// Walks the suffix array matches once and stops as soon as all three flags are set.
+    fn boundary_flags(&self, typo: &str) -> u8 {
+        if typo.is_empty() {
+            return 0;
         }
-        idx = absolute_pos + 1;
-        if idx >= source_word.len() {
-            break;
+        let self_start = self.self_start(typo);
+        let mut flags = 0u8;
+        for &pos_u32 in self.suffix_array.positions(typo) {
+            let pos = pos_u32 as usize;
+            if Some(pos) == self_start {
+                continue;
+            }
+            flags |= FLAG_SUBSTRING;
+            if self.is_entry_start(pos) {
+                flags |= FLAG_START;
+            }
+            if self.is_entry_end(pos + typo.len()) {
+                flags |= FLAG_END;
+            }
+            if flags == FLAG_START | FLAG_END | FLAG_SUBSTRING {
+                break;
+            }
         }
+        flags
     }
-    false
 }
 
-/// Check if a pattern would corrupt a source word for LTR matching.
+/// Pack u32 values into a Python bytes object (native endianness) without an
+/// intermediate byte vector.
+fn u32_bytes(py: Python<'_>, values: &[u32]) -> PyResult<PyObject> {
+    let bytes = PyBytes::new_bound_with(py, values.len() * 4, |buf| {
+        for (chunk, value) in buf.chunks_exact_mut(4).zip(values) {
+            chunk.copy_from_slice(&value.to_ne_bytes());
+        }
+        Ok(())
+    })?;
+    Ok(bytes.into_any().unbind())
+}
+
+/// Compute all six false trigger flags for many typos in one call.
+///
+/// For each typo, checks whether it is a prefix, suffix or substring of some other
+/// string in the validation index (bits 0-2) and the source index (bits 3-5).
+/// Releases the GIL and spreads typos across all cores with rayon.
+///
+/// Args:
+///     typos: Typos to check
+///     validation_index: Index built over the validation words
+///     source_index: Index built over the source words
+///
+/// Returns:
+///     bytes with one bitmask per typo, in input order
+#[pyfunction]
+fn batch_false_trigger_flags(
+    py: Python<'_>,
+    typos: Vec<String>,
+    validation_index: PyRef<'_, RustSubstringIndex>,
+    source_index: PyRef<'_, RustSubstringIndex>,
+) -> PyResult<PyObject> {
+    let validation: &RustSubstringIndex = &validation_index;
+    let source: &RustSubstringIndex = &source_index;
+    let flags: Vec<u8> = py.allow_threads(|| {
+        typos
+            .par_iter()
+            .map(|typo| {
+                validation.boundary_flags(typo) | (source.boundary_flags(typo) << SOURCE_SHIFT)
+            })
+            .collect()
+    });
+    Ok(PyBytes::new_bound(py, &flags).into_any().unbind())
+}
+
+/// Whether a match direction string means RIGHT_TO_LEFT.
+///
+/// Accepts the MatchDirection enum values ("rtl"/"ltr") as well as "RTL"/"LTR"
+/// and the enum member names.
+fn parse_is_rtl(match_direction: &str) -> PyResult<bool> {
+    match match_direction.to_ascii_uppercase().as_str() {
+        "RTL" | "RIGHT_TO_LEFT" => Ok(true),
+        "LTR" | "LEFT_TO_RIGHT" => Ok(false),
+        _ => Err(pyo3::exceptions::PyValueError::new_err(format!(
+            "Unknown match direction: {match_direction:?}"
+        ))),
+    }
+}
+
+/// Sorted index of word-boundary-anchored suffixes of source words.
+///
+/// For RTL, a pattern corrupts a source word if it occurs at a word boundary at its
+/// start (position 0 or after a non-alphabetic character), i.e. if it is a prefix of
+/// some boundary-anchored suffix of the word. For LTR, a pattern corrupts a word if
+/// it occurs at a boundary at its end, i.e. if its reverse is a prefix of some
+/// boundary-anchored suffix of the reversed word.
 ///
-/// For LTR: checks if pattern appears at word boundaries at the end
-/// (at end of word or before a non-alpha character).
-fn would_corrupt_ltr(pattern: &str, source_word: &str) -> bool {
-    let mut idx = 0;
-    while let Some(pos) = source_word[idx..].find(pattern) {
-        let absolute_pos = idx + pos;
-        let char_after_idx = absolute_pos + pattern.len();
-        // Check if there's a word boundary after the pattern
-        if char_after_idx >= source_word.len() || !source_word.chars().nth(char_after_idx).map_or(false, |c| c.is_alphabetic()) {
-            return true;
+/// Anchors are (text index, byte offset) pairs sorted by the text they point at, so
+/// each query is a single binary search over O(total boundaries) entries.
+struct AnchorIndex {
+    texts: Vec<String>,
+    anchors: Vec<(u32, u32)>,
+    reversed: bool,
+}
+
+impl AnchorIndex {
+    fn build(source_words: Vec<String>, is_rtl: bool) -> Self {
+        let texts: Vec<String> = if is_rtl {
+            source_words
+        } else {
+            source_words
+                .par_iter()
+                .map(|word| word.chars().rev().collect::<String>())
+                .collect()
+        };
+        let mut anchors: Vec<(u32, u32)> = texts
+            .par_iter()
+            .enumerate()
+            .flat_map_iter(|(text_idx, text)| {
+                boundary_offsets(text)
+                    .into_iter()
+                    .map(move |offset| (text_idx as u32, offset as u32))
+            })
+            .collect();
+        anchors.par_sort_unstable_by(|a, b| anchor_text(&texts, a).cmp(anchor_text(&texts, b)));
+        Self {
+            texts,
+            anchors,
+            reversed: !is_rtl,
         }
-        idx = absolute_pos + 1;
-        if idx >= source_word.len() {
-            break;
+    }
+
+    /// Whether `pattern` occurs at a word boundary in any source word.
+    fn would_corrupt(&self, pattern: &str) -> bool {
+        if pattern.is_empty() {
+            return false;
         }
+        let reversed_pattern: String;
+        let needle = if self.reversed {
+            reversed_pattern = pattern.chars().rev().collect();
+            reversed_pattern.as_str()
+        } else {
+            pattern
+        };
+        // First anchor whose text is >= needle; any text starting with needle sorts there
+        let i = self
+            .anchors
+            .partition_point(|anchor| anchor_text(&self.texts, anchor) < needle);
+        i < self.anchors.len() && anchor_text(&self.texts, &self.anchors[i]).starts_with(needle)
+    }
+}
+
+fn anchor_text<'a>(texts: &'a [String], anchor: &(u32, u32)) -> &'a str {
+    &texts[anchor.0 as usize][anchor.1 as usize..]
+}
+
+/// Byte offsets in `text` where a boundary-anchored, non-empty suffix starts.
+///
+/// An offset is a boundary if it is 0 or follows a non-alphabetic character. On a
+/// reversed word the same rule marks the positions that, in the original word, are
+/// the end of the word or precede a non-alphabetic character.
+fn boundary_offsets(text: &str) -> Vec<usize> {
+    let mut offsets = Vec::new();
+    let mut prev_is_alpha = false;
+    for (offset, c) in text.char_indices() {
+        if offset == 0 || !prev_is_alpha {
+            offsets.push(offset);
+        }
+        prev_is_alpha = c.is_alphabetic();
+    }
+    offsets
+}
+
+/// Prebuilt boundary-anchored index for pattern corruption checks.
+///
+/// Build once per (source words, match direction) and query many pattern batches.
+/// Building and querying both release the GIL and run across all CPU cores.
+#[pyclass]
+pub struct RustBoundaryAnchorIndex {
+    index: AnchorIndex,
+}
+
+#[pymethods]
+impl RustBoundaryAnchorIndex {
+    /// Build the index from source words.
+    ///
+    /// Args:
+    ///     source_words: Source words to index
+    ///     match_direction: "rtl"/"RTL"/"RIGHT_TO_LEFT" or "ltr"/"LTR"/"LEFT_TO_RIGHT"
+    #[new]
+    pub fn new(py: Python<'_>, source_words: Vec<String>, match_direction: &str) -> PyResult<Self> {
+        let is_rtl = parse_is_rtl(match_direction)?;
+        let index = py.allow_threads(|| AnchorIndex::build(source_words, is_rtl));
+        Ok(Self { index })
+    }
+
+    /// Check which patterns would corrupt any source word.
+    ///
+    /// Args:
+    ///     patterns: Typo patterns to check
+    ///
+    /// Returns:
+    ///     List of booleans, True if the pattern would corrupt any source word
+    pub fn would_corrupt_batch(&self, py: Python<'_>, patterns: Vec<String>) -> Vec<bool> {
+        let index = &self.index;
+        py.allow_threads(|| {
+            patterns
+                .par_iter()
+                .map(|pattern| index.would_corrupt(pattern))
+                .collect()
+        })
     }
-    false
 }
 
 /// Batch check if patterns would corrupt source words.
 ///
-/// This function releases the GIL and can run in parallel across all CPU cores.
-/// Returns a vector of booleans indicating which patterns would corrupt source words.
+/// Builds a boundary-anchored index over the source words, then answers each pattern
+/// with one binary search. Releases the GIL and runs across all CPU cores. Prefer
+/// RustBoundaryAnchorIndex when the same source words are checked repeatedly.
 ///
 /// Args:
 ///     patterns: List of typo patterns to check
 ///     source_words: List of source words to check against
-///     match_direction: "RTL" for RIGHT_TO_LEFT, "LTR" for LEFT_TO_RIGHT
+///     match_direction: "rtl"/"RTL"/"RIGHT_TO_LEFT" or "ltr"/"LTR"/"LEFT_TO_RIGHT"
 ///
 /// Returns:
 ///     List of booleans, True if pattern would corrupt any source word
 #[pyfunction]
 fn batch_check_patterns(
+    py: Python<'_>,
     patterns: Vec<String>,
     source_words: Vec<String>,
     match_direction: String,
 ) -> PyResult<Vec<bool>> {
-    let is_rtl = match_direction.as_str() == "RTL" || match_direction.as_str() == "RIGHT_TO_LEFT";
-
-    let results: Vec<bool> = patterns
-        .iter()
-        .map(|pattern| {
-            if is_rtl {
-                source_words.iter().any(|word| would_corrupt_rtl(pattern, word))
-            } else {
-                source_words.iter().any(|word| would_corrupt_ltr(pattern, word))
-            }
-        })
-        .collect();
-
-    Ok(results)
+    let index = RustBoundaryAnchorIndex::new(py, source_words, &match_direction)?;
+    Ok(index.would_corrupt_batch(py, patterns))
 }
 
 /// Python module definition
 #[pymodule]
 fn rust_ext(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<RustSubstringIndex>()?;
+    m.add_class::<RustBoundaryAnchorIndex>()?;
     m.add_function(wrap_pyfunction!(batch_check_patterns, m)?)?;
+    m.add_function(wrap_pyfunction!(batch_false_trigger_flags, m)?)?;
     Ok(())
 }
@@ -0,0 +1,53 @@
+"""Performance regression tests for the pipeline stages.
+
+Deselected by default; run with ``pytest -m benchmark``. The scaling test runs the
+pipeline on the baseline's corpus and on one twice its size, and fails if any stage
+grows much faster than linearly; it needs no recorded numbers. Each stage recorded in
+``baseline.json`` also becomes one test that fails if the stage got slower or used more
+memory than the baseline's tolerances allow. Record a new baseline on the reference
+machine with ``python -m entroppy.benchmark --baseline tests/benchmarks/baseline.json
+--save tests/benchmarks/baseline.json``.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from entroppy.benchmark import (
+    BenchmarkResult,
+    compare_scaling,
+    compare_to_baseline,
+    load_baseline,
+    run_benchmark,
+)
+
+pytestmark = pytest.mark.benchmark
+
+BASELINE = load_baseline(Path(__file__).parent / "baseline.json")
+
+
+@pytest.fixture(scope="module")
+def result() -> BenchmarkResult:
+    """One benchmark run on the baseline's corpus, shared by all stage tests."""
+    corpus = BASELINE["corpus"]
+    return run_benchmark(corpus["words"], corpus["seed"], corpus["jobs"])
+
+
+def test_stages_scale_linearly(result: BenchmarkResult) -> None:
+    """Doubling the corpus at most doubles each stage's time, within tolerance."""
+    corpus = BASELINE["corpus"]
+    large = run_benchmark(corpus["words"] * 2, corpus["seed"], corpus["jobs"])
+    regressions = compare_scaling(result, large)
+    assert not regressions, "; ".join(str(regression) for regression in regressions)
+
+
+@pytest.mark.skipif(
+    not BASELINE["stages"],
+    reason="baseline.json has no recorded stages; record them on the reference machine",
+)
+@pytest.mark.parametrize("stage", sorted(BASELINE["stages"]) or ["none"])
+def test_stage_within_baseline(result: BenchmarkResult, stage: str) -> None:
+    """The stage is no slower and no larger than its baseline allows."""
+    single = BenchmarkResult(result.corpus, {stage: result.stages[stage]})
+    regressions = compare_to_baseline(single, BASELINE)
+    assert not regressions, "; ".join(str(regression) for regression in regressions)
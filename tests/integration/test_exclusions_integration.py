@@ -236,6 +236,14 @@ class TestExclusionMatcherIntegration:
 
         assert "teh" in rule and "the" in rule
 
+    def test_exclusion_matcher_get_matching_rule_wildcard(self) -> None:
+        """Verify get_matching_rule returns the original wildcard rule."""
+        exclusions = {"*toin -> *tion", "*toin* -> other"}
+        matcher = ExclusionMatcher(exclusions)
+
+        correction = ("actoin", "action", BoundaryType.BOTH)
+        assert matcher.get_matching_rule(correction) == "*toin -> *tion"
+
     def test_exclusion_matcher_exact_typo_with_wildcard_word_matches_just(self) -> None:
         """Verify exact typo with wildcard word pattern matches 'just'."""
         exclusions = {"jst -> *"}
@@ -0,0 +1,40 @@
+"""Unit tests for the Aho–Corasick automaton.
+
+Tests verify that AhoCorasick reports the IDs of every literal occurring in a text,
+including overlapping matches found through failure links. Each test has a single
+assertion and focuses on behavior.
+"""
+
+from entroppy.utils.aho_corasick import AhoCorasick
+
+
+def _find(automaton: AhoCorasick, text: str, first_only: bool = False) -> list[int]:
+    """Run the automaton over a text and return the collected IDs."""
+    found: list[int] = []
+    automaton.find(text, found, first_only)
+    return found
+
+
+class TestAhoCorasick:
+    """Test finding literals inside a text."""
+
+    def test_finds_literal_at_start(self) -> None:
+        """A literal at the start of the text is reported."""
+        assert _find(AhoCorasick({"aemr": [0], ":aemr": [1]}), "aemr:") == [0]
+
+    def test_finds_middle_and_overlapping_matches(self) -> None:
+        """Matches reached only through failure links are reported."""
+        automaton = AhoCorasick({"she": [0], "he": [1], "hers": [2], "ushers": [3]})
+        assert sorted(_find(automaton, "ushers")) == [0, 1, 2, 3]
+
+    def test_reports_every_id_of_a_literal(self) -> None:
+        """All IDs attached to a literal are reported."""
+        assert _find(AhoCorasick({"teh": [2, 5]}), "tehir") == [2, 5]
+
+    def test_first_only_stops_at_first_match(self) -> None:
+        """With first_only, only one ID is reported."""
+        assert _find(AhoCorasick({"teh": [2, 5], "ir": [7]}), "tehir", first_only=True) == [2]
+
+    def test_text_without_matches(self) -> None:
+        """Unrelated text yields no matches."""
+        assert not AhoCorasick({"teh": [0], ":teh": [1]}).find("recieve", [])
@@ -0,0 +1,80 @@
+"""Unit tests for the benchmark corpus, baseline comparison and scaling check.
+
+Tests verify that synthetic corpora are deterministic and respect their settings, and
+that only changes beyond a stage's tolerance, or beyond linear growth with the corpus,
+count as regressions. Each test has a
+single assertion and focuses on behavior.
+"""
+
+from entroppy.benchmark.baseline import (
+    BenchmarkResult,
+    StageMeasurement,
+    compare_scaling,
+    compare_to_baseline,
+)
+from entroppy.benchmark.corpus import build_corpus
+
+
+def _result(seconds: float, peak_rss_mb: float = 100.0, words: int = 10) -> BenchmarkResult:
+    """A result with a single stage."""
+    return BenchmarkResult({"words": words}, {"solver": StageMeasurement(seconds, peak_rss_mb)})
+
+
+BASELINE = {
+    "tolerances": {"seconds": 0.25, "stages": {"solver": {"peak_rss_mb": 0.5}}},
+    "stages": {"solver": {"seconds": 2.0, "peak_rss_mb": 100.0}},
+}
+
+
+class TestCorpus:
+    """Test synthetic corpus generation."""
+
+    def test_same_seed_gives_same_corpus(self) -> None:
+        """Building twice with the same arguments gives identical corpora."""
+        assert build_corpus(200, seed=3) == build_corpus(200, seed=3)
+
+    def test_source_words_respect_length_limits(self) -> None:
+        """Source words stay within the requested length range."""
+        corpus = build_corpus(300, min_length=4, max_length=8)
+        assert all(4 <= len(word) <= 8 for word in corpus.source_words)
+
+    def test_source_words_are_valid_words(self) -> None:
+        """Every source word is in the validation set."""
+        corpus = build_corpus(300)
+        assert set(corpus.source_words) <= corpus.validation_words
+
+
+class TestCompareToBaseline:
+    """Test regression detection."""
+
+    def test_slowdown_within_tolerance_passes(self) -> None:
+        """A 20% slowdown is allowed by a 25% tolerance."""
+        assert not compare_to_baseline(_result(2.4), BASELINE)
+
+    def test_slowdown_beyond_tolerance_fails(self) -> None:
+        """A 50% slowdown is reported."""
+        assert [r.metric for r in compare_to_baseline(_result(3.0), BASELINE)] == ["seconds"]
+
+    def test_stage_tolerance_overrides_global(self) -> None:
+        """A per-stage memory tolerance of 50% allows 40% growth."""
+        assert not compare_to_baseline(_result(2.0, peak_rss_mb=140.0), BASELINE)
+
+    def test_command_line_tolerance_overrides_baseline(self) -> None:
+        """An explicit tolerance replaces the baseline's."""
+        assert compare_to_baseline(_result(2.4), BASELINE, {"seconds": 0.1})
+
+
+class TestCompareScaling:
+    """Test the in-run scaling check between two corpus sizes."""
+
+    def test_linear_growth_passes(self) -> None:
+        """Doubling the time with a doubled corpus is not a regression."""
+        assert not compare_scaling(_result(2.0, words=10), _result(4.0, words=20))
+
+    def test_quadratic_growth_fails(self) -> None:
+        """Quadrupling the time with a doubled corpus is a regression."""
+        assert compare_scaling(_result(2.0, words=10), _result(8.0, words=20))
+
+    def test_tiny_absolute_change_passes(self) -> None:
+        """Stages too fast to time reliably are never flagged."""
+        assert not compare_scaling(_result(0.001, words=10), _result(0.01, words=20))
@@ -4,9 +4,12 @@ Tests verify boundary detection logic that determines when typos need word bound
 to prevent false triggers. Each test has a single assertion and focuses on behavior.
 """
 
+import pytest
+
 from entroppy.core import BoundaryType
 from entroppy.core.boundaries import (
     BoundaryIndex,
+    BoundaryIndexRegistry,
     determine_boundaries,
     is_substring_of_any,
     would_trigger_at_end,
@@ -66,6 +69,20 @@ class TestIsSubstringOfAny:
         result = is_substring_of_any("test", index)
         assert result is True
 
+    def test_detects_substring_when_typo_is_also_a_word(self) -> None:
+        """When typo is itself a word but also inside another word, returns True."""
+        word_set = {"test", "atestb"}
+        index = BoundaryIndex(word_set)
+        result = is_substring_of_any("test", index)
+        assert result is True
+
+    def test_detects_substring_with_sorted_backend(self) -> None:
+        """Substring detection does not depend on the index backend."""
+        word_set = {"atestb"}
+        index = BoundaryIndex(word_set, backend="sorted")
+        result = is_substring_of_any("test", index)
+        assert result is True
+
 
 class TestWouldTriggerAtStart:
     """Test prefix detection behavior."""
@@ -312,3 +329,77 @@ class TestDetermineBoundariesEdgeCases:
         source_index = BoundaryIndex(source_words)
         result = determine_boundaries("test", validation_index, source_index)
         assert result == BoundaryType.LEFT
+
+
+class TestBoundaryIndexRegistry:
+    """Test shared boundary index registry behavior."""
+
+    def test_same_word_set_returns_same_index(self) -> None:
+        """Requesting the same word set twice returns the same index object."""
+        registry = BoundaryIndexRegistry()
+        word_set = {"hello", "world"}
+        assert registry.get(word_set) is registry.get(word_set)
+
+    def test_equal_copy_returns_same_index(self) -> None:
+        """An equal copy of a word set (e.g. a frozenset in a worker) reuses the index."""
+        registry = BoundaryIndexRegistry()
+        word_set = {"hello", "world"}
+        assert registry.get(word_set) is registry.get(frozenset(word_set))
+
+    def test_different_word_sets_get_different_indexes(self) -> None:
+        """Different word sets get distinct indexes."""
+        registry = BoundaryIndexRegistry()
+        assert registry.get({"hello"}) is not registry.get({"world"})
+
+    def test_counts_hits_and_misses(self) -> None:
+        """Registry counts one miss per build and one hit per reuse."""
+        registry = BoundaryIndexRegistry()
+        word_set = {"hello", "world"}
+        registry.get(word_set)
+        registry.get(word_set)
+        registry.get(frozenset(word_set))
+        assert (registry.stats.misses, registry.stats.hits) == (1, 2)
+
+    def test_clear_resets_counters(self) -> None:
+        """Clearing the registry resets its counters."""
+        registry = BoundaryIndexRegistry()
+        registry.get({"hello"})
+        registry.clear()
+        assert registry.stats.misses == 0
+
+
+class TestIndexBackends:
+    """Test that the compact sorted backend answers queries like the dict backend."""
+
+    WORDS = {"test", "testing", "attest", "protest", "atestb", "hello"}
+    QUERIES = ["test", "tes", "est", "testing", "hello", "xyz", "t", "atest", ""]
+
+    @pytest.mark.parametrize("typo", QUERIES)
+    def test_batch_check_start_matches_dict_backend(self, typo: str) -> None:
+        """Sorted backend prefix checks agree with the dict backend."""
+        dict_index = BoundaryIndex(self.WORDS, backend="dict")
+        sorted_index = BoundaryIndex(self.WORDS, backend="sorted")
+        assert sorted_index.batch_check_start([typo]) == dict_index.batch_check_start([typo])
+
+    @pytest.mark.parametrize("typo", QUERIES)
+    def test_batch_check_end_matches_dict_backend(self, typo: str) -> None:
+        """Sorted backend suffix checks agree with the dict backend."""
+        dict_index = BoundaryIndex(self.WORDS, backend="dict")
+        sorted_index = BoundaryIndex(self.WORDS, backend="sorted")
+        assert sorted_index.batch_check_end([typo]) == dict_index.batch_check_end([typo])
+
+    def test_words_with_suffix_returns_original_words(self) -> None:
+        """Sorted backend suffix lookup yields words in their original orientation."""
+        index = BoundaryIndex(self.WORDS, backend="sorted")
+        assert set(index.words_with_suffix("test")) == {"test", "attest", "protest"}
+
+    def test_sorted_backend_is_smaller_than_dict_backend(self) -> None:
+        """Sorted backend reports a smaller memory footprint than the dict backend."""
+        dict_index = BoundaryIndex(self.WORDS, backend="dict")
+        sorted_index = BoundaryIndex(self.WORDS, backend="sorted")
+        assert sorted_index.memory_footprint() < dict_index.memory_footprint()
+
+    def test_unknown_backend_raises(self) -> None:
+        """Unknown backend names are rejected."""
+        with pytest.raises(ValueError):
+            BoundaryIndex(self.WORDS, backend="trie")  # type: ignore[arg-type]
@@ -0,0 +1,134 @@
+"""Unit tests for solver checkpoints.
+
+Tests verify that a DictionaryState snapshot restores into a fresh state with the same
+corrections, patterns and graveyard, and that the checkpoint store round-trips
+snapshots and refuses checkpoints written with other settings or input files. Each test has a single
+assertion and focuses on behavior.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from entroppy.core import BoundaryType, Config
+from entroppy.resolution.checkpoint import CheckpointStore, SolverCheckpoint, config_fingerprint
+from entroppy.resolution.event_log import ALL_EVENTS
+from entroppy.resolution.state import DictionaryState, RejectionReason
+
+
+def _solved_state() -> DictionaryState:
+    """State after one iteration with a correction, a pattern and a graveyard entry."""
+    state = DictionaryState({"teh": ["the"], "tehir": ["their"], "thier": ["their"]})
+    state.start_iteration()
+    state.add_correction("thier", "their", BoundaryType.NONE, "CandidateSelection")
+    state.add_pattern("teh", "the", BoundaryType.LEFT, "PatternGeneralization")
+    state.pattern_replacements[("teh", "the", BoundaryType.LEFT)] = [
+        ("tehir", "their", BoundaryType.NONE)
+    ]
+    state.add_to_graveyard(
+        "teh", "the", BoundaryType.NONE, RejectionReason.TOO_SHORT, "te", "ConflictRemoval"
+    )
+    return state
+
+
+def _restored_state() -> DictionaryState:
+    """Fresh state loaded from a snapshot of _solved_state()."""
+    snapshot = _solved_state().snapshot()
+    state = DictionaryState({"teh": ["the"], "tehir": ["their"], "thier": ["their"]})
+    state.restore_snapshot(snapshot)
+    return state
+
+
+class TestStateSnapshot:
+    """Test restoring a DictionaryState from a snapshot."""
+
+    def test_restores_corrections(self) -> None:
+        """Active corrections come back."""
+        assert set(_restored_state().active_corrections) == {("thier", "their", BoundaryType.NONE)}
+
+    def test_restores_patterns(self) -> None:
+        """Active patterns come back."""
+        assert set(_restored_state().active_patterns) == {("teh", "the", BoundaryType.LEFT)}
+
+    def test_restores_graveyard_entries(self) -> None:
+        """Graveyard entries keep their reason and blocker."""
+        entry = _restored_state().graveyard[("teh", "the", BoundaryType.NONE)]
+        assert (entry.reason, entry.blocker) == (RejectionReason.TOO_SHORT, "te")
+
+    def test_restores_pattern_replacements(self) -> None:
+        """Pattern replacements come back as correction tuples."""
+        assert _restored_state().pattern_replacements == {
+            ("teh", "the", BoundaryType.LEFT): [("tehir", "their", BoundaryType.NONE)]
+        }
+
+    def test_rebuilds_pattern_coverage(self) -> None:
+        """Typos covered by a restored pattern are reported as covered."""
+        assert _restored_state().is_typo_covered("tehir")
+
+    def test_replays_debug_trace(self) -> None:
+        """Traced changes to debug words come back in the trace log."""
+        raw = {"thier": ["their"]}
+        state = DictionaryState(raw, debug_words={"their"})
+        state.start_iteration()
+        state.add_correction("thier", "their", BoundaryType.NONE, "CandidateSelection")
+        restored = DictionaryState(raw, debug_words={"their"})
+        restored.restore_snapshot(state.snapshot())
+        events = restored.trace_log.read(ALL_EVENTS)
+        assert [(event.typo, event.iteration) for event in events] == [("thier", 1)]
+
+    def test_restores_iteration(self) -> None:
+        """The iteration counter continues where the snapshot left off."""
+        assert _restored_state().current_iteration == 1
+
+
+class TestCheckpointStore:
+    """Test saving and loading checkpoint files."""
+
+    def test_solver_checkpoint_round_trip(self, tmp_path: Path) -> None:
+        """A saved solver checkpoint loads back with its pass states."""
+        store = CheckpointStore(tmp_path, "abc")
+        store.save_solver(SolverCheckpoint(_solved_state().snapshot(), (1, 1, 1), {"p": [1]}))
+        store.wait()
+        assert store.load_solver().pass_states == {"p": [1]}
+
+    def test_missing_checkpoint_loads_as_none(self, tmp_path: Path) -> None:
+        """Loading from an empty directory returns None."""
+        assert CheckpointStore(tmp_path, "abc").load_solver() is None
+
+    def test_other_settings_are_refused(self, tmp_path: Path) -> None:
+        """A checkpoint written with another config fingerprint raises ValueError."""
+        store = CheckpointStore(tmp_path, "abc")
+        store.save_solver(SolverCheckpoint(_solved_state().snapshot(), (1, 1, 1)))
+        store.wait()
+        with pytest.raises(ValueError):
+            CheckpointStore(tmp_path, "def").load_solver()
+
+    def test_failed_write_keeps_previous_checkpoint(self, tmp_path: Path) -> None:
+        """A payload that cannot be pickled leaves the last good checkpoint loadable."""
+        store = CheckpointStore(tmp_path, "abc")
+        store.save_solver(SolverCheckpoint(_solved_state().snapshot(), (1, 1, 1), {"p": [1]}))
+        store.wait()
+        store.save_solver(
+            SolverCheckpoint(_solved_state().snapshot(), (1, 1, 1), {"p": (n for n in [1])})
+        )
+        store.wait()
+        assert store.load_solver().pass_states == {"p": [1]}
+
+
+class TestConfigFingerprint:
+    """Test which settings change the checkpoint fingerprint."""
+
+    def test_edited_include_file_changes_fingerprint(self, tmp_path: Path) -> None:
+        """Editing an include file invalidates checkpoints even with the same path."""
+        include = tmp_path / "include.txt"
+        include.write_text("teh\n")
+        before = config_fingerprint(Config(include=str(include)))
+        include.write_text("teh\nthier\n")
+        assert config_fingerprint(Config(include=str(include))) != before
+
+    def test_unchanged_inputs_keep_fingerprint(self, tmp_path: Path) -> None:
+        """The same settings and file contents give the same fingerprint."""
+        include = tmp_path / "include.txt"
+        include.write_text("teh\n")
+        config = Config(include=str(include))
+        assert config_fingerprint(config) == config_fingerprint(config)
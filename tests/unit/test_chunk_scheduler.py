@@ -0,0 +1,67 @@
+"""Unit tests for the cost-model-driven chunk scheduler.
+
+Tests verify that chunks are balanced by estimated cost and handed out most
+expensive first, and that the cost model learns feature weights from measured chunk
+times. Each test has a single assertion and focuses on behavior.
+"""
+
+import pytest
+
+from entroppy.utils.chunk_scheduler import ChunkScheduler, CostModel
+from entroppy.utils.worker_pool import WorkerPool
+
+
+def _item_features(item: int) -> tuple[float, ...]:
+    """Features of a test item: constant term and the item's value."""
+    return 1.0, float(item)
+
+
+def _sum_chunk(chunk: list[int]) -> int:
+    """Chunk function run in workers."""
+    return sum(chunk)
+
+
+class TestPlan:
+    """Test splitting items into chunks."""
+
+    def test_chunks_cover_every_item_once(self) -> None:
+        """Planning reorders items but never drops or duplicates them."""
+        scheduler = ChunkScheduler(_item_features, prior=(0.0, 1.0))
+        items = list(range(100))
+        chunks = scheduler.plan(items, workers=2)
+        assert sorted(item for chunk in chunks for item in chunk) == items
+
+    def test_expensive_chunks_come_first(self) -> None:
+        """The first chunk holds the most expensive item."""
+        scheduler = ChunkScheduler(_item_features, prior=(0.0, 1.0))
+        chunks = scheduler.plan([1, 2, 500, 3, 4], workers=2)
+        assert chunks[0] == [500]
+
+    def test_zero_cost_items_are_still_chunked(self) -> None:
+        """Items the model thinks are free are split evenly."""
+        scheduler = ChunkScheduler(_item_features, prior=(0.0, 0.0))
+        assert len(scheduler.plan(list(range(32)), workers=2)) == 16
+
+
+class TestCostModel:
+    """Test learning feature weights."""
+
+    def test_refit_recovers_linear_costs(self) -> None:
+        """Chunk times that grow with a feature give that feature a weight."""
+        model = CostModel(prior=(1.0, 0.0))
+        for size in range(1, 20):
+            model.add_sample((1.0, float(size)), 0.5 + 2.0 * size)
+        model.refit()
+        assert model.weights == pytest.approx([0.5, 2.0], rel=1e-3)
+
+
+class TestImap:
+    """Test running planned chunks on a pool."""
+
+    def test_records_utilization_stats(self) -> None:
+        """After a run, the scheduler reports how many chunks it timed."""
+        scheduler = ChunkScheduler(_item_features, prior=(0.0, 1.0))
+        chunks = scheduler.plan(list(range(50)), workers=2)
+        with WorkerPool(2) as pool:
+            list(scheduler.imap(pool, _sum_chunk, chunks))
+        assert scheduler.last_stats is not None and scheduler.last_stats.chunks == len(chunks)
@@ -0,0 +1,86 @@
+"""Unit tests for the typo trie used by conflict removal.
+
+Tests verify that ConflictTrie finds the same candidates as comparing typos that share
+an index character, and that it stays correct as corrections are inserted and removed.
+Each test has a single assertion and focuses on behavior.
+"""
+
+from entroppy.core import BoundaryType
+from entroppy.resolution.conflict_trie import ConflictTrie
+
+
+class TestContainedIn:
+    """Test finding shorter stored typos inside a typo."""
+
+    def test_finds_prefix_typo(self) -> None:
+        """A stored typo at the start of the typo is a candidate."""
+        trie = ConflictTrie.for_boundary(BoundaryType.NONE)
+        trie.insert(("teh", "the", BoundaryType.NONE))
+        assert trie.contained_in("tehir") == [("teh", "the", BoundaryType.NONE)]
+
+    def test_finds_typo_at_later_anchor(self) -> None:
+        """A stored typo starting at a repeat of the first character is a candidate."""
+        trie = ConflictTrie.for_boundary(BoundaryType.NONE)
+        trie.insert(("teh", "the", BoundaryType.NONE))
+        assert trie.contained_in("tateh") == [("teh", "the", BoundaryType.NONE)]
+
+    def test_ignores_typo_with_other_index_character(self) -> None:
+        """A stored typo not starting with the typo's first character is skipped."""
+        trie = ConflictTrie.for_boundary(BoundaryType.NONE)
+        trie.insert(("eh", "he", BoundaryType.NONE))
+        assert trie.contained_in("tehir") == []
+
+    def test_reversed_trie_finds_suffix_typo(self) -> None:
+        """RIGHT tries match on the last character."""
+        trie = ConflictTrie.for_boundary(BoundaryType.RIGHT)
+        trie.insert(("herre", "here", BoundaryType.RIGHT))
+        assert trie.contained_in("wherre") == [("herre", "here", BoundaryType.RIGHT)]
+
+    def test_returns_shortest_typo_first(self) -> None:
+        """Candidates come back in the order a full conflict check would try them."""
+        trie = ConflictTrie.for_boundary(BoundaryType.NONE)
+        trie.insert(("tehi", "thei", BoundaryType.NONE))
+        trie.insert(("teh", "the", BoundaryType.NONE))
+        assert [c[0] for c in trie.contained_in("tehir")] == ["teh", "tehi"]
+
+
+class TestContaining:
+    """Test finding longer stored typos that contain a typo."""
+
+    def test_finds_typo_at_anchor_past_start(self) -> None:
+        """A stored typo containing the typo at a repeated first character is found."""
+        trie = ConflictTrie.for_boundary(BoundaryType.NONE)
+        trie.insert(("tateh", "tathe", BoundaryType.NONE))
+        assert trie.containing("teh") == [("tateh", "tathe", BoundaryType.NONE)]
+
+    def test_excludes_equal_typo(self) -> None:
+        """A stored typo equal to the query is not reported as containing it."""
+        trie = ConflictTrie.for_boundary(BoundaryType.NONE)
+        trie.insert(("teh", "the", BoundaryType.NONE))
+        assert trie.containing("teh") == []
+
+
+class TestRemove:
+    """Test deleting corrections."""
+
+    def test_removed_typo_is_no_longer_found(self) -> None:
+        """Removed corrections stop being candidates."""
+        trie = ConflictTrie.for_boundary(BoundaryType.NONE)
+        trie.insert(("teh", "the", BoundaryType.NONE))
+        trie.remove(("teh", "the", BoundaryType.NONE))
+        assert trie.contained_in("tehir") == []
+
+    def test_removing_longer_typo_keeps_shorter_one(self) -> None:
+        """Pruning a longer typo's path leaves typos on the same path intact."""
+        trie = ConflictTrie.for_boundary(BoundaryType.NONE)
+        trie.insert(("teh", "the", BoundaryType.NONE))
+        trie.insert(("tehtr", "there", BoundaryType.NONE))
+        trie.remove(("tehtr", "there", BoundaryType.NONE))
+        assert trie.contained_in("tehir") == [("teh", "the", BoundaryType.NONE)]
+
+    def test_removed_typo_no_longer_contains_others(self) -> None:
+        """Anchored suffixes of a removed typo are deleted too."""
+        trie = ConflictTrie.for_boundary(BoundaryType.NONE)
+        trie.insert(("tateh", "tathe", BoundaryType.NONE))
+        trie.remove(("tateh", "tathe", BoundaryType.NONE))
+        assert trie.containing("teh") == []
@@ -0,0 +1,106 @@
+"""Unit tests for interned correction keys.
+
+Tests verify that CorrectionSet and CorrectionMap behave like the set and dict of
+(typo, word, boundary) tuples they replace. Each test has a single assertion and
+focuses on behavior.
+"""
+
+import pytest
+
+from entroppy.core import BoundaryType, CorrectionMap, CorrectionSet, CorrectionTable
+
+
+class TestCorrectionTable:
+    """Test encoding corrections into packed keys."""
+
+    def test_decode_round_trips_encode(self) -> None:
+        """A decoded key gives back the original correction."""
+        table = CorrectionTable()
+        correction = ("teh", "the", BoundaryType.BOTH)
+        assert table.decode(table.encode(correction)) == correction
+
+    def test_equal_corrections_share_a_key(self) -> None:
+        """Encoding the same correction twice yields the same key."""
+        table = CorrectionTable()
+        first = table.encode(("teh", "the", BoundaryType.NONE))
+        assert table.encode(("teh", "the", BoundaryType.NONE)) == first
+
+    def test_boundary_is_part_of_the_key(self) -> None:
+        """Corrections differing only in boundary get different keys."""
+        table = CorrectionTable()
+        left = table.encode(("teh", "the", BoundaryType.LEFT))
+        assert table.encode(("teh", "the", BoundaryType.RIGHT)) != left
+
+    def test_lookup_of_unknown_correction_does_not_intern(self) -> None:
+        """Looking up an unseen correction leaves the table empty."""
+        table = CorrectionTable()
+        table.lookup(("teh", "the", BoundaryType.NONE))
+        assert len(table) == 0
+
+
+class TestCorrectionSet:
+    """Test the set-of-tuples interface."""
+
+    def test_contains_added_correction(self) -> None:
+        """An added tuple is reported as a member."""
+        corrections = CorrectionSet(CorrectionTable())
+        corrections.add(("teh", "the", BoundaryType.NONE))
+        assert ("teh", "the", BoundaryType.NONE) in corrections
+
+    def test_iterates_as_tuples(self) -> None:
+        """Iteration yields the same tuples a plain set would hold."""
+        items = {("teh", "the", BoundaryType.NONE), ("aer", "are", BoundaryType.LEFT)}
+        assert set(CorrectionSet(CorrectionTable(), items)) == items
+
+    def test_remove_missing_correction_raises(self) -> None:
+        """Removing a correction that is not present raises KeyError like a set."""
+        corrections = CorrectionSet(CorrectionTable())
+        with pytest.raises(KeyError):
+            corrections.remove(("teh", "the", BoundaryType.NONE))
+
+    def test_set_difference_returns_plain_set(self) -> None:
+        """Set operators produce a plain set of tuples."""
+        corrections = CorrectionSet(CorrectionTable(), [("teh", "the", BoundaryType.NONE)])
+        assert corrections - {("aer", "are", BoundaryType.NONE)} == {
+            ("teh", "the", BoundaryType.NONE)
+        }
+
+    def test_typos_yields_typo_of_each_correction(self) -> None:
+        """typos() gives one typo string per stored correction."""
+        corrections = CorrectionSet(
+            CorrectionTable(),
+            [("teh", "the", BoundaryType.NONE), ("aer", "are", BoundaryType.NONE)],
+        )
+        assert sorted(corrections.typos()) == ["aer", "teh"]
+
+
+class TestCorrectionMap:
+    """Test the dict-keyed-by-tuple interface."""
+
+    def test_get_returns_stored_value(self) -> None:
+        """A value stored under a tuple is returned for an equal tuple."""
+        mapping: CorrectionMap[str] = CorrectionMap(CorrectionTable())
+        mapping[("teh", "the", BoundaryType.NONE)] = "teh"
+        assert mapping.get(("teh", "the", BoundaryType.NONE)) == "teh"
+
+    def test_get_of_unknown_correction_returns_default(self) -> None:
+        """Unknown corrections behave like missing dict keys."""
+        mapping: CorrectionMap[str] = CorrectionMap(CorrectionTable())
+        assert mapping.get(("teh", "the", BoundaryType.NONE)) is None
+
+    def test_delete_removes_entry(self) -> None:
+        """Deleted corrections are no longer members."""
+        mapping: CorrectionMap[str] = CorrectionMap(CorrectionTable())
+        mapping[("teh", "the", BoundaryType.NONE)] = "teh"
+        del mapping[("teh", "the", BoundaryType.NONE)]
+        assert ("teh", "the", BoundaryType.NONE) not in mapping
+
+    def test_keys_iterate_in_insertion_order(self) -> None:
+        """Keys come back as tuples in the order they were inserted."""
+        mapping: CorrectionMap[int] = CorrectionMap(CorrectionTable())
+        mapping[("teh", "the", BoundaryType.NONE)] = 1
+        mapping[("aer", "are", BoundaryType.LEFT)] = 2
+        assert list(mapping) == [
+            ("teh", "the", BoundaryType.NONE),
+            ("aer", "are", BoundaryType.LEFT),
+        ]
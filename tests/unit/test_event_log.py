@@ -0,0 +1,98 @@
+"""Unit tests for the solver lifecycle event log.
+
+Tests verify that events written to the binary log are read back with their
+correction, pass, reason and order intact, that reads can be limited to some kinds
+of event, and that changes to debug targets are traced through a log. Each test has
+a single assertion and focuses on behavior.
+"""
+
+import os
+
+from entroppy.core import BoundaryType, CorrectionTable
+from entroppy.resolution.event_log import (
+    ALL_EVENTS,
+    CORRECTION_EVENTS,
+    GRAVEYARD_EVENTS,
+    TRACE_ACTIONS,
+    EventLog,
+)
+from entroppy.resolution.state import DictionaryState, RejectionReason
+from entroppy.resolution.state_delta import ChangeKind
+
+
+def _log_with_events() -> EventLog:
+    """Log holding a correction add, a graveyard entry and a correction removal."""
+    table = CorrectionTable()
+    log = EventLog(table)
+    key = table.encode(("teh", "the", BoundaryType.NONE))
+    log.record(ChangeKind.CORRECTION_ADDED, key, 1, "CandidateSelection")
+    log.record(ChangeKind.GRAVEYARD_ADDED, key, 1, "ConflictRemoval", "too_short", "te")
+    log.record(ChangeKind.CORRECTION_REMOVED, key, 2, "ConflictRemoval", "Covered by pattern")
+    return log
+
+
+class TestRecordAndRead:
+    """Test writing events and reading them back."""
+
+    def test_read_decodes_correction(self) -> None:
+        """Events come back with their typo, word and boundary."""
+        event = next(_log_with_events().read(CORRECTION_EVENTS))
+        assert (event.typo, event.word, event.boundary) == ("teh", "the", BoundaryType.NONE)
+
+    def test_read_keeps_recording_order(self) -> None:
+        """Events of the requested kinds come back in the order they were recorded."""
+        events = _log_with_events().read(CORRECTION_EVENTS)
+        assert [event.action for event in events] == ["added", "removed"]
+
+    def test_read_filters_by_kind(self) -> None:
+        """Only events of the requested kinds are returned."""
+        events = list(_log_with_events().read(GRAVEYARD_EVENTS))
+        assert [(event.reason, event.blocker) for event in events] == [("too_short", "te")]
+
+    def test_count_by_kind(self) -> None:
+        """Counts are kept per kind without reading the file."""
+        assert _log_with_events().count(CORRECTION_EVENTS) == 2
+
+    def test_records_are_fixed_width_on_disk(self) -> None:
+        """Each event takes the same number of bytes in the file."""
+        log = _log_with_events()
+        log.flush()
+        # pylint: disable=protected-access
+        assert os.fstat(log._file.fileno()).st_size == 3 * 36
+
+
+class TestDebugTrace:
+    """Test tracing changes to debug words through the state's trace log."""
+
+    def test_trace_actions_name_pattern_changes(self) -> None:
+        """A log opened with TRACE_ACTIONS reports pattern additions as added_pattern."""
+        table = CorrectionTable()
+        log = EventLog(table, TRACE_ACTIONS)
+        log.record(
+            ChangeKind.PATTERN_ADDED, table.encode(("teh", "the", BoundaryType.LEFT)), 1, "p"
+        )
+        assert next(log.read(ALL_EVENTS)).action == "added_pattern"
+
+    def test_no_trace_log_without_debug_targets(self) -> None:
+        """Without debug words or typos the state opens no trace log."""
+        assert DictionaryState({"teh": ["the"]}).trace_log is None
+
+    def test_debug_word_changes_are_traced(self) -> None:
+        """Changes to a debug word's corrections are recorded in order."""
+        state = DictionaryState({"teh": ["the"], "thier": ["their"]}, debug_words={"the"})
+        state.add_correction("teh", "the", BoundaryType.NONE, "CandidateSelection")
+        state.add_correction("thier", "their", BoundaryType.NONE, "CandidateSelection")
+        state.remove_correction("teh", "the", BoundaryType.NONE, "ConflictRemoval")
+        events = state.trace_log.read(ALL_EVENTS)
+        assert [(event.typo, event.action) for event in events] == [
+            ("teh", "added"),
+            ("teh", "removed"),
+        ]
+
+    def test_rejection_reason_includes_blocker(self) -> None:
+        """A traced graveyard entry keeps its reason and blocker in one string."""
+        state = DictionaryState({"teh": ["the"]}, debug_words={"the"})
+        state.add_to_graveyard(
+            "teh", "the", BoundaryType.NONE, RejectionReason.TOO_SHORT, "te", "ConflictRemoval"
+        )
+        assert next(state.trace_log.read(ALL_EVENTS)).reason == "too_short: te"
@@ -14,6 +14,7 @@ from entroppy.resolution.passes import (
 )
 from entroppy.resolution.solver import IterativeSolver, PassContext
 from entroppy.resolution.state import DictionaryState, RejectionReason
+from entroppy.resolution.state_caching import StateCaching
 
 
 class TestSubstringTyposNotAddedWithNoneBoundary:
@@ -242,3 +243,43 @@ class TestPatternSubstringFalseTriggers:
 
         simet_patterns = [p for p in state.active_patterns if p[0] == "simet"]
         assert len(simet_patterns) == 0
+
+
+class TestFalseTriggerMemo:
+    """Test that batch false trigger results are memoized across iterations."""
+
+    def test_only_unseen_typos_are_computed(self) -> None:
+        """A second request computes only typos not seen before."""
+        caching = StateCaching()
+        validation_index = BoundaryIndex({"train", "maintain"})
+        source_index = BoundaryIndex({"train"})
+        caching.ensure_batch_false_trigger_results(["tain"], validation_index, source_index)
+        _, computed = caching.ensure_batch_false_trigger_results(
+            ["tain", "trian"], validation_index, source_index
+        )
+        assert computed == 1
+
+    def test_memo_returns_only_requested_typos(self) -> None:
+        """Returned results cover exactly the requested typos."""
+        caching = StateCaching()
+        validation_index = BoundaryIndex({"train", "maintain"})
+        source_index = BoundaryIndex({"train"})
+        caching.ensure_batch_false_trigger_results(
+            ["tain", "trian"], validation_index, source_index
+        )
+        results, _ = caching.ensure_batch_false_trigger_results(
+            ["tain"], validation_index, source_index
+        )
+        assert list(results) == ["tain"]
+
+    def test_memo_survives_new_iteration(self) -> None:
+        """Starting a new solver iteration keeps memoized results."""
+        state = DictionaryState({"tain": ["train"]})
+        validation_index = BoundaryIndex({"train", "maintain"})
+        source_index = BoundaryIndex({"train"})
+        state.caching.ensure_batch_false_trigger_results(["tain"], validation_index, source_index)
+        state.start_iteration()
+        _, computed = state.caching.ensure_batch_false_trigger_results(
+            ["tain"], validation_index, source_index
+        )
+        assert computed == 0
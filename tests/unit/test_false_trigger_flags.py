@@ -0,0 +1,60 @@
+"""Unit tests for the packed false trigger flags container."""
+
+import pickle
+
+from entroppy.resolution.false_trigger_flags import (
+    END_SRC,
+    START_VAL,
+    SUBSTRING_VAL,
+    FalseTriggerFlags,
+)
+
+
+class TestFalseTriggerFlags:
+    """Test the typo -> bitmask container."""
+
+    def test_get_returns_legacy_dict_form(self) -> None:
+        """The details-compatible accessor returns the six named checks."""
+        flags = FalseTriggerFlags()
+        flags.set("tain", START_VAL | SUBSTRING_VAL)
+        assert flags.get("tain") == {
+            "start_val": True,
+            "end_val": False,
+            "substring_val": True,
+            "start_src": False,
+            "end_src": False,
+            "substring_src": False,
+        }
+
+    def test_unknown_typo_has_no_mask(self) -> None:
+        """Typos without stored results return None."""
+        flags = FalseTriggerFlags()
+        assert flags.mask("tain") is None
+
+    def test_set_replaces_existing_mask(self) -> None:
+        """Setting a typo twice keeps one entry with the latest mask."""
+        flags = FalseTriggerFlags()
+        flags.set("tain", START_VAL)
+        flags.set("tain", END_SRC)
+        assert (len(flags), flags.mask("tain")) == (1, END_SRC)
+
+    def test_subset_keeps_only_requested_typos(self) -> None:
+        """Subset contains only the requested typos that have results."""
+        flags = FalseTriggerFlags()
+        flags.set("tain", START_VAL)
+        flags.set("teh", END_SRC)
+        subset = flags.subset(["teh", "missing"])
+        assert ("teh" in subset, "tain" in subset, len(subset)) == (True, False, 1)
+
+    def test_round_trips_through_pickle(self) -> None:
+        """Unpickled containers answer lookups like the original."""
+        flags = FalseTriggerFlags()
+        flags.set("tain", START_VAL)
+        flags.set("teh", END_SRC)
+        restored = pickle.loads(pickle.dumps(flags))
+        assert restored.mask("teh") == END_SRC
+
+    def test_from_masks_pairs_typos_with_mask_bytes(self) -> None:
+        """Containers built from kernel output map each typo to its byte."""
+        flags = FalseTriggerFlags.from_masks(["tain", "teh"], bytes([START_VAL, END_SRC]))
+        assert (flags.mask("tain"), flags.mask("teh")) == (START_VAL, END_SRC)
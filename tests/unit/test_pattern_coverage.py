@@ -0,0 +1,68 @@
+"""Unit tests for the active pattern coverage index.
+
+Tests verify that PatternCoverageIndex finds patterns that cover a typo exactly or by
+rewriting its prefix or suffix into one of its words, and that it stays correct as
+patterns are removed. Each test has a single assertion and focuses on behavior.
+"""
+
+from entroppy.core import BoundaryType
+from entroppy.resolution.pattern_coverage import PatternCoverageIndex
+
+
+class TestCovers:
+    """Test coverage checks."""
+
+    def test_exact_pattern_typo_is_covered(self) -> None:
+        """A typo equal to a pattern's typo is covered."""
+        index = PatternCoverageIndex()
+        index.add("teh", "the", BoundaryType.LEFT)
+        assert index.covers("teh", [])
+
+    def test_suffix_pattern_rewrites_to_word(self) -> None:
+        """A RIGHT pattern covers a typo whose rewritten suffix gives its word."""
+        index = PatternCoverageIndex()
+        index.add("toin", "tion", BoundaryType.RIGHT)
+        assert index.covers("actoin", ["action"])
+
+    def test_prefix_pattern_rewrites_to_word(self) -> None:
+        """A LEFT pattern covers a typo whose rewritten prefix gives its word."""
+        index = PatternCoverageIndex()
+        index.add("teh", "the", BoundaryType.LEFT)
+        assert index.covers("tehir", ["their"])
+
+    def test_rewrite_to_other_word_is_not_coverage(self) -> None:
+        """A matching pattern that rewrites to a different word does not cover the typo."""
+        index = PatternCoverageIndex()
+        index.add("toin", "tion", BoundaryType.RIGHT)
+        assert not index.covers("actoin", ["acting"])
+
+    def test_right_pattern_does_not_match_prefix(self) -> None:
+        """RIGHT patterns are only tried at the end of the typo."""
+        index = PatternCoverageIndex()
+        index.add("teh", "the", BoundaryType.RIGHT)
+        assert not index.covers("tehir", ["their"])
+
+    def test_none_pattern_prefers_suffix(self) -> None:
+        """A NONE pattern at both ends is read as a suffix, like the validator does."""
+        index = PatternCoverageIndex()
+        index.add("ab", "ba", BoundaryType.NONE)
+        assert not index.covers("abxab", ["baxab"])
+
+
+class TestRemove:
+    """Test removing patterns."""
+
+    def test_removed_pattern_no_longer_covers(self) -> None:
+        """After removal a pattern no longer covers typos."""
+        index = PatternCoverageIndex()
+        index.add("toin", "tion", BoundaryType.RIGHT)
+        index.remove("toin", "tion", BoundaryType.RIGHT)
+        assert not index.covers("actoin", ["action"])
+
+    def test_shared_typo_stays_covered(self) -> None:
+        """Removing one of two patterns with the same typo keeps exact coverage."""
+        index = PatternCoverageIndex()
+        index.add("teh", "the", BoundaryType.LEFT)
+        index.add("teh", "the", BoundaryType.RIGHT)
+        index.remove("teh", "the", BoundaryType.LEFT)
+        assert index.covers("teh", [])
@@ -6,6 +6,9 @@ assertion and focuses on behavior.
 """
 
 from entroppy.core.boundaries import BoundaryIndex, BoundaryType
+from entroppy.core.patterns.validation.batch_processor_helpers import (
+    _precalculate_would_corrupt_patterns,
+)
 from entroppy.core.patterns.validation.validator import (
     _validate_pattern_result,
     _would_corrupt_source_word,
@@ -522,3 +525,28 @@ class TestCheckPatternConflicts:
             BoundaryType.BOTH,
         )
         assert is_safe is True
+
+
+class TestPrecalculateWouldCorruptPatterns:
+    """Test the index-driven batch source-word corruption check."""
+
+    def test_rtl_flags_pattern_at_word_start_after_separator(self) -> None:
+        """RTL patterns starting after a non-alpha character corrupt the word."""
+        result = _precalculate_would_corrupt_patterns(
+            ["teh", "eh"], {"word teh"}, MatchDirection.RIGHT_TO_LEFT, verbose=False
+        )
+        assert result == frozenset({"teh"})
+
+    def test_ltr_flags_pattern_before_separator(self) -> None:
+        """LTR patterns ending before a non-alpha character corrupt the word."""
+        result = _precalculate_would_corrupt_patterns(
+            ["eh", "wor"], {"wordeh. word"}, MatchDirection.LEFT_TO_RIGHT, verbose=False
+        )
+        assert result == frozenset({"eh"})
+
+    def test_mid_word_pattern_does_not_corrupt(self) -> None:
+        """Patterns that only occur inside a word are not flagged."""
+        result = _precalculate_would_corrupt_patterns(
+            ["teh"], {"wordtehword"}, MatchDirection.RIGHT_TO_LEFT, verbose=False
+        )
+        assert result == frozenset()
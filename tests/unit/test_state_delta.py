@@ -0,0 +1,164 @@
+"""Unit tests for the state change journal and incremental solver passes.
+
+Tests verify that DictionaryState records net changes between journal positions, as
+correction keys, and that incremental passes only rerun when something relevant to
+them changed. Each test
+has a single assertion and focuses on behavior.
+"""
+
+import pytest
+
+from entroppy.core.boundaries import BoundaryIndex, BoundaryType
+from entroppy.resolution.passes import ConflictRemovalPass
+from entroppy.resolution.solver import PassContext
+from entroppy.resolution.state import DictionaryState, RejectionReason
+
+
+@pytest.fixture
+def pass_context() -> PassContext:
+    """Minimal context for running solver passes directly."""
+    words = {"the", "their", "other"}
+    return PassContext(
+        validation_set=words,
+        filtered_validation_set=words,
+        source_words_set={"the", "their"},
+        user_words_set=set(),
+        exclusion_matcher=None,
+        exclusion_set=set(),
+        validation_index=BoundaryIndex(words),
+        source_index=BoundaryIndex({"the", "their"}),
+        platform=None,
+        min_typo_length=2,
+        collision_threshold=2.0,
+        jobs=1,
+        verbose=False,
+        use_gpu=False,
+    )
+
+
+class TestChangeLog:
+    """Test net changes reported by the state journal."""
+
+    def test_added_then_removed_correction_is_reported_removed(self) -> None:
+        """A correction added and removed since the cursor is not reported as added."""
+        state = DictionaryState({})
+        cursor = state.changes.cursor
+        state.add_correction("teh", "the", BoundaryType.NONE, "test")
+        state.remove_correction("teh", "the", BoundaryType.NONE, "test")
+        assert not state.changes.since(cursor).added_corrections
+
+    def test_removed_then_readded_pattern_is_reported_added(self) -> None:
+        """The latest change to an item wins."""
+        state = DictionaryState({})
+        state.add_pattern("teh", "the", BoundaryType.LEFT, "test")
+        cursor = state.changes.cursor
+        state.remove_pattern("teh", "the", BoundaryType.LEFT, "test")
+        state.add_pattern("teh", "the", BoundaryType.LEFT, "test")
+        key = state.correction_table.lookup(("teh", "the", BoundaryType.LEFT))
+        assert state.changes.since(cursor).added_patterns == {key}
+
+    def test_delta_table_decodes_keys(self) -> None:
+        """Keys in a delta decode back to the changed corrections."""
+        state = DictionaryState({})
+        cursor = state.changes.cursor
+        state.add_correction("teh", "the", BoundaryType.NONE, "test")
+        delta = state.changes.since(cursor)
+        assert {delta.table.decode(key) for key in delta.added_corrections} == {
+            ("teh", "the", BoundaryType.NONE)
+        }
+
+    def test_graveyard_additions_are_recorded(self) -> None:
+        """Burying a correction shows up in the delta."""
+        state = DictionaryState({})
+        cursor = state.changes.cursor
+        state.add_to_graveyard("teh", "the", BoundaryType.NONE, RejectionReason.TOO_SHORT)
+        key = state.correction_table.lookup(("teh", "the", BoundaryType.NONE))
+        assert state.changes.since(cursor).graveyard_added == {key}
+
+    def test_graveyard_added_since_skips_other_changes(self) -> None:
+        """Only graveyard additions are collected."""
+        state = DictionaryState({})
+        cursor = state.changes.cursor
+        state.add_correction("teh", "the", BoundaryType.NONE, "test")
+        state.add_to_graveyard("hte", "the", BoundaryType.LEFT, RejectionReason.TOO_SHORT)
+        key = state.correction_table.lookup(("hte", "the", BoundaryType.LEFT))
+        assert state.changes.graveyard_added_since(cursor) == {key}
+
+    def test_changes_before_cursor_are_excluded(self) -> None:
+        """Only changes after the cursor are reported."""
+        state = DictionaryState({})
+        state.add_correction("teh", "the", BoundaryType.NONE, "test")
+        assert state.changes.since(state.changes.cursor).is_empty()
+
+
+class TestIncrementalPasses:
+    """Test how incremental passes use the journal."""
+
+    def test_first_prepare_requests_full_run(self, pass_context: PassContext) -> None:
+        """A pass that never ran gets no delta."""
+        conflict_pass = ConflictRemovalPass(pass_context)
+        conflict_pass.prepare(DictionaryState({}))
+        assert conflict_pass.delta is None
+
+    def test_prepare_skips_conflict_removal_after_only_removals(
+        self, pass_context: PassContext
+    ) -> None:
+        """Removals cannot create conflicts, so ConflictRemoval is skipped."""
+        state = DictionaryState({})
+        state.add_correction("teh", "the", BoundaryType.NONE, "test")
+        conflict_pass = ConflictRemovalPass(pass_context)
+        conflict_pass.prepare(state)
+        state.remove_correction("teh", "the", BoundaryType.NONE, "test")
+        assert not conflict_pass.prepare(state)
+
+    def test_incremental_conflict_removal_blocks_new_typo(self, pass_context: PassContext) -> None:
+        """A typo added after a full run is still blocked by an older shorter typo."""
+        state = DictionaryState({})
+        state.add_correction("teh", "the", BoundaryType.NONE, "test")
+        conflict_pass = ConflictRemovalPass(pass_context)
+        conflict_pass.prepare(state)
+        conflict_pass.run(state)
+        state.add_correction("tehir", "their", BoundaryType.NONE, "test")
+        conflict_pass.prepare(state)
+        conflict_pass.run(state)
+        assert ("tehir", "their", BoundaryType.NONE) not in state.active_corrections
+
+    def test_incremental_conflict_removal_blocks_existing_longer_typo(
+        self, pass_context: PassContext
+    ) -> None:
+        """A shorter typo added after a full run removes an older longer typo it blocks."""
+        state = DictionaryState({})
+        state.add_correction("tehir", "their", BoundaryType.NONE, "test")
+        conflict_pass = ConflictRemovalPass(pass_context)
+        conflict_pass.prepare(state)
+        conflict_pass.run(state)
+        state.add_correction("teh", "the", BoundaryType.NONE, "test")
+        conflict_pass.prepare(state)
+        conflict_pass.run(state)
+        assert ("tehir", "their", BoundaryType.NONE) not in state.active_corrections
+
+    def test_readded_correction_does_not_block_itself(self, pass_context: PassContext) -> None:
+        """A correction removed and re-added between runs stays active."""
+        state = DictionaryState({})
+        state.add_correction("teh", "the", BoundaryType.NONE, "test")
+        conflict_pass = ConflictRemovalPass(pass_context)
+        conflict_pass.prepare(state)
+        conflict_pass.run(state)
+        state.remove_correction("teh", "the", BoundaryType.NONE, "test")
+        state.add_correction("teh", "the", BoundaryType.NONE, "test")
+        conflict_pass.prepare(state)
+        conflict_pass.run(state)
+        assert ("teh", "the", BoundaryType.NONE) in state.active_corrections
+
+    def test_skipped_changes_are_reported_on_next_run(self, pass_context: PassContext) -> None:
+        """Removals seen by a skipped prepare() are still in the next delta."""
+        state = DictionaryState({})
+        state.add_correction("teh", "the", BoundaryType.NONE, "test")
+        conflict_pass = ConflictRemovalPass(pass_context)
+        conflict_pass.prepare(state)
+        state.remove_correction("teh", "the", BoundaryType.NONE, "test")
+        conflict_pass.prepare(state)
+        state.add_correction("tehir", "their", BoundaryType.NONE, "test")
+        conflict_pass.prepare(state)
+        key = state.correction_table.lookup(("teh", "the", BoundaryType.NONE))
+        assert conflict_pass.delta is not None and conflict_pass.delta.removed_corrections == {key}
@@ -0,0 +1,51 @@
+"""Unit tests for the Rust-backed substring index.
+
+Tests verify substring queries and in-place rebuilds. Each test has a single
+assertion and focuses on behavior.
+"""
+
+from entroppy.utils.suffix_array import SubstringIndex
+
+
+def _conflicts(index: SubstringIndex, typo: str) -> list[int]:
+    """Indices of the typos containing a typo, from a one-typo batch query."""
+    _offsets, indices = index.find_substring_conflicts_batch([typo])
+    return indices.tolist()
+
+
+class TestSubstringIndexRebuild:
+    """Test rebuilding an index in place from a new typo list."""
+
+    def test_rebuilt_index_answers_queries_for_new_typos(self) -> None:
+        """After a rebuild, matches come from the new typo list."""
+        index = SubstringIndex(["teh", "tehn"])
+        index.rebuild(["aer", "aerly", "xyz"])
+        assert _conflicts(index, "aer") == [1]
+
+    def test_rebuilt_index_forgets_old_typos(self) -> None:
+        """Typos from before the rebuild no longer match."""
+        index = SubstringIndex(["teh", "tehn"])
+        index.rebuild(["aer", "aerly"])
+        assert not index.contains_substring("teh")
+
+    def test_unchanged_typo_list_skips_rebuild(self) -> None:
+        """Rebuilding with the same typo list reports that nothing changed."""
+        index = SubstringIndex(["teh", "tehn"])
+        assert index.rebuild(["teh", "tehn"]) is False
+
+
+class TestSubstringIndexBufferQueries:
+    """Test uint32 buffer and batched CSR query results."""
+
+    def test_query_returns_unique_sorted_indices(self) -> None:
+        """A typo occurring twice in one entry is reported once."""
+        index = SubstringIndex(["aer", "aeraer", "xaer"])
+        assert _conflicts(index, "aer") == [1, 2]
+
+    def test_batch_query_slices_match_single_queries(self) -> None:
+        """Each CSR slice holds the same indices as a query for that typo alone."""
+        typos = ["aer", "aerly", "teh", "tehn"]
+        index = SubstringIndex(typos)
+        offsets, indices = index.find_substring_conflicts_batch(typos)
+        batched = [indices[offsets[i] : offsets[i + 1]].tolist() for i in range(len(typos))]
+        assert batched == [_conflicts(index, typo) for typo in typos]
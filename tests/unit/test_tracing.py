@@ -0,0 +1,90 @@
+"""Unit tests for pipeline tracing.
+
+Tests verify that spans are recorded only while tracing is on, that pool worker tasks
+are recorded under the workers' process IDs, and that traces export as Chrome trace
+JSON and CSV. Each test has a single assertion and focuses on behavior.
+"""
+
+import csv
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from entroppy.utils.tracing import (
+    Tracer,
+    disable_tracing,
+    enable_tracing,
+    record_worker_tasks,
+    span,
+)
+from entroppy.utils.worker_pool import WorkerPool
+
+
+def _square(value: int) -> int:
+    """Function run in workers."""
+    return value * value
+
+
+@pytest.fixture
+def tracer():
+    """Tracing enabled for one test."""
+    active = enable_tracing()
+    yield active
+    disable_tracing()
+
+
+class TestSpans:
+    """Test recording spans."""
+
+    def test_span_is_recorded_with_values(self, tracer: Tracer) -> None:
+        """A span records values set while it is open."""
+        with span("Stage 2", "stage") as stage_span:
+            stage_span.set(items=3)
+        assert tracer.events[0].args["items"] == 3
+
+    def test_nothing_recorded_when_disabled(self, tracer: Tracer) -> None:
+        """Spans opened after tracing is turned off are dropped."""
+        disable_tracing()
+        with span("Stage 2", "stage"):
+            pass
+        assert not tracer.events
+
+
+class TestWorkerTasks:
+    """Test recording work done in pool workers."""
+
+    def test_short_tasks_are_merged(self) -> None:
+        """Back-to-back short tasks on one worker become a single span."""
+        tracer = Tracer()
+        record_worker_tasks(tracer, "work", [(0, 1000, 7, 1, 0), (1000, 2000, 7, 1, 0)])
+        assert [event.args["tasks"] for event in tracer.events] == [2]
+
+    def test_pool_tasks_recorded_under_worker_pids(self, tracer: Tracer) -> None:
+        """Mapping over a pool records worker spans with worker process IDs."""
+        with WorkerPool(2) as pool:
+            pool.map(_square, range(10))
+        worker_pids = {event.pid for event in tracer.events if event.category == "worker"}
+        assert worker_pids and os.getpid() not in worker_pids
+
+
+class TestExport:
+    """Test writing traces."""
+
+    def test_chrome_trace_has_complete_events(self, tracer: Tracer, tmp_path: Path) -> None:
+        """Spans are written as Chrome trace complete ("X") events."""
+        with span("Stage 1", "stage"):
+            pass
+        tracer.write_chrome_trace(tmp_path / "trace.json")
+        events = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))["traceEvents"]
+        assert [event["name"] for event in events if event["ph"] == "X"] == ["Stage 1"]
+
+    def test_csv_has_one_row_per_span(self, tracer: Tracer, tmp_path: Path) -> None:
+        """The CSV has a header plus one row per span."""
+        for name in ("a", "b"):
+            with span(name, "pass"):
+                pass
+        tracer.write_csv(tmp_path / "trace.csv")
+        with open(tmp_path / "trace.csv", newline="", encoding="utf-8") as f:
+            assert len(list(csv.reader(f))) == 3
@@ -0,0 +1,49 @@
+"""Unit tests for the columnar typo store.
+
+Tests verify that the packed store answers like the dict[str, list[str]] typo map it
+replaces. Each test has a single assertion and focuses on behavior.
+"""
+
+import pickle
+
+from entroppy.core import TypoStore, TypoStoreBuilder
+
+
+def _build(pairs: list[tuple[str, str]]) -> TypoStore:
+    builder = TypoStoreBuilder()
+    builder.add_pairs(pairs)
+    return builder.build()
+
+
+class TestTypoStore:
+    """Test the typo -> words read API."""
+
+    def test_matches_dict_built_by_appending(self) -> None:
+        """Typos keep first-seen order and words keep insertion order."""
+        store = _build([("teh", "the"), ("aer", "are"), ("teh", "tech")])
+        assert dict(store.items()) == {"teh": ["the", "tech"], "aer": ["are"]}
+
+    def test_lookup_of_unknown_typo_uses_default(self) -> None:
+        """Unknown typos behave like missing dict keys."""
+        store = _build([("teh", "the")])
+        assert store.get("xyz", []) == []
+
+    def test_unique_words_drops_repeated_words(self) -> None:
+        """A word generated twice for the same typo is reported once."""
+        store = _build([("teh", "the"), ("teh", "tech"), ("teh", "the")])
+        assert store.unique_words("teh") == ["the", "tech"]
+
+    def test_pair_count_counts_every_pair(self) -> None:
+        """All (typo, word) pairs are counted, including repeats."""
+        store = _build([("teh", "the"), ("teh", "the"), ("aer", "are")])
+        assert store.pair_count == 3
+
+    def test_from_mapping_round_trips_plain_dict(self) -> None:
+        """Packing a plain typo map preserves its contents."""
+        typo_map = {"tain": ["train", "taint"], "teh": ["the"]}
+        assert dict(TypoStore.from_mapping(typo_map)) == typo_map
+
+    def test_round_trips_through_pickle(self) -> None:
+        """Unpickled stores answer lookups like the original."""
+        store = _build([("teh", "the"), ("aer", "are")])
+        assert pickle.loads(pickle.dumps(store))["aer"] == ["are"]
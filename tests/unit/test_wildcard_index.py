@@ -0,0 +1,54 @@
+"""Unit tests for the combined wildcard pattern index.
+
+Tests verify that prefix, suffix, infix and other wildcard shapes match the same
+strings as their regexes, and that all matching pattern IDs are reported. Each test
+has a single assertion and focuses on behavior.
+"""
+
+from entroppy.matching.wildcard_index import WildcardIndex
+from entroppy.utils import compile_wildcard_regex
+
+PATTERNS = ["in*", "*ball", "*teh*", "a*z", "*", "*ion", "*io*"]
+
+WORDS = ["inside", "football", "ball", "tehs", "ateh", "teh", "az", "abcz", "zion", "", "x"]
+
+
+class TestMatches:
+    """Test checking a string against all patterns."""
+
+    def test_prefix_pattern_matches_start(self) -> None:
+        """A ``x*`` pattern matches strings starting with x."""
+        assert WildcardIndex(["in*"]).matches("inside")
+
+    def test_suffix_pattern_rejects_other_endings(self) -> None:
+        """A ``*x`` pattern does not match when x only appears mid-string."""
+        assert not WildcardIndex(["*ball"]).matches("ballot")
+
+    def test_infix_pattern_matches_whole_string(self) -> None:
+        """A ``*x*`` pattern matches a string equal to x."""
+        assert WildcardIndex(["*teh*"]).matches("teh")
+
+    def test_star_matches_empty_string(self) -> None:
+        """A pattern made only of ``*`` matches everything."""
+        assert WildcardIndex(["*"]).matches("")
+
+    def test_agrees_with_regexes(self) -> None:
+        """Every pattern matches exactly the strings its regex matches."""
+        index = WildcardIndex(PATTERNS)
+        expected = {
+            word: [i for i, p in enumerate(PATTERNS) if compile_wildcard_regex(p).match(word)]
+            for word in WORDS
+        }
+        assert {word: index.matching(word) for word in WORDS} == expected
+
+
+class TestMatching:
+    """Test listing every matching pattern."""
+
+    def test_reports_overlapping_infixes(self) -> None:
+        """Infix literals ending at the same position are all reported."""
+        assert WildcardIndex(["*tion*", "*ion*", "*on*"]).matching("station") == [0, 1, 2]
+
+    def test_reports_duplicate_patterns(self) -> None:
+        """Identical patterns each get their own ID."""
+        assert WildcardIndex(["in*", "in*"]).matching("into") == [0, 1]
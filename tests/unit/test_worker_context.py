@@ -4,9 +4,21 @@ from multiprocessing import Pool
 
 import pytest
 
-from entroppy.core import Config
+from entroppy.core import BoundaryType, Config
 from entroppy.processing.stages.data_models import DictionaryData
-from entroppy.processing.stages.worker_context import WorkerContext, get_worker_context, init_worker
+from entroppy.processing.stages.typo_generation import MAX_WORDS_PER_CHUNK, _chunk_words
+from entroppy.processing.stages.worker_context import (
+    WorkerContext,
+    get_worker_context,
+    get_worker_state,
+    init_worker,
+)
+from entroppy.resolution.false_trigger_flags import FalseTriggerFlags
+from entroppy.resolution.worker_context import (
+    CandidateSelectionContext,
+    CandidateSelectionUpdate,
+    apply_candidate_selection_update,
+)
 
 
 # Module-level worker functions (needed for multiprocessing)
@@ -119,3 +131,80 @@ class TestMultiprocessingBehavior:
         """Accessing context before initialization should provide clear error."""
         with pytest.raises(RuntimeError, match="Worker context not initialized"):
             get_worker_context()
+
+
+class TestWorkerStateBehavior:
+    """Tests for per-worker state built once in init_worker."""
+
+    def test_init_worker_builds_word_exclusion_matcher(self):
+        """Single-word exclusions are matched without rebuilding per word."""
+        context = WorkerContext(
+            validation_set=frozenset(),
+            filtered_validation_set=frozenset(),
+            source_words_set=frozenset(),
+            typo_freq_threshold=0.0,
+            adjacent_letters_map={},
+            exclusions_set=frozenset(["tset", "teh -> the"]),
+            debug_words=frozenset(),
+            debug_typo_patterns=frozenset(),
+        )
+        init_worker(context)
+        assert get_worker_state().exclusion_matcher.matches("tset")
+
+    def test_init_worker_joins_adjacent_letters(self):
+        """Adjacent letter lists are joined into the string form process_word expects."""
+        context = WorkerContext(
+            validation_set=frozenset(),
+            filtered_validation_set=frozenset(),
+            source_words_set=frozenset(),
+            typo_freq_threshold=0.0,
+            adjacent_letters_map={"a": ["s", "q"]},
+            exclusions_set=frozenset(),
+            debug_words=frozenset(),
+            debug_typo_patterns=frozenset(),
+        )
+        init_worker(context)
+        assert get_worker_state().adj_map == {"a": "sq"}
+
+
+class TestCandidateSelectionUpdate:
+    """Tests for extending a candidate selection context between iterations."""
+
+    def test_update_extends_graveyard_in_place(self):
+        """Workers keep their context and only merge the new graveyard entries."""
+        context = CandidateSelectionContext(
+            validation_set=frozenset(["the"]),
+            source_words=frozenset(["the"]),
+            min_typo_length=2,
+            collision_threshold=2.0,
+            exclusion_set=frozenset(),
+            graveyard={("teh", "the", BoundaryType.NONE)},
+            batch_false_trigger_results=FalseTriggerFlags(),
+            boundary_map={},
+        )
+        update = CandidateSelectionUpdate(
+            graveyard_added=frozenset([("teh", "the", BoundaryType.LEFT)]),
+            batch_false_trigger_results=FalseTriggerFlags(),
+            boundary_map={"teh": BoundaryType.NONE},
+        )
+        apply_candidate_selection_update(context, update)
+        assert context.graveyard == {
+            ("teh", "the", BoundaryType.NONE),
+            ("teh", "the", BoundaryType.LEFT),
+        }
+
+
+class TestWordChunking:
+    """Tests for splitting Stage 2 work into worker batches."""
+
+    def test_chunks_cover_all_words_in_order(self):
+        """Concatenating the batches gives back the original word list."""
+        words = [f"word{i}" for i in range(1000)]
+        chunks = _chunk_words(words, jobs=4)
+        assert [word for chunk in chunks for word in chunk] == words
+
+    def test_chunks_are_capped_in_size(self):
+        """No batch exceeds the per-task word cap."""
+        words = [f"word{i}" for i in range(100_000)]
+        chunks = _chunk_words(words, jobs=2)
+        assert max(len(chunk) for chunk in chunks) <= MAX_WORDS_PER_CHUNK
@@ -0,0 +1,74 @@
+"""Unit tests for the persistent worker pool.
+
+Tests verify that broadcasts install state in every worker, that resident data is
+resolved in the workers instead of being re-sent, and that borrow_pool hands out the
+shared pool while one is running. Each test has a single assertion and focuses on
+behavior.
+"""
+
+import threading
+
+import pytest
+
+from entroppy.utils import worker_pool
+from entroppy.utils.worker_pool import WorkerPool, borrow_pool, shared_worker_pool
+
+_installed = threading.local()
+
+
+def _install(value: object) -> None:
+    """Broadcast target: remember a value in this worker."""
+    _installed.value = value
+
+
+def _read_installed(_item: int) -> object:
+    """Map target: return the value installed in this worker."""
+    return _installed.value
+
+
+def _is_resident(_item: int) -> bool:
+    """Map target: check the installed value is this worker's resident copy."""
+    # pylint: disable=protected-access
+    return _installed.value is worker_pool._worker.resident["words"]
+
+
+@pytest.fixture
+def pool():
+    """A two-worker pool with one resident set."""
+    with WorkerPool(2, {"words": frozenset({"the", "their", "there"})}) as started:
+        yield started
+
+
+class TestBroadcast:
+    """Test installing state in every worker."""
+
+    def test_every_worker_sees_broadcast_value(self, pool: WorkerPool) -> None:
+        """Tasks on any worker read the broadcast value."""
+        pool.broadcast(_install, "teh")
+        assert set(pool.map(_read_installed, range(20))) == {"teh"}
+
+    def test_later_broadcast_replaces_value(self, pool: WorkerPool) -> None:
+        """A second broadcast of the same initializer overwrites the first."""
+        pool.broadcast(_install, "teh")
+        pool.broadcast(_install, "recieve")
+        assert set(pool.map(_read_installed, range(20))) == {"recieve"}
+
+    def test_repeated_broadcast_is_skipped(self, pool: WorkerPool) -> None:
+        """Broadcasting the same argument objects again does not rerun the initializer."""
+        value = ["teh"]
+        pool.broadcast(_install, value)
+        assert not pool.broadcast(_install, value)
+
+    def test_equal_frozenset_resolves_to_resident_copy(self, pool: WorkerPool) -> None:
+        """A frozenset equal to resident data arrives as the worker's resident object."""
+        pool.broadcast(_install, frozenset(["there", "their", "the"]))
+        assert all(pool.map(_is_resident, range(20)))
+
+
+class TestBorrowPool:
+    """Test handing out pools."""
+
+    def test_borrows_shared_pool_while_running(self) -> None:
+        """Inside shared_worker_pool, borrow_pool yields the shared pool."""
+        with shared_worker_pool(2) as shared, borrow_pool(2) as borrowed:
+            assert borrowed is shared
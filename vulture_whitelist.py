@@ -21,19 +21,9 @@ model_config  # noqa: F821  # unused variable (entroppy/processing/stages/data_m
 # Functions used via imports - vulture can't detect usage through imports
 format_corrections_with_cache  # noqa: F821  # unused function (entroppy/resolution/platform_conflicts/formatting.py:92)
 is_debug_target  # noqa: F821  # unused function (entroppy/resolution/state_debug.py:34)
-create_correction_history_entry  # noqa: F821  # unused function (entroppy/resolution/state_history.py:17)
-create_pattern_history_entry  # noqa: F821  # unused function (entroppy/resolution/state_history.py:52)
-create_debug_trace_entry  # noqa: F821  # unused function (entroppy/resolution/state_history.py:87)
 update_pattern_prefix_index_add  # noqa: F821  # unused function (entroppy/resolution/state_patterns.py:13)
 update_pattern_prefix_index_remove  # noqa: F821  # unused function (entroppy/resolution/state_patterns.py:28)
 
-# Parallel processing functions - used via module attribute access (parallel.function_name)
-# vulture can't detect usage through module.attribute syntax
-DebugTypoMatcher  # unused import (entroppy/resolution/platform_conflicts/parallel.py:72)
-detect_conflicts_for_chunk  # unused function (entroppy/resolution/platform_conflicts/parallel.py:83)
-resolve_conflicts_sequential  # unused function (entroppy/resolution/platform_conflicts/parallel.py:132)
-divide_into_chunks  # unused function (entroppy/resolution/platform_conflicts/parallel.py:221)
-
 # StateCaching class and methods - used via instance attribute access (self._caching.method_name)
 # vulture can't detect usage through instance.attribute syntax
 StateCaching  # unused class (entroppy/resolution/state_caching.py:11)
@@ -50,5 +40,10 @@ IterationPassEntry  # unused class (entroppy/reports/helpers.py:19)
 
 # Functions used via imports - vulture can't detect usage through imports
 format_corrections_parallel  # unused function (entroppy/resolution/platform_conflicts/formatting_helpers.py:20)
-build_index_keys_to_check  # unused function (entroppy/resolution/platform_conflicts/utils.py:41)
-find_substring_conflicts_in_index  # unused function (entroppy/resolution/platform_conflicts/utils.py:70)
+
+# collections.abc.Set hook, called by the inherited set operators
+_._from_iterable  # unused method (entroppy/core/correction_table.py:160)
+
+# pickle.Pickler / pickle.Unpickler hooks, called by pickle itself
+_.persistent_id  # unused method (entroppy/utils/worker_pool.py:47)
+_.persistent_load  # unused method (entroppy/utils/worker_pool.py:60)